@@ -22,7 +22,12 @@
 from dagster._core.execution.backfill import BulkActionsFilter, BulkActionStatus
 from dagster._core.instance import DagsterInstance
 from dagster._core.storage.dagster_run import DagsterRunStatus, RunRecord, RunsFilter
-from dagster._core.storage.event_log.base import AssetRecord
+from dagster._core.storage.event_log.base import (
+    AssetRecord,
+    EventLogCursor,
+    RunStatsRecord,
+    RunStepStatsRecord,
+)
 from dagster._core.storage.tags import BACKFILL_ID_TAG, TagType, get_tag_type
 from dagster._record import copy, record
 from dagster._time import datetime_from_timestamp
@@ -352,21 +357,28 @@ def get_execution_plan(
     )
 
 
-def get_stats(graphene_info: "ResolveInfo", run_id: str) -> "GrapheneRunStatsSnapshot":
+async def gen_stats(graphene_info: "ResolveInfo", run_id: str) -> "GrapheneRunStatsSnapshot":
     from dagster_graphql.schema.pipelines.pipeline_run_stats import GrapheneRunStatsSnapshot
 
-    stats = graphene_info.context.instance.get_run_stats(run_id)
-    stats.id = "stats-{run_id}"  # type: ignore  # (unused code path)
+    # batched with the stats of the other runs resolved in the same request
+    record = await RunStatsRecord.gen(graphene_info.context, run_id)
+    stats = record.stats if record else graphene_info.context.instance.get_run_stats(run_id)
     return GrapheneRunStatsSnapshot(stats)
 
 
-def get_step_stats(
+async def gen_step_stats(
     graphene_info: "ResolveInfo", run_id: str, step_keys: Optional[Sequence[str]] = None
 ) -> Sequence["GrapheneRunStepStats"]:
     from dagster_graphql.schema.logs.events import GrapheneRunStepStats
 
-    step_stats = graphene_info.context.instance.get_run_step_stats(run_id, step_keys)
-    return [GrapheneRunStepStats(stats) for stats in step_stats]
+    # batched with the step stats of the other runs resolved in the same request
+    record = await RunStepStatsRecord.gen(graphene_info.context, run_id)
+    step_stats = record.step_stats if record else []
+    return [
+        GrapheneRunStepStats(stats)
+        for stats in step_stats
+        if step_keys is None or stats.step_key in step_keys
+    ]
 
 
 def get_logs_for_run(
@@ -375,21 +387,53 @@ def get_logs_for_run(
     cursor: Optional[str] = None,
     limit: Optional[int] = None,
 ) -> Union["GrapheneRunNotFoundError", "GrapheneEventConnection"]:
-    from dagster_graphql.implementation.events import from_event_record
     from dagster_graphql.schema.errors import GrapheneRunNotFoundError
-    from dagster_graphql.schema.pipelines.pipeline import GrapheneEventConnection
 
     instance = graphene_info.context.instance
     run = instance.get_run_by_id(run_id)
     if not run:
         return GrapheneRunNotFoundError(run_id)
 
-    conn = instance.get_records_for_run(run_id, cursor=cursor, limit=limit)
-    return GrapheneEventConnection(
-        events=[from_event_record(record.event_log_entry, run.job_name) for record in conn.records],
-        cursor=conn.cursor,
-        hasMore=conn.has_more,
-    )
+    return get_event_connection_for_run(instance, run_id, run.job_name, cursor, limit)
+
+
+def get_event_connection_for_run(
+    instance: DagsterInstance,
+    run_id: str,
+    job_name: str,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = None,
+) -> "GrapheneEventConnection":
+    from dagster_graphql.implementation.events import from_event_record
+    from dagster_graphql.schema.pipelines.pipeline import GrapheneEventConnection
+
+    if limit:
+        conn = instance.get_records_for_run(run_id, cursor=cursor, limit=limit)
+        return GrapheneEventConnection(
+            events=[
+                from_event_record(event_record.event_log_entry, job_name)
+                for event_record in conn.records
+            ],
+            cursor=conn.cursor,
+            hasMore=conn.has_more,
+        )
+
+    # without a limit, stream the records of the run so that each record is converted as soon as
+    # it is deserialized, rather than holding every raw and deserialized record of the run at once
+    events = []
+    last_storage_id = None
+    for event_record in instance.iter_records_for_run(run_id, cursor=cursor):
+        events.append(from_event_record(event_record.event_log_entry, job_name))
+        last_storage_id = event_record.storage_id
+
+    if last_storage_id is not None:
+        next_cursor = EventLogCursor.from_storage_id(last_storage_id).to_string()
+    elif cursor:
+        next_cursor = cursor
+    else:
+        next_cursor = EventLogCursor.from_storage_id(-1).to_string()
+
+    return GrapheneEventConnection(events=events, cursor=next_cursor, hasMore=False)
 
 
 @record
@@ -34,6 +34,7 @@
 )
 from dagster._core.snap.node import GraphDefSnap, OpDefSnap
 from dagster._core.storage.asset_check_execution_record import AssetCheckInstanceSupport
+from dagster._core.storage.dagster_run import RunRecord
 from dagster._core.storage.event_log.base import AssetRecord
 from dagster._core.storage.tags import KIND_PREFIX
 from dagster._core.utils import is_valid_email
@@ -1015,7 +1016,7 @@ def resolve_latestRunForPartition(
         )
         if not planned_info:
             return None
-        run_record = graphene_info.context.instance.get_run_record_by_id(planned_info.run_id)
+        run_record = RunRecord.blocking_get(graphene_info.context, planned_info.run_id)
         return GrapheneRun(run_record) if run_record else None
 
     def resolve_assetPartitionStatuses(
@@ -8,7 +8,7 @@
 from dagster._core.execution.stats import RunStepKeyStatsSnapshot
 
 from dagster_graphql.implementation.events import construct_basic_params
-from dagster_graphql.implementation.fetch_runs import gen_run_by_id, get_step_stats
+from dagster_graphql.implementation.fetch_runs import gen_run_by_id, gen_step_stats
 from dagster_graphql.schema.asset_checks import GrapheneAssetCheckEvaluation
 from dagster_graphql.schema.asset_key import GrapheneAssetKey, GrapheneAssetLineageInfo
 from dagster_graphql.schema.errors import GraphenePythonError, GrapheneRunNotFoundError
@@ -337,10 +337,10 @@ async def resolve_runOrError(
     ) -> Union["GrapheneRun", GrapheneRunNotFoundError]:
         return await gen_run_by_id(graphene_info, self._event.run_id)
 
-    def resolve_stepStats(self, graphene_info) -> "GrapheneRunStepStats":
+    async def resolve_stepStats(self, graphene_info) -> "GrapheneRunStepStats":
         run_id = self.runId  # type: ignore  # (value obj access)
         step_key = self.stepKey  # type: ignore  # (value obj access)
-        stats = get_step_stats(graphene_info, run_id, step_keys=[step_key])
+        stats = await gen_step_stats(graphene_info, run_id, step_keys=[step_key])
         return stats[0]
 
     def resolve_metadataEntries(self, _graphene_info: ResolveInfo):
@@ -19,16 +19,22 @@
     RunRecord,
     RunsFilter,
 )
+from dagster._core.storage.event_log.base import RunStatsRecord
 from dagster._core.storage.tags import REPOSITORY_LABEL_TAG, RUN_METRIC_TAGS, TagType, get_tag_type
 from dagster._core.workspace.permissions import Permissions
 from dagster._utils.tags import get_boolean_tag_value
 from dagster._utils.yaml_utils import dump_run_config_yaml
 
-from dagster_graphql.implementation.events import from_event_record, iterate_metadata_entries
+from dagster_graphql.implementation.events import iterate_metadata_entries
 from dagster_graphql.implementation.fetch_asset_checks import get_asset_checks_for_run_id
 from dagster_graphql.implementation.fetch_assets import get_assets_for_run, get_unique_asset_id
 from dagster_graphql.implementation.fetch_pipelines import get_job_reference_or_raise
-from dagster_graphql.implementation.fetch_runs import get_runs, get_stats, get_step_stats
+from dagster_graphql.implementation.fetch_runs import (
+    gen_stats,
+    gen_step_stats,
+    get_event_connection_for_run,
+    get_runs,
+)
 from dagster_graphql.implementation.fetch_schedules import get_schedules_for_job
 from dagster_graphql.implementation.fetch_sensors import get_sensors_for_job
 from dagster_graphql.implementation.utils import (
@@ -407,7 +413,6 @@ def __init__(self, record: RunRecord):
         )
         self.dagster_run = dagster_run
         self._run_record = record
-        self._run_stats: Optional[DagsterRunStatsSnapshot] = None
 
     def _get_permission_value(self, permission: Permissions, graphene_info: ResolveInfo) -> bool:
         location_name = (
@@ -484,11 +489,11 @@ def resolve_parentPipelineSnapshotId(self, graphene_info: ResolveInfo):
         return None
 
     @capture_error
-    def resolve_stats(self, graphene_info: ResolveInfo):
-        return get_stats(graphene_info, self.run_id)
+    async def resolve_stats(self, graphene_info: ResolveInfo):
+        return await gen_stats(graphene_info, self.run_id)
 
-    def resolve_stepStats(self, graphene_info: ResolveInfo):
-        return get_step_stats(graphene_info, self.run_id)
+    async def resolve_stepStats(self, graphene_info: ResolveInfo):
+        return await gen_step_stats(graphene_info, self.run_id)
 
     def resolve_capturedLogs(self, graphene_info: ResolveInfo, fileKey):
         compute_log_manager = get_compute_log_manager(graphene_info)
@@ -564,39 +569,39 @@ def resolve_assetMaterializations(self, graphene_info: ResolveInfo):
         ]
 
     def resolve_eventConnection(self, graphene_info: ResolveInfo, afterCursor=None, limit=None):
-        conn = graphene_info.context.instance.get_records_for_run(
-            self.run_id, cursor=afterCursor, limit=limit
-        )
-        return GrapheneEventConnection(
-            events=[
-                from_event_record(record.event_log_entry, self.dagster_run.job_name)
-                for record in conn.records
-            ],
-            cursor=conn.cursor,
-            hasMore=conn.has_more,
+        return get_event_connection_for_run(
+            graphene_info.context.instance,
+            self.run_id,
+            self.dagster_run.job_name,
+            cursor=afterCursor,
+            limit=limit,
         )
 
-    def resolve_startTime(self, graphene_info: ResolveInfo):
-        # If a user has not migrated in 0.13.15, then run_record will not have start_time and end_time. So it will be necessary to fill this data using the run_stats. Since we potentially make this call multiple times, we cache the result.
+    async def _gen_run_stats(self, graphene_info: ResolveInfo) -> DagsterRunStatsSnapshot:
+        # batched with the stats of the other runs resolved in the same request, and cached for
+        # the rest of the request
+        record = await RunStatsRecord.gen(graphene_info.context, self.run_id)
+        return record.stats if record else graphene_info.context.instance.get_run_stats(self.runId)
+
+    async def resolve_startTime(self, graphene_info: ResolveInfo):
+        # If a user has not migrated in 0.13.15, then run_record will not have start_time and end_time. So it will be necessary to fill this data using the run_stats.
         if self._run_record.start_time is None and self.dagster_run.status in STARTED_STATUSES:
             # Short-circuit if pipeline failed to start, so it has an end time but no start time
             if self._run_record.end_time is not None:
                 return self._run_record.end_time
 
-            if self._run_stats is None or self._run_stats.start_time is None:
-                self._run_stats = graphene_info.context.instance.get_run_stats(self.runId)
+            run_stats = await self._gen_run_stats(graphene_info)
 
-            if self._run_stats.start_time is None and self._run_stats.end_time:
-                return self._run_stats.end_time
+            if run_stats.start_time is None and run_stats.end_time:
+                return run_stats.end_time
 
-            return self._run_stats.start_time
+            return run_stats.start_time
         return self._run_record.start_time
 
-    def resolve_endTime(self, graphene_info: ResolveInfo):
+    async def resolve_endTime(self, graphene_info: ResolveInfo):
         if self._run_record.end_time is None and self.dagster_run.status in COMPLETED_STATUSES:
-            if self._run_stats is None or self._run_stats.end_time is None:
-                self._run_stats = graphene_info.context.instance.get_run_stats(self.runId)
-            return self._run_stats.end_time
+            run_stats = await self._gen_run_stats(graphene_info)
+            return run_stats.end_time
         return self._run_record.end_time
 
     def resolve_updateTime(self, graphene_info: ResolveInfo):
@@ -640,11 +640,15 @@ def resolve_stepStats(self, _graphene_info: ResolveInfo, limit: Optional[int]):
 
         instance = _graphene_info.context.instance
         runs_filter = RunsFilter(job_name=self._solid.get_pipeline_name())
-        runs = instance.get_runs(runs_filter, limit=limit)
+        run_ids = instance.get_run_ids(runs_filter, limit=limit)
+        step_key = str(self.handleID)
         nodes = []
-        for run in runs:
-            stats = instance.get_run_step_stats(run.run_id, [str(self.handleID)])
-            if len(stats):
+        # fetch this step's stats across all of the runs in batches, without loading the events of
+        # the runs' other steps
+        step_stats_by_run_id = instance.get_run_step_stats_for_runs(run_ids, step_keys=[step_key])
+        for run_id in run_ids:
+            stats = step_stats_by_run_id.get(run_id)
+            if stats:
                 nodes.append(GrapheneRunStepStats(stats[0]))
         return GrapheneSolidStepStatsConnection(nodes=nodes)
 
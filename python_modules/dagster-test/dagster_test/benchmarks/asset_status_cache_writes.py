@@ -0,0 +1,146 @@
+# ruff: noqa: T201
+import argparse
+import time
+from typing import List
+
+from dagster import AssetKey, AssetMaterialization, StaticPartitionsDefinition
+from dagster._core.events import DagsterEvent, DagsterEventType, StepMaterializationData
+from dagster._core.events.log import EventLogEntry
+from dagster._core.instance import DagsterInstance
+from dagster._core.instance_for_test import instance_for_test
+from dagster._core.storage.partition_status_cache import AssetStatusCacheValue
+from dagster._core.utils import make_new_run_id
+from rich.console import Console
+from rich.table import Table
+
+DESC = """
+Measure the overhead that the asset status cache adds to storing materialization events of an asset
+with many partitions.
+
+The asset has `--num-partitions` static partitions. Every partition is recorded as materialized in
+its cached status value, and `--num-events` materializations of the asset are then stored one at a
+time, as a run would store them. The same events are stored for the asset with no cached status
+value, which is the baseline, and the best time per event over `--iterations` repetitions is
+reported for each. Recording the materialized partitions on the cached status value only touches the
+pending columns of the asset, so its overhead should not grow with the number of partitions.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="asset_status_cache_writes",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-partitions",
+    type=int,
+    default=100_000,
+    help="Set the number of partitions of the asset.",
+)
+
+parser.add_argument(
+    "--num-events",
+    type=int,
+    default=200,
+    help="Set the number of materialization events stored per iteration.",
+)
+
+parser.add_argument(
+    "--iterations",
+    type=int,
+    default=5,
+    help="Set the number of times the events are stored.",
+)
+
+ASSET_KEY = AssetKey("benchmark_asset")
+
+
+def materialization_event(run_id: str, partition: str) -> EventLogEntry:
+    return EventLogEntry(
+        error_info=None,
+        user_message="",
+        level="debug",
+        run_id=run_id,
+        timestamp=time.time(),
+        dagster_event=DagsterEvent(
+            DagsterEventType.ASSET_MATERIALIZATION.value,
+            "benchmark_job",
+            event_specific_data=StepMaterializationData(
+                AssetMaterialization(asset_key=ASSET_KEY, partition=partition)
+            ),
+        ),
+    )
+
+
+def seed_cached_status(
+    instance: DagsterInstance, partitions_def: StaticPartitionsDefinition, run_id: str
+) -> int:
+    partition_keys = partitions_def.get_partition_keys()
+    instance.event_log_storage.store_event(materialization_event(run_id, partition_keys[0]))
+    latest_storage_id = next(
+        iter(instance.fetch_materializations(ASSET_KEY, limit=1).records)
+    ).storage_id
+
+    empty_subset = partitions_def.empty_subset()
+    cache_value = AssetStatusCacheValue(
+        latest_storage_id=latest_storage_id,
+        partitions_def_id=partitions_def.get_serializable_unique_identifier(),
+        serialized_materialized_partition_subset=partitions_def.subset_with_partition_keys(
+            partition_keys
+        ).serialize(),
+        serialized_failed_partition_subset=empty_subset.serialize(),
+        serialized_in_progress_partition_subset=empty_subset.serialize(),
+    )
+    instance.update_asset_cached_status_data(ASSET_KEY, cache_value)
+    return len(cache_value.serialized_materialized_partition_subset or "")
+
+
+def time_per_event(
+    instance: DagsterInstance, run_id: str, partition_keys: List[str], iterations: int
+) -> float:
+    times = []
+    for _ in range(iterations):
+        events = [materialization_event(run_id, partition) for partition in partition_keys]
+        start = time.perf_counter()
+        for event in events:
+            instance.event_log_storage.store_event(event)
+        times.append((time.perf_counter() - start) / len(events))
+    return min(times)
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_partitions: int, num_events: int, iterations: int) -> None:
+    partitions_def = StaticPartitionsDefinition([f"p_{i}" for i in range(num_partitions)])
+    partition_keys = partitions_def.get_partition_keys()[-num_events:]
+
+    table = Table(
+        title=f"store_event per materialization ({num_partitions} partitions)",
+        title_justify="left",
+    )
+    for column in ["Cached status", "Cache value size (chars)", "Per event (ms)"]:
+        table.add_column(column, justify="right")
+
+    with instance_for_test() as instance:
+        run_id = make_new_run_id()
+        baseline = time_per_event(instance, run_id, partition_keys, iterations)
+        table.add_row("none", "-", f"{baseline * 1000:.3f}")
+
+        cache_value_size = seed_cached_status(instance, partitions_def, run_id)
+        cached = time_per_event(instance, run_id, partition_keys, iterations)
+        table.add_row("all partitions", str(cache_value_size), f"{cached * 1000:.3f}")
+
+        cached_status = next(
+            iter(instance.get_asset_records([ASSET_KEY]))
+        ).asset_entry.cached_status
+        assert cached_status
+        assert set(cached_status.pending_materialized_partition_keys or []) == set(partition_keys)
+
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_partitions, args.num_events, args.iterations)
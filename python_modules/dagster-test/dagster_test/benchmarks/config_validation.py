@@ -0,0 +1,202 @@
+# ruff: noqa: T201
+import argparse
+import time
+from typing import Any, Callable, Mapping
+
+from dagster import (
+    Enum,
+    EnumValue,
+    Field,
+    IntSource,
+    Noneable,
+    Permissive,
+    Selector,
+    StringSource,
+    job,
+    op,
+)
+from dagster._config import (
+    ConfigType,
+    EvaluateValueResult,
+    process_config,
+    validate_config_from_snap,
+)
+from dagster._config.post_process import _recursively_process_config
+from dagster._config.stack import EvaluationStack
+from dagster._config.traversal_context import TraversalContext, TraversalType
+from dagster._core.test_utils import environ
+from rich.console import Console
+from rich.table import Table
+
+DESC = """
+Compare the time to validate and fill in the defaults of the run config of a large job, between the
+interpreted traversals of the config schema snapshot and config type tree, and `process_config`,
+which uses validators and default processors compiled once per config type.
+
+The job has `--num-ops` ops, each with a config schema made up of nested shapes, selectors, arrays,
+maps, enums and `StringSource`/`IntSource` fields with defaults, and a run config that sets some of
+those fields for every op. Each is repeated `--iterations` times and the best time is reported,
+along with the time per run config for a backfill of `--num-runs` runs.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="config_validation",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-ops",
+    type=int,
+    default=200,
+    help="Set the number of ops in the job.",
+)
+
+parser.add_argument(
+    "--num-runs",
+    type=int,
+    default=10_000,
+    help="Set the number of runs used to extrapolate the time to validate a backfill.",
+)
+
+parser.add_argument(
+    "--iterations",
+    type=int,
+    default=20,
+    help="Set the number of times each validation is repeated.",
+)
+
+OP_CONFIG_SCHEMA = {
+    "table": str,
+    "partition_date": Field(str, is_required=False),
+    "batch_size": Field(IntSource, is_required=False, default_value=1000),
+    "sample_rate": Field(float, is_required=False, default_value=1.0),
+    "columns": Field([str], is_required=False, default_value=[]),
+    "tags": Field({str: str}, is_required=False, default_value={}),
+    "mode": Field(
+        Enum("WriteMode", [EnumValue("append"), EnumValue("overwrite")]),
+        is_required=False,
+        default_value="append",
+    ),
+    "credentials": {
+        "user": Field(StringSource, is_required=False, default_value={"env": "BENCHMARK_USER"}),
+        "password": Field(StringSource, is_required=False),
+        "timeout": Field(Noneable(int), is_required=False, default_value=None),
+    },
+    "destination": Field(
+        Selector(
+            {
+                "warehouse": {
+                    "schema": Field(str, is_required=False, default_value="public"),
+                    "retries": {
+                        "max_retries": Field(int, is_required=False, default_value=3),
+                        "backoff": Field(float, is_required=False, default_value=2.0),
+                    },
+                },
+                "s3": {"bucket": str, "prefix": Field(str, is_required=False, default_value="")},
+            }
+        ),
+        is_required=False,
+        default_value={"warehouse": {}},
+    ),
+    "extra": Field(Permissive(), is_required=False),
+}
+
+
+def make_job(num_ops: int):
+    ops = []
+    for i in range(num_ops):
+
+        @op(name=f"op_{i}", config_schema=OP_CONFIG_SCHEMA)
+        def _op(_):
+            pass
+
+        ops.append(_op)
+
+    @job
+    def large_job():
+        for _op in ops:
+            _op()
+
+    return large_job
+
+
+def make_run_config(num_ops: int) -> Mapping[str, Any]:
+    return {
+        "ops": {
+            f"op_{i}": {
+                "config": {
+                    "table": f"table_{i}",
+                    "partition_date": "2024-01-01",
+                    "columns": ["id", "value", "updated_at"],
+                    "tags": {"team": "data"},
+                    "credentials": {"password": {"env": "BENCHMARK_PASSWORD"}},
+                    **({"destination": {"s3": {"bucket": "bucket"}}} if i % 2 else {}),
+                    "extra": {"owner": "benchmark"},
+                }
+            }
+            for i in range(num_ops)
+        },
+        "execution": {"config": {"multiprocess": {"max_concurrent": 4}}},
+    }
+
+
+def interpreted_process_config(
+    config_type: ConfigType, config_value: Mapping[str, Any]
+) -> EvaluateValueResult:
+    validate_evr = validate_config_from_snap(
+        config_type.get_schema_snapshot(), config_type.key, config_value
+    )
+    if not validate_evr.success:
+        return validate_evr
+
+    ctx = TraversalContext.from_config_type(
+        config_type=config_type,
+        stack=EvaluationStack(entries=[]),
+        traversal_type=TraversalType.RESOLVE_DEFAULTS_AND_POSTPROCESS,
+    )
+    return _recursively_process_config(ctx, validate_evr.value)
+
+
+def best_time(fn: Callable[[], object], iterations: int) -> float:
+    times = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_ops: int, num_runs: int, iterations: int) -> None:
+    config_type = make_job(num_ops).run_config_schema.config_type
+    run_config = make_run_config(num_ops)
+
+    table = Table(
+        title=f"Run config validation ({num_ops} ops, {num_runs} runs)", title_justify="left"
+    )
+    for column in ["Validator", "Per run config (s)", f"{num_runs} runs (s)"]:
+        table.add_column(column, justify="right")
+
+    with environ({"BENCHMARK_USER": "user", "BENCHMARK_PASSWORD": "password"}):
+        interpreted_result = interpreted_process_config(config_type, run_config)
+        compiled_result = process_config(config_type, run_config)
+        assert interpreted_result.success and compiled_result.success
+        assert interpreted_result.value == compiled_result.value
+
+        for name, fn in [
+            ("interpreted", lambda: interpreted_process_config(config_type, run_config)),
+            ("compiled", lambda: process_config(config_type, run_config)),
+        ]:
+            run_time = best_time(fn, iterations)
+            table.add_row(name, f"{run_time:.4f}", f"{run_time * num_runs:.1f}")
+
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_ops, args.num_runs, args.iterations)
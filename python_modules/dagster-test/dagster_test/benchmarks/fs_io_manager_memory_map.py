@@ -0,0 +1,93 @@
+# ruff: noqa: T201
+import argparse
+import tempfile
+import time
+from typing import Callable
+
+import numpy as np
+from dagster import build_input_context, build_output_context
+from dagster._core.storage.fs_io_manager import PickledObjectFilesystemIOManager
+from rich.console import Console
+from rich.table import Table
+from upath import UPath
+
+DESC = """
+Compare the time to store and load a large NumPy array with the `PickledObjectFilesystemIOManager`
+used by `FilesystemIOManager`, between the default pickle format and the `memory_map` format, which
+writes the array data out-of-band with pickle protocol 5 so that it is memory-mapped on load.
+
+The size of the array is configurable via the `--size-mb` arg. Each operation is repeated
+`--iterations` times and the best time is reported. Loading is reported both on its own, and
+followed by a pass over the loaded array, since memory-mapped data is only read from disk when it is
+accessed. Requires `numpy`.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="fs_io_manager_memory_map",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--size-mb",
+    type=int,
+    default=512,
+    help="Set the size of the stored array in megabytes.",
+)
+
+parser.add_argument(
+    "--iterations",
+    type=int,
+    default=5,
+    help="Set the number of times each store and load is repeated.",
+)
+
+
+def best_time(fn: Callable[[], object], iterations: int) -> float:
+    times = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(size_mb: int, iterations: int) -> None:
+    array = np.random.default_rng(0).random(size_mb * 1024 * 1024 // 8)
+
+    table = Table(title=f"FilesystemIOManager ({size_mb}MB array)", title_justify="left")
+    for column in ["Format", "Store (s)", "Load (s)", "Load + sum (s)"]:
+        table.add_column(column, justify="right")
+
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        for memory_map in [False, True]:
+            manager = PickledObjectFilesystemIOManager(base_dir=tmpdir_path, memory_map=memory_map)
+            path = UPath(tmpdir_path, "memory_map" if memory_map else "pickle")
+            output_context = build_output_context()
+            input_context = build_input_context()
+
+            def _load():
+                return manager.load_from_path(input_context, path)
+
+            store_time = best_time(
+                lambda: manager.dump_to_path(output_context, array, path),
+                iterations,
+            )
+            assert np.array_equal(_load(), array)
+            table.add_row(
+                "memory_map" if memory_map else "pickle",
+                f"{store_time:.4f}",
+                f"{best_time(_load, iterations):.4f}",
+                f"{best_time(lambda: _load().sum(), iterations):.4f}",
+            )
+
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.size_mb, args.iterations)
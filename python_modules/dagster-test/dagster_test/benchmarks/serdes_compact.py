@@ -0,0 +1,133 @@
+# ruff: noqa: T201
+import argparse
+import time
+from typing import Callable, Sequence
+
+from dagster import AssetKey, AssetMaterialization, In, Nothing, job, op
+from dagster._core.events import DagsterEvent, DagsterEventType, StepMaterializationData
+from dagster._core.events.log import EventLogEntry
+from dagster._core.snap import JobSnap
+from dagster._serdes import deserialize_value, serialize_value
+from rich.console import Console
+from rich.table import Table
+
+DESC = """
+Compare the size and (de)serialization time of the default JSON serdes format with the compact
+format written by `serialize_value(..., compact=True)`, for a `JobSnap` of a job with N ops arranged
+in a binary tree, and for a list of N asset materialization `EventLogEntry` objects.
+
+N is configurable via the `--num-objects` arg. Each operation is repeated `--iterations` times and
+the best time is reported.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="serdes_compact",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-objects",
+    type=int,
+    default=1000,
+    help="Set the number of ops in the job snapshot and the number of event log entries.",
+)
+
+parser.add_argument(
+    "--iterations",
+    type=int,
+    default=5,
+    help="Set the number of times each serialization and deserialization is repeated.",
+)
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+
+def get_job_snap(num_ops: int) -> JobSnap:
+    def make_op(i: int):
+        @op(name=f"op_{i}", ins={"start": In(Nothing)} if i > 0 else None)
+        def _op() -> None: ...
+
+        return _op
+
+    ops = [make_op(i) for i in range(num_ops)]
+
+    @job
+    def wide_job():
+        results = [ops[0]()]
+        for i in range(1, num_ops):
+            results.append(ops[i](start=results[(i - 1) // 2]))
+
+    return JobSnap.from_job_def(wide_job)
+
+
+def get_event_log_entries(num_events: int) -> Sequence[EventLogEntry]:
+    return [
+        EventLogEntry(
+            error_info=None,
+            level="debug",
+            user_message="",
+            run_id="b9a1f1ef-4e2d-4d43-9e5c-5a0e8f3a4f6e",
+            timestamp=1700000000.0 + i,
+            step_key=f"op_{i}",
+            job_name="wide_job",
+            dagster_event=DagsterEvent(
+                DagsterEventType.ASSET_MATERIALIZATION.value,
+                "wide_job",
+                step_key=f"op_{i}",
+                event_specific_data=StepMaterializationData(
+                    AssetMaterialization(
+                        asset_key=AssetKey(["prefix", f"asset_{i}"]),
+                        partition=str(i % 100),
+                        metadata={"row_count": i},
+                    )
+                ),
+            ),
+        )
+        for i in range(num_events)
+    ]
+
+
+def best_time(fn: Callable[[], object], iterations: int) -> float:
+    times = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_objects: int, iterations: int) -> None:
+    values = {
+        f"JobSnap ({num_objects} ops)": get_job_snap(num_objects),
+        f"EventLogEntry ({num_objects} entries)": get_event_log_entries(num_objects),
+    }
+
+    table = Table(title="Serdes formats", title_justify="left")
+    for column in ["Value", "Format", "Size (bytes)", "Serialize (s)", "Deserialize (s)"]:
+        table.add_column(column, justify="right")
+
+    for name, value in values.items():
+        for compact in [False, True]:
+            serialized = serialize_value(value, compact=compact)
+            assert deserialize_value(serialized) == value
+            table.add_row(
+                name,
+                "compact" if compact else "json",
+                str(len(serialized)),
+                f"{best_time(lambda: serialize_value(value, compact=compact), iterations):.4f}",
+                f"{best_time(lambda: deserialize_value(serialized), iterations):.4f}",
+            )
+
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_objects, args.iterations)
@@ -180,12 +180,21 @@ async def download_captured_logs_endpoint(self, request: Request):
             )
         else:
             location = compute_log_manager.get_captured_local_path(log_key, file_extension)
+            if not path.exists(location) and file_extension in ("out", "err"):
+                # the logs may have been compressed
+                location = compute_log_manager.get_captured_log_location(
+                    log_key,
+                    ComputeIOType.STDOUT if file_extension == "out" else ComputeIOType.STDERR,
+                )
 
         if not location or not path.exists(location):
             raise HTTPException(404, detail="No log files available for download")
 
         filebase = "__".join(log_key)
-        return FileResponse(location, filename=f"{filebase}.{file_extension}")
+        filename = f"{filebase}.{file_extension}"
+        if location.endswith(f".{file_extension}.gz"):
+            filename = f"{filename}.gz"
+        return FileResponse(location, filename=filename)
 
     async def report_asset_materialization_endpoint(self, request: Request) -> JSONResponse:
         context = self.make_request_context(request)
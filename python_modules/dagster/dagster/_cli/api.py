@@ -602,6 +602,29 @@ def _execute_step_command_body(
     ),
     envvar="DAGSTER_LAZY_LOAD_USER_CODE",
 )
+@click.option(
+    "--defer-definitions-loading",
+    is_flag=True,
+    required=False,
+    default=False,
+    help=(
+        "Start serving requests as soon as the code has been imported, and resolve each"
+        " repository's definitions when it is first requested (or in the background, see"
+        " --warm-up-definitions) instead of before the server starts. Reduces the startup time of"
+        " servers for code locations whose definitions are expensive to load."
+    ),
+    envvar="DAGSTER_DEFER_DEFINITIONS_LOADING",
+)
+@click.option(
+    "--warm-up-definitions/--no-warm-up-definitions",
+    required=False,
+    default=True,
+    help=(
+        "If --defer-definitions-loading is set, whether to load the deferred definitions in a"
+        " background thread once the server has started, rather than only when first requested."
+    ),
+    envvar="DAGSTER_WARM_UP_DEFINITIONS",
+)
 @python_origin_target_argument
 @click.option(
     "--use-python-environment-entry-point",
@@ -718,6 +741,8 @@ def grpc_command(
     instance_ref=None,
     inject_env_vars_from_instance: bool = False,
     enable_metrics: bool = False,
+    defer_definitions_loading: bool = False,
+    warm_up_definitions: bool = True,
     **kwargs: Any,
 ) -> None:
     check.invariant(heartbeat_timeout > 0, "heartbeat_timeout must be greater than 0")
@@ -812,6 +837,8 @@ def grpc_command(
         location_name=location_name,
         enable_metrics=enable_metrics,
         server_threadpool_executor=threadpool_executor,
+        defer_definitions_loading=defer_definitions_loading,
+        warm_up_definitions=warm_up_definitions,
     )
 
     server = DagsterGrpcServer(
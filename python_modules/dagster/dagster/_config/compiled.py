@@ -0,0 +1,397 @@
+"""Compiles ConfigTypes into closures that validate config values and resolve their defaults.
+
+The interpreted traversals in validate.py and post_process.py build a context and evaluation stack
+for every node they visit so that they can report where in a config value an error occurred. The
+compiled closures only determine whether a value is valid, and what it resolves to, so callers fall
+back to the interpreted traversals to report errors.
+
+Compiled closures are cached on the ConfigType they are compiled from, and are composed from the
+compiled closures of the ConfigTypes nested within it, so each ConfigType is only compiled once.
+Shapes, Permissives and Selectors are interned by key, so in practice this is once per config type
+key.
+"""
+
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+import dagster._check as check
+from dagster._config.config_type import ConfigScalarKind, ConfigType, ConfigTypeKind, Enum, Float
+
+if TYPE_CHECKING:
+    from dagster._config.field import Field
+
+ConfigValidator = Callable[[Any], Any]
+ConfigProcessor = Callable[[Any], Any]
+
+
+class _InvalidConfig:
+    def __repr__(self) -> str:
+        return "INVALID_CONFIG"
+
+
+# Returned by compiled validators in place of the validated value when a config value is invalid
+INVALID_CONFIG: Any = _InvalidConfig()
+
+# The post_process implementations whose output only depends on their input, so that the processed
+# default value of a field made up only of types that use them can be computed once and reused
+_PURE_POST_PROCESS_FNS = {ConfigType.post_process, Float.post_process, Enum.post_process}
+
+
+def compile_config_validator(config_type: ConfigType) -> ConfigValidator:
+    """Returns a function that returns the validated config value for a config value of the given
+    type, or INVALID_CONFIG if the config value is invalid. Equivalent to the success and value of
+    validate.validate_config.
+    """
+    kind = config_type.kind
+
+    if kind == ConfigTypeKind.NONEABLE:
+        inner_validator = config_type.inner_type.get_compiled_validator()  # type: ignore
+        return lambda config_value: (
+            config_value if config_value is None else inner_validator(config_value)
+        )
+    elif kind == ConfigTypeKind.ANY:
+        return lambda config_value: config_value
+    elif kind == ConfigTypeKind.SCALAR:
+        return _compile_scalar_validator(config_type)
+    elif kind == ConfigTypeKind.SELECTOR:
+        return _compile_selector_validator(config_type)
+    elif ConfigTypeKind.is_shape(kind):
+        return _compile_shape_validator(config_type)
+    elif kind == ConfigTypeKind.MAP:
+        return _compile_map_validator(config_type)
+    elif kind == ConfigTypeKind.ARRAY:
+        return _compile_array_validator(config_type)
+    elif kind == ConfigTypeKind.ENUM:
+        return _compile_enum_validator(config_type)
+    elif kind == ConfigTypeKind.SCALAR_UNION:
+        return _compile_scalar_union_validator(config_type)
+    else:
+        check.failed(f"Unsupported ConfigTypeKind {kind}")
+
+
+def _compile_scalar_validator(config_type: ConfigType) -> ConfigValidator:
+    from dagster._config.field_utils import EnvVar, IntEnvVar
+
+    scalar_kind = getattr(config_type, "scalar_kind", None)
+    if scalar_kind == ConfigScalarKind.INT:
+        is_valid = lambda value: isinstance(value, int) and not isinstance(value, bool)
+    elif scalar_kind == ConfigScalarKind.STRING:
+        # EnvVars are strs, but are only valid in structured config
+        is_valid = lambda value: isinstance(value, str) and not isinstance(
+            value, (EnvVar, IntEnvVar)
+        )
+    elif scalar_kind == ConfigScalarKind.BOOL:
+        is_valid = lambda value: isinstance(value, bool)
+    elif scalar_kind == ConfigScalarKind.FLOAT:
+        is_valid = lambda value: isinstance(value, (int, float))
+    else:
+        check.failed(f"Not a supported scalar {config_type.key}")
+
+    return lambda config_value: config_value if is_valid(config_value) else INVALID_CONFIG
+
+
+def _compile_selector_validator(config_type: ConfigType) -> ConfigValidator:
+    fields: Mapping[str, "Field"] = config_type.fields  # type: ignore
+    field_validators: Dict[str, Tuple[ConfigValidator, bool]] = {
+        name: (
+            field.config_type.get_compiled_validator(),
+            ConfigTypeKind.has_fields(field.config_type.kind),
+        )
+        for name, field in fields.items()
+    }
+    # an empty selector is valid if it has a single optional field
+    empty_is_valid = len(fields) == 1 and not next(iter(fields.values())).is_required
+
+    def _validate(config_value: Any) -> Any:
+        if config_value == {}:
+            return {} if empty_is_valid else INVALID_CONFIG
+        if not isinstance(config_value, dict) or len(config_value) != 1:
+            return INVALID_CONFIG
+
+        ((field_name, field_value),) = config_value.items()
+        if field_name not in field_validators:
+            return INVALID_CONFIG
+
+        field_validator, field_has_fields = field_validators[field_name]
+        # selecting a field without a value fills in the defaults of its fields
+        validated_value = field_validator(
+            {} if field_value is None and field_has_fields else field_value
+        )
+        if validated_value is INVALID_CONFIG:
+            return INVALID_CONFIG
+        return {field_name: validated_value}
+
+    return _validate
+
+
+def _compile_shape_validator(config_type: ConfigType) -> ConfigValidator:
+    fields: Mapping[str, "Field"] = config_type.fields  # type: ignore
+    field_aliases: Mapping[str, str] = getattr(config_type, "field_aliases", None) or {}
+    defined_field_names = set(fields) | set(field_aliases.values())
+    required_fields = [
+        (name, field_aliases.get(name)) for name, field in fields.items() if field.is_required
+    ]
+    field_validators = [
+        (name, field_aliases.get(name), field.config_type.get_compiled_validator())
+        for name, field in fields.items()
+    ]
+    check_for_extra_incoming_fields = config_type.kind == ConfigTypeKind.STRICT_SHAPE
+
+    def _validate(config_value: Any) -> Any:
+        if not isinstance(config_value, dict):
+            return INVALID_CONFIG
+        if check_for_extra_incoming_fields and not defined_field_names.issuperset(config_value):
+            return INVALID_CONFIG
+
+        for name, alias in required_fields:
+            if name not in config_value and (alias is None or alias not in config_value):
+                return INVALID_CONFIG
+
+        for name, alias, field_validator in field_validators:
+            if name in config_value:
+                if alias is not None and alias in config_value:
+                    return INVALID_CONFIG
+                if field_validator(config_value[name]) is INVALID_CONFIG:
+                    return INVALID_CONFIG
+            elif alias is not None and alias in config_value:
+                if field_validator(config_value[alias]) is INVALID_CONFIG:
+                    return INVALID_CONFIG
+
+        return config_value
+
+    return _validate
+
+
+def _compile_map_validator(config_type: ConfigType) -> ConfigValidator:
+    key_validator = config_type.key_type.get_compiled_validator()  # type: ignore
+    value_validator = config_type.inner_type.get_compiled_validator()  # type: ignore
+
+    def _validate(config_value: Any) -> Any:
+        if not isinstance(config_value, dict):
+            return INVALID_CONFIG
+        for key, value in config_value.items():
+            if key_validator(key) is INVALID_CONFIG or value_validator(value) is INVALID_CONFIG:
+                return INVALID_CONFIG
+        return config_value
+
+    return _validate
+
+
+def _compile_array_validator(config_type: ConfigType) -> ConfigValidator:
+    inner_validator = config_type.inner_type.get_compiled_validator()  # type: ignore
+
+    def _validate(config_value: Any) -> Any:
+        if not isinstance(config_value, list):
+            return INVALID_CONFIG
+        values = []
+        for item in config_value:
+            validated_item = inner_validator(item)
+            if validated_item is INVALID_CONFIG:
+                return INVALID_CONFIG
+            values.append(validated_item)
+        return values
+
+    return _validate
+
+
+def _compile_enum_validator(config_type: ConfigType) -> ConfigValidator:
+    valid_config_values = frozenset(config_type.config_values)  # type: ignore
+
+    return lambda config_value: (
+        config_value
+        if isinstance(config_value, str) and config_value in valid_config_values
+        else INVALID_CONFIG
+    )
+
+
+def _compile_scalar_union_validator(config_type: ConfigType) -> ConfigValidator:
+    scalar_validator = config_type.scalar_type.get_compiled_validator()  # type: ignore
+    non_scalar_validator = config_type.non_scalar_type.get_compiled_validator()  # type: ignore
+
+    def _validate(config_value: Any) -> Any:
+        if config_value is None:
+            return INVALID_CONFIG
+        if isinstance(config_value, (dict, list)):
+            return non_scalar_validator(config_value)
+        return scalar_validator(config_value)
+
+    return _validate
+
+
+def compile_config_processor(config_type: ConfigType) -> ConfigProcessor:
+    """Returns a function that fills in the defaults of a validated config value of the given type,
+    and post-processes it. Equivalent to the value of post_process.post_process_config. Raises if
+    post-processing fails, in which case callers fall back to post_process_config to report the
+    error.
+    """
+    resolve_defaults = _compile_defaults_resolver(config_type)
+    if type(config_type).post_process is ConfigType.post_process:
+        return resolve_defaults
+
+    post_process = config_type.post_process
+    return lambda config_value: post_process(resolve_defaults(config_value))
+
+
+def _compile_defaults_resolver(config_type: ConfigType) -> ConfigProcessor:
+    kind = config_type.kind
+
+    if kind in (ConfigTypeKind.SCALAR, ConfigTypeKind.ENUM, ConfigTypeKind.ANY):
+        return lambda config_value: config_value
+    elif kind == ConfigTypeKind.SELECTOR:
+        return _compile_selector_defaults_resolver(config_type)
+    elif ConfigTypeKind.is_shape(kind):
+        return _compile_shape_defaults_resolver(config_type)
+    elif kind == ConfigTypeKind.ARRAY:
+        return _compile_array_defaults_resolver(config_type)
+    elif kind == ConfigTypeKind.MAP:
+        return _compile_map_defaults_resolver(config_type)
+    elif kind == ConfigTypeKind.NONEABLE:
+        inner_processor = config_type.inner_type.get_compiled_processor()  # type: ignore
+        return lambda config_value: (
+            None if config_value is None else inner_processor(config_value)
+        )
+    elif kind == ConfigTypeKind.SCALAR_UNION:
+        scalar_processor = config_type.scalar_type.get_compiled_processor()  # type: ignore
+        non_scalar_processor = config_type.non_scalar_type.get_compiled_processor()  # type: ignore
+        return lambda config_value: (
+            non_scalar_processor(config_value)
+            if isinstance(config_value, (dict, list))
+            else scalar_processor(config_value)
+        )
+    else:
+        check.failed(f"Unsupported type {config_type.key}")
+
+
+def _copy_config_value(config_value: Any) -> Any:
+    if isinstance(config_value, dict):
+        return {key: _copy_config_value(value) for key, value in config_value.items()}
+    elif isinstance(config_value, list):
+        return [_copy_config_value(item) for item in config_value]
+    return config_value
+
+
+def _compile_default_value_processor(field: "Field") -> Optional[Callable[[], Any]]:
+    """Returns a function that returns the processed default value of the field, or None if the
+    field has no default value.
+    """
+    if not field.default_provided:
+        return None
+
+    processor = field.config_type.get_compiled_processor()
+    default_value = field.default_value
+    if not all(
+        type(config_type).post_process in _PURE_POST_PROCESS_FNS
+        for config_type in field.config_type.type_iterator()
+    ):
+        # e.g. StringSource defaults are read from the environment each time they are processed
+        return lambda: processor(default_value)
+
+    processed_default_value: List[Any] = []
+
+    def _get_processed_default_value() -> Any:
+        if not processed_default_value:
+            processed_default_value.append(processor(default_value))
+        # copied so that callers mutating the processed config don't change the cached default
+        return _copy_config_value(processed_default_value[0])
+
+    return _get_processed_default_value
+
+
+def _compile_selector_defaults_resolver(config_type: ConfigType) -> ConfigProcessor:
+    fields: Mapping[str, "Field"] = config_type.fields  # type: ignore
+    field_processors: Dict[str, Tuple[ConfigProcessor, bool]] = {
+        name: (
+            field.config_type.get_compiled_processor(),
+            ConfigTypeKind.has_fields(field.config_type.kind),
+        )
+        for name, field in fields.items()
+    }
+
+    def _resolve(config_value: Any) -> Any:
+        if config_value:
+            check.invariant(len(config_value) == 1)
+            ((field_name, field_value),) = config_value.items()
+        else:
+            check.invariant(len(fields) == 1)
+            ((field_name, field),) = fields.items()
+            field_value = field.default_value if field.default_provided else None
+
+        field_processor, field_has_fields = field_processors[field_name]
+        return {
+            field_name: field_processor(
+                {} if field_value is None and field_has_fields else field_value
+            )
+        }
+
+    return _resolve
+
+
+def _compile_shape_defaults_resolver(config_type: ConfigType) -> ConfigProcessor:
+    fields: Mapping[str, "Field"] = config_type.fields  # type: ignore
+    field_aliases: Mapping[str, str] = getattr(config_type, "field_aliases", None) or {}
+    field_processors = [
+        (
+            name,
+            field_aliases.get(name),
+            field.config_type.get_compiled_processor(),
+            _compile_default_value_processor(field),
+            field.is_required,
+        )
+        for name, field in fields.items()
+    ]
+    # for permissive shapes, fields that aren't defined are passed through as is
+    is_permissive = config_type.kind == ConfigTypeKind.PERMISSIVE_SHAPE
+
+    def _resolve(config_value: Any) -> Any:
+        config_value = check.opt_mapping_param(config_value, "config_value", key_type=str)
+
+        processed_fields = {}
+        for name, alias, field_processor, default_value_processor, is_required in field_processors:
+            if name in config_value:
+                processed_fields[name] = field_processor(config_value[name])
+            elif alias is not None and alias in config_value:
+                processed_fields[name] = field_processor(config_value[alias])
+            elif default_value_processor is not None:
+                processed_fields[name] = default_value_processor()
+            elif is_required:
+                check.failed("Missing required composite member not caught in validation")
+
+        if is_permissive:
+            processed_fields.update(
+                {name: value for name, value in config_value.items() if name not in fields}
+            )
+
+        return processed_fields
+
+    return _resolve
+
+
+def _compile_array_defaults_resolver(config_type: ConfigType) -> ConfigProcessor:
+    inner_type: ConfigType = config_type.inner_type  # type: ignore
+    inner_processor = inner_type.get_compiled_processor()
+    inner_is_noneable = inner_type.kind == ConfigTypeKind.NONEABLE
+
+    def _resolve(config_value: Any) -> Any:
+        if not config_value:
+            return []
+        if not inner_is_noneable and any(item is None for item in config_value):
+            check.failed("Null array member not caught in validation")
+        return [inner_processor(item) for item in config_value]
+
+    return _resolve
+
+
+def _compile_map_defaults_resolver(config_type: ConfigType) -> ConfigProcessor:
+    inner_type: ConfigType = config_type.inner_type  # type: ignore
+    inner_processor = inner_type.get_compiled_processor()
+    inner_is_noneable = inner_type.kind == ConfigTypeKind.NONEABLE
+
+    def _resolve(config_value: Any) -> Any:
+        if not config_value:
+            return {}
+        if any(key is None for key in config_value.keys()):
+            check.failed("Null map key not caught in validation")
+        if not inner_is_noneable and any(value is None for value in config_value.values()):
+            check.failed("Null map member not caught in validation")
+        return {key: inner_processor(value) for key, value in config_value.items()}
+
+    return _resolve
@@ -9,6 +9,7 @@
 from dagster._serdes import whitelist_for_serdes
 
 if TYPE_CHECKING:
+    from dagster._config.compiled import ConfigProcessor, ConfigValidator
     from dagster._config.snap import ConfigSchemaSnapshot, ConfigTypeSnap
 
 
@@ -78,6 +79,9 @@ def __init__(
 
         # memoized snap representation
         self._snap: Optional["ConfigTypeSnap"] = None
+        # memoized compiled validator and processor
+        self._compiled_validator: Optional["ConfigValidator"] = None
+        self._compiled_processor: Optional["ConfigProcessor"] = None
 
     @property
     def description(self) -> Optional[str]:
@@ -105,6 +109,22 @@ def get_snapshot(self) -> "ConfigTypeSnap":
 
         return self._snap
 
+    def get_compiled_validator(self) -> "ConfigValidator":
+        from dagster._config.compiled import compile_config_validator
+
+        if self._compiled_validator is None:
+            self._compiled_validator = compile_config_validator(self)
+
+        return self._compiled_validator
+
+    def get_compiled_processor(self) -> "ConfigProcessor":
+        from dagster._config.compiled import compile_config_processor
+
+        if self._compiled_processor is None:
+            self._compiled_processor = compile_config_processor(self)
+
+        return self._compiled_processor
+
     def type_iterator(self) -> Iterator["ConfigType"]:
         yield self
 
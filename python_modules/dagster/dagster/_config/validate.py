@@ -1,6 +1,7 @@
 from typing import Any, Dict, List, Mapping, Optional, Sequence, Set, TypeVar, cast
 
 import dagster._check as check
+from dagster._config.compiled import INVALID_CONFIG
 from dagster._config.config_type import ConfigScalarKind, ConfigType, ConfigTypeKind
 from dagster._config.errors import (
     EvaluationError,
@@ -56,6 +57,12 @@ def is_config_scalar_valid(config_type_snap: ConfigTypeSnap, config_value: objec
 def validate_config(config_schema: object, config_value: T) -> EvaluateValueResult[T]:
     config_type = check.inst(resolve_to_config_type(config_schema), ConfigType)
 
+    # the compiled validator is much faster for valid config, but doesn't report errors, so fall
+    # back to validating against the schema snapshot if the config is invalid
+    validated_value = config_type.get_compiled_validator()(config_value)
+    if validated_value is not INVALID_CONFIG:
+        return EvaluateValueResult.for_value(validated_value)
+
     return validate_config_from_snap(
         config_schema_snapshot=config_type.get_schema_snapshot(),
         config_type_key=config_type.key,
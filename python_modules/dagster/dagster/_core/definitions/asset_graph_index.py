@@ -0,0 +1,235 @@
+from array import array
+from functools import cached_property
+from typing import (
+    AbstractSet,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from dagster._core.definitions.asset_key import AssetKey
+from dagster._core.utils import toposort
+
+
+def _to_csr(adjacency_lists: Sequence[Sequence[int]]) -> Tuple[array, array]:
+    offsets = array("q", [0])
+    indices = array("q")
+    for adjacent in adjacency_lists:
+        indices.extend(adjacent)
+        offsets.append(len(indices))
+    return offsets, indices
+
+
+class AssetGraphIndex:
+    """A frozen representation of the dependencies between the assets in an asset graph, which
+    traversals can run over without hashing AssetKeys at every step.
+
+    Each asset key is interned to an integer index, and the parents and children of each asset are
+    stored as contiguous ranges of compressed sparse row (CSR) arrays. Topological levels, as well as
+    the set of ancestors and descendants of each asset, are computed on first use and cached. Sets of
+    assets are represented as bitsets, i.e. ints in which bit i is set if the asset with index i is
+    in the set.
+
+    Keys that are referenced as parents but are not themselves in the upstream mapping are included
+    with no parents, consistent with how `toposort` treats them.
+    """
+
+    def __init__(self, upstream: Mapping[AssetKey, AbstractSet[AssetKey]]):
+        keys: List[AssetKey] = list(upstream)
+        index_by_key: Dict[AssetKey, int] = {key: i for i, key in enumerate(keys)}
+        for parent_keys in upstream.values():
+            for parent_key in parent_keys:
+                if parent_key not in index_by_key:
+                    index_by_key[parent_key] = len(keys)
+                    keys.append(parent_key)
+
+        parent_lists: List[List[int]] = [[] for _ in keys]
+        child_lists: List[List[int]] = [[] for _ in keys]
+        for key, parent_keys in upstream.items():
+            i = index_by_key[key]
+            for parent_key in parent_keys:
+                parent = index_by_key[parent_key]
+                parent_lists[i].append(parent)
+                child_lists[parent].append(i)
+
+        self._upstream = upstream
+        self._keys = tuple(keys)
+        self._index_by_key = index_by_key
+        self._parent_offsets, self._parent_indices = _to_csr(parent_lists)
+        self._child_offsets, self._child_indices = _to_csr(child_lists)
+        self._ancestor_bitsets: Dict[int, int] = {}
+        self._descendant_bitsets: Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._index_by_key
+
+    @property
+    def keys(self) -> Sequence[AssetKey]:
+        return self._keys
+
+    def index_of(self, key: AssetKey) -> int:
+        return self._index_by_key[key]
+
+    def parent_indices(self, i: int) -> Sequence[int]:
+        """Returns the indices of the direct parents of the asset with index i, including i itself
+        if the asset depends on itself.
+        """
+        return self._parent_indices[self._parent_offsets[i] : self._parent_offsets[i + 1]]
+
+    def child_indices(self, i: int) -> Sequence[int]:
+        """Returns the indices of the direct children of the asset with index i, including i itself
+        if the asset depends on itself.
+        """
+        return self._child_indices[self._child_offsets[i] : self._child_offsets[i + 1]]
+
+    def has_self_dependency(self, i: int) -> bool:
+        return i in self.parent_indices(i)
+
+    @cached_property
+    def toposorted_levels(self) -> Sequence[Sequence[int]]:
+        """Returns the indices of the assets grouped into topological levels, such that each asset is
+        in the level after the latest level of any of its parents. Self-dependencies are ignored.
+        """
+        num_unsorted_parents = [
+            sum(1 for parent in self.parent_indices(i) if parent != i) for i in range(len(self))
+        ]
+        level = [i for i, num_parents in enumerate(num_unsorted_parents) if num_parents == 0]
+        levels: List[Sequence[int]] = []
+        num_sorted = 0
+        while level:
+            levels.append(level)
+            num_sorted += len(level)
+            next_level = []
+            for i in level:
+                for child in self.child_indices(i):
+                    if child == i:
+                        continue
+                    num_unsorted_parents[child] -= 1
+                    if num_unsorted_parents[child] == 0:
+                        next_level.append(child)
+            level = next_level
+
+        if num_sorted != len(self):
+            # raises the same CircularDependencyError that toposorting the upstream mapping does
+            toposort(self._upstream)
+        return levels
+
+    def ancestors_bitset(self, i: int) -> int:
+        """Returns a bitset of all nth-order parents of the asset with index i, not including i."""
+        return self._reachable_bitset(
+            i, self._parent_offsets, self._parent_indices, self._ancestor_bitsets
+        )
+
+    def descendants_bitset(self, i: int) -> int:
+        """Returns a bitset of all nth-order children of the asset with index i, not including i."""
+        return self._reachable_bitset(
+            i, self._child_offsets, self._child_indices, self._descendant_bitsets
+        )
+
+    def _reachable_bitset(
+        self, i: int, offsets: array, indices: array, cache: Dict[int, int]
+    ) -> int:
+        # toposorting first raises on cycles, which the traversal below would not terminate on
+        _ = self.toposorted_levels
+
+        # iterative post-order traversal so that deep graphs don't exceed the recursion limit
+        stack = [i]
+        while stack:
+            current = stack[-1]
+            if current in cache:
+                stack.pop()
+                continue
+
+            adjacent = [
+                other
+                for other in indices[offsets[current] : offsets[current + 1]]
+                if other != current
+            ]
+            pending = [other for other in adjacent if other not in cache]
+            if pending:
+                stack.extend(pending)
+                continue
+
+            bitset = 0
+            for other in adjacent:
+                bitset |= cache[other] | (1 << other)
+            cache[current] = bitset
+            stack.pop()
+
+        return cache[i]
+
+    def bitset_for_indices(self, indices: Iterable[int]) -> int:
+        packed = bytearray((len(self) + 7) // 8)
+        for i in indices:
+            packed[i >> 3] |= 1 << (i & 7)
+        return int.from_bytes(packed, "little")
+
+    def bitset_for_keys(self, keys: Iterable[AssetKey]) -> int:
+        """Returns a bitset of the given keys. Keys that are not in the graph are ignored."""
+        index_by_key = self._index_by_key
+        return self.bitset_for_indices(index_by_key[key] for key in keys if key in index_by_key)
+
+    def indices_for_bitset(self, bitset: int) -> Sequence[int]:
+        # the binary representation is reversed so that the character at position i is bit i
+        bits = bin(bitset)[:1:-1]
+        indices = []
+        i = bits.find("1")
+        while i != -1:
+            indices.append(i)
+            i = bits.find("1", i + 1)
+        return indices
+
+    def keys_for_bitset(self, bitset: int) -> Set[AssetKey]:
+        return {self._keys[i] for i in self.indices_for_bitset(bitset)}
+
+    def expand_bitset(self, bitset: int, *, upstream: bool, depth: Optional[int] = None) -> int:
+        """Returns a bitset of the assets in the given bitset, along with all assets that are at most
+        depth steps upstream or downstream of any of them. A depth of None is unlimited.
+        """
+        offsets, indices = (
+            (self._parent_offsets, self._parent_indices)
+            if upstream
+            else (self._child_offsets, self._child_indices)
+        )
+        frontier = self.indices_for_bitset(bitset)
+        visited = bytearray(len(self))
+        for i in frontier:
+            visited[i] = 1
+
+        reached = []
+        remaining_depth = depth
+        while frontier and (remaining_depth is None or remaining_depth > 0):
+            next_frontier = []
+            for current in frontier:
+                for other in indices[offsets[current] : offsets[current + 1]]:
+                    if not visited[other]:
+                        visited[other] = 1
+                        next_frontier.append(other)
+            reached.extend(next_frontier)
+            frontier = next_frontier
+            if remaining_depth is not None:
+                remaining_depth -= 1
+
+        return bitset | self.bitset_for_indices(reached)
+
+    def iterate_upstream_indices(self, i: int) -> Iterator[int]:
+        """Iterates breadth-first through the indices of all assets upstream of the asset with
+        index i. Includes i itself if it depends on itself.
+        """
+        visited = bytearray(len(self))
+        queue = [i]
+        for current in queue:
+            for parent in self.parent_indices(current):
+                if not visited[parent]:
+                    visited[parent] = 1
+                    queue.append(parent)
+                    yield parent
@@ -1,7 +1,7 @@
 import collections.abc
 import operator
 from abc import ABC, abstractmethod
-from functools import reduce
+from functools import lru_cache, reduce
 from typing import AbstractSet, Iterable, Optional, Sequence, Union, cast
 
 from typing_extensions import TypeAlias, TypeGuard
@@ -22,12 +22,7 @@
 from dagster._core.definitions.resolved_asset_deps import resolve_similar_asset_names
 from dagster._core.definitions.source_asset import SourceAsset
 from dagster._core.errors import DagsterInvalidSubsetError
-from dagster._core.selector.subset_selector import (
-    fetch_connected,
-    fetch_sinks,
-    fetch_sources,
-    parse_clause,
-)
+from dagster._core.selector.subset_selector import fetch_sources, parse_clause
 from dagster._record import copy, record
 from dagster._serdes.serdes import whitelist_for_serdes
 
@@ -50,6 +45,21 @@ def is_coercible_to_asset_selection(
     )
 
 
+@lru_cache(maxsize=256)
+def _parse_antlr_asset_selection(string: str, include_sources: bool) -> Optional["AssetSelection"]:
+    """Parses an asset selection string with the Antlr grammar, returning None if it can't be parsed.
+    Asset selections are immutable, so the parsed selection for a given string is shared.
+    """
+    from dagster._core.definitions.antlr_asset_selection.antlr_asset_selection import (
+        AntlrAssetSelectionParser,
+    )
+
+    try:
+        return AntlrAssetSelectionParser(string, include_sources).asset_selection
+    except:
+        return None
+
+
 class AssetSelection(ABC):
     """An AssetSelection defines a query over a set of assets and asset checks, normally all that are defined in a code location.
 
@@ -470,7 +480,7 @@ def resolve(
             check.iterable_param(all_assets, "all_assets", (AssetsDefinition, SourceAsset))
             asset_graph = AssetGraph.from_assets(all_assets)
 
-        return self.resolve_inner(asset_graph, allow_missing=allow_missing)
+        return asset_graph.resolve_asset_selection(self, allow_missing=allow_missing)
 
     @abstractmethod
     def resolve_inner(
@@ -495,14 +505,9 @@ def resolve_checks_inner(
 
     @classmethod
     def from_string(cls, string: str, include_sources=False) -> "AssetSelection":
-        from dagster._core.definitions.antlr_asset_selection.antlr_asset_selection import (
-            AntlrAssetSelectionParser,
-        )
-
-        try:
-            return AntlrAssetSelectionParser(string, include_sources).asset_selection
-        except:
-            pass
+        antlr_selection = _parse_antlr_asset_selection(string, include_sources)
+        if antlr_selection is not None:
+            return antlr_selection
         if string == "*":
             return cls.all()
 
@@ -825,7 +830,14 @@ def resolve_inner(
         self, asset_graph: BaseAssetGraph, allow_missing: bool
     ) -> AbstractSet[AssetKey]:
         selection = self.child.resolve_inner(asset_graph, allow_missing=allow_missing)
-        return fetch_sinks(asset_graph.asset_dep_graph, selection)
+        index = asset_graph.asset_graph_index
+        selection_bitset = index.bitset_for_keys(selection)
+        return {
+            asset_key
+            for asset_key in selection
+            if asset_key not in index
+            or not index.descendants_bitset(index.index_of(asset_key)) & selection_bitset
+        }
 
     def to_selection_str(self) -> str:
         return f"sinks({self.child.to_selection_str()})"
@@ -877,21 +889,8 @@ def resolve_inner(
         self, asset_graph: BaseAssetGraph, allow_missing: bool
     ) -> AbstractSet[AssetKey]:
         selection = self.child.resolve_inner(asset_graph, allow_missing=allow_missing)
-        return operator.sub(
-            reduce(
-                operator.or_,
-                [
-                    {asset_key}
-                    | fetch_connected(
-                        item=asset_key,
-                        graph=asset_graph.asset_dep_graph,
-                        direction="downstream",
-                        depth=self.depth,
-                    )
-                    for asset_key in selection
-                ],
-            ),
-            selection if not self.include_self else set(),
+        return _fetch_connected_within_depth(
+            selection, asset_graph, upstream=False, depth=self.depth, include_self=self.include_self
         )
 
     def to_selection_str(self) -> str:
@@ -1104,23 +1103,27 @@ def _fetch_all_upstream(
     depth: Optional[int] = None,
     include_self: bool = True,
 ) -> AbstractSet[AssetKey]:
-    return operator.sub(
-        reduce(
-            operator.or_,
-            [
-                {asset_key}
-                | fetch_connected(
-                    item=asset_key,
-                    graph=asset_graph.asset_dep_graph,
-                    direction="upstream",
-                    depth=depth,
-                )
-                for asset_key in selection
-            ],
-            set(),
-        ),
-        selection if not include_self else set(),
+    return _fetch_connected_within_depth(
+        selection, asset_graph, upstream=True, depth=depth, include_self=include_self
+    )
+
+
+def _fetch_connected_within_depth(
+    selection: AbstractSet[AssetKey],
+    asset_graph: BaseAssetGraph,
+    upstream: bool,
+    depth: Optional[int],
+    include_self: bool,
+) -> AbstractSet[AssetKey]:
+    """Returns the asset keys that are at most depth steps upstream or downstream of any of the
+    selected keys, traversing the whole selection at once over the asset graph index.
+    """
+    index = asset_graph.asset_graph_index
+    connected = index.keys_for_bitset(
+        index.expand_bitset(index.bitset_for_keys(selection), upstream=upstream, depth=depth)
     )
+    # keys that aren't in the graph have nothing connected to them, but are still selected
+    return connected | selection if include_self else connected - selection
 
 
 @whitelist_for_serdes
@@ -63,7 +63,9 @@ def _evaluate(sensor_def: "AutomationConditionSensorDefinition", context: Sensor
 
     return SensorResult(
         run_requests=run_requests,
-        cursor=asset_daemon_cursor_to_instigator_serialized_cursor(new_cursor),
+        cursor=asset_daemon_cursor_to_instigator_serialized_cursor(
+            new_cursor, compact=context.instance.auto_materialize_use_compact_cursors
+        ),
         automation_condition_evaluations=updated_evaluations,
     )
 
@@ -1,5 +1,6 @@
+import threading
 from abc import ABC, abstractmethod
-from collections import defaultdict, deque
+from collections import OrderedDict, defaultdict, deque
 from datetime import datetime
 from functools import cached_property, total_ordering
 from heapq import heapify, heappop, heappush
@@ -26,6 +27,7 @@
 
 import dagster._check as check
 from dagster._core.definitions.asset_check_spec import AssetCheckKey
+from dagster._core.definitions.asset_graph_index import AssetGraphIndex
 from dagster._core.definitions.asset_key import AssetKey, EntityKey, T_EntityKey
 from dagster._core.definitions.backfill_policy import BackfillPolicy
 from dagster._core.definitions.events import AssetKeyPartitionKey
@@ -50,6 +52,7 @@
 
 if TYPE_CHECKING:
     from dagster._core.definitions.asset_graph_subset import AssetGraphSubset
+    from dagster._core.definitions.asset_selection import AssetSelection
     from dagster._core.definitions.auto_materialize_policy import AutoMaterializePolicy
     from dagster._core.definitions.declarative_automation.automation_condition import (
         AutomationCondition,
@@ -225,6 +228,11 @@ def automation_condition(self) -> Optional["AutomationCondition[AssetCheckKey]"]
 
 T_AssetNode = TypeVar("T_AssetNode", bound=BaseAssetNode)
 
+# The maximum number of resolved asset selections cached per asset graph
+ASSET_SELECTION_CACHE_SIZE = 256
+
+_asset_selection_cache_lock = threading.Lock()
+
 
 class BaseAssetGraph(ABC, Generic[T_AssetNode]):
     _asset_nodes_by_key: Mapping[AssetKey, T_AssetNode]
@@ -263,6 +271,43 @@ def asset_dep_graph(self) -> DependencyGraph[AssetKey]:
             "downstream": {node.key: node.child_keys for node in self.asset_nodes},
         }
 
+    @cached_property
+    def asset_graph_index(self) -> AssetGraphIndex:
+        """An integer-indexed representation of the asset dependency graph, which traversals over
+        the asset keys in the graph run over.
+        """
+        return AssetGraphIndex(self.asset_dep_graph["upstream"])
+
+    @cached_property
+    def _resolved_asset_selections(
+        self,
+    ) -> "OrderedDict[Tuple[int, bool], Tuple[AssetSelection, AbstractSet[AssetKey]]]":
+        return OrderedDict()
+
+    def resolve_asset_selection(
+        self, selection: "AssetSelection", allow_missing: bool = False
+    ) -> AbstractSet[AssetKey]:
+        """Returns the set of asset keys in the graph that match the given selection.
+
+        Asset graphs and asset selections are immutable, so resolved selections are cached by the
+        identity of the selection. The cache is bounded, since many selections are only constructed
+        to be resolved once.
+        """
+        cache_key = (id(selection), allow_missing)
+        with _asset_selection_cache_lock:
+            cached = self._resolved_asset_selections.get(cache_key)
+            # the selection is held in the cache, so its id can't be reused by another object
+            if cached is not None and cached[0] is selection:
+                self._resolved_asset_selections.move_to_end(cache_key)
+                return set(cached[1])
+
+        resolved = frozenset(selection.resolve_inner(self, allow_missing=allow_missing))
+        with _asset_selection_cache_lock:
+            self._resolved_asset_selections[cache_key] = (selection, resolved)
+            if len(self._resolved_asset_selections) > ASSET_SELECTION_CACHE_SIZE:
+                self._resolved_asset_selections.popitem(last=False)
+        return set(resolved)
+
     @cached_property
     def entity_dep_graph(self) -> DependencyGraph[EntityKey]:
         return {
@@ -298,10 +343,11 @@ def toposorted_asset_keys(self) -> Sequence[AssetKey]:
         """Return topologically sorted asset keys in graph. Keys with the same topological level are
         sorted alphabetically to provide stability.
         """
+        keys = self.asset_graph_index.keys
         return [
             item
-            for items_in_level in toposort(self.asset_dep_graph["upstream"])
-            for item in sorted(items_in_level)
+            for level in self.asset_graph_index.toposorted_levels
+            for item in sorted(keys[i] for i in level)
         ]
 
     @cached_property
@@ -317,7 +363,8 @@ def toposorted_asset_keys_by_level(self) -> Sequence[AbstractSet[AssetKey]]:
         """Return topologically sorted asset keys grouped into sets containing keys of the same
         topological level.
         """
-        return [set(level) for level in toposort(self.asset_dep_graph["upstream"])]
+        keys = self.asset_graph_index.keys
+        return [{keys[i] for i in level} for level in self.asset_graph_index.toposorted_levels]
 
     @cached_property
     def unpartitioned_asset_keys(self) -> AbstractSet[AssetKey]:
@@ -388,18 +435,8 @@ def get_ancestor_asset_keys(
         self, asset_key: AssetKey, include_self: bool = False
     ) -> AbstractSet[AssetKey]:
         """Returns all nth-order dependencies of an asset."""
-        ancestors = set()
-        next_parents = self.get(asset_key).parent_keys - {asset_key}  # remove self-dependencies
-        while next_parents:
-            pending_next_parents = set()
-            for node_key in next_parents:
-                if node_key in ancestors:
-                    continue
-                ancestors.add(node_key)
-                pending_next_parents.update(self.get(node_key).parent_keys)
-
-            next_parents = pending_next_parents
-
+        index = self.asset_graph_index
+        ancestors = index.keys_for_bitset(index.ancestors_bitset(index.index_of(asset_key)))
         if include_self:
             ancestors.add(asset_key)
         return ancestors
@@ -608,15 +645,9 @@ def get_materializable_roots(self, asset_key: AssetKey) -> AbstractSet[AssetKey]
 
     def upstream_key_iterator(self, asset_key: AssetKey) -> Iterator[AssetKey]:
         """Iterates through all asset keys which are upstream of the given key."""
-        visited: Set[AssetKey] = set()
-        queue = deque([asset_key])
-        while queue:
-            current_key = queue.popleft()
-            for parent_key in self.get(current_key).parent_keys:
-                if parent_key not in visited:
-                    yield parent_key
-                    queue.append(parent_key)
-                    visited.add(parent_key)
+        index = self.asset_graph_index
+        for i in index.iterate_upstream_indices(index.index_of(asset_key)):
+            yield index.keys[i]
 
     @abstractmethod
     def get_execution_set_asset_and_check_keys(
@@ -648,15 +679,18 @@ def get_downstream_freshness_policies(
     def get_downstream_automation_conditions(
         self, *, asset_key: AssetKey
     ) -> Mapping["AutomationCondition", AbstractSet[AssetKey]]:
-        asset = self.get(asset_key)
+        index = self.asset_graph_index
+        i = index.index_of(asset_key)
+        descendants = index.descendants_bitset(i)
+        if index.has_self_dependency(i):
+            descendants |= 1 << i
+
         downstream_conditions = defaultdict(set)
-        for child_key in asset.child_keys:
-            child_policy = self.get(child_key).auto_materialize_policy
-            child_condition = child_policy.asset_condition if child_policy else None
-            if child_condition:
-                downstream_conditions[child_condition].add(child_key)
-            for c, aks in self.get_downstream_automation_conditions(asset_key=child_key).items():
-                downstream_conditions[c].update(aks)
+        for descendant_key in index.keys_for_bitset(descendants):
+            policy = self.get(descendant_key).auto_materialize_policy
+            condition = policy.asset_condition if policy else None
+            if condition:
+                downstream_conditions[condition].add(descendant_key)
         return downstream_conditions
 
     def bfs_filter_subsets(
@@ -676,16 +710,19 @@ def bfs_filter_subsets(
         """
         from dagster._core.definitions.asset_graph_subset import AssetGraphSubset
 
-        all_assets = set(initial_subset.asset_keys)
         check.invariant(
             len(initial_subset.asset_keys) == 1,
             "Multiple initial assets not yet supported",
         )
+        index = self.asset_graph_index
         initial_asset_key = next(iter(initial_subset.asset_keys))
-        queue = deque([initial_asset_key])
+        initial_i = index.index_of(initial_asset_key)
+        queue = deque([initial_i])
+        queued = bytearray(len(index))
+        queued[initial_i] = 1
 
-        queued_subsets_by_asset_key: Dict[AssetKey, Optional[PartitionsSubset]] = {
-            initial_asset_key: (
+        queued_subsets_by_index: Dict[int, Optional[PartitionsSubset]] = {
+            initial_i: (
                 initial_subset.get_partitions_subset(initial_asset_key, self)
                 if self.get(initial_asset_key).is_partitioned
                 else None
@@ -694,8 +731,9 @@ def bfs_filter_subsets(
         result = AssetGraphSubset()
 
         while len(queue) > 0:
-            asset_key = queue.popleft()
-            partitions_subset = queued_subsets_by_asset_key.get(asset_key)
+            i = queue.popleft()
+            asset_key = index.keys[i]
+            partitions_subset = queued_subsets_by_index.get(i)
 
             if condition_fn(asset_key, partitions_subset):
                 result |= AssetGraphSubset(
@@ -705,7 +743,8 @@ def bfs_filter_subsets(
                     ),
                 )
 
-                for child_key in self.get(asset_key).child_keys:
+                for child_i in index.child_indices(i):
+                    child_key = index.keys[child_i]
                     partition_mapping = self.get_partition_mapping(child_key, asset_key)
                     child_partitions_def = self.get(child_key).partitions_def
 
@@ -717,7 +756,7 @@ def bfs_filter_subsets(
                                     dynamic_partitions_store=dynamic_partitions_store,
                                 )
                             )
-                            queued_subsets_by_asset_key[child_key] = child_partitions_subset
+                            queued_subsets_by_index[child_i] = child_partitions_subset
                         else:
                             child_partitions_subset = (
                                 partition_mapping.get_downstream_partitions_for_partitions(
@@ -728,10 +767,8 @@ def bfs_filter_subsets(
                                     current_time=current_time,
                                 )
                             )
-                            prior_child_partitions_subset = queued_subsets_by_asset_key.get(
-                                child_key
-                            )
-                            queued_subsets_by_asset_key[child_key] = (
+                            prior_child_partitions_subset = queued_subsets_by_index.get(child_i)
+                            queued_subsets_by_index[child_i] = (
                                 child_partitions_subset
                                 if not prior_child_partitions_subset
                                 else child_partitions_subset | prior_child_partitions_subset
@@ -739,9 +776,9 @@ def bfs_filter_subsets(
                     else:
                         child_partitions_subset = None
 
-                    if child_key not in all_assets:
-                        queue.append(child_key)
-                        all_assets.add(child_key)
+                    if not queued[child_i]:
+                        queue.append(child_i)
+                        queued[child_i] = 1
 
         return result
 
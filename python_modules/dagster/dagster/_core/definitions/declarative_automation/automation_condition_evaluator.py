@@ -2,7 +2,7 @@
 import datetime
 import logging
 from collections import defaultdict
-from typing import TYPE_CHECKING, AbstractSet, Dict, Mapping, Optional, Sequence, Tuple
+from typing import TYPE_CHECKING, AbstractSet, Dict, Mapping, Optional, Sequence, Set, Tuple, Type
 
 from dagster._core.asset_graph_view.asset_graph_view import AssetGraphView, TemporalContext
 from dagster._core.asset_graph_view.entity_subset import EntitySubset
@@ -15,6 +15,11 @@
     AutomationResult,
 )
 from dagster._core.definitions.declarative_automation.automation_context import AutomationContext
+from dagster._core.definitions.declarative_automation.operands import (
+    ExecutionFailedAutomationCondition,
+    NewlyUpdatedCondition,
+    RunInProgressAutomationCondition,
+)
 from dagster._core.definitions.events import AssetKey
 from dagster._core.instance import DagsterInstance
 from dagster._time import get_current_datetime
@@ -23,6 +28,13 @@
     from dagster._utils.caching_instance_queryer import CachingInstanceQueryer
 
 
+def _get_condition_types(condition: AutomationCondition) -> AbstractSet[Type[AutomationCondition]]:
+    condition_types = {type(condition)}
+    for child in condition.children:
+        condition_types.update(_get_condition_types(child))
+    return condition_types
+
+
 class AutomationConditionEvaluator:
     def __init__(
         self,
@@ -101,6 +113,47 @@ def prefetch(self) -> None:
         )
         self.instance_queryer.prefetch_asset_records(self.asset_records_to_prefetch)
         self.logger.info("Done prefetching asset records.")
+        self.prefetch_for_conditions()
+
+    def prefetch_for_conditions(self) -> None:
+        """Batches together the per-asset queries that the conditions being evaluated are known to
+        make, based on the operands in their condition trees. Any value not prefetched here is
+        still queried for as needed during evaluation.
+        """
+        updated_asset_keys_by_cursor: Dict[Optional[int], Set[AssetKey]] = defaultdict(set)
+        run_status_asset_keys: Set[AssetKey] = set()
+        for key in self.entity_keys:
+            if not isinstance(key, AssetKey) or not self.asset_graph.has(key):
+                continue
+            condition = self.asset_graph.get(key).automation_condition or self.default_condition
+            if condition is None:
+                continue
+
+            condition_types = _get_condition_types(condition)
+            # conditions may be evaluated against the parents of the asset through dep operators
+            asset_keys = {key, *self.asset_graph.get(key).parent_keys}
+
+            previous_cursor = self.cursor.get_previous_condition_cursor(key)
+            if condition.has_rule_condition:
+                updated_asset_keys_by_cursor[
+                    previous_cursor.temporal_context.last_event_id if previous_cursor else None
+                ].update(asset_keys)
+            elif NewlyUpdatedCondition in condition_types and previous_cursor:
+                updated_asset_keys_by_cursor[previous_cursor.temporal_context.last_event_id].update(
+                    asset_keys
+                )
+
+            if condition_types & {
+                RunInProgressAutomationCondition,
+                ExecutionFailedAutomationCondition,
+            }:
+                run_status_asset_keys.update(asset_keys)
+
+        for cursor, asset_keys in updated_asset_keys_by_cursor.items():
+            self.instance_queryer.prefetch_latest_storage_ids_by_partition(
+                asset_keys, after_cursor=cursor
+            )
+        self.instance_queryer.prefetch_planned_materialization_runs(run_status_asset_keys)
 
     def evaluate(self) -> Tuple[Sequence[AutomationResult], Sequence[EntitySubset[EntityKey]]]:
         return asyncio.run(self.async_evaluate())
@@ -337,6 +337,8 @@ def _core_multiprocess_executor_creation(config: ExecutorConfig) -> "Multiproces
         retries=RetryMode.from_config(check.dict_elem(config, "retries")),  # type: ignore
         start_method=start_method,
         explicit_forkserver_preload=check.opt_list_elem(start_cfg, "preload_modules", of_type=str),
+        reuse_processes=bool(config.get("reuse_processes", False)),
+        max_steps_per_worker=check.opt_int_elem(config, "max_steps_per_worker"),
     )
 
 
@@ -389,6 +391,24 @@ def _core_multiprocess_executor_creation(config: ExecutorConfig) -> "Multiproces
                 "https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods."
             ),
         ),
+        "reuse_processes": Field(
+            bool,
+            default_value=False,
+            description=(
+                "Execute steps in a pool of long-lived worker processes instead of starting a new"
+                " process for each step. Workers keep imported modules and the loaded job"
+                " definition between steps, which reduces per-step start-up cost for jobs with"
+                " many small steps."
+            ),
+        ),
+        "max_steps_per_worker": Field(
+            Noneable(Int),
+            default_value=None,
+            description=(
+                "When `reuse_processes` is enabled, the number of steps a worker process executes"
+                " before it is replaced by a fresh process. By default, workers are not recycled."
+            ),
+        ),
         "retries": get_retries_config(),
     },
     description="Execute each step in an individual process.",
@@ -1,10 +1,14 @@
+import base64
 import copy
 import hashlib
 import json
+import zlib
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
+from itertools import compress
 from typing import (
     AbstractSet,
     Any,
@@ -16,6 +20,7 @@
     NamedTuple,
     Optional,
     Sequence,
+    Tuple,
     Type,
     Union,
     cast,
@@ -41,6 +46,7 @@
 from dagster._core.instance import DagsterInstance, DynamicPartitionsStore
 from dagster._core.storage.tags import PARTITION_NAME_TAG, PARTITION_SET_TAG
 from dagster._serdes import whitelist_for_serdes
+from dagster._serdes.serdes import NamedTupleSerializer
 from dagster._utils import xor
 from dagster._utils.cached_method import cached_method
 from dagster._utils.tags import normalize_tags
@@ -338,6 +344,16 @@ def __init__(self, partition_keys: Sequence[str]):
 
         self._partition_keys = partition_keys
 
+    @property
+    def partitions_subset_class(self) -> Type["PartitionsSubset"]:
+        return BitmapPartitionsSubset
+
+    @cached_property
+    def partition_key_index(self) -> "PartitionKeyIndex":
+        return PartitionKeyIndex(
+            self._partition_keys, partitions_def_unique_id=self.get_serializable_unique_identifier()
+        )
+
     @public
     def get_partition_keys(
         self,
@@ -475,6 +491,16 @@ def __new__(
             name=check.opt_str_param(name, "name"),
         )
 
+    @property
+    def partitions_subset_class(self) -> Type["PartitionsSubset"]:
+        return BitmapPartitionsSubset
+
+    @cached_property
+    def partition_key_index(self) -> "PartitionKeyIndex":
+        # The partition keys of a dynamic partitions definition are only known to the dynamic
+        # partitions store, so each subset extends this empty index with the keys added to it.
+        return PartitionKeyIndex([], partitions_def_unique_id=None)
+
     def _validated_name(self) -> str:
         if self.name is None:
             check.failed(
@@ -1107,17 +1133,24 @@ def __new__(
         check.opt_set_param(subset, "subset")
         return super(DefaultPartitionsSubset, cls).__new__(cls, subset or set())
 
+    @property
+    def is_empty(self) -> bool:
+        return not self.subset
+
     def get_partition_keys_not_in_subset(
         self,
         partitions_def: PartitionsDefinition,
         current_time: Optional[datetime] = None,
         dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
     ) -> Iterable[str]:
-        return set(
-            partitions_def.get_partition_keys(
+        subset = self.subset
+        return {
+            partition_key
+            for partition_key in partitions_def.get_partition_keys(
                 current_time=current_time, dynamic_partitions_store=dynamic_partitions_store
             )
-        ) - set(self.subset)
+            if partition_key not in subset
+        }
 
     def get_partition_keys(self) -> Iterable[str]:
         return self.subset
@@ -1151,9 +1184,35 @@ def get_partition_key_ranges(
 
     def with_partition_keys(self, partition_keys: Iterable[str]) -> "DefaultPartitionsSubset":
         return DefaultPartitionsSubset(
-            self.subset | set(partition_keys),
+            self.subset.union(partition_keys),
         )
 
+    # Set algebra between two DefaultPartitionsSubsets operates on the underlying sets directly,
+    # rather than materializing and re-hashing the partition keys of both operands.
+
+    def __or__(self, other: "PartitionsSubset") -> "PartitionsSubset":
+        if isinstance(other, DefaultPartitionsSubset):
+            if self is other or not other.subset:
+                return self
+            if not self.subset:
+                return other
+            return DefaultPartitionsSubset(self.subset | other.subset)
+        return super().__or__(other)
+
+    def __sub__(self, other: "PartitionsSubset") -> "PartitionsSubset":
+        if isinstance(other, DefaultPartitionsSubset):
+            if not other.subset:
+                return self
+            return DefaultPartitionsSubset(self.subset - other.subset)
+        return super().__sub__(other)
+
+    def __and__(self, other: "PartitionsSubset") -> "PartitionsSubset":
+        if isinstance(other, DefaultPartitionsSubset):
+            if self is other:
+                return self
+            return DefaultPartitionsSubset(self.subset & other.subset)
+        return super().__and__(other)
+
     def serialize(self) -> str:
         # Serialize version number, so attempting to deserialize old versions can be handled gracefully.
         # Any time the serialization format changes, we should increment the version number.
@@ -1200,6 +1259,8 @@ def can_deserialize(
         )
 
     def __eq__(self, other: object) -> bool:
+        if isinstance(other, BitmapPartitionsSubset):
+            return other == self
         return isinstance(other, DefaultPartitionsSubset) and self.subset == other.subset
 
     def __len__(self) -> int:
@@ -1218,6 +1279,388 @@ def empty_subset(
         return cls()
 
 
+# number of set bits in each byte value, used to count the partitions in a bitmap
+_BYTE_POPCOUNTS = bytes(bin(byte).count("1") for byte in range(256))
+# maps the ascii binary digits "0" and "1" to the bytes 0 and 1
+_BINARY_DIGIT_SELECTORS = bytes.maketrans(b"01", b"\x00\x01")
+
+
+class PartitionKeyIndex:
+    """Assigns an ordinal to each partition key of a static or dynamic partitions definition, so
+    that subsets of its partitions can be represented as bitmaps over those ordinals.
+
+    The keys of the partitions definition are assigned ordinals in order. An index is never
+    modified: a subset that needs keys the index does not have gets a new index that extends it,
+    with the new keys assigned ordinals past the existing ones. Bitmaps built against an index are
+    therefore also valid against every index that extends it.
+    """
+
+    def __init__(
+        self,
+        partition_keys: Sequence[str],
+        partitions_def_unique_id: Optional[str],
+        base: Optional["PartitionKeyIndex"] = None,
+    ):
+        self._partition_keys: Tuple[str, ...] = tuple(partition_keys)
+        self._ordinals: Dict[str, int] = {
+            partition_key: ordinal for ordinal, partition_key in enumerate(self._partition_keys)
+        }
+        self._base = base
+        # Bitmaps only reference keys of the partitions definition below this ordinal, and can only
+        # be serialized against its unique id if it is stable across processes.
+        if base is None:
+            self.partitions_def_keys: Sequence[str] = partition_keys
+            self.num_partitions_def_keys = len(self._partition_keys)
+        else:
+            self.partitions_def_keys = base.partitions_def_keys
+            self.num_partitions_def_keys = base.num_partitions_def_keys
+        self.partitions_def_unique_id = partitions_def_unique_id
+
+    def get_ordinal(self, partition_key: str) -> Optional[int]:
+        return self._ordinals.get(partition_key)
+
+    def extends(self, other: "PartitionKeyIndex") -> bool:
+        """Whether bitmaps built against the other index are also valid against this one."""
+        index = self
+        while index is not None:
+            if index is other:
+                return True
+            index = index._base  # noqa: SLF001
+        return False
+
+    def with_keys(self, partition_keys: Iterable[str]) -> "PartitionKeyIndex":
+        new_partition_keys = [
+            partition_key for partition_key in partition_keys if partition_key not in self._ordinals
+        ]
+        if not new_partition_keys:
+            return self
+        return PartitionKeyIndex(
+            [*self._partition_keys, *dict.fromkeys(new_partition_keys)],
+            partitions_def_unique_id=self.partitions_def_unique_id,
+            base=self,
+        )
+
+    def bitmap_for_keys(self, partition_keys: Iterable[str]) -> bytes:
+        ordinals = [self._ordinals[partition_key] for partition_key in partition_keys]
+        if not ordinals:
+            return b""
+        bitmap = bytearray(max(ordinals) // 8 + 1)
+        for ordinal in ordinals:
+            bitmap[ordinal >> 3] |= 1 << (ordinal & 7)
+        return bytes(bitmap)
+
+    def keys_for_bitmap(self, bitmap: bytes) -> Sequence[str]:
+        # The binary representation of the bitmap, least significant bit first, is translated to
+        # one 0 or 1 byte per ordinal and used to select the keys, so no bit is tested in python.
+        selectors = (
+            format(int.from_bytes(bitmap, "little"), "b")[::-1]
+            .encode("ascii")
+            .translate(_BINARY_DIGIT_SELECTORS)
+        )
+        return list(compress(self._partition_keys, selectors))
+
+
+def bitmap_to_int(bitmap: bytes) -> int:
+    return int.from_bytes(bitmap, "little")
+
+
+def bitmap_from_int(value: int) -> bytes:
+    # trailing zero bytes are dropped, so that equal subsets have identical bitmaps
+    return value.to_bytes((value.bit_length() + 7) // 8, "little")
+
+
+class BitmapPartitionsSubsetSerializer(NamedTupleSerializer):
+    # BitmapPartitionsSubsets are stored as the DefaultPartitionsSubset of their partition keys, as
+    # their ordinals are only meaningful to the process that assigned them. This also keeps them
+    # readable by older versions of dagster.
+    def get_storage_name(self) -> str:
+        return DefaultPartitionsSubset.__name__
+
+    def object_as_mapping(self, value: "BitmapPartitionsSubset") -> Mapping[str, Any]:
+        return {"subset": value.get_partition_keys()}
+
+
+@whitelist_for_serdes(serializer=BitmapPartitionsSubsetSerializer)
+class BitmapPartitionsSubset(
+    NamedTuple(
+        "_BitmapPartitionsSubset",
+        [("partition_key_index", PartitionKeyIndex), ("bitmap", bytes)],
+    ),
+    PartitionsSubset,
+):
+    """A subset of the partitions of a static or dynamic partitions definition, represented as a
+    bitmap over the ordinals its PartitionKeyIndex assigns to partition keys. Set operations between
+    subsets of the same partitions definition, and counting the partitions in a subset, operate on
+    the bitmaps rather than on the partition keys.
+
+    When serialized with serdes, it is stored as a DefaultPartitionsSubset. Its `serialize` method
+    falls back to the key-based format of DefaultPartitionsSubset when the ordinals are not stable
+    across processes.
+    """
+
+    # Every time we change the serialization format, we should increment the version number.
+    # Version 1 is the key-based format of DefaultPartitionsSubset, which can also be deserialized.
+    SERIALIZATION_VERSION = 2
+
+    def __new__(cls, partition_key_index: PartitionKeyIndex, bitmap: bytes = b""):
+        return super(BitmapPartitionsSubset, cls).__new__(
+            cls,
+            partition_key_index=check.inst_param(
+                partition_key_index, "partition_key_index", PartitionKeyIndex
+            ),
+            bitmap=check.inst_param(bitmap, "bitmap", bytes),
+        )
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.bitmap
+
+    def _with_bitmap(self, bitmap: bytes) -> "BitmapPartitionsSubset":
+        return BitmapPartitionsSubset(self.partition_key_index, bitmap)
+
+    def _get_aligned_bitmaps(self, other: PartitionsSubset) -> Tuple[PartitionKeyIndex, int, int]:
+        """Returns an index that both subsets can be represented against, along with the bitmaps of
+        this subset and the other subset against it.
+        """
+        index = self.partition_key_index
+        if isinstance(other, BitmapPartitionsSubset):
+            if other.partition_key_index.extends(index):
+                return (
+                    other.partition_key_index,
+                    bitmap_to_int(self.bitmap),
+                    bitmap_to_int(other.bitmap),
+                )
+            if index.extends(other.partition_key_index):
+                return index, bitmap_to_int(self.bitmap), bitmap_to_int(other.bitmap)
+
+        other_partition_keys = other.get_partition_keys()
+        index = index.with_keys(other_partition_keys)
+        return (
+            index,
+            bitmap_to_int(self.bitmap),
+            bitmap_to_int(index.bitmap_for_keys(other_partition_keys)),
+        )
+
+    def _ordinals_match_partition_keys(self, partition_keys: Sequence[str]) -> bool:
+        # whether the partition keys of a partitions definition are the keys with the first ordinals
+        # of this subset's index, in order, so that its bitmap can be used to select from them
+        index = self.partition_key_index
+        return (
+            index.partitions_def_unique_id is not None
+            and partition_keys is index.partitions_def_keys
+        ) or (
+            len(partition_keys) <= index.num_partitions_def_keys
+            and all(
+                index.get_ordinal(partition_key) == ordinal
+                for ordinal, partition_key in enumerate(partition_keys)
+            )
+        )
+
+    def get_partition_keys_not_in_subset(
+        self,
+        partitions_def: PartitionsDefinition,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> Iterable[str]:
+        partition_keys = partitions_def.get_partition_keys(
+            current_time=current_time, dynamic_partitions_store=dynamic_partitions_store
+        )
+        if self._ordinals_match_partition_keys(partition_keys):
+            all_partitions_bitmap = (1 << len(partition_keys)) - 1
+            return set(
+                self.partition_key_index.keys_for_bitmap(
+                    bitmap_from_int(all_partitions_bitmap & ~bitmap_to_int(self.bitmap))
+                )
+            )
+        return {partition_key for partition_key in partition_keys if partition_key not in self}
+
+    def get_partition_keys(self) -> AbstractSet[str]:
+        return set(self.partition_key_index.keys_for_bitmap(self.bitmap))
+
+    def get_partition_key_ranges(
+        self,
+        partitions_def: PartitionsDefinition,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> Sequence[PartitionKeyRange]:
+        partition_keys = partitions_def.get_partition_keys(
+            current_time, dynamic_partitions_store=dynamic_partitions_store
+        )
+        if not self._ordinals_match_partition_keys(partition_keys):
+            return DefaultPartitionsSubset(set(self.get_partition_keys())).get_partition_key_ranges(
+                partitions_def, current_time, dynamic_partitions_store
+            )
+
+        # runs of set bits over the ordinals of the partitions definition's keys
+        bits = format(bitmap_to_int(self.bitmap), "b")[::-1][: len(partition_keys)]
+        result = []
+        start = bits.find("1")
+        while start != -1:
+            end = bits.find("0", start)
+            if end == -1:
+                end = len(bits)
+            result.append(PartitionKeyRange(partition_keys[start], partition_keys[end - 1]))
+            start = bits.find("1", end)
+        return result
+
+    def with_partition_keys(self, partition_keys: Iterable[str]) -> "BitmapPartitionsSubset":
+        partition_keys = list(partition_keys)
+        index = self.partition_key_index.with_keys(partition_keys)
+        added_bitmap = index.bitmap_for_keys(partition_keys)
+        if not added_bitmap:
+            return self
+        return BitmapPartitionsSubset(
+            index, bitmap_from_int(bitmap_to_int(self.bitmap) | bitmap_to_int(added_bitmap))
+        )
+
+    def __or__(self, other: "PartitionsSubset") -> "PartitionsSubset":
+        if self is other or other.is_empty:
+            return self
+        if self.is_empty or isinstance(other, AllPartitionsSubset):
+            return other
+        index, bitmap, other_bitmap = self._get_aligned_bitmaps(other)
+        return BitmapPartitionsSubset(index, bitmap_from_int(bitmap | other_bitmap))
+
+    def __sub__(self, other: "PartitionsSubset") -> "PartitionsSubset":
+        if self is other:
+            return self._with_bitmap(b"")
+        if other.is_empty or self.is_empty:
+            return self
+        if isinstance(other, AllPartitionsSubset):
+            return self._with_bitmap(b"")
+        index, bitmap, other_bitmap = self._get_aligned_bitmaps(other)
+        return BitmapPartitionsSubset(index, bitmap_from_int(bitmap & ~other_bitmap))
+
+    def __and__(self, other: "PartitionsSubset") -> "PartitionsSubset":
+        if self is other or self.is_empty:
+            return self
+        if other.is_empty:
+            return self._with_bitmap(b"")
+        if isinstance(other, AllPartitionsSubset):
+            return self
+        index, bitmap, other_bitmap = self._get_aligned_bitmaps(other)
+        return BitmapPartitionsSubset(index, bitmap_from_int(bitmap & other_bitmap))
+
+    def serialize(self) -> str:
+        index = self.partition_key_index
+        if index.partitions_def_unique_id is None or (
+            bitmap_to_int(self.bitmap) >> index.num_partitions_def_keys
+        ):
+            # The ordinals are only meaningful to this process, or the subset contains keys that
+            # are not in the partitions definition, so the subset is serialized by key instead.
+            return DefaultPartitionsSubset(set(self.get_partition_keys())).serialize()
+
+        return json.dumps(
+            {
+                "version": self.SERIALIZATION_VERSION,
+                "partitions_def_id": index.partitions_def_unique_id,
+                "bitmap": base64.b64encode(zlib.compress(self.bitmap)).decode("ascii"),
+            }
+        )
+
+    @classmethod
+    def from_serialized(
+        cls, partitions_def: PartitionsDefinition, serialized: str
+    ) -> "PartitionsSubset":
+        data = json.loads(serialized)
+        if (
+            isinstance(data, list)
+            or data.get("version") == DefaultPartitionsSubset.SERIALIZATION_VERSION
+        ):
+            return cls.empty_subset(partitions_def).with_partition_keys(
+                DefaultPartitionsSubset.from_serialized(
+                    partitions_def, serialized
+                ).get_partition_keys()
+            )
+
+        if data.get("version") != cls.SERIALIZATION_VERSION:
+            raise DagsterInvalidDeserializationVersionError(
+                f"Attempted to deserialize partition subset with version {data.get('version')},"
+                f" but only versions {DefaultPartitionsSubset.SERIALIZATION_VERSION} and"
+                f" {cls.SERIALIZATION_VERSION} are supported."
+            )
+
+        index = cls._get_partition_key_index(partitions_def)
+        if data.get("partitions_def_id") != index.partitions_def_unique_id:
+            raise DagsterInvalidDeserializationVersionError(
+                "Attempted to deserialize a partition subset of a partitions definition that has"
+                " since changed."
+            )
+        return cls(index, zlib.decompress(base64.b64decode(data["bitmap"])))
+
+    @classmethod
+    def can_deserialize(
+        cls,
+        partitions_def: PartitionsDefinition,
+        serialized: str,
+        serialized_partitions_def_unique_id: Optional[str],
+        serialized_partitions_def_class_name: Optional[str],
+    ) -> bool:
+        if (
+            serialized_partitions_def_class_name is not None
+            and serialized_partitions_def_class_name != partitions_def.__class__.__name__
+        ):
+            return False
+
+        data = json.loads(serialized)
+        if isinstance(data, list):
+            return True
+        if data.get("version") == DefaultPartitionsSubset.SERIALIZATION_VERSION:
+            return data.get("subset") is not None
+        # bitmaps can only be read against the partitions definition they were serialized with
+        return (
+            data.get("version") == cls.SERIALIZATION_VERSION
+            and data.get("partitions_def_id")
+            == cls._get_partition_key_index(partitions_def).partitions_def_unique_id
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, BitmapPartitionsSubset) and (
+            other.partition_key_index.extends(self.partition_key_index)
+            or self.partition_key_index.extends(other.partition_key_index)
+        ):
+            return self.bitmap == other.bitmap
+        return isinstance(other, (BitmapPartitionsSubset, DefaultPartitionsSubset)) and set(
+            self.get_partition_keys()
+        ) == set(other.get_partition_keys())
+
+    def __len__(self) -> int:
+        return sum(self.bitmap.translate(_BYTE_POPCOUNTS))
+
+    def __contains__(self, value) -> bool:
+        ordinal = self.partition_key_index.get_ordinal(value)
+        return (
+            ordinal is not None
+            and (ordinal >> 3) < len(self.bitmap)
+            and bool(self.bitmap[ordinal >> 3] & (1 << (ordinal & 7)))
+        )
+
+    def __repr__(self) -> str:
+        return f"BitmapPartitionsSubset(subset={set(self.get_partition_keys())})"
+
+    @staticmethod
+    def _get_partition_key_index(
+        partitions_def: Optional[PartitionsDefinition],
+    ) -> PartitionKeyIndex:
+        if not isinstance(
+            partitions_def, (StaticPartitionsDefinition, DynamicPartitionsDefinition)
+        ):
+            check.failed(
+                "Partitions definition must be a StaticPartitionsDefinition or"
+                " DynamicPartitionsDefinition"
+            )
+        return partitions_def.partition_key_index
+
+    @classmethod
+    def empty_subset(
+        cls, partitions_def: Optional[PartitionsDefinition] = None
+    ) -> "BitmapPartitionsSubset":
+        return cls(cls._get_partition_key_index(partitions_def))
+
+    def to_serializable_subset(self) -> PartitionsSubset:
+        return DefaultPartitionsSubset(set(self.get_partition_keys()))
+
+
 class AllPartitionsSubset(
     NamedTuple(
         "_AllPartitionsSubset",
@@ -1301,6 +1744,14 @@ def __sub__(self, other: "PartitionsSubset") -> "PartitionsSubset":
             return self.partitions_def.empty_subset()
         elif isinstance(other, TimeWindowPartitionsSubset):
             return TimeWindowPartitionsSubset.from_all_partitions_subset(self) - other
+        elif isinstance(other, BitmapPartitionsSubset):
+            return (
+                self.partitions_def.subset_with_all_partitions(
+                    current_time=self.current_time,
+                    dynamic_partitions_store=self.dynamic_partitions_store,
+                )
+                - other
+            )
         return self.partitions_def.empty_subset().with_partition_keys(
             set(self.get_partition_keys()).difference(set(other.get_partition_keys()))
         )
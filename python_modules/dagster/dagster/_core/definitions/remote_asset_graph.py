@@ -49,6 +49,7 @@
 from dagster._utils.cached_method import cached_method
 
 if TYPE_CHECKING:
+    from dagster._core.remote_representation.code_location import CodeLocation
     from dagster._core.remote_representation.external_data import AssetCheckNodeSnap, AssetNodeSnap
 
 
@@ -564,9 +565,13 @@ def __init__(
         self,
         remote_asset_nodes_by_key: Mapping[AssetKey, RemoteWorkspaceAssetNode],
         remote_asset_check_nodes_by_key: Mapping[AssetCheckKey, RemoteAssetCheckNode],
+        location_asset_infos_by_location_name: Optional[Mapping[str, "LocationAssetInfos"]] = None,
     ):
         self._remote_asset_nodes_by_key = remote_asset_nodes_by_key
         self._remote_asset_check_nodes_by_key = remote_asset_check_nodes_by_key
+        # the contribution of each code location to the graph, used to update the graph when
+        # only some of the code locations in the workspace change
+        self._location_asset_infos_by_location_name = location_asset_infos_by_location_name
 
     @property
     def remote_asset_nodes_by_key(self) -> Mapping[AssetKey, RemoteWorkspaceAssetNode]:
@@ -620,21 +625,114 @@ def split_entity_keys_by_repository(
     @classmethod
     def build(cls, workspace: WorkspaceSnapshot):
         # Combine repository scoped asset graphs with additional context to form the global graph
-
-        code_locations = (
-            location_entry.code_location
-            for location_entry in workspace.code_location_entries.values()
+        location_asset_infos_by_location_name = {
+            location_name: LocationAssetInfos.build(location_entry.code_location)
+            for location_name, location_entry in workspace.code_location_entries.items()
             if location_entry.code_location
+        }
+
+        asset_nodes_by_key = {}
+        nodes_with_multiple = []
+        for key, asset_infos in _merge_asset_infos_by_key(
+            location_asset_infos_by_location_name.values()
+        ).items():
+            node = RemoteWorkspaceAssetNode(
+                repo_scoped_asset_infos=asset_infos,
+            )
+            asset_nodes_by_key[key] = node
+            if len(asset_infos) > 1:
+                nodes_with_multiple.append(node)
+
+        _warn_on_duplicate_nodes(nodes_with_multiple)
+
+        return cls(
+            remote_asset_nodes_by_key=asset_nodes_by_key,
+            remote_asset_check_nodes_by_key=_merge_asset_checks_by_key(
+                location_asset_infos_by_location_name.values()
+            ),
+            location_asset_infos_by_location_name=location_asset_infos_by_location_name,
         )
-        repos = (
-            repo
-            for code_location in code_locations
-            for repo in code_location.get_repositories().values()
+
+    def with_updated_code_locations(
+        self, workspace: WorkspaceSnapshot, location_names: AbstractSet[str]
+    ) -> "RemoteWorkspaceAssetGraph":
+        """Returns the asset graph for the given workspace, which differs from the workspace this
+        graph was built from only in the given code locations (which may have been added, removed,
+        or reloaded).
+
+        Only the nodes for asset keys that are defined in the changed code locations, before or
+        after the change, are rebuilt. The nodes of all other asset keys are shared with this graph.
+        """
+        if self._location_asset_infos_by_location_name is None:
+            return RemoteWorkspaceAssetGraph.build(workspace)
+
+        location_asset_infos_by_location_name: Dict[str, LocationAssetInfos] = {}
+        changed_keys: Set[AssetKey] = set()
+        for location_name, location_entry in workspace.code_location_entries.items():
+            if location_name not in location_names:
+                if location_name in self._location_asset_infos_by_location_name:
+                    location_asset_infos_by_location_name[location_name] = (
+                        self._location_asset_infos_by_location_name[location_name]
+                    )
+                else:
+                    check.invariant(
+                        location_entry.code_location is None,
+                        f"Code location {location_name} is not in the asset graph, but was not"
+                        " marked as changed",
+                    )
+            elif location_entry.code_location:
+                location_asset_infos = LocationAssetInfos.build(location_entry.code_location)
+                location_asset_infos_by_location_name[location_name] = location_asset_infos
+                changed_keys.update(location_asset_infos.asset_infos_by_key.keys())
+
+        for location_name in location_names:
+            previous_location_asset_infos = self._location_asset_infos_by_location_name.get(
+                location_name
+            )
+            if previous_location_asset_infos:
+                changed_keys.update(previous_location_asset_infos.asset_infos_by_key.keys())
+
+        asset_nodes_by_key = {
+            key: node
+            for key, node in self.remote_asset_nodes_by_key.items()
+            if key not in changed_keys
+        }
+        nodes_with_multiple = []
+        for key, asset_infos in _merge_asset_infos_by_key(
+            location_asset_infos_by_location_name.values(), keys=changed_keys
+        ).items():
+            node = RemoteWorkspaceAssetNode(
+                repo_scoped_asset_infos=asset_infos,
+            )
+            asset_nodes_by_key[key] = node
+            if len(asset_infos) > 1:
+                nodes_with_multiple.append(node)
+
+        _warn_on_duplicate_nodes(nodes_with_multiple)
+
+        return RemoteWorkspaceAssetGraph(
+            remote_asset_nodes_by_key=asset_nodes_by_key,
+            remote_asset_check_nodes_by_key=_merge_asset_checks_by_key(
+                location_asset_infos_by_location_name.values()
+            ),
+            location_asset_infos_by_location_name=location_asset_infos_by_location_name,
         )
 
+
+@record
+class LocationAssetInfos:
+    """The asset infos and asset checks contributed by a single code location to a
+    RemoteWorkspaceAssetGraph.
+    """
+
+    asset_infos_by_key: Mapping[AssetKey, Sequence[RepositoryScopedAssetInfo]]
+    asset_checks_by_key: Mapping[AssetCheckKey, RemoteAssetCheckNode]
+
+    @staticmethod
+    def build(code_location: "CodeLocation") -> "LocationAssetInfos":
         asset_infos_by_key: Dict[AssetKey, List[RepositoryScopedAssetInfo]] = defaultdict(list)
         asset_checks_by_key: Dict[AssetCheckKey, RemoteAssetCheckNode] = {}
-        for repo in repos:
+        for repo in code_location.get_repositories().values():
             for key, asset_node in repo.asset_graph.remote_asset_nodes_by_key.items():
                 asset_infos_by_key[key].append(
                     RepositoryScopedAssetInfo(
@@ -650,22 +748,33 @@ def build(cls, workspace: WorkspaceSnapshot):
             # NOTE: matches previous behavior of completely ignoring asset check collisions
             asset_checks_by_key.update(repo.asset_graph.remote_asset_check_nodes_by_key)
 
-        asset_nodes_by_key = {}
-        nodes_with_multiple = []
-        for key, asset_infos in asset_infos_by_key.items():
-            node = RemoteWorkspaceAssetNode(
-                repo_scoped_asset_infos=asset_infos,
-            )
-            asset_nodes_by_key[key] = node
-            if len(asset_infos) > 1:
-                nodes_with_multiple.append(node)
+        return LocationAssetInfos(
+            asset_infos_by_key=dict(asset_infos_by_key),
+            asset_checks_by_key=asset_checks_by_key,
+        )
 
-        _warn_on_duplicate_nodes(nodes_with_multiple)
 
-        return cls(
-            remote_asset_nodes_by_key=asset_nodes_by_key,
-            remote_asset_check_nodes_by_key=asset_checks_by_key,
-        )
+def _merge_asset_infos_by_key(
+    location_asset_infos: Iterable[LocationAssetInfos],
+    keys: Optional[AbstractSet[AssetKey]] = None,
+) -> Mapping[AssetKey, Sequence[RepositoryScopedAssetInfo]]:
+    # infos are ordered by the order of the code locations in the workspace, so that a node
+    # built from scratch and a node built by updating a graph are the same
+    asset_infos_by_key: Dict[AssetKey, List[RepositoryScopedAssetInfo]] = defaultdict(list)
+    for infos in location_asset_infos:
+        for key, asset_infos in infos.asset_infos_by_key.items():
+            if keys is None or key in keys:
+                asset_infos_by_key[key].extend(asset_infos)
+    return asset_infos_by_key
+
+
+def _merge_asset_checks_by_key(
+    location_asset_infos: Iterable[LocationAssetInfos],
+) -> Mapping[AssetCheckKey, RemoteAssetCheckNode]:
+    asset_checks_by_key: Dict[AssetCheckKey, RemoteAssetCheckNode] = {}
+    for infos in location_asset_infos:
+        asset_checks_by_key.update(infos.asset_checks_by_key)
+    return asset_checks_by_key
 
 
 def _warn_on_duplicate_nodes(
@@ -422,6 +422,12 @@ def get_partition_keys_between_indexes(
         # partition keys included within the indices.
         current_timestamp = self._get_current_timestamp(current_time=current_time)
 
+        if self._fixed_interval_seconds:
+            num_partitions = self._get_fixed_interval_num_partitions(current_timestamp)
+            return self._get_fixed_interval_partition_keys(
+                max(start_idx, 0), min(end_idx, num_partitions)
+            )
+
         partitions_past_current_time = 0
         partition_keys = []
         reached_end = False
@@ -460,6 +466,11 @@ def get_partition_keys(
     ) -> Sequence[str]:
         current_timestamp = self._get_current_timestamp(current_time=current_time)
 
+        if self._fixed_interval_seconds:
+            return self._get_fixed_interval_partition_keys(
+                0, self._get_fixed_interval_num_partitions(current_timestamp)
+            )
+
         partitions_past_current_time = 0
         partition_keys: List[str] = []
         for time_window in self._iterate_time_windows(self.start.timestamp()):
@@ -514,6 +525,10 @@ def __hash__(self):
     @functools.lru_cache(maxsize=100)
     def time_window_for_partition_key(self, partition_key: str) -> TimeWindow:
         partition_key_dt = dst_safe_strptime(partition_key, self.timezone, self.fmt)
+        if self._fixed_interval_seconds:
+            return self._get_fixed_interval_time_window(
+                self._get_fixed_interval_tick_at_or_after(partition_key_dt.timestamp())
+            )
         return next(iter(self._iterate_time_windows(partition_key_dt.timestamp())))
 
     @functools.lru_cache(maxsize=5)
@@ -525,30 +540,42 @@ def time_windows_for_partition_keys(
         if len(partition_keys) == 0:
             return []
 
-        sorted_pks = sorted(
-            partition_keys,
-            key=lambda pk: dst_safe_strptime(pk, self.timezone, self.fmt).timestamp(),
-        )
-        cur_windows_iterator = iter(
-            self._iterate_time_windows(
-                dst_safe_strptime(sorted_pks[0], self.timezone, self.fmt).timestamp()
-            )
-        )
         partition_key_time_windows: List[TimeWindow] = []
-        for partition_key in sorted_pks:
-            next_window = next(cur_windows_iterator)
-            if (
-                dst_safe_strftime(next_window.start, self.timezone, self.fmt, self.cron_schedule)
-                == partition_key
-            ):
-                partition_key_time_windows.append(next_window)
-            else:
-                cur_windows_iterator = iter(
-                    self._iterate_time_windows(
-                        dst_safe_strptime(partition_key, self.timezone, self.fmt).timestamp()
+        if self._fixed_interval_seconds:
+            for partition_key in partition_keys:
+                partition_key_dt = dst_safe_strptime(partition_key, self.timezone, self.fmt)
+                partition_key_time_windows.append(
+                    self._get_fixed_interval_time_window(
+                        self._get_fixed_interval_tick_at_or_after(partition_key_dt.timestamp())
                     )
                 )
-                partition_key_time_windows.append(next(cur_windows_iterator))
+            partition_key_time_windows.sort(key=lambda tw: tw.start.timestamp())
+        else:
+            sorted_pks = sorted(
+                partition_keys,
+                key=lambda pk: dst_safe_strptime(pk, self.timezone, self.fmt).timestamp(),
+            )
+            cur_windows_iterator = iter(
+                self._iterate_time_windows(
+                    dst_safe_strptime(sorted_pks[0], self.timezone, self.fmt).timestamp()
+                )
+            )
+            for partition_key in sorted_pks:
+                next_window = next(cur_windows_iterator)
+                if (
+                    dst_safe_strftime(
+                        next_window.start, self.timezone, self.fmt, self.cron_schedule
+                    )
+                    == partition_key
+                ):
+                    partition_key_time_windows.append(next_window)
+                else:
+                    cur_windows_iterator = iter(
+                        self._iterate_time_windows(
+                            dst_safe_strptime(partition_key, self.timezone, self.fmt).timestamp()
+                        )
+                    )
+                    partition_key_time_windows.append(next(cur_windows_iterator))
 
         if validate:
             start_time_window = self.get_first_partition_window()
@@ -574,6 +601,11 @@ def start_time_for_partition_key(self, partition_key: str) -> datetime:
         # the datetime format might not include granular components, so we need to recover them,
         # e.g. if cron_schedule="0 7 * * *" and fmt="%Y-%m-%d".
         # we make the assumption that the parsed partition key is <= the start datetime.
+        if self._fixed_interval_seconds:
+            return datetime_from_timestamp(
+                self._get_fixed_interval_tick_at_or_after(partition_key_dt.timestamp()),
+                self.timezone,
+            )
         return next(iter(self._iterate_time_windows(partition_key_dt.timestamp()))).start
 
     def get_next_partition_key(
@@ -716,6 +748,14 @@ def end_time_for_partition_key(self, partition_key: str) -> datetime:
     def get_partition_keys_in_time_window(self, time_window: TimeWindow) -> Sequence[str]:
         result: List[str] = []
         time_window_end_timestamp = time_window.end.timestamp()
+        fixed_interval_seconds = self._fixed_interval_seconds
+        if fixed_interval_seconds:
+            tick = self._get_fixed_interval_tick_at_or_after(time_window.start.timestamp())
+            while tick < time_window_end_timestamp:
+                result.append(self._get_fixed_interval_partition_key(tick))
+                tick += fixed_interval_seconds
+            return result
+
         for partition_time_window in self._iterate_time_windows(time_window.start.timestamp()):
             if partition_time_window.start.timestamp() < time_window_end_timestamp:
                 result.append(
@@ -930,11 +970,101 @@ def _reverse_iterate_time_windows(self, end_timestamp: float) -> Iterable[TimeWi
             yield TimeWindow(next_time, prev_time)
             prev_time = next_time
 
+    @cached_property
+    def _fixed_interval_seconds(self) -> Optional[int]:
+        """The number of seconds between the starts of consecutive partitions, if it is the same for
+        every partition. For these schedules, partition keys and time windows are computed directly
+        from their index, rather than by iterating over the ticks of the cron schedule.
+        """
+        fixed_minute_interval = get_fixed_minute_interval(self.cron_schedule)
+        if fixed_minute_interval:
+            return fixed_minute_interval * 60
+
+        # other schedules are only evenly spaced in the absence of DST transitions
+        if self.timezone.upper() != "UTC":
+            return None
+
+        schedule_type = self.schedule_type
+        if schedule_type == ScheduleType.HOURLY:
+            return 60 * 60
+        elif schedule_type == ScheduleType.DAILY:
+            return 24 * 60 * 60
+        elif schedule_type == ScheduleType.WEEKLY:
+            return 7 * 24 * 60 * 60
+        return None
+
+    @cached_property
+    def _first_tick_timestamp(self) -> float:
+        return next(iter(self._iterate_time_windows(self.start.timestamp()))).start.timestamp()
+
+    def _get_fixed_interval_tick_at_or_after(self, timestamp: float) -> float:
+        interval = check.not_none(self._fixed_interval_seconds)
+        first_tick = self._first_tick_timestamp
+        return first_tick - ((first_tick - timestamp) // interval) * interval
+
+    def _get_fixed_interval_time_window(self, start_timestamp: float) -> TimeWindow:
+        interval = check.not_none(self._fixed_interval_seconds)
+        return TimeWindow(
+            datetime_from_timestamp(start_timestamp, self.timezone),
+            datetime_from_timestamp(start_timestamp + interval, self.timezone),
+        )
+
+    def _get_fixed_interval_partition_key(self, start_timestamp: float) -> str:
+        return dst_safe_strftime(
+            datetime_from_timestamp(start_timestamp, self.timezone),
+            self.timezone,
+            self.fmt,
+            self.cron_schedule,
+        )
+
+    def _get_fixed_interval_num_partitions(self, current_timestamp: float) -> int:
+        """The number of partitions that get_partition_keys would return at the given time."""
+        interval = check.not_none(self._fixed_interval_seconds)
+        first_tick = self._first_tick_timestamp
+
+        # partitions that have ended by the current time, plus any partitions in the end offset
+        num_partitions = max(int((current_timestamp - first_tick) // interval), 0) + max(
+            self.end_offset, 0
+        )
+        if self.end:
+            num_partitions = min(
+                num_partitions, max(int((self.end.timestamp() - first_tick) // interval), 0)
+            )
+        if self.end_offset < 0:
+            num_partitions = max(num_partitions + self.end_offset, 0)
+        return num_partitions
+
+    def _get_fixed_interval_partition_keys(self, start_idx: int, end_idx: int) -> List[str]:
+        interval = check.not_none(self._fixed_interval_seconds)
+        first_tick = self._first_tick_timestamp
+        tzinfo = get_timezone(self.timezone)
+        fmt = self.fmt
+        # equivalent to dst_safe_strftime, with the checks that are the same for every key hoisted
+        disambiguate = "%z" not in fmt and cron_string_repeats_every_hour(self.cron_schedule)
+
+        partition_keys: List[str] = []
+        for idx in range(start_idx, end_idx):
+            dt = datetime.fromtimestamp(first_tick + idx * interval, tz=tzinfo)
+            if disambiguate and is_second_ambiguous_time(dt, self.timezone):
+                partition_keys.append(dt.strftime(dst_safe_fmt(fmt)))
+            else:
+                partition_keys.append(dt.strftime(fmt))
+        return partition_keys
+
     def get_partition_key_for_timestamp(self, timestamp: float, end_closed: bool = False) -> str:
         """Args:
         timestamp (float): Timestamp from the unix epoch, UTC.
         end_closed (bool): Whether the interval is closed at the end or at the beginning.
         """
+        fixed_interval_seconds = self._fixed_interval_seconds
+        if fixed_interval_seconds:
+            # the first tick >= timestamp, and the tick before it, which is < timestamp
+            next_tick = self._get_fixed_interval_tick_at_or_after(timestamp)
+            prev_tick = next_tick - fixed_interval_seconds
+            return self._get_fixed_interval_partition_key(
+                prev_tick if end_closed or next_tick > timestamp else next_tick
+            )
+
         iterator = cron_string_iterator(
             timestamp, self.cron_schedule, self.timezone, start_offset=-1
         )
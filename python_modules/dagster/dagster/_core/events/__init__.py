@@ -237,7 +237,8 @@ class DagsterEventType(str, Enum):
 
 PIPELINE_RUN_STATUS_TO_EVENT_TYPE = {v: k for k, v in EVENT_TYPE_TO_PIPELINE_RUN_STATUS.items()}
 
-# These are the only events currently supported in `EventLogStorage.store_event_batch`
+# These are the only events that every `EventLogStorage.store_event_batch` implementation supports.
+# Some storages (e.g. Postgres) accept batches of any event type.
 BATCH_WRITABLE_EVENTS = {
     DagsterEventType.ASSET_MATERIALIZATION,
     DagsterEventType.ASSET_OBSERVATION,
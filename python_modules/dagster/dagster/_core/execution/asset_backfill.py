@@ -1308,6 +1308,71 @@ def _get_failed_and_downstream_asset_partitions(
     return failed_and_downstream_subset
 
 
+def _get_frontier_asset_partitions(
+    asset_backfill_data: AssetBackfillData,
+    materialized_since_last_tick: AssetGraphSubset,
+    updated_materialized_subset: AssetGraphSubset,
+    asset_graph: BaseAssetGraph,
+    dynamic_partitions_store: DynamicPartitionsStore,
+    current_time: datetime,
+) -> AbstractSet[AssetKeyPartitionKey]:
+    """Returns the targeted asset partitions that may have become ready to request since the last
+    tick.
+
+    A targeted asset partition that has not yet been requested can only become ready to request once
+    one of its targeted parents has been materialized by the backfill, so only the children of the
+    asset partitions that the backfill materialized since the last tick need to be reevaluated.
+    Children are mapped a whole asset subset at a time, rather than a partition at a time.
+    """
+    target_subset = asset_backfill_data.target_subset
+    settled_subset = updated_materialized_subset | asset_backfill_data.requested_subset
+
+    frontier: Set[AssetKeyPartitionKey] = set()
+    for parent_key in materialized_since_last_tick.asset_keys:
+        parent_node = asset_graph.get(parent_key)
+        parent_partitions_subset = (
+            materialized_since_last_tick.get_partitions_subset(parent_key, asset_graph)
+            if parent_node.is_partitioned
+            else None
+        )
+        for child_key in parent_node.child_keys:
+            if child_key not in target_subset.asset_keys:
+                continue
+
+            child_node = asset_graph.get(child_key)
+            if not child_node.is_partitioned:
+                if child_key not in settled_subset:
+                    frontier.add(AssetKeyPartitionKey(child_key))
+                continue
+
+            child_partitions_def = check.not_none(child_node.partitions_def)
+            if parent_partitions_subset is None:
+                child_partitions_subset = target_subset.get_partitions_subset(
+                    child_key, asset_graph
+                )
+            else:
+                child_partitions_subset = asset_graph.get_partition_mapping(
+                    child_key, parent_key
+                ).get_downstream_partitions_for_partitions(
+                    parent_partitions_subset,
+                    check.not_none(parent_node.partitions_def),
+                    downstream_partitions_def=child_partitions_def,
+                    dynamic_partitions_store=dynamic_partitions_store,
+                    current_time=current_time,
+                )
+
+            child_partitions_subset = (
+                child_partitions_subset
+                & target_subset.get_partitions_subset(child_key, asset_graph)
+            ) - settled_subset.get_partitions_subset(child_key, asset_graph)
+            frontier.update(
+                AssetKeyPartitionKey(child_key, partition_key)
+                for partition_key in child_partitions_subset.get_partition_keys()
+            )
+
+    return frontier
+
+
 def _get_next_latest_storage_id(instance_queryer: CachingInstanceQueryer) -> int:
     # Events are not always guaranteed to be written to the event log in monotonically increasing
     # order, so add a configurable offset to ensure that any stragglers will still be included in
@@ -1417,16 +1482,16 @@ def execute_asset_backfill_iteration_inner(
             else "No relevant assets materialized since last tick."
         )
 
-        parent_materialized_asset_partitions = set().union(
-            *(
-                instance_queryer.asset_partitions_with_newly_updated_parents_and_new_cursor(
-                    latest_storage_id=asset_backfill_data.latest_storage_id,
-                    child_asset_key=asset_key,
-                )[0]
-                for asset_key in asset_backfill_data.target_subset.asset_keys
+        initial_candidates.update(
+            _get_frontier_asset_partitions(
+                asset_backfill_data=asset_backfill_data,
+                materialized_since_last_tick=materialized_since_last_tick,
+                updated_materialized_subset=updated_materialized_subset,
+                asset_graph=asset_graph,
+                dynamic_partitions_store=instance_queryer,
+                current_time=datetime_from_timestamp(backfill_start_timestamp),
             )
         )
-        initial_candidates.update(parent_materialized_asset_partitions)
 
         yield None
 
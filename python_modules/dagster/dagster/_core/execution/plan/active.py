@@ -4,6 +4,7 @@
     Any,
     Callable,
     Dict,
+    Iterable,
     Iterator,
     List,
     Mapping,
@@ -625,7 +626,7 @@ def _resolve_any_dynamic_outputs(self, step_key: str) -> None:
             self._new_dynamic_mappings = True
 
     def rebuild_from_events(
-        self, dagster_events: Sequence[DagsterEvent]
+        self, dagster_events: Iterable[DagsterEvent]
     ) -> Sequence[ExecutionStep]:
         """Replay events to rebuild the execution state and continue after a failure.
 
@@ -7,7 +7,7 @@
 from multiprocessing import Queue
 from multiprocessing.context import BaseContext as MultiprocessingBaseContext
 from multiprocessing.process import BaseProcess
-from typing import TYPE_CHECKING, Iterator, NamedTuple, Optional, Union
+from typing import TYPE_CHECKING, Any, Iterator, List, NamedTuple, Optional, Union
 
 from typing_extensions import Literal
 
@@ -56,6 +56,15 @@ def execute(self) -> Iterator[Union[ChildProcessEvent, "DagsterEvent"]]:
         Yields a sequence of events to be handled by _execute_command_in_child_process.
         """
 
+    def with_worker_term_event(self, term_event: Any) -> "ChildProcessCommand":
+        """Invoked in a pooled worker process before the command is executed.
+
+        Multiprocessing events can only be shared with a process when it is started, so commands
+        run by a ChildProcessWorkerPool are handed the termination event of the worker executing
+        them instead of carrying their own.
+        """
+        return self
+
 
 class ChildProcessCrashException(Exception):
     """Thrown when the child process crashes."""
@@ -93,6 +102,20 @@ def _execute_command_in_child_process(event_queue: Queue, command: ChildProcessC
             )
 
 
+def _execute_commands_in_worker_process(
+    command_queue: Queue, event_queue: Queue, term_event: Any
+) -> None:
+    """Executes ChildProcessCommands received over the command queue until a None sentinel is
+    received, reporting events for each command using the same protocol as
+    _execute_command_in_child_process.
+    """
+    while True:
+        command = command_queue.get()
+        if command is None:
+            return
+        _execute_command_in_child_process(event_queue, command.with_worker_term_event(term_event))
+
+
 TICK = 20.0 * 1.0 / 1000.0
 """The minimum interval at which to check for child process liveness -- default 20ms."""
 
@@ -175,3 +198,159 @@ def execute_child_process_command(
         process.join()
     finally:
         event_queue.close()
+
+
+WORKER_SHUTDOWN_TIMEOUT = 5.0
+"""The number of seconds to wait for a pooled worker process to exit before terminating it."""
+
+
+class ChildProcessWorker:
+    def __init__(self, multiprocessing_ctx: MultiprocessingBaseContext):
+        self.command_queue = multiprocessing_ctx.Queue()
+        self.event_queue = multiprocessing_ctx.Queue()
+        self.term_event = multiprocessing_ctx.Event()
+        self.process = multiprocessing_ctx.Process(  # type: ignore
+            target=_execute_commands_in_worker_process,
+            args=(self.command_queue, self.event_queue, self.term_event),
+        )
+        self.process.start()
+        self.commands_executed = 0
+
+    def shutdown(self, timeout: float) -> None:
+        if self.process.is_alive():
+            self.command_queue.put(None)
+            self.process.join(timeout)
+            if self.process.is_alive():
+                self.process.terminate()
+                self.process.join()
+        self.command_queue.close()
+        self.event_queue.close()
+
+
+class ChildProcessWorkerPool:
+    """A bounded pool of long-lived processes that execute ChildProcessCommands.
+
+    Commands are executed with the same event protocol as execute_child_process_command, but each
+    worker process is reused across commands, so that process start-up and anything cached in the
+    process (imported modules, loaded definitions) is paid for once per worker rather than once per
+    command. A worker is retired once it has executed ``max_commands_per_worker`` commands, or as
+    soon as a command it executes ends in an error, crash, or is abandoned by the caller.
+
+    Args:
+        multiprocessing_ctx: The multiprocessing context to start workers in (spawn, forkserver)
+        max_workers (int): The maximum number of worker processes that may be busy at once.
+        max_commands_per_worker (Optional[int]): The number of commands after which a worker is
+            replaced by a fresh process. Workers are never recycled if not set.
+    """
+
+    def __init__(
+        self,
+        multiprocessing_ctx: MultiprocessingBaseContext,
+        max_workers: int,
+        max_commands_per_worker: Optional[int] = None,
+    ):
+        self._multiprocessing_ctx = multiprocessing_ctx
+        self._max_workers = check.int_param(max_workers, "max_workers")
+        self._max_commands_per_worker = check.opt_int_param(
+            max_commands_per_worker, "max_commands_per_worker"
+        )
+        self._idle_workers: List[ChildProcessWorker] = []
+        self._busy_workers: List[ChildProcessWorker] = []
+        self._retired_workers: List[ChildProcessWorker] = []
+
+    def __enter__(self) -> "ChildProcessWorkerPool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
+
+    def get_term_event(self, process: BaseProcess) -> Any:
+        """The termination event of the worker running as the given process."""
+        for worker in self._busy_workers:
+            if worker.process is process:
+                return worker.term_event
+        check.failed(f"No busy worker found for process {process.pid}")
+
+    def _acquire_worker(self) -> ChildProcessWorker:
+        while self._idle_workers:
+            worker = self._idle_workers.pop()
+            if worker.process.is_alive():
+                break
+            self._retired_workers.append(worker)
+        else:
+            check.invariant(
+                len(self._busy_workers) < self._max_workers,
+                f"All {self._max_workers} workers in the pool are busy",
+            )
+            worker = ChildProcessWorker(self._multiprocessing_ctx)
+
+        # the event is set by the previous command when it completes, so it is cleared here
+        # rather than in the worker to avoid dropping a termination request for the next command
+        worker.term_event.clear()
+        self._busy_workers.append(worker)
+        return worker
+
+    def _release_worker(self, worker: ChildProcessWorker, reusable: bool) -> None:
+        self._busy_workers.remove(worker)
+        worker.commands_executed += 1
+        if (
+            reusable
+            and worker.process.is_alive()
+            and (
+                self._max_commands_per_worker is None
+                or worker.commands_executed < self._max_commands_per_worker
+            )
+        ):
+            self._idle_workers.append(worker)
+        else:
+            if worker.process.is_alive():
+                # exits once any in-flight command completes
+                worker.command_queue.put(None)
+            self._retired_workers.append(worker)
+
+    def execute_command(
+        self, command: ChildProcessCommand
+    ) -> Iterator[Optional[Union["DagsterEvent", ChildProcessEvent, BaseProcess]]]:
+        """Execute a ChildProcessCommand in a worker process from the pool.
+
+        Yields the same sequence of objects as execute_child_process_command, where the yielded
+        process is the worker process executing the command.
+        """
+        check.inst_param(command, "command", ChildProcessCommand)
+
+        worker = self._acquire_worker()
+        reusable = False
+        try:
+            worker.command_queue.put(command)
+            yield worker.process
+
+            completed_properly = False
+
+            while not completed_properly:
+                event = _poll_for_event(worker.process, worker.event_queue)
+
+                if event == PROCESS_DEAD_AND_QUEUE_EMPTY:
+                    break
+
+                yield event
+
+                if isinstance(event, ChildProcessDoneEvent):
+                    completed_properly = True
+                    reusable = True
+                elif isinstance(event, ChildProcessSystemErrorEvent):
+                    completed_properly = True
+
+            if not completed_properly:
+                worker.process.join()
+                raise ChildProcessCrashException(
+                    pid=worker.process.pid, exit_code=worker.process.exitcode
+                )
+        finally:
+            self._release_worker(worker, reusable)
+
+    def shutdown(self, timeout: float = WORKER_SHUTDOWN_TIMEOUT) -> None:
+        for worker in [*self._idle_workers, *self._busy_workers, *self._retired_workers]:
+            worker.shutdown(timeout)
+        self._idle_workers = []
+        self._busy_workers = []
+        self._retired_workers = []
@@ -32,6 +32,7 @@
     ChildProcessCrashException,
     ChildProcessEvent,
     ChildProcessSystemErrorEvent,
+    ChildProcessWorkerPool,
     execute_child_process_command,
 )
 from dagster._core.instance import DagsterInstance
@@ -106,6 +107,10 @@ def execute(self) -> Iterator[DagsterEvent]:
                 done_event.set()  # waiting on term_event so set done first
                 self.term_event.set()
 
+    def with_worker_term_event(self, term_event: Any) -> "MultiprocessExecutorChildProcessCommand":
+        self.term_event = term_event
+        return self
+
 
 class MultiprocessExecutor(Executor):
     def __init__(
@@ -115,6 +120,8 @@ def __init__(
         tag_concurrency_limits: Optional[List[Dict[str, Any]]] = None,
         start_method: Optional[str] = None,
         explicit_forkserver_preload: Optional[Sequence[str]] = None,
+        reuse_processes: bool = False,
+        max_steps_per_worker: Optional[int] = None,
     ):
         self._retries = check.inst_param(retries, "retries", RetryMode)
         if not max_concurrent:
@@ -140,6 +147,10 @@ def __init__(
             )
         self._start_method = start_method
         self._explicit_forkserver_preload = explicit_forkserver_preload
+        self._reuse_processes = check.bool_param(reuse_processes, "reuse_processes")
+        self._max_steps_per_worker = check.opt_int_param(
+            max_steps_per_worker, "max_steps_per_worker"
+        )
 
     @property
     def retries(self) -> RetryMode:
@@ -190,6 +201,18 @@ def execute(
         with ExitStack() as stack:
             timer_result = stack.enter_context(time_execution_scope())
 
+            worker_pool = (
+                stack.enter_context(
+                    ChildProcessWorkerPool(
+                        multiproc_ctx,
+                        max_workers=limit,
+                        max_commands_per_worker=self._max_steps_per_worker,
+                    )
+                )
+                if self._reuse_processes
+                else None
+            )
+
             instance_concurrency_context = stack.enter_context(
                 InstanceConcurrencyContext(plan_context.instance, plan_context.dagster_run)
             )
@@ -249,6 +272,7 @@ def execute(
                                 self.retries,
                                 active_execution.get_known_state(),
                                 execution_plan.repository_load_data,
+                                worker_pool,
                             )
 
                     # process active iterators
@@ -372,13 +396,15 @@ def execute_step_out_of_process(
     retries: RetryMode,
     known_state: KnownExecutionState,
     repository_load_data: Optional[RepositoryLoadData],
+    worker_pool: Optional[ChildProcessWorkerPool] = None,
 ) -> Iterator[Optional[DagsterEvent]]:
     command = MultiprocessExecutorChildProcessCommand(
         run_config=step_context.run_config,
         dagster_run=step_context.dagster_run,
         step_key=step.key,
         instance_ref=step_context.instance.get_ref(),
-        term_event=term_events[step.key],
+        # pooled workers supply their own termination event when the command is executed
+        term_event=term_events[step.key] if worker_pool is None else None,
         recon_pipeline=recon_job,
         retry_mode=retries,
         known_state=known_state,
@@ -387,11 +413,18 @@ def execute_step_out_of_process(
 
     yield DagsterEvent.step_worker_starting(
         step_context,
-        f'Launching subprocess for "{step.key}".',
+        f'Launching subprocess for "{step.key}".'
+        if worker_pool is None
+        else f'Dispatching "{step.key}" to a worker process.',
         metadata={},
     )
 
-    for ret in execute_child_process_command(multiproc_ctx, command):
+    child_process_iterator = (
+        execute_child_process_command(multiproc_ctx, command)
+        if worker_pool is None
+        else worker_pool.execute_command(command)
+    )
+    for ret in child_process_iterator:
         if ret is None or isinstance(ret, DagsterEvent):
             yield ret
         elif isinstance(ret, ChildProcessEvent):
@@ -399,5 +432,7 @@ def execute_step_out_of_process(
                 errors[ret.pid] = ret.error_info
         elif isinstance(ret, BaseProcess):
             processes[step.key] = ret
+            if worker_pool is not None:
+                term_events[step.key] = worker_pool.get_term_event(ret)
         else:
             check.failed(f"Unexpected return value from child process {type(ret)}")
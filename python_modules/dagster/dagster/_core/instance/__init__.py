@@ -17,6 +17,7 @@
     Dict,
     Generic,
     Iterable,
+    Iterator,
     List,
     Mapping,
     Optional,
@@ -130,6 +131,7 @@
     from dagster._core.execution.plan.plan import ExecutionPlan
     from dagster._core.execution.plan.resume_retry import ReexecutionStrategy
     from dagster._core.execution.stats import RunStepKeyStatsSnapshot
+    from dagster._core.instance.event_buffer import BufferedEventWriter
     from dagster._core.launcher import RunLauncher
     from dagster._core.remote_representation import (
         CodeLocation,
@@ -200,6 +202,19 @@ def _is_batch_writing_enabled() -> bool:
     return _get_event_batch_size() > 0
 
 
+# Sets the maximum number of seconds that an event will be buffered before being written to the
+# event log. When this and the event batch size are both set, all events of a run are buffered (not
+# only explicitly batched events) and written with `store_event_batch` once the buffer is full, a
+# step or run boundary event is received, or the interval has elapsed. Defaults to 0, which keeps
+# buffering limited to explicitly batched events.
+def _get_event_batch_flush_interval() -> float:
+    return float(os.getenv("DAGSTER_EVENT_BATCH_FLUSH_INTERVAL", "0"))
+
+
+def _is_buffered_writing_enabled() -> bool:
+    return _is_batch_writing_enabled() and _get_event_batch_flush_interval() > 0
+
+
 def _check_run_equality(
     pipeline_run: DagsterRun, candidate_run: DagsterRun
 ) -> Mapping[str, Tuple[Any, Any]]:
@@ -495,6 +510,7 @@ def __init__(
 
         # Used for batched event handling
         self._event_buffer: Dict[str, List[EventLogEntry]] = defaultdict(list)
+        self._buffered_event_writer: Optional["BufferedEventWriter"] = None
 
     # ctors
 
@@ -958,6 +974,10 @@ def auto_materialize_max_tick_retries(self) -> int:
     def auto_materialize_use_sensors(self) -> int:
         return self.get_settings("auto_materialize").get("use_sensors", True)
 
+    @property
+    def auto_materialize_use_compact_cursors(self) -> bool:
+        return self.get_settings("auto_materialize").get("use_compact_cursors", False)
+
     @property
     def global_op_concurrency_default_limit(self) -> Optional[int]:
         return self.get_settings("concurrency").get("default_op_concurrency_limit")
@@ -1015,6 +1035,9 @@ def reindex(self, print_fn: PrintFn = lambda _: None) -> None:
         print_fn("Done.")
 
     def dispose(self) -> None:
+        if self._buffered_event_writer:
+            self._buffered_event_writer.close()
+            self._buffered_event_writer = None
         self._local_artifact_storage.dispose()
         self._run_storage.dispose()
         if self._run_coordinator:
@@ -1109,6 +1132,18 @@ def get_run_step_stats(
     ) -> Sequence["RunStepKeyStatsSnapshot"]:
         return self._event_storage.get_step_stats_for_run(run_id, step_keys)
 
+    @traced
+    def get_run_stats_for_runs(
+        self, run_ids: Sequence[str]
+    ) -> Mapping[str, DagsterRunStatsSnapshot]:
+        return self._event_storage.get_stats_for_runs(run_ids)
+
+    @traced
+    def get_run_step_stats_for_runs(
+        self, run_ids: Sequence[str], step_keys: Optional[Sequence[str]] = None
+    ) -> Mapping[str, Sequence["RunStepKeyStatsSnapshot"]]:
+        return self._event_storage.get_step_stats_for_runs(run_ids, step_keys)
+
     @traced
     def get_run_tags(
         self,
@@ -1902,6 +1937,18 @@ def get_records_for_run(
     ) -> "EventLogConnection":
         return self._event_storage.get_records_for_run(run_id, cursor, of_type, limit, ascending)
 
+    def iter_records_for_run(
+        self,
+        run_id: str,
+        cursor: Optional[str] = None,
+        of_type: Optional[Union["DagsterEventType", Set["DagsterEventType"]]] = None,
+        ascending: bool = True,
+    ) -> Iterator["EventLogRecord"]:
+        """Iterate over the event log records of a run, without loading all of them into memory
+        at once.
+        """
+        return self._event_storage.iter_records_for_run(run_id, cursor, of_type, ascending)
+
     def watch_event_logs(self, run_id: str, cursor: Optional[str], cb: "EventHandlerFn") -> None:
         return self._event_storage.watch(run_id, cursor, cb)
 
@@ -2290,6 +2337,21 @@ def get_latest_storage_id_by_partition(
             asset_key, event_type, partitions
         )
 
+    @traced
+    def get_latest_storage_id_by_partition_for_asset_keys(
+        self,
+        asset_keys: Sequence[AssetKey],
+        event_type: "DagsterEventType",
+    ) -> Mapping[AssetKey, Mapping[str, int]]:
+        """Fetch the latest storage id for each partition of each of the given asset keys, in a
+        single query where the storage supports it.
+
+        Returns a mapping of asset key to a mapping of partition to storage id.
+        """
+        return self._event_storage.get_latest_storage_id_by_partition_for_asset_keys(
+            asset_keys, event_type
+        )
+
     @traced
     def get_latest_planned_materialization_info(
         self,
@@ -2418,11 +2480,21 @@ def handle_new_event(
         to the storage layer in a single batch. If an error occurrs during batch writing, then we
         fall back to iterative individual event writes.
 
+        If buffered writing is also enabled (by setting `DAGSTER_EVENT_BATCH_FLUSH_INTERVAL`), all
+        events of a run are buffered and written in batches, regardless of `batch_metadata`. See
+        `BufferedEventWriter` for when buffered events are written. Subscribers are notified once
+        an event has been written.
+
         Args:
             event (EventLogEntry): The event to handle.
             batch_metadata (Optional[DagsterEventBatchMetadata]): Metadata for batch writing.
         """
-        if batch_metadata is None or not _is_batch_writing_enabled():
+        if _is_buffered_writing_enabled() and event.run_id:
+            self._get_buffered_event_writer().write(
+                event, flush=batch_metadata is not None and batch_metadata.is_end
+            )
+            return
+        elif batch_metadata is None or not _is_batch_writing_enabled():
             events = [event]
         else:
             batch_id, is_batch_end = batch_metadata.id, batch_metadata.is_end
@@ -2433,6 +2505,25 @@ def handle_new_event(
             else:
                 return
 
+        self._store_and_notify_events(events)
+
+    def _get_buffered_event_writer(self) -> "BufferedEventWriter":
+        from dagster._core.instance.event_buffer import BufferedEventWriter
+
+        if self._buffered_event_writer is None:
+            self._buffered_event_writer = BufferedEventWriter(
+                self._store_and_notify_events,
+                get_batch_size=_get_event_batch_size,
+                get_flush_interval=_get_event_batch_flush_interval,
+            )
+        return self._buffered_event_writer
+
+    def flush_buffered_events(self) -> None:
+        """Write out any events that are being held back by buffered writing."""
+        if self._buffered_event_writer:
+            self._buffered_event_writer.flush()
+
+    def _store_and_notify_events(self, events: Sequence["EventLogEntry"]) -> None:
         if len(events) == 1:
             self._event_storage.store_event(events[0])
         else:
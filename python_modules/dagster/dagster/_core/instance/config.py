@@ -414,6 +414,43 @@ def dagster_instance_config_schema() -> Mapping[str, Field]:
                         "How many threads to use to process ticks from multiple automation policy sensors in parallel"
                     ),
                 ),
+                "use_processes": Field(
+                    Bool,
+                    is_required=False,
+                    default_value=False,
+                    description=(
+                        "Whether to process ticks from multiple automation condition sensors in a"
+                        " pool of `num_workers` worker processes rather than threads, so that"
+                        " evaluations of different sensors are not limited to a single core."
+                    ),
+                ),
+                "num_shards": Field(
+                    IntSource,
+                    is_required=False,
+                    description=(
+                        "The number of asset daemon replicas that automation condition sensors are"
+                        " split between. Each sensor is only evaluated by the replica whose"
+                        " `shard_index` it is assigned to."
+                    ),
+                ),
+                "shard_index": Field(
+                    IntSource,
+                    is_required=False,
+                    description=(
+                        "The shard of automation condition sensors evaluated by this asset daemon,"
+                        " between 0 and `num_shards` - 1."
+                    ),
+                ),
+                "use_compact_cursors": Field(
+                    Bool,
+                    is_required=False,
+                    default_value=False,
+                    description=(
+                        "Whether to store automation condition sensor cursors in the compact serdes"
+                        " format. Cursors in either format can be read, but versions of Dagster"
+                        " older than the compact format cannot read compact cursors."
+                    ),
+                ),
             }
         ),
         "concurrency": Field(
@@ -0,0 +1,114 @@
+import logging
+import threading
+import time
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional, Sequence
+
+import dagster._check as check
+from dagster._core.events import PIPELINE_EVENTS, DagsterEventType
+from dagster._core.events.log import EventLogEntry
+
+# Buffered events are written out as soon as one of these events is received for the same run, so
+# that the state of a run and its steps is never held back by the buffer.
+FLUSH_EVENT_TYPES = {
+    *PIPELINE_EVENTS,
+    DagsterEventType.STEP_START,
+    DagsterEventType.STEP_SUCCESS,
+    DagsterEventType.STEP_FAILURE,
+    DagsterEventType.STEP_SKIPPED,
+    DagsterEventType.STEP_UP_FOR_RETRY,
+    DagsterEventType.STEP_RESTARTED,
+}
+
+
+class BufferedEventWriter:
+    """Buffers the events of each run and writes them out in batches.
+
+    A run's buffer is written out when it reaches ``get_batch_size()`` events, when an event that
+    marks a step or run boundary (see ``FLUSH_EVENT_TYPES``) is received for the run, when
+    ``flush=True`` is passed, or at the latest ``get_flush_interval()`` seconds after it was
+    started, by a background thread. All writes happen while holding a single lock, so events of
+    the same run are always written in the order they were received.
+
+    Args:
+        write_fn (Callable[[Sequence[EventLogEntry]], None]): Writes a batch of events of a single
+            run, in order.
+        get_batch_size (Callable[[], int]): Returns the maximum number of events to buffer per run.
+        get_flush_interval (Callable[[], float]): Returns the maximum number of seconds an event
+            is buffered for.
+    """
+
+    def __init__(
+        self,
+        write_fn: Callable[[Sequence[EventLogEntry]], None],
+        get_batch_size: Callable[[], int],
+        get_flush_interval: Callable[[], float],
+    ):
+        self._write_fn = check.callable_param(write_fn, "write_fn")
+        self._get_batch_size = check.callable_param(get_batch_size, "get_batch_size")
+        self._get_flush_interval = check.callable_param(get_flush_interval, "get_flush_interval")
+
+        # INVARIANT: _lock protects _buffers and _buffer_start_times, and is held for all writes
+        self._lock = threading.RLock()
+        self._buffers: Dict[str, List[EventLogEntry]] = defaultdict(list)
+        self._buffer_start_times: Dict[str, float] = {}
+
+        self._shutdown_event = threading.Event()
+        self._flush_thread: Optional[threading.Thread] = None
+
+    def write(self, event: EventLogEntry, flush: bool = False) -> None:
+        check.inst_param(event, "event", EventLogEntry)
+        run_id = event.run_id
+
+        with self._lock:
+            buffer = self._buffers[run_id]
+            buffer.append(event)
+            self._buffer_start_times.setdefault(run_id, time.time())
+            if (
+                flush
+                or len(buffer) >= self._get_batch_size()
+                or (event.is_dagster_event and event.dagster_event_type in FLUSH_EVENT_TYPES)
+            ):
+                self._flush_run(run_id)
+            else:
+                self._ensure_flush_thread()
+
+    def flush(self) -> None:
+        with self._lock:
+            for run_id in list(self._buffers.keys()):
+                self._flush_run(run_id)
+
+    def close(self) -> None:
+        self._shutdown_event.set()
+        if self._flush_thread:
+            self._flush_thread.join()
+            self._flush_thread = None
+        self.flush()
+
+    def _flush_run(self, run_id: str) -> None:
+        events = self._buffers.pop(run_id, None)
+        self._buffer_start_times.pop(run_id, None)
+        if events:
+            self._write_fn(events)
+
+    def _flush_expired(self) -> None:
+        with self._lock:
+            cutoff = time.time() - self._get_flush_interval()
+            for run_id, start_time in list(self._buffer_start_times.items()):
+                if start_time <= cutoff:
+                    self._flush_run(run_id)
+
+    def _ensure_flush_thread(self) -> None:
+        if self._flush_thread is None and not self._shutdown_event.is_set():
+            self._flush_thread = threading.Thread(
+                target=self._flush_loop, name="event-buffer-flush", daemon=True
+            )
+            self._flush_thread.start()
+
+    def _flush_loop(self) -> None:
+        # check twice per interval so that no event waits much longer than the interval
+        while not self._shutdown_event.wait(max(self._get_flush_interval() / 2, 0.01)):
+            try:
+                self._flush_expired()
+            except Exception:
+                logging.exception("Exception while flushing buffered events to the event log")
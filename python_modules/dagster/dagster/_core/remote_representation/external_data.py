@@ -11,6 +11,7 @@
 from enum import Enum
 from typing import (
     Any,
+    Callable,
     Dict,
     Iterable,
     List,
@@ -176,8 +177,10 @@ def from_def(
         cls,
         repository_def: RepositoryDefinition,
         defer_snapshots: bool = False,
+        job_data_snap_fn: Optional[Callable[[JobDefinition], "JobDataSnap"]] = None,
     ) -> Self:
         check.inst_param(repository_def, "repository_def", RepositoryDefinition)
+        check.opt_callable_param(job_data_snap_fn, "job_data_snap_fn")
 
         jobs = repository_def.get_all_jobs()
         if defer_snapshots:
@@ -190,7 +193,10 @@ def from_def(
             job_datas = sorted(
                 list(
                     map(
-                        lambda job: JobDataSnap.from_job_def(job, include_parent_snapshot=True),
+                        job_data_snap_fn
+                        or (
+                            lambda job: JobDataSnap.from_job_def(job, include_parent_snapshot=True)
+                        ),
                         jobs,
                     )
                 ),
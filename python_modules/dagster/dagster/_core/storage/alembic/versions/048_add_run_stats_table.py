@@ -0,0 +1,50 @@
+"""add run_stats table
+
+Revision ID: 9c8a1f4e2b7d
+Revises: 6b7fb194ff9c
+Create Date: 2024-12-02 10:41:12.118203
+
+"""
+
+import sqlalchemy as db
+from alembic import op
+from dagster._core.storage.migration.utils import has_table
+from dagster._core.storage.sql import get_sql_current_timestamp
+from sqlalchemy.dialects import sqlite
+
+# revision identifiers, used by Alembic.
+revision = "9c8a1f4e2b7d"
+down_revision = "6b7fb194ff9c"
+branch_labels = None
+depends_on = None
+
+TABLE_NAME = "run_stats"
+
+
+def upgrade():
+    # only applies to event log storage
+    if has_table("event_logs") and not has_table(TABLE_NAME):
+        op.create_table(
+            TABLE_NAME,
+            db.Column(
+                "id",
+                db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+                primary_key=True,
+                autoincrement=True,
+            ),
+            db.Column("run_id", db.String(255), unique=True, nullable=False),
+            db.Column("steps_succeeded", db.Integer, nullable=False, default=0),
+            db.Column("steps_failed", db.Integer, nullable=False, default=0),
+            db.Column("materializations", db.Integer, nullable=False, default=0),
+            db.Column("expectations", db.Integer, nullable=False, default=0),
+            db.Column("enqueued_timestamp", db.types.TIMESTAMP),
+            db.Column("launch_timestamp", db.types.TIMESTAMP),
+            db.Column("start_timestamp", db.types.TIMESTAMP),
+            db.Column("end_timestamp", db.types.TIMESTAMP),
+            db.Column("create_timestamp", db.DateTime, server_default=get_sql_current_timestamp()),
+        )
+
+
+def downgrade():
+    if has_table(TABLE_NAME):
+        op.drop_table(TABLE_NAME)
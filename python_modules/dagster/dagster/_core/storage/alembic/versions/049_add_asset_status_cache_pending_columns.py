@@ -0,0 +1,26 @@
+"""add asset status cache pending columns
+
+Revision ID: 3e1d5c7a9b2f
+Revises: 9c8a1f4e2b7d
+Create Date: 2024-12-09 14:12:37.502914
+
+"""
+
+from dagster._core.storage.migration.utils import (
+    add_asset_status_cache_pending_columns,
+    drop_asset_status_cache_pending_columns,
+)
+
+# revision identifiers, used by Alembic.
+revision = "3e1d5c7a9b2f"
+down_revision = "9c8a1f4e2b7d"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    add_asset_status_cache_pending_columns()
+
+
+def downgrade():
+    drop_asset_status_cache_pending_columns()
@@ -0,0 +1,146 @@
+"""Compressed log files that can be read from an arbitrary offset of the uncompressed log.
+
+A chunked log file stores a log as a sequence of gzip members, each compressing one chunk of the
+log. Since a sequence of gzip members is itself a valid gzip file, the data file can be read with
+standard tools. Each chunk is described by a record in an index file, which maps offsets of the
+uncompressed log to the gzip member containing it, so a range of the log can be read by
+decompressing only the chunks that overlap it.
+"""
+
+import gzip
+import os
+import struct
+from bisect import bisect_right
+from typing import NamedTuple, Optional, Sequence, Tuple
+
+import dagster._check as check
+
+CHUNKED_LOG_DATA_EXTENSION = "gz"
+CHUNKED_LOG_INDEX_EXTENSION = "idx"
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+COMPRESS_LEVEL = 6
+
+# uncompressed offset, uncompressed length, compressed offset, compressed length
+_INDEX_RECORD = struct.Struct("<QIQI")
+
+
+class ChunkedLogIndexRecord(NamedTuple):
+    offset: int
+    length: int
+    compressed_offset: int
+    compressed_length: int
+
+
+def get_chunked_log_paths(path: str) -> Tuple[str, str]:
+    """Returns the paths of the data file and the index file of the chunked log for the log at
+    the given path.
+    """
+    return (
+        f"{path}.{CHUNKED_LOG_DATA_EXTENSION}",
+        f"{path}.{CHUNKED_LOG_INDEX_EXTENSION}",
+    )
+
+
+def write_chunked_log(
+    path: str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_bytes: Optional[int] = None,
+) -> None:
+    """Compresses the log at the given path into a chunked log next to it.
+
+    Args:
+        path (str): The path of the uncompressed log.
+        chunk_size (int): The number of uncompressed bytes stored in each chunk.
+        max_bytes (Optional[int]): If set, only the chunks containing the last `max_bytes` bytes of
+            the log are kept. Offsets into the log are preserved, so a cursor into the
+            uncompressed log remains valid for the chunked log.
+    """
+    check.invariant(chunk_size > 0, "chunk_size must be positive")
+    data_path, index_path = get_chunked_log_paths(path)
+
+    size = os.path.getsize(path)
+    start = 0
+    if max_bytes is not None and size > max_bytes:
+        # rotate out whole chunks, so chunk boundaries stay aligned to the chunk size
+        start = ((size - max_bytes) // chunk_size) * chunk_size
+
+    tmp_data_path = f"{data_path}.tmp"
+    tmp_index_path = f"{index_path}.tmp"
+    with open(path, "rb") as log_file, open(tmp_data_path, "wb") as data_file:
+        with open(tmp_index_path, "wb") as index_file:
+            log_file.seek(start)
+            offset = start
+            compressed_offset = 0
+            while True:
+                chunk = log_file.read(chunk_size)
+                if not chunk:
+                    break
+                compressed = gzip.compress(chunk, compresslevel=COMPRESS_LEVEL)
+                data_file.write(compressed)
+                index_file.write(
+                    _INDEX_RECORD.pack(offset, len(chunk), compressed_offset, len(compressed))
+                )
+                offset += len(chunk)
+                compressed_offset += len(compressed)
+
+    # the index file is what marks the chunked log as present, so it is moved into place last
+    os.replace(tmp_data_path, data_path)
+    os.replace(tmp_index_path, index_path)
+
+
+def read_chunked_log_index(path: str) -> Sequence[ChunkedLogIndexRecord]:
+    _, index_path = get_chunked_log_paths(path)
+    with open(index_path, "rb") as index_file:
+        data = index_file.read()
+    return [
+        ChunkedLogIndexRecord(*fields)
+        for fields in _INDEX_RECORD.iter_unpack(data[: len(data) - len(data) % _INDEX_RECORD.size])
+    ]
+
+
+def has_chunked_log(path: str) -> bool:
+    _, index_path = get_chunked_log_paths(path)
+    return os.path.exists(index_path)
+
+
+def read_chunked_log(
+    path: str, offset: int = 0, max_bytes: Optional[int] = None
+) -> Tuple[bytes, int]:
+    """Reads the uncompressed bytes of the chunked log for the log at the given path, starting
+    from the given offset of the uncompressed log. If the bytes at the offset were rotated out of
+    the log, reads from the start of the oldest chunk that was kept instead.
+
+    Returns the bytes read and the offset to read the rest of the log from.
+    """
+    records = read_chunked_log_index(path)
+    if not records:
+        return b"", offset
+
+    offset = max(offset, records[0].offset)
+    # the first chunk that ends after the offset
+    index = bisect_right([record.offset + record.length for record in records], offset)
+
+    data_path, _ = get_chunked_log_paths(path)
+    parts = []
+    num_bytes = 0
+    with open(data_path, "rb") as data_file:
+        for record in records[index:]:
+            if max_bytes is not None and num_bytes >= max_bytes:
+                break
+            data_file.seek(record.compressed_offset)
+            chunk = gzip.decompress(data_file.read(record.compressed_length))
+            part = chunk[offset - record.offset :]
+            if max_bytes is not None:
+                part = part[: max_bytes - num_bytes]
+            parts.append(part)
+            num_bytes += len(part)
+            offset += len(part)
+
+    return b"".join(parts), offset
+
+
+def delete_chunked_log(path: str) -> None:
+    for chunked_log_path in get_chunked_log_paths(path):
+        if os.path.exists(chunked_log_path):
+            os.remove(chunked_log_path)
@@ -5,7 +5,8 @@
 from abc import abstractmethod
 from collections import defaultdict
 from contextlib import contextmanager
-from typing import IO, Iterator, Optional, Sequence
+from functools import cached_property
+from typing import IO, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
 
 from dagster._core.instance import T_DagsterInstance
 from dagster._core.storage.compute_log_manager import (
@@ -23,6 +24,19 @@
 
 SUBSCRIPTION_POLLING_INTERVAL = 5
 
+# Partial logs that are uploaded incrementally are stored as a sequence of chunk objects, each
+# holding a range of the log, along with a manifest object listing the chunks. A chunk smaller
+# than this is rewritten to include the new bytes of the log on the next upload, rather than
+# the new bytes being uploaded as a new chunk, to bound the number of chunk objects.
+MIN_PARTIAL_LOG_CHUNK_BYTES = 1024 * 1024
+PARTIAL_LOG_MANIFEST_NAME = "manifest.json"
+
+
+class PartialLogChunk(NamedTuple):
+    name: str
+    offset: int
+    length: int
+
 
 class CloudStorageComputeLogManager(ComputeLogManager[T_DagsterInstance]):
     """Abstract class that uses the local compute log manager to capture logs and stores them in
@@ -70,6 +84,38 @@ def download_from_cloud_storage(
     ) -> None:
         """Downloads the logs for a given log key from cloud storage to local storage."""
 
+    @property
+    def supports_incremental_partial_upload(self) -> bool:
+        """Whether partial logs are uploaded incrementally, as chunks holding only the bytes
+        written since the previous upload, instead of re-uploading the whole log every
+        `upload_interval`. Implementations that return True must implement
+        `upload_partial_log_object`, `download_partial_log_object`, and
+        `delete_partial_log_objects`.
+        """
+        return False
+
+    def upload_partial_log_object(
+        self, log_key: Sequence[str], io_type: ComputeIOType, name: str, data: bytes
+    ) -> None:
+        """Uploads an object with the given name, overwriting any existing object, to the location
+        for the incrementally uploaded partial logs of the given log key.
+        """
+        raise NotImplementedError()
+
+    def download_partial_log_object(
+        self, log_key: Sequence[str], io_type: ComputeIOType, name: str
+    ) -> Optional[bytes]:
+        """Downloads the object with the given name from the location for the incrementally
+        uploaded partial logs of the given log key, or returns None if it does not exist.
+        """
+        raise NotImplementedError()
+
+    def delete_partial_log_objects(self, log_key: Sequence[str], io_type: ComputeIOType) -> None:
+        """Deletes all objects in the location for the incrementally uploaded partial logs of the
+        given log key.
+        """
+        raise NotImplementedError()
+
     @contextmanager
     def capture_logs(self, log_key: Sequence[str]) -> Iterator[CapturedLogContext]:
         with self._poll_for_local_upload(log_key):
@@ -89,6 +135,12 @@ def _on_capture_complete(self, log_key: Sequence[str]):
         self.upload_to_cloud_storage(log_key, ComputeIOType.STDOUT)
         self.upload_to_cloud_storage(log_key, ComputeIOType.STDERR)
 
+        if self.supports_incremental_partial_upload:
+            # the partial logs are superseded by the complete logs
+            for io_type in [ComputeIOType.STDOUT, ComputeIOType.STDERR]:
+                if self._partial_log_chunks.pop((json.dumps(log_key), io_type), None):
+                    self.delete_partial_log_objects(log_key, io_type)
+
     def is_capture_complete(self, log_key: Sequence[str]) -> bool:
         if self.local_manager.is_capture_complete(log_key):
             return True
@@ -109,6 +161,10 @@ def log_data_for_type(
                 log_key, IO_TYPE_EXTENSION[io_type]
             )
             return self.local_manager.read_path(local_path, offset=offset, max_bytes=max_bytes)
+        if self.supports_incremental_partial_upload:
+            chunks = self._download_partial_log_manifest(log_key, io_type)
+            if chunks is not None:
+                return self._read_partial_log_chunks(log_key, io_type, chunks, offset, max_bytes)
         if self.cloud_storage_has_logs(log_key, io_type, partial=True):
             self.download_from_cloud_storage(log_key, io_type, partial=True)
             local_path = self.local_manager.get_captured_local_path(
@@ -151,8 +207,89 @@ def on_progress(self, log_key):
         if self.is_capture_complete(log_key):
             return
 
-        self.upload_to_cloud_storage(log_key, ComputeIOType.STDOUT, partial=True)
-        self.upload_to_cloud_storage(log_key, ComputeIOType.STDERR, partial=True)
+        if self.supports_incremental_partial_upload:
+            self._upload_partial_log_increment(log_key, ComputeIOType.STDOUT)
+            self._upload_partial_log_increment(log_key, ComputeIOType.STDERR)
+        else:
+            self.upload_to_cloud_storage(log_key, ComputeIOType.STDOUT, partial=True)
+            self.upload_to_cloud_storage(log_key, ComputeIOType.STDERR, partial=True)
+
+    @cached_property
+    def _partial_log_chunks(self) -> Dict[Tuple[str, ComputeIOType], List[PartialLogChunk]]:
+        # the chunks uploaded so far for the logs being captured by this process
+        return {}
+
+    def _upload_partial_log_increment(self, log_key: Sequence[str], io_type: ComputeIOType):
+        path = self.local_manager.get_captured_local_path(log_key, IO_TYPE_EXTENSION[io_type])
+        if not os.path.exists(path):
+            return
+
+        chunks = self._partial_log_chunks.setdefault((json.dumps(log_key), io_type), [])
+        size = os.path.getsize(path)
+        uploaded_size = chunks[-1].offset + chunks[-1].length if chunks else 0
+        if size <= uploaded_size:
+            return
+
+        if chunks and chunks[-1].length < MIN_PARTIAL_LOG_CHUNK_BYTES:
+            # extend the last chunk instead of starting a new one
+            name, start = chunks[-1].name, chunks[-1].offset
+            chunks.pop()
+        else:
+            name, start = f"{len(chunks):06d}.chunk", uploaded_size
+
+        with open(path, "rb") as f:
+            f.seek(start)
+            data = f.read(size - start)
+
+        self.upload_partial_log_object(log_key, io_type, name, data)
+        chunks.append(PartialLogChunk(name=name, offset=start, length=len(data)))
+        # the manifest is uploaded after the chunk, so it only ever lists uploaded data
+        self.upload_partial_log_object(
+            log_key,
+            io_type,
+            PARTIAL_LOG_MANIFEST_NAME,
+            json.dumps({"chunks": [chunk._asdict() for chunk in chunks]}).encode("utf-8"),
+        )
+
+    def _download_partial_log_manifest(
+        self, log_key: Sequence[str], io_type: ComputeIOType
+    ) -> Optional[Sequence[PartialLogChunk]]:
+        manifest = self.download_partial_log_object(log_key, io_type, PARTIAL_LOG_MANIFEST_NAME)
+        if manifest is None:
+            return None
+        return [PartialLogChunk(**chunk) for chunk in json.loads(manifest)["chunks"]]
+
+    def _read_partial_log_chunks(
+        self,
+        log_key: Sequence[str],
+        io_type: ComputeIOType,
+        chunks: Sequence[PartialLogChunk],
+        offset: int,
+        max_bytes: Optional[int],
+    ) -> Tuple[bytes, int]:
+        # only download the chunks overlapping the requested range
+        parts = []
+        num_bytes = 0
+        for chunk in chunks:
+            if chunk.offset + chunk.length <= offset:
+                continue
+            if max_bytes is not None and num_bytes >= max_bytes:
+                break
+
+            data = self.download_partial_log_object(log_key, io_type, chunk.name)
+            if data is None:
+                # the partial logs were deleted after the complete logs were uploaded
+                break
+
+            # a chunk may have been extended since the manifest was read
+            part = data[offset - chunk.offset : chunk.length]
+            if max_bytes is not None:
+                part = part[: max_bytes - num_bytes]
+            parts.append(part)
+            num_bytes += len(part)
+            offset += len(part)
+
+        return b"".join(parts), offset
 
     def subscribe(
         self, log_key: Sequence[str], cursor: Optional[str] = None
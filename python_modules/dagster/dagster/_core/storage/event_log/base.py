@@ -2,6 +2,7 @@
 from typing import (
     TYPE_CHECKING,
     Iterable,
+    Iterator,
     Mapping,
     NamedTuple,
     Optional,
@@ -49,6 +50,10 @@
     from dagster._core.storage.partition_status_cache import AssetStatusCacheValue
 
 
+# The number of event log records fetched per query when iterating over the records of a run
+RUN_EVENT_RECORD_BATCH_SIZE = 1000
+
+
 class EventLogConnection(NamedTuple):
     records: Sequence[EventLogRecord]
     cursor: str
@@ -171,6 +176,55 @@ def _blocking_batch_load(
         return [records_by_key[key] for key in keys]
 
 
+class RunStatsRecord(
+    NamedTuple("_RunStatsRecord", [("run_id", str), ("stats", DagsterRunStatsSnapshot)]),
+    LoadableBy[str],
+):
+    """The stats of a run, loadable by run id so that the stats of many runs can be fetched in a
+    single batch.
+
+    Users should not invoke this class directly.
+    """
+
+    @classmethod
+    def _blocking_batch_load(
+        cls, keys: Iterable[str], context: LoadingContext
+    ) -> Iterable[Optional["RunStatsRecord"]]:
+        keys = list(keys)
+        stats_by_run_id = context.instance.get_run_stats_for_runs(keys)
+        return [
+            RunStatsRecord(run_id, stats_by_run_id[run_id]) if run_id in stats_by_run_id else None
+            for run_id in keys
+        ]
+
+
+class RunStepStatsRecord(
+    NamedTuple(
+        "_RunStepStatsRecord",
+        [("run_id", str), ("step_stats", Sequence[RunStepKeyStatsSnapshot])],
+    ),
+    LoadableBy[str],
+):
+    """The per-step stats of a run, loadable by run id so that the step stats of many runs can be
+    fetched in a single batch.
+
+    Users should not invoke this class directly.
+    """
+
+    @classmethod
+    def _blocking_batch_load(
+        cls, keys: Iterable[str], context: LoadingContext
+    ) -> Iterable[Optional["RunStepStatsRecord"]]:
+        keys = list(keys)
+        step_stats_by_run_id = context.instance.get_run_step_stats_for_runs(keys)
+        return [
+            RunStepStatsRecord(run_id, step_stats_by_run_id[run_id])
+            if run_id in step_stats_by_run_id
+            else None
+            for run_id in keys
+        ]
+
+
 class PlannedMaterializationInfo(NamedTuple):
     """Internal representation of an planned materialization event, containing storage_id / run_id.
 
@@ -240,24 +294,71 @@ def get_records_for_run(
             limit (Optional[int]): Max number of records to return.
         """
 
+    def iter_records_for_run(
+        self,
+        run_id: str,
+        cursor: Optional[str] = None,
+        of_type: Optional[Union[DagsterEventType, Set[DagsterEventType]]] = None,
+        ascending: bool = True,
+        batch_size: int = RUN_EVENT_RECORD_BATCH_SIZE,
+    ) -> Iterator[EventLogRecord]:
+        """Iterate over the event log records of a run, fetching them in batches so that only a
+        single batch is held in memory at a time.
+
+        Args:
+            run_id (str): The id of the run for which to fetch logs.
+            cursor (Optional[str]): Cursor value to start iterating after.
+            of_type (Optional[DagsterEventType]): the dagster event type to filter the logs.
+            ascending (bool): Whether to iterate from the oldest to the newest record.
+            batch_size (int): The maximum number of records to fetch per query.
+        """
+        check.int_param(batch_size, "batch_size")
+        check.invariant(batch_size > 0, "batch_size must be positive")
+
+        has_more = True
+        while has_more:
+            connection = self.get_records_for_run(
+                run_id, cursor, of_type, limit=batch_size, ascending=ascending
+            )
+            yield from connection.records
+            cursor = connection.cursor
+            has_more = connection.has_more
+
     def get_stats_for_run(self, run_id: str) -> DagsterRunStatsSnapshot:
         """Get a summary of events that have ocurred in a run."""
-        return build_run_stats_from_events(run_id, self.get_logs_for_run(run_id))
+        return build_run_stats_from_events(
+            run_id, (record.event_log_entry for record in self.iter_records_for_run(run_id))
+        )
 
     def get_step_stats_for_run(
         self, run_id: str, step_keys: Optional[Sequence[str]] = None
     ) -> Sequence[RunStepKeyStatsSnapshot]:
         """Get per-step stats for a pipeline run."""
-        logs = self.get_logs_for_run(run_id, of_type=STEP_STATS_EVENT_TYPES)
+        logs = (
+            record.event_log_entry
+            for record in self.iter_records_for_run(run_id, of_type=STEP_STATS_EVENT_TYPES)
+        )
         if step_keys:
-            logs = [
+            logs = (
                 event
                 for event in logs
                 if event.is_dagster_event and event.get_dagster_event().step_key in step_keys
-            ]
+            )
 
         return build_run_step_stats_from_events(run_id, logs)
 
+    def get_stats_for_runs(self, run_ids: Sequence[str]) -> Mapping[str, DagsterRunStatsSnapshot]:
+        """Get a summary of the events that have occurred in each of a sequence of runs, keyed by
+        run id.
+        """
+        return {run_id: self.get_stats_for_run(run_id) for run_id in run_ids}
+
+    def get_step_stats_for_runs(
+        self, run_ids: Sequence[str], step_keys: Optional[Sequence[str]] = None
+    ) -> Mapping[str, Sequence[RunStepKeyStatsSnapshot]]:
+        """Get the per-step stats for each of a sequence of runs, keyed by run id."""
+        return {run_id: self.get_step_stats_for_run(run_id, step_keys) for run_id in run_ids}
+
     @abstractmethod
     def store_event(self, event: "EventLogEntry") -> None:
         """Store an event corresponding to a pipeline run.
@@ -473,6 +574,22 @@ def get_latest_storage_id_by_partition(
     ) -> Mapping[str, int]:
         pass
 
+    def get_latest_storage_id_by_partition_for_asset_keys(
+        self,
+        asset_keys: Sequence[AssetKey],
+        event_type: DagsterEventType,
+    ) -> Mapping[AssetKey, Mapping[str, int]]:
+        """Fetch the latest storage id of the given event type for each partition of each of the
+        given asset keys.
+
+        Returns a mapping of asset key to a mapping of partition to storage id, containing every
+        given asset key.
+        """
+        return {
+            asset_key: self.get_latest_storage_id_by_partition(asset_key, event_type)
+            for asset_key in asset_keys
+        }
+
     @abstractmethod
     def get_latest_tags_by_partition(
         self,
@@ -67,6 +67,10 @@
     db.Column("tags", db.TEXT),  # guarded by secondary index check
     db.Column("create_timestamp", db.DateTime, server_default=get_sql_current_timestamp()),
     db.Column("cached_status_data", db.TEXT),
+    # materialized partitions not yet folded into cached_status_data, and the storage id up to which
+    # every materialization is reflected in them, guarded by column check
+    db.Column("pending_materialized_partitions", db.TEXT),
+    db.Column("pending_materialization_storage_id", db.BigInteger),
 )
 
 AssetEventTagsTable = db.Table(
@@ -180,6 +184,30 @@
     db.Column("create_timestamp", db.DateTime, server_default=get_sql_current_timestamp()),
 )
 
+# Rollup of the per-run event counts and timestamps served by `get_stats_for_run`, kept up to date
+# as events are stored so that stats can be read for many runs at once without aggregating over the
+# event log.
+RunStatsTable = db.Table(
+    "run_stats",
+    SqlEventLogStorageMetadata,
+    db.Column(
+        "id",
+        db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    ),
+    db.Column("run_id", db.String(255), unique=True, nullable=False),
+    db.Column("steps_succeeded", db.Integer, nullable=False, default=0),
+    db.Column("steps_failed", db.Integer, nullable=False, default=0),
+    db.Column("materializations", db.Integer, nullable=False, default=0),
+    db.Column("expectations", db.Integer, nullable=False, default=0),
+    db.Column("enqueued_timestamp", db.types.TIMESTAMP),
+    db.Column("launch_timestamp", db.types.TIMESTAMP),
+    db.Column("start_timestamp", db.types.TIMESTAMP),
+    db.Column("end_timestamp", db.types.TIMESTAMP),
+    db.Column("create_timestamp", db.DateTime, server_default=get_sql_current_timestamp()),
+)
+
 db.Index(
     "idx_asset_check_executions",
     AssetCheckExecutionsTable.c.asset_key,
@@ -63,6 +63,7 @@
 )
 from dagster._core.storage.dagster_run import DagsterRunStatsSnapshot
 from dagster._core.storage.event_log.base import (
+    RUN_EVENT_RECORD_BATCH_SIZE,
     AssetCheckSummaryRecord,
     AssetEntry,
     AssetRecord,
@@ -87,6 +88,7 @@
     ConcurrencySlotsTable,
     DynamicPartitionsTable,
     PendingStepsTable,
+    RunStatsTable,
     SecondaryIndexMigrationTable,
     SqlEventLogStorageTable,
 )
@@ -99,7 +101,6 @@
 )
 from dagster._serdes import deserialize_value, serialize_value
 from dagster._serdes.errors import DeserializationError
-from dagster._serdes.serdes import deserialize_values
 from dagster._time import datetime_from_timestamp, get_current_timestamp, utc_datetime_from_naive
 from dagster._utils import PrintFn
 from dagster._utils.concurrency import (
@@ -116,7 +117,47 @@
     from dagster._core.storage.partition_status_cache import AssetStatusCacheValue
 
 MIN_ASSET_ROWS = 25
+# The number of times a materialization is retried against a concurrently updated asset status cache
+# value before the cache value is discarded
+ASSET_CACHED_STATUS_UPDATE_ATTEMPTS = 5
 DEFAULT_MAX_LIMIT_EVENT_RECORDS = 10000
+# number of runs whose step events are fetched per query when loading step stats for many runs
+STEP_STATS_RUN_ID_BATCH_SIZE = 25
+
+# Columns of the run stats table that count the events of a given type
+RUN_STATS_COUNT_COLUMN_BY_EVENT_TYPE = {
+    DagsterEventType.STEP_SUCCESS: "steps_succeeded",
+    DagsterEventType.STEP_FAILURE: "steps_failed",
+    DagsterEventType.ASSET_MATERIALIZATION: "materializations",
+    DagsterEventType.STEP_EXPECTATION_RESULT: "expectations",
+}
+# Columns of the run stats table that record the time of the latest event of a given type
+RUN_STATS_TIMESTAMP_COLUMN_BY_EVENT_TYPE = {
+    DagsterEventType.PIPELINE_ENQUEUED: "enqueued_timestamp",
+    DagsterEventType.PIPELINE_STARTING: "launch_timestamp",
+    DagsterEventType.PIPELINE_START: "start_timestamp",
+    DagsterEventType.PIPELINE_SUCCESS: "end_timestamp",
+    DagsterEventType.PIPELINE_FAILURE: "end_timestamp",
+    DagsterEventType.PIPELINE_CANCELED: "end_timestamp",
+}
+
+# a run's end time is that of its success event, falling back to its failure or cancel event
+RUN_STATS_END_EVENT_TYPES_BY_PRECEDENCE = [
+    DagsterEventType.PIPELINE_SUCCESS,
+    DagsterEventType.PIPELINE_FAILURE,
+    DagsterEventType.PIPELINE_CANCELED,
+]
+
+
+def _get_run_stats_end_timestamp(times: Mapping[str, datetime]) -> Optional[datetime]:
+    return next(
+        (
+            times[event_type.value]
+            for event_type in RUN_STATS_END_EVENT_TYPES_BY_PRECEDENCE
+            if event_type.value in times
+        ),
+        None,
+    )
 
 
 def get_max_event_records_limit() -> int:
@@ -461,10 +502,173 @@ def store_event(self, event: EventLogEntry) -> None:
                 )
 
             self.store_asset_event_tags([event], [event_id])
+            self.update_asset_cached_status_for_events([event], [event_id])
 
         if event.is_dagster_event and event.dagster_event_type in ASSET_CHECK_EVENTS:
             self.store_asset_check_event(event, event_id)
 
+        self.update_run_stats_for_events([event])
+
+    @cached_property
+    def has_run_stats_table(self) -> bool:
+        # This table was added later, and to avoid forcing a migration
+        # we handle in the code if its been added or not.
+        return self.has_table(RunStatsTable.name)
+
+    def update_run_stats_for_events(self, events: Sequence[EventLogEntry]) -> None:
+        """Applies a sequence of stored events to the rollup in the run stats table, with a single
+        update per run.
+        """
+        if not self.has_run_stats_table:
+            return
+
+        values_by_run_id: Dict[str, Dict[str, Any]] = defaultdict(dict)
+        run_ids_with_end_events: Set[str] = set()
+        for event in events:
+            event_type = event.dagster_event_type
+            if event_type in RUN_STATS_COUNT_COLUMN_BY_EVENT_TYPE:
+                column = RUN_STATS_COUNT_COLUMN_BY_EVENT_TYPE[event_type]
+                values = values_by_run_id[event.run_id]
+                values[column] = values.get(column, 0) + 1
+            elif event_type in RUN_STATS_END_EVENT_TYPES_BY_PRECEDENCE:
+                # resolved against all of the run's end events when the row is updated
+                run_ids_with_end_events.add(event.run_id)
+            elif event_type in RUN_STATS_TIMESTAMP_COLUMN_BY_EVENT_TYPE:
+                column = RUN_STATS_TIMESTAMP_COLUMN_BY_EVENT_TYPE[event_type]
+                values_by_run_id[event.run_id][column] = self._event_insert_timestamp(event)
+
+        for run_id in {*values_by_run_id, *run_ids_with_end_events}:
+            self._update_run_stats(
+                run_id,
+                values_by_run_id.get(run_id, {}),
+                update_end_timestamp=run_id in run_ids_with_end_events,
+            )
+
+    def _update_run_stats(
+        self, run_id: str, values: Mapping[str, Any], update_end_timestamp: bool = False
+    ) -> None:
+        with self.run_connection(run_id) as conn:
+            if update_end_timestamp:
+                # A run can store more than one end event (e.g. a failure followed by a cancel), so
+                # the end time is recomputed with the same precedence as the full aggregate rather
+                # than taken from whichever end event was stored last.
+                values = {**values, "end_timestamp": self._get_run_end_timestamp(conn, run_id)}
+
+            update_statement = (
+                RunStatsTable.update()
+                .where(RunStatsTable.c.run_id == run_id)
+                .values(
+                    {
+                        column: (
+                            RunStatsTable.c[column] + value
+                            if column in RUN_STATS_COUNT_COLUMN_BY_EVENT_TYPE.values()
+                            else value
+                        )
+                        for column, value in values.items()
+                    }
+                )
+            )
+            if conn.execute(update_statement).rowcount > 0:
+                return
+
+            # This is the first stats event of the run since the table was created. The events have
+            # already been stored, so the row is initialized by aggregating over the event log,
+            # which also accounts for any events that were stored before the table existed.
+            try:
+                conn.execute(
+                    RunStatsTable.insert().values(
+                        run_id=run_id, **self._get_run_stats_values(conn, [run_id])[run_id]
+                    )
+                )
+            except db_exc.IntegrityError:
+                # initialized concurrently, from an aggregate that may not include these events
+                conn.execute(
+                    RunStatsTable.update()
+                    .where(RunStatsTable.c.run_id == run_id)
+                    .values(**self._get_run_stats_values(conn, [run_id])[run_id])
+                )
+
+    def _get_run_end_timestamp(self, conn: Connection, run_id: str) -> Optional[datetime]:
+        query = (
+            db_select(
+                [
+                    SqlEventLogStorageTable.c.dagster_event_type,
+                    db.func.max(SqlEventLogStorageTable.c.timestamp).label("last_event_timestamp"),
+                ]
+            )
+            .where(
+                db.and_(
+                    SqlEventLogStorageTable.c.run_id == run_id,
+                    SqlEventLogStorageTable.c.dagster_event_type.in_(
+                        [event_type.value for event_type in RUN_STATS_END_EVENT_TYPES_BY_PRECEDENCE]
+                    ),
+                )
+            )
+            .group_by(SqlEventLogStorageTable.c.dagster_event_type)
+        )
+        return _get_run_stats_end_timestamp(
+            {
+                dagster_event_type: last_event_timestamp
+                for dagster_event_type, last_event_timestamp in conn.execute(query).fetchall()
+            }
+        )
+
+    def _get_run_stats_values(
+        self, conn: Connection, run_ids: Sequence[str]
+    ) -> Mapping[str, Mapping[str, Any]]:
+        """Aggregates the run stats table values for the given runs from the event log."""
+        query = (
+            db_select(
+                [
+                    SqlEventLogStorageTable.c.run_id,
+                    SqlEventLogStorageTable.c.dagster_event_type,
+                    db.func.count().label("n_events_of_type"),
+                    db.func.max(SqlEventLogStorageTable.c.timestamp).label("last_event_timestamp"),
+                ]
+            )
+            .where(
+                db.and_(
+                    SqlEventLogStorageTable.c.run_id.in_(run_ids),
+                    SqlEventLogStorageTable.c.dagster_event_type.in_(
+                        [
+                            event_type.value
+                            for event_type in [
+                                *RUN_STATS_COUNT_COLUMN_BY_EVENT_TYPE,
+                                *RUN_STATS_TIMESTAMP_COLUMN_BY_EVENT_TYPE,
+                            ]
+                        ]
+                    ),
+                )
+            )
+            .group_by(
+                SqlEventLogStorageTable.c.run_id, SqlEventLogStorageTable.c.dagster_event_type
+            )
+        )
+
+        counts_by_run_id: Dict[str, Dict[str, int]] = {run_id: {} for run_id in run_ids}
+        times_by_run_id: Dict[str, Dict[str, datetime]] = {run_id: {} for run_id in run_ids}
+        for run_id, dagster_event_type, n_events_of_type, last_event_timestamp in conn.execute(
+            query
+        ).fetchall():
+            counts_by_run_id[run_id][dagster_event_type] = n_events_of_type
+            times_by_run_id[run_id][dagster_event_type] = last_event_timestamp
+
+        values_by_run_id = {}
+        for run_id in run_ids:
+            counts = counts_by_run_id[run_id]
+            times = times_by_run_id[run_id]
+            values_by_run_id[run_id] = {
+                **{
+                    column: counts.get(event_type.value, 0)
+                    for event_type, column in RUN_STATS_COUNT_COLUMN_BY_EVENT_TYPE.items()
+                },
+                "enqueued_timestamp": times.get(DagsterEventType.PIPELINE_ENQUEUED.value),
+                "launch_timestamp": times.get(DagsterEventType.PIPELINE_STARTING.value),
+                "start_timestamp": times.get(DagsterEventType.PIPELINE_START.value),
+                "end_timestamp": _get_run_stats_end_timestamp(times),
+            }
+        return values_by_run_id
+
     def get_records_for_run(
         self,
         run_id,
@@ -485,29 +689,7 @@ def get_records_for_run(
         check.str_param(run_id, "run_id")
         check.opt_str_param(cursor, "cursor")
 
-        check.invariant(not of_type or isinstance(of_type, (DagsterEventType, frozenset, set)))
-
-        dagster_event_types = (
-            {of_type}
-            if isinstance(of_type, DagsterEventType)
-            else check.opt_set_param(of_type, "dagster_event_type", of_type=DagsterEventType)
-        )
-
-        query = (
-            db_select([SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event])
-            .where(SqlEventLogStorageTable.c.run_id == run_id)
-            .order_by(
-                SqlEventLogStorageTable.c.id.asc()
-                if ascending
-                else SqlEventLogStorageTable.c.id.desc()
-            )
-        )
-        if dagster_event_types:
-            query = query.where(
-                SqlEventLogStorageTable.c.dagster_event_type.in_(
-                    [dagster_event_type.value for dagster_event_type in dagster_event_types]
-                )
-            )
+        query = self._get_records_for_run_query(run_id, of_type, ascending)
 
         # adjust 0 based index cursor to SQL offset
         if cursor is not None:
@@ -558,68 +740,164 @@ def get_records_for_run(
             has_more=bool(limit and len(results) == limit),
         )
 
-    def get_stats_for_run(self, run_id: str) -> DagsterRunStatsSnapshot:
-        check.str_param(run_id, "run_id")
+    def _get_records_for_run_query(
+        self,
+        run_id: str,
+        of_type: Optional[Union[DagsterEventType, Set[DagsterEventType]]],
+        ascending: bool,
+    ) -> SqlAlchemyQuery:
+        check.invariant(not of_type or isinstance(of_type, (DagsterEventType, frozenset, set)))
+
+        dagster_event_types = (
+            {of_type}
+            if isinstance(of_type, DagsterEventType)
+            else check.opt_set_param(of_type, "dagster_event_type", of_type=DagsterEventType)
+        )
 
         query = (
-            db_select(
-                [
-                    SqlEventLogStorageTable.c.dagster_event_type,
-                    db.func.count().label("n_events_of_type"),
-                    db.func.max(SqlEventLogStorageTable.c.timestamp).label("last_event_timestamp"),
-                ]
+            db_select([SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event])
+            .where(SqlEventLogStorageTable.c.run_id == run_id)
+            .order_by(
+                SqlEventLogStorageTable.c.id.asc()
+                if ascending
+                else SqlEventLogStorageTable.c.id.desc()
             )
-            .where(
-                db.and_(
-                    SqlEventLogStorageTable.c.run_id == run_id,
-                    SqlEventLogStorageTable.c.dagster_event_type != None,  # noqa: E711
+        )
+        if dagster_event_types:
+            query = query.where(
+                SqlEventLogStorageTable.c.dagster_event_type.in_(
+                    [dagster_event_type.value for dagster_event_type in dagster_event_types]
                 )
             )
-            .group_by("dagster_event_type")
+        return query
+
+    def _iter_run_rows_by_storage_id(
+        self,
+        run_id: str,
+        query: SqlAlchemyQuery,
+        ascending: bool,
+        after_storage_id: Optional[int],
+        batch_size: int,
+    ) -> Iterator[SqlAlchemyRow]:
+        """Yields the rows of a query over the event log rows of a run, ordered by storage id and
+        selecting the storage id as its first column, in batches of `batch_size` rows. Each batch
+        is fetched with a fresh connection, filtering on the storage id of the last row of the
+        previous batch rather than using an offset, so that every batch is an index range scan.
+        """
+        while True:
+            batch_query = query
+            if after_storage_id is not None:
+                batch_query = batch_query.where(
+                    SqlEventLogStorageTable.c.id > after_storage_id
+                    if ascending
+                    else SqlEventLogStorageTable.c.id < after_storage_id
+                )
+
+            with self.run_connection(run_id) as conn:
+                rows = conn.execute(batch_query.limit(batch_size)).fetchall()
+
+            yield from rows
+
+            if len(rows) < batch_size:
+                return
+            after_storage_id = rows[-1][0]
+
+    def iter_records_for_run(
+        self,
+        run_id: str,
+        cursor: Optional[str] = None,
+        of_type: Optional[Union[DagsterEventType, Set[DagsterEventType]]] = None,
+        ascending: bool = True,
+        batch_size: int = RUN_EVENT_RECORD_BATCH_SIZE,
+    ) -> Iterator[EventLogRecord]:
+        check.str_param(run_id, "run_id")
+        check.opt_str_param(cursor, "cursor")
+        check.int_param(batch_size, "batch_size")
+        check.invariant(batch_size > 0, "batch_size must be positive")
+
+        cursor_obj = EventLogCursor.parse(cursor) if cursor is not None else None
+        if cursor_obj and cursor_obj.is_offset_cursor():
+            # the first page resolves the offset into a storage id cursor
+            yield from super().iter_records_for_run(run_id, cursor, of_type, ascending, batch_size)
+            return
+
+        rows = self._iter_run_rows_by_storage_id(
+            run_id,
+            self._get_records_for_run_query(run_id, of_type, ascending),
+            ascending,
+            after_storage_id=cursor_obj.storage_id() if cursor_obj else None,
+            batch_size=batch_size,
         )
+        for record_id, json_str in rows:
+            # only deserialize each entry as it is consumed
+            try:
+                event_log_entry = deserialize_value(json_str, EventLogEntry)
+            except (seven.JSONDecodeError, DeserializationError) as err:
+                raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+            yield EventLogRecord(storage_id=record_id, event_log_entry=event_log_entry)
+
+    def get_stats_for_run(self, run_id: str) -> DagsterRunStatsSnapshot:
+        check.str_param(run_id, "run_id")
 
         with self.run_connection(run_id) as conn:
-            results = conn.execute(query).fetchall()
+            values = self._get_run_stats_rows(conn, [run_id]).get(run_id)
+            if values is None:
+                values = self._get_run_stats_values(conn, [run_id])[run_id]
 
-        try:
-            counts = {}
-            times = {}
-            for result in results:
-                (dagster_event_type, n_events_of_type, last_event_timestamp) = result
-                check.invariant(dagster_event_type is not None)
-                counts[dagster_event_type] = n_events_of_type
-                times[dagster_event_type] = last_event_timestamp
-
-            enqueued_time = times.get(DagsterEventType.PIPELINE_ENQUEUED.value, None)
-            launch_time = times.get(DagsterEventType.PIPELINE_STARTING.value, None)
-            start_time = times.get(DagsterEventType.PIPELINE_START.value, None)
-            end_time = times.get(
-                DagsterEventType.PIPELINE_SUCCESS.value,
-                times.get(
-                    DagsterEventType.PIPELINE_FAILURE.value,
-                    times.get(DagsterEventType.PIPELINE_CANCELED.value, None),
-                ),
-            )
+        return self._run_stats_from_values(run_id, values)
 
-            return DagsterRunStatsSnapshot(
-                run_id=run_id,
-                steps_succeeded=counts.get(DagsterEventType.STEP_SUCCESS.value, 0),
-                steps_failed=counts.get(DagsterEventType.STEP_FAILURE.value, 0),
-                materializations=counts.get(DagsterEventType.ASSET_MATERIALIZATION.value, 0),
-                expectations=counts.get(DagsterEventType.STEP_EXPECTATION_RESULT.value, 0),
-                enqueued_time=(
-                    utc_datetime_from_naive(enqueued_time).timestamp() if enqueued_time else None
-                ),
-                launch_time=(
-                    utc_datetime_from_naive(launch_time).timestamp() if launch_time else None
-                ),
-                start_time=(
-                    utc_datetime_from_naive(start_time).timestamp() if start_time else None
-                ),
-                end_time=(utc_datetime_from_naive(end_time).timestamp() if end_time else None),
-            )
-        except (seven.JSONDecodeError, DeserializationError) as err:
-            raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+    def get_stats_for_runs(self, run_ids: Sequence[str]) -> Mapping[str, DagsterRunStatsSnapshot]:
+        check.sequence_param(run_ids, "run_ids", of_type=str)
+
+        if self.is_run_sharded:
+            return {run_id: self.get_stats_for_run(run_id) for run_id in run_ids}
+
+        run_ids = list(dict.fromkeys(run_ids))
+        if not run_ids:
+            return {}
+
+        with self.index_connection() as conn:
+            values_by_run_id = dict(self._get_run_stats_rows(conn, run_ids))
+            # runs without a row in the run stats table, either because they have not stored any
+            # stats events or because they stored them before the table existed
+            missing_run_ids = [run_id for run_id in run_ids if run_id not in values_by_run_id]
+            if missing_run_ids:
+                values_by_run_id.update(self._get_run_stats_values(conn, missing_run_ids))
+
+        return {
+            run_id: self._run_stats_from_values(run_id, values_by_run_id[run_id])
+            for run_id in run_ids
+        }
+
+    def _get_run_stats_rows(
+        self, conn: Connection, run_ids: Sequence[str]
+    ) -> Mapping[str, Mapping[str, Any]]:
+        if not self.has_run_stats_table:
+            return {}
+
+        rows = db_fetch_mappings(
+            conn, db_select([RunStatsTable]).where(RunStatsTable.c.run_id.in_(run_ids))
+        )
+        return {cast(str, row["run_id"]): row for row in rows}
+
+    def _run_stats_from_values(
+        self, run_id: str, values: Mapping[str, Any]
+    ) -> DagsterRunStatsSnapshot:
+        def _timestamp(column: str) -> Optional[float]:
+            value = values[column]
+            return utc_datetime_from_naive(value).timestamp() if value else None
+
+        return DagsterRunStatsSnapshot(
+            run_id=run_id,
+            steps_succeeded=values["steps_succeeded"],
+            steps_failed=values["steps_failed"],
+            materializations=values["materializations"],
+            expectations=values["expectations"],
+            enqueued_time=_timestamp("enqueued_timestamp"),
+            launch_time=_timestamp("launch_timestamp"),
+            start_time=_timestamp("start_timestamp"),
+            end_time=_timestamp("end_timestamp"),
+        )
 
     def get_step_stats_for_run(
         self, run_id: str, step_keys: Optional[Sequence[str]] = None
@@ -639,9 +917,68 @@ def get_step_stats_for_run(
         # being able to share code with the in-memory event log storage implementation.  We may
         # choose to revisit this in the future, especially if we are able to do JSON-column queries
         # in SQL as a way of bypassing the serdes layer in all cases.
-        raw_event_query = (
-            db_select([SqlEventLogStorageTable.c.event])
-            .where(SqlEventLogStorageTable.c.run_id == run_id)
+        raw_event_query = self._get_step_stats_query([run_id], step_keys)
+
+        # stream the events so that only a batch of them is held in memory at a time
+        rows = self._iter_run_rows_by_storage_id(
+            run_id,
+            raw_event_query,
+            ascending=True,
+            after_storage_id=None,
+            batch_size=RUN_EVENT_RECORD_BATCH_SIZE,
+        )
+
+        try:
+            records = (deserialize_value(json_str, EventLogEntry) for (_, json_str, _) in rows)
+            return build_run_step_stats_from_events(run_id, records)
+        except (seven.JSONDecodeError, DeserializationError) as err:
+            raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+
+    def get_step_stats_for_runs(
+        self, run_ids: Sequence[str], step_keys: Optional[Sequence[str]] = None
+    ) -> Mapping[str, Sequence[RunStepKeyStatsSnapshot]]:
+        check.sequence_param(run_ids, "run_ids", of_type=str)
+        check.opt_list_param(step_keys, "step_keys", of_type=str)
+
+        if self.is_run_sharded:
+            return {run_id: self.get_step_stats_for_run(run_id, step_keys) for run_id in run_ids}
+
+        run_ids = list(dict.fromkeys(run_ids))
+        step_stats_by_run_id: Dict[str, Sequence[RunStepKeyStatsSnapshot]] = {}
+        # fetch the events of a bounded number of runs at a time, so that only the events of one
+        # batch of runs are held in memory while their stats are built
+        for i in range(0, len(run_ids), STEP_STATS_RUN_ID_BATCH_SIZE):
+            batch_run_ids = run_ids[i : i + STEP_STATS_RUN_ID_BATCH_SIZE]
+            query = self._get_step_stats_query(batch_run_ids, step_keys)
+            with self.index_connection() as conn:
+                rows = conn.execute(query).fetchall()
+
+            entries_by_run_id: Dict[str, List[EventLogEntry]] = {
+                run_id: [] for run_id in batch_run_ids
+            }
+            for _, json_str, run_id in rows:
+                try:
+                    entries_by_run_id[run_id].append(deserialize_value(json_str, EventLogEntry))
+                except (seven.JSONDecodeError, DeserializationError) as err:
+                    raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+
+            for run_id, entries in entries_by_run_id.items():
+                step_stats_by_run_id[run_id] = build_run_step_stats_from_events(run_id, entries)
+
+        return step_stats_by_run_id
+
+    def _get_step_stats_query(
+        self, run_ids: Sequence[str], step_keys: Optional[Sequence[str]]
+    ) -> SqlAlchemyQuery:
+        query = (
+            db_select(
+                [
+                    SqlEventLogStorageTable.c.id,
+                    SqlEventLogStorageTable.c.event,
+                    SqlEventLogStorageTable.c.run_id,
+                ]
+            )
+            .where(SqlEventLogStorageTable.c.run_id.in_(run_ids))
             .where(SqlEventLogStorageTable.c.step_key != None)  # noqa: E711
             .where(
                 SqlEventLogStorageTable.c.dagster_event_type.in_(
@@ -662,18 +999,9 @@ def get_step_stats_for_run(
             .order_by(SqlEventLogStorageTable.c.id.asc())
         )
         if step_keys:
-            raw_event_query = raw_event_query.where(
-                SqlEventLogStorageTable.c.step_key.in_(step_keys)
-            )
-
-        with self.run_connection(run_id) as conn:
-            results = conn.execute(raw_event_query).fetchall()
+            query = query.where(SqlEventLogStorageTable.c.step_key.in_(step_keys))
 
-        try:
-            records = deserialize_values((json_str for (json_str,) in results), EventLogEntry)
-            return build_run_step_stats_from_events(run_id, records)
-        except (seven.JSONDecodeError, DeserializationError) as err:
-            raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+        return query
 
     def _apply_migration(self, migration_name, migration_fn, print_fn, force):
         if self.has_secondary_index(migration_name):
@@ -726,6 +1054,9 @@ def wipe(self) -> None:
             if self.has_table("asset_check_executions"):
                 conn.execute(AssetCheckExecutionsTable.delete())
 
+            if self.has_table("run_stats"):
+                conn.execute(RunStatsTable.delete())
+
         self._wipe_index()
 
     def _wipe_index(self):
@@ -748,6 +1079,9 @@ def _wipe_index(self):
             if self.has_table("asset_check_executions"):
                 conn.execute(AssetCheckExecutionsTable.delete())
 
+            if self.has_table("run_stats"):
+                conn.execute(RunStatsTable.delete())
+
     def delete_events(self, run_id: str) -> None:
         with self.run_connection(run_id) as conn:
             self.delete_events_for_run(conn, run_id)
@@ -781,6 +1115,8 @@ def delete_events_for_run(self, conn: Connection, run_id: str) -> None:
                     AssetEventTagsTable.c.event_id.in_(asset_event_ids)
                 )
             )
+        if self.has_run_stats_table:
+            conn.execute(RunStatsTable.delete().where(RunStatsTable.c.run_id == run_id))
 
     @property
     def is_persistent(self) -> bool:
@@ -1193,8 +1529,6 @@ def _construct_asset_record_from_row(
         last_materialization_record: Optional[EventLogRecord],
         can_read_asset_status_cache: bool,
     ) -> AssetRecord:
-        from dagster._core.storage.partition_status_cache import AssetStatusCacheValue
-
         asset_key = AssetKey.from_db_string(row["asset_key"])
         if asset_key:
             return AssetRecord(
@@ -1205,9 +1539,7 @@ def _construct_asset_record_from_row(
                     last_run_id=row["last_run_id"],
                     asset_details=AssetDetails.from_db_string(row["asset_details"]),
                     cached_status=(
-                        AssetStatusCacheValue.from_db_string(row["cached_status_data"])
-                        if can_read_asset_status_cache
-                        else None
+                        self._cached_status_from_row(row) if can_read_asset_status_cache else None
                     ),
                     last_planned_materialization_storage_id=None,
                 ),
@@ -1215,6 +1547,24 @@ def _construct_asset_record_from_row(
         else:
             check.failed("Row did not contain asset key.")
 
+    def _cached_status_from_row(self, row) -> Optional["AssetStatusCacheValue"]:
+        from dagster._core.storage.partition_status_cache import AssetStatusCacheValue
+
+        cached_status = AssetStatusCacheValue.from_db_string(row["cached_status_data"])
+        if (
+            cached_status is None
+            or not self.has_asset_status_cache_pending_cols
+            or not row["pending_materialized_partitions"]
+        ):
+            return cached_status
+
+        return cached_status._replace(
+            pending_materialized_partition_keys=seven.json.loads(
+                row["pending_materialized_partitions"]
+            ),
+            pending_materialization_storage_id=row["pending_materialization_storage_id"],
+        )
+
     def _get_latest_materialization_records(
         self, raw_asset_rows
     ) -> Mapping[AssetKey, Optional[EventLogRecord]]:
@@ -1295,12 +1645,26 @@ def wipe_asset_cached_status(self, asset_key: AssetKey) -> None:
             with self.index_connection() as conn:
                 conn.execute(
                     AssetKeyTable.update()
-                    .values(dict(cached_status_data=None))
+                    .values(self._get_cleared_asset_status_cache_values())
                     .where(
                         AssetKeyTable.c.asset_key == asset_key.to_string(),
                     )
                 )
 
+    def _get_cleared_asset_status_cache_values(self) -> Mapping[str, Any]:
+        values: Dict[str, Any] = dict(cached_status_data=None)
+        if self.has_asset_status_cache_pending_cols:
+            values.update(
+                dict(pending_materialized_partitions=None, pending_materialization_storage_id=None)
+            )
+        return values
+
+    @cached_property
+    def has_asset_status_cache_pending_cols(self) -> bool:
+        # These columns were added later, and to avoid forcing a migration
+        # we handle in the code if they've been added or not.
+        return self.has_asset_key_col("pending_materialization_storage_id")
+
     def get_asset_records(
         self, asset_keys: Optional[Sequence[AssetKey]] = None
     ) -> Sequence[AssetRecord]:
@@ -1436,6 +1800,13 @@ def _fetch_raw_asset_rows(
         ]
         if self.can_read_asset_status_cache():
             columns.extend([AssetKeyTable.c.cached_status_data])
+            if self.has_asset_status_cache_pending_cols:
+                columns.extend(
+                    [
+                        AssetKeyTable.c.pending_materialized_partitions,
+                        AssetKeyTable.c.pending_materialization_storage_id,
+                    ]
+                )
 
         is_partial_query = asset_keys is not None or bool(prefix) or bool(limit) or bool(cursor)
         if self.has_asset_key_index_cols() and not is_partial_query:
@@ -1515,14 +1886,174 @@ def update_asset_cached_status_data(
         self, asset_key: AssetKey, cache_values: "AssetStatusCacheValue"
     ) -> None:
         if self.can_read_asset_status_cache():
+            if not self.has_asset_status_cache_pending_cols:
+                with self.index_connection() as conn:
+                    conn.execute(
+                        AssetKeyTable.update()
+                        .where(
+                            AssetKeyTable.c.asset_key == asset_key.to_string(),
+                        )
+                        .values(cached_status_data=serialize_value(cache_values))
+                    )
+                return
+
+            # The pending partitions are stored in their own columns, so that they can be recorded
+            # as materializations are written without rewriting the cache value.
+            pending_partition_keys = cache_values.pending_materialized_partition_keys
+            materialization_cursor = cache_values.materialization_cursor
             with self.index_connection() as conn:
                 conn.execute(
                     AssetKeyTable.update()
                     .where(
-                        AssetKeyTable.c.asset_key == asset_key.to_string(),
+                        db.and_(
+                            AssetKeyTable.c.asset_key == asset_key.to_string(),
+                            # Skip the update if the stored value already reflects later
+                            # materializations, e.g. if it was concurrently rebuilt by another
+                            # reader, or had materializations recorded on it since it was read.
+                            db.or_(
+                                AssetKeyTable.c.pending_materialization_storage_id == None,  # noqa: E711
+                                AssetKeyTable.c.pending_materialization_storage_id
+                                <= materialization_cursor,
+                            ),
+                        )
+                    )
+                    .values(
+                        cached_status_data=serialize_value(
+                            cache_values._replace(
+                                pending_materialized_partition_keys=None,
+                                pending_materialization_storage_id=None,
+                            )
+                        ),
+                        pending_materialized_partitions=(
+                            seven.json.dumps(list(pending_partition_keys))
+                            if pending_partition_keys
+                            else None
+                        ),
+                        pending_materialization_storage_id=materialization_cursor,
+                    )
+                )
+
+    def update_asset_cached_status_for_events(
+        self, events: Sequence[EventLogEntry], event_ids: Sequence[int]
+    ) -> None:
+        """Records the partitions materialized by the given events on the cached status of their
+        assets as they are written, so that reading the cached status does not need to query the
+        event log for materializations stored since it was last built.
+        """
+        if not self.has_asset_status_cache_pending_cols:
+            # the cached status is rebuilt from the event log on read until the storage is migrated
+            return
+
+        partitions_and_event_ids_by_asset_key: Dict[AssetKey, List[Tuple[str, int]]] = defaultdict(
+            list
+        )
+        for event, event_id in zip(events, event_ids):
+            dagster_event = event.dagster_event
+            if (
+                dagster_event
+                and dagster_event.is_step_materialization
+                and dagster_event.asset_key
+                and dagster_event.partition
+            ):
+                partitions_and_event_ids_by_asset_key[dagster_event.asset_key].append(
+                    (dagster_event.partition, event_id)
+                )
+
+        if not partitions_and_event_ids_by_asset_key or not self.can_write_asset_status_cache():
+            return
+
+        for asset_key, partitions_and_event_ids in partitions_and_event_ids_by_asset_key.items():
+            self._update_asset_cached_status_for_materializations(
+                asset_key, partitions_and_event_ids
+            )
+
+    def _update_asset_cached_status_for_materializations(
+        self, asset_key: AssetKey, partitions_and_event_ids: Sequence[Tuple[str, int]]
+    ) -> None:
+        from dagster._core.storage.partition_status_cache import (
+            MAX_PENDING_MATERIALIZED_PARTITION_KEYS,
+        )
+
+        asset_key_str = asset_key.to_string()
+        min_event_id = min(event_id for _, event_id in partitions_and_event_ids)
+        max_event_id = max(event_id for _, event_id in partitions_and_event_ids)
+        previous_materialization_id = None
+
+        # Only the pending columns are read and written here, never the cache value itself, so
+        # the cost of recording a materialization is independent of the number of partitions.
+        for _ in range(ASSET_CACHED_STATUS_UPDATE_ATTEMPTS):
+            with self.index_connection() as conn:
+                row = conn.execute(
+                    db_select(
+                        [
+                            AssetKeyTable.c.pending_materialization_storage_id,
+                            AssetKeyTable.c.pending_materialized_partitions,
+                        ]
+                    ).where(AssetKeyTable.c.asset_key == asset_key_str)
+                ).fetchone()
+
+            materialization_cursor = row[0] if row else None
+            if materialization_cursor is None:
+                # there is no cache value, or it predates the pending columns, so it is built on
+                # read
+                return
+
+            if previous_materialization_id is None:
+                with self.index_connection() as conn:
+                    previous_materialization_id = (
+                        conn.execute(
+                            db_select([db.func.max(SqlEventLogStorageTable.c.id)]).where(
+                                db.and_(
+                                    SqlEventLogStorageTable.c.asset_key == asset_key_str,
+                                    SqlEventLogStorageTable.c.dagster_event_type
+                                    == DagsterEventType.ASSET_MATERIALIZATION.value,
+                                    SqlEventLogStorageTable.c.id < min_event_id,
+                                )
+                            )
+                        ).scalar()
+                        or 0
+                    )
+
+            # Pending partitions can only be recorded on a cache value that reflects every prior
+            # materialization, otherwise its cursor would skip past the ones it is missing. Those
+            # are picked up by the reader, which queries the event log past the cursor.
+            if materialization_cursor < previous_materialization_id:
+                return
+
+            # dicts preserve insertion order, so keys stay in the order they were materialized
+            pending_partition_keys = dict.fromkeys(seven.json.loads(row[1]) if row[1] else [])
+            pending_partition_keys.update(
+                dict.fromkeys(partition for partition, _ in partitions_and_event_ids)
+            )
+            if len(pending_partition_keys) > MAX_PENDING_MATERIALIZED_PARTITION_KEYS:
+                # left for the reader to catch up on from the event log
+                return
+
+            # compare-and-swap on the cursor, which advances with every update to the cache value
+            with self.index_connection() as conn:
+                result = conn.execute(
+                    AssetKeyTable.update()
+                    .where(
+                        db.and_(
+                            AssetKeyTable.c.asset_key == asset_key_str,
+                            AssetKeyTable.c.pending_materialization_storage_id
+                            == materialization_cursor,
+                        )
+                    )
+                    .values(
+                        pending_materialized_partitions=seven.json.dumps(
+                            list(pending_partition_keys)
+                        ),
+                        pending_materialization_storage_id=max(
+                            materialization_cursor, max_event_id
+                        ),
                     )
-                    .values(cached_status_data=serialize_value(cache_values))
                 )
+                if result.rowcount:
+                    return
+
+        # If every attempt lost the race, the cursor was never advanced past these materializations
+        # without reflecting them, so the reader catches up on them from the event log.
 
     def _fetch_backcompat_materialization_times(
         self, asset_keys: Sequence[AssetKey]
@@ -1772,7 +2303,7 @@ def _get_asset_key_values_on_wipe(self) -> Mapping[str, Any]:
                 )
             )
         if self.can_read_asset_status_cache():
-            values.update(dict(cached_status_data=None))
+            values.update(self._get_cleared_asset_status_cache_values())
         return values
 
     def wipe_asset(self, asset_key: AssetKey) -> None:
@@ -1906,6 +2437,52 @@ def get_latest_storage_id_by_partition(
             latest_materialization_storage_id_by_partition[cast(str, row[0])] = cast(int, row[1])
         return latest_materialization_storage_id_by_partition
 
+    def get_latest_storage_id_by_partition_for_asset_keys(
+        self,
+        asset_keys: Sequence[AssetKey],
+        event_type: DagsterEventType,
+    ) -> Mapping[AssetKey, Mapping[str, int]]:
+        check.sequence_param(asset_keys, "asset_keys", of_type=AssetKey)
+        check.inst_param(event_type, "event_type", DagsterEventType)
+
+        latest_storage_id_by_partition_by_asset_key: Dict[AssetKey, Dict[str, int]] = {
+            asset_key: {} for asset_key in asset_keys
+        }
+        if not asset_keys:
+            return latest_storage_id_by_partition_by_asset_key
+
+        query = (
+            db_select(
+                [
+                    SqlEventLogStorageTable.c.asset_key,
+                    SqlEventLogStorageTable.c.partition,
+                    db.func.max(SqlEventLogStorageTable.c.id),
+                ]
+            )
+            .where(
+                db.and_(
+                    SqlEventLogStorageTable.c.asset_key.in_(
+                        [asset_key.to_string() for asset_key in asset_keys]
+                    ),
+                    SqlEventLogStorageTable.c.partition != None,  # noqa: E711
+                    SqlEventLogStorageTable.c.dagster_event_type == event_type.value,
+                )
+            )
+            .group_by(SqlEventLogStorageTable.c.asset_key, SqlEventLogStorageTable.c.partition)
+        )
+        assets_details = self._get_assets_details(asset_keys)
+        query = self._add_assets_wipe_filter_to_query(query, assets_details, asset_keys)
+
+        with self.index_connection() as conn:
+            rows = conn.execute(query).fetchall()
+
+        for asset_key_str, partition, storage_id in rows:
+            asset_key = check.not_none(AssetKey.from_db_string(asset_key_str))
+            latest_storage_id_by_partition_by_asset_key[asset_key][cast(str, partition)] = cast(
+                int, storage_id
+            )
+        return latest_storage_id_by_partition_by_asset_key
+
     def get_latest_tags_by_partition(
         self,
         asset_key: AssetKey,
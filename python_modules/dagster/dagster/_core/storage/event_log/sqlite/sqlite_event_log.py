@@ -277,6 +277,7 @@ def store_event(self, event: EventLogEntry) -> None:
                 )
 
             self.store_asset_event_tags([event], [event_id])
+            self.update_asset_cached_status_for_events([event], [event_id])
 
         if event.is_dagster_event and event.dagster_event_type in ASSET_CHECK_EVENTS:
             self.store_asset_check_event(event, None)
@@ -286,6 +287,8 @@ def store_event(self, event: EventLogEntry) -> None:
             with self.index_connection() as conn:
                 conn.execute(insert_event_statement)
 
+        self.update_run_stats_for_events([event])
+
     def get_event_records(
         self,
         event_records_filter: EventRecordsFilter,
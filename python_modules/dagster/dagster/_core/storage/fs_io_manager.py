@@ -1,6 +1,10 @@
+import contextlib
+import mmap
 import os
 import pickle
-from typing import TYPE_CHECKING, Any, Optional
+import struct
+import uuid
+from typing import IO, TYPE_CHECKING, Any, Callable, List, Optional
 
 from pydantic import Field
 
@@ -122,6 +126,14 @@ def job():
     """
 
     base_dir: Optional[str] = Field(default=None, description="Base directory for storing files.")
+    memory_map: bool = Field(
+        default=False,
+        description=(
+            "Whether to store objects with pickle protocol 5, with their large buffers (e.g. the"
+            " data of NumPy arrays and pandas DataFrames) written out-of-band, so that they can be"
+            " memory-mapped instead of copied when loaded from a local filesystem."
+        ),
+    )
 
     @classmethod
     def _is_dagster_maintained(cls) -> bool:
@@ -129,7 +141,7 @@ def _is_dagster_maintained(cls) -> bool:
 
     def create_io_manager(self, context: InitResourceContext) -> "PickledObjectFilesystemIOManager":
         base_dir = self.base_dir or check.not_none(context.instance).storage_directory()
-        return PickledObjectFilesystemIOManager(base_dir=base_dir)
+        return PickledObjectFilesystemIOManager(base_dir=base_dir, memory_map=self.memory_map)
 
 
 @dagster_maintained_io_manager
@@ -242,22 +254,35 @@ class PickledObjectFilesystemIOManager(UPathIOManager):
     Args:
         base_dir (Optional[str]): base directory where all the step outputs which use this object
             manager will be stored in.
+        memory_map (bool): whether to store objects with pickle protocol 5 and out-of-band
+            buffers, which are memory-mapped instead of copied when loaded from a local filesystem.
+            Objects stored either way can be loaded regardless of this setting.
         **kwargs: additional keyword arguments for `universal_pathlib.UPath`.
     """
 
     extension: str = ""  # TODO: maybe change this to .pickle? Leaving blank for compatibility.
 
-    def __init__(self, base_dir=None, **kwargs):
+    def __init__(self, base_dir=None, memory_map: bool = False, **kwargs):
         from upath import UPath
 
         self.base_dir = check.opt_str_param(base_dir, "base_dir")
+        self.memory_map = check.bool_param(memory_map, "memory_map")
 
         super().__init__(base_path=UPath(base_dir, **kwargs))
 
+    def _write_object(self, obj: Any, file: IO[bytes]) -> None:
+        if self.memory_map:
+            dump_out_of_band_pickle(obj, file)
+        else:
+            pickle.dump(obj, file, PICKLE_PROTOCOL)
+
     def dump_to_path(self, context: OutputContext, obj: Any, path: "UPath"):
         try:
-            with path.open("wb") as file:
-                pickle.dump(obj, file, PICKLE_PROTOCOL)
+            if _is_local_path(path):
+                replace_local_file(path.path, lambda file: self._write_object(obj, file))
+            else:
+                with path.open("wb") as file:
+                    self._write_object(obj, file)
         except (AttributeError, RecursionError, ImportError, pickle.PicklingError) as e:
             executor = context.step_context.job_def.executor_def
 
@@ -281,9 +306,129 @@ def dump_to_path(self, context: OutputContext, obj: Any, path: "UPath"):
 
     def load_from_path(self, context: InputContext, path: "UPath") -> Any:
         with path.open("rb") as file:
+            if file.read(len(OUT_OF_BAND_PICKLE_MAGIC)) == OUT_OF_BAND_PICKLE_MAGIC:
+                return load_out_of_band_pickle(file)
+            file.seek(0)
             return pickle.load(file)
 
 
+def _is_local_path(path: "UPath") -> bool:
+    return getattr(path, "protocol", "") in ("", "file", "local")
+
+
+def replace_local_file(path: str, write: Callable[[IO[bytes]], None]) -> None:
+    """Writes a local file by writing to a temporary file in the same directory, which then replaces
+    the file once it is complete.
+
+    Objects loaded from files written by `dump_out_of_band_pickle` are views of a memory-mapping of
+    the file, so truncating the file in place would crash any process still holding them with a
+    SIGBUS once they are accessed. Replacing the file leaves the mapped file intact until it is
+    unmapped.
+    """
+    temp_path = os.path.join(
+        os.path.dirname(path), f".{os.path.basename(path)}.{uuid.uuid4().hex}.tmp"
+    )
+    fd = os.open(
+        temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0), 0o666
+    )
+    try:
+        with os.fdopen(fd, "wb") as file:
+            write(file)
+        os.replace(temp_path, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(temp_path)
+        raise
+
+
+# Files written by `dump_out_of_band_pickle` start with this magic, followed by a header holding
+# the length of the pickle, the number of out-of-band buffers, and the offset and length of each
+# buffer in the file. The pickle follows the header, and each buffer is stored at an offset aligned
+# to BUFFER_ALIGNMENT bytes, so that the memory-mapped buffers are suitably aligned for NumPy.
+OUT_OF_BAND_PICKLE_MAGIC = b"\x80DAGSTER_OOB_PICKLE\n"
+BUFFER_ALIGNMENT = 64
+_OUT_OF_BAND_PICKLE_HEADER = struct.Struct("<QQ")
+_OUT_OF_BAND_BUFFER_RECORD = struct.Struct("<QQ")
+
+
+def _align(offset: int) -> int:
+    return -(-offset // BUFFER_ALIGNMENT) * BUFFER_ALIGNMENT
+
+
+def dump_out_of_band_pickle(obj: Any, file: IO[bytes]) -> None:
+    """Pickles the object with protocol 5, writing the buffers of objects that support out-of-band
+    pickling (e.g. NumPy arrays) to the file separately from the pickle, without copying them.
+    """
+    buffers: List[memoryview] = []
+
+    def _buffer_callback(buffer: pickle.PickleBuffer) -> bool:
+        try:
+            buffers.append(buffer.raw())
+        except BufferError:
+            # non-contiguous buffers are serialized in-band
+            return True
+        return False
+
+    data = pickle.dumps(obj, protocol=5, buffer_callback=_buffer_callback)
+
+    position = (
+        len(OUT_OF_BAND_PICKLE_MAGIC)
+        + _OUT_OF_BAND_PICKLE_HEADER.size
+        + _OUT_OF_BAND_BUFFER_RECORD.size * len(buffers)
+        + len(data)
+    )
+    offsets = []
+    offset = position
+    for buffer in buffers:
+        offset = _align(offset)
+        offsets.append(offset)
+        offset += buffer.nbytes
+
+    file.write(OUT_OF_BAND_PICKLE_MAGIC)
+    file.write(_OUT_OF_BAND_PICKLE_HEADER.pack(len(data), len(buffers)))
+    for buffer, offset in zip(buffers, offsets):
+        file.write(_OUT_OF_BAND_BUFFER_RECORD.pack(offset, buffer.nbytes))
+    file.write(data)
+    for buffer, offset in zip(buffers, offsets):
+        file.write(b"\0" * (offset - position))
+        file.write(buffer)
+        position = offset + buffer.nbytes
+
+
+def load_out_of_band_pickle(file: IO[bytes]) -> Any:
+    """Loads an object written by `dump_out_of_band_pickle` from a file positioned after the magic.
+
+    If the file is a local file, it is memory-mapped, and the out-of-band buffers are loaded as
+    views of the mapped file, so their data is only read from disk when it is accessed. The mapping
+    is copy-on-write, so the loaded objects can be modified without modifying the file.
+    """
+    pickle_length, num_buffers = _OUT_OF_BAND_PICKLE_HEADER.unpack(
+        file.read(_OUT_OF_BAND_PICKLE_HEADER.size)
+    )
+    records = [
+        _OUT_OF_BAND_BUFFER_RECORD.unpack(file.read(_OUT_OF_BAND_BUFFER_RECORD.size))
+        for _ in range(num_buffers)
+    ]
+    data = file.read(pickle_length)
+
+    try:
+        fileno = file.fileno()
+    except (AttributeError, OSError):
+        fileno = None
+
+    if fileno is not None and num_buffers:
+        # the mapping stays open for as long as any of the loaded buffers reference it
+        contents = memoryview(mmap.mmap(fileno, 0, access=mmap.ACCESS_COPY))
+    else:
+        # not a local file, so read the rest of the file and load the buffers from memory
+        start = file.tell()
+        contents = memoryview(bytearray(start) + file.read())
+
+    return pickle.loads(
+        data, buffers=[contents[offset : offset + length] for offset, length in records]
+    )
+
+
 class CustomPathPickledObjectFilesystemIOManager(IOManager):
     """Built-in filesystem IO managerthat stores and retrieves values using pickling and
     allow users to specify file path for outputs.
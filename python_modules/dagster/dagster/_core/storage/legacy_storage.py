@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Iterable, Mapping, Optional, Sequence, Set, Tuple, Union
+from typing import TYPE_CHECKING, Iterable, Iterator, Mapping, Optional, Sequence, Set, Tuple, Union
 
 from dagster import _check as check
 from dagster._config.config_schema import UserConfigSchema
@@ -12,6 +12,7 @@
 from dagster._core.storage.asset_check_execution_record import AssetCheckExecutionRecord
 from dagster._core.storage.base_storage import DagsterStorage
 from dagster._core.storage.event_log.base import (
+    RUN_EVENT_RECORD_BATCH_SIZE,
     AssetCheckSummaryRecord,
     AssetRecord,
     EventLogConnection,
@@ -411,6 +412,14 @@ def get_step_stats_for_run(
     ) -> Sequence["RunStepKeyStatsSnapshot"]:
         return self._storage.event_log_storage.get_step_stats_for_run(run_id, step_keys)
 
+    def get_stats_for_runs(self, run_ids: Sequence[str]) -> Mapping[str, "DagsterRunStatsSnapshot"]:
+        return self._storage.event_log_storage.get_stats_for_runs(run_ids)
+
+    def get_step_stats_for_runs(
+        self, run_ids: Sequence[str], step_keys: Optional[Sequence[str]] = None
+    ) -> Mapping[str, Sequence["RunStepKeyStatsSnapshot"]]:
+        return self._storage.event_log_storage.get_step_stats_for_runs(run_ids, step_keys)
+
     def store_event(self, event: "EventLogEntry") -> None:
         return self._storage.event_log_storage.store_event(event)
 
@@ -566,6 +575,15 @@ def get_latest_storage_id_by_partition(
             asset_key, event_type, partitions
         )
 
+    def get_latest_storage_id_by_partition_for_asset_keys(
+        self,
+        asset_keys: Sequence["AssetKey"],
+        event_type: "DagsterEventType",
+    ) -> Mapping["AssetKey", Mapping[str, int]]:
+        return self._storage.event_log_storage.get_latest_storage_id_by_partition_for_asset_keys(
+            asset_keys, event_type
+        )
+
     def get_latest_tags_by_partition(
         self,
         asset_key: "AssetKey",
@@ -644,6 +662,18 @@ def get_records_for_run(
             run_id, cursor, of_type, limit, ascending
         )
 
+    def iter_records_for_run(
+        self,
+        run_id: str,
+        cursor: Optional[str] = None,
+        of_type: Optional[Union["DagsterEventType", Set["DagsterEventType"]]] = None,
+        ascending: bool = True,
+        batch_size: int = RUN_EVENT_RECORD_BATCH_SIZE,
+    ) -> Iterator[EventLogRecord]:
+        return self._storage.event_log_storage.iter_records_for_run(
+            run_id, cursor, of_type, ascending, batch_size
+        )
+
     def initialize_concurrency_limit_to_default(self, concurrency_key: str) -> bool:
         return self._storage.event_log_storage.initialize_concurrency_limit_to_default(
             concurrency_key
@@ -1,23 +1,34 @@
 import os
 import shutil
 import sys
+import threading
+import warnings
 from collections import defaultdict
 from contextlib import contextmanager
 from pathlib import Path
-from typing import IO, Generator, Iterator, Mapping, Optional, Sequence, Tuple
+from typing import IO, Dict, Generator, Iterator, List, Mapping, Optional, Sequence, Tuple
 
 from typing_extensions import Final
-from watchdog.events import PatternMatchingEventHandler
-from watchdog.observers.polling import PollingObserver
 
 from dagster import (
+    Bool,
     Field,
     Float,
+    Int,
     StringSource,
     _check as check,
 )
 from dagster._config.config_schema import UserConfigSchema
 from dagster._core.execution.compute_logs import mirror_stream_to_file
+from dagster._core.storage.chunked_log_file import (
+    CHUNKED_LOG_INDEX_EXTENSION,
+    DEFAULT_CHUNK_SIZE,
+    delete_chunked_log,
+    get_chunked_log_paths,
+    has_chunked_log,
+    read_chunked_log,
+    write_chunked_log,
+)
 from dagster._core.storage.compute_log_manager import (
     CapturedLogContext,
     CapturedLogData,
@@ -28,7 +39,7 @@
 )
 from dagster._serdes import ConfigurableClass, ConfigurableClassData
 from dagster._seven import json
-from dagster._utils import ensure_dir, ensure_file, touch_file
+from dagster._utils import ensure_file, touch_file
 from dagster._utils.security import non_secure_md5_hash_str
 
 DEFAULT_WATCHDOG_POLLING_TIMEOUT: Final = 2.5
@@ -42,18 +53,37 @@
 
 
 class LocalComputeLogManager(ComputeLogManager, ConfigurableClass):
-    """Stores copies of stdout & stderr for each compute step locally on disk."""
+    """Stores copies of stdout & stderr for each compute step locally on disk.
+
+    If `compress_logs` is set, the logs of each step are compressed into chunked logs (see
+    `dagster._core.storage.chunked_log_file`) once the step completes, keeping at most
+    `max_log_bytes` of the most recent output of each log, if set. Logs are written uncompressed
+    while the step is running, so they can be tailed as they are written.
+    """
 
     def __init__(
         self,
         base_dir: str,
         polling_timeout: Optional[float] = None,
         inst_data: Optional[ConfigurableClassData] = None,
+        compress_logs: bool = False,
+        compressed_chunk_size: Optional[int] = None,
+        max_log_bytes: Optional[int] = None,
     ):
         self._base_dir = base_dir
         self._polling_timeout = check.opt_float_param(
             polling_timeout, "polling_timeout", DEFAULT_WATCHDOG_POLLING_TIMEOUT
         )
+        self._compress_logs = check.bool_param(compress_logs, "compress_logs")
+        self._compressed_chunk_size = check.opt_int_param(
+            compressed_chunk_size, "compressed_chunk_size", DEFAULT_CHUNK_SIZE
+        )
+        check.invariant(self._compressed_chunk_size > 0, "compressed_chunk_size must be positive")
+        self._max_log_bytes = check.opt_int_param(max_log_bytes, "max_log_bytes")
+        check.invariant(
+            self._max_log_bytes is None or self._compress_logs,
+            "max_log_bytes can only be set if compress_logs is set",
+        )
         self._subscription_manager = LocalComputeLogSubscriptionManager(self)
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
 
@@ -70,6 +100,29 @@ def config_type(cls) -> UserConfigSchema:
         return {
             "base_dir": StringSource,
             "polling_timeout": Field(Float, is_required=False),
+            "compress_logs": Field(
+                Bool,
+                is_required=False,
+                default_value=False,
+                description=(
+                    "Compress the captured logs of each step once it completes. Compressed logs"
+                    " are stored in chunks, so they can be read from any offset without"
+                    " decompressing the whole log."
+                ),
+            ),
+            "compressed_chunk_size": Field(
+                Int,
+                is_required=False,
+                description="The number of uncompressed bytes in each chunk of a compressed log.",
+            ),
+            "max_log_bytes": Field(
+                Int,
+                is_required=False,
+                description=(
+                    "If set, only the most recent output of each compressed log, up to about this"
+                    " many bytes, is kept. Requires compress_logs."
+                ),
+            ),
         }
 
     @classmethod
@@ -85,9 +138,24 @@ def capture_logs(self, log_key: Sequence[str]) -> Generator[CapturedLogContext,
         with mirror_stream_to_file(sys.stdout, outpath), mirror_stream_to_file(sys.stderr, errpath):
             yield CapturedLogContext(log_key)
 
+        if self._compress_logs:
+            self._compress_captured_logs(outpath)
+            self._compress_captured_logs(errpath)
+
         # leave artifact on filesystem so that we know the capture is completed
         touch_file(self.complete_artifact_path(log_key))
 
+    def _compress_captured_logs(self, path: str) -> None:
+        try:
+            write_chunked_log(
+                path, chunk_size=self._compressed_chunk_size, max_bytes=self._max_log_bytes
+            )
+        except Exception as e:
+            # keep the uncompressed logs rather than failing the step
+            warnings.warn(f"Failed to compress captured logs at {path}: {e}")
+        else:
+            os.remove(path)
+
     @contextmanager
     def open_log_stream(
         self, log_key: Sequence[str], io_type: ComputeIOType
@@ -119,12 +187,8 @@ def get_log_data(
 
     def get_log_metadata(self, log_key: Sequence[str]) -> CapturedLogMetadata:
         return CapturedLogMetadata(
-            stdout_location=self.get_captured_local_path(
-                log_key, IO_TYPE_EXTENSION[ComputeIOType.STDOUT]
-            ),
-            stderr_location=self.get_captured_local_path(
-                log_key, IO_TYPE_EXTENSION[ComputeIOType.STDERR]
-            ),
+            stdout_location=self.get_captured_log_location(log_key, ComputeIOType.STDOUT),
+            stderr_location=self.get_captured_log_location(log_key, ComputeIOType.STDERR),
             stdout_download_url=self.get_captured_log_download_url(log_key, ComputeIOType.STDOUT),
             stderr_download_url=self.get_captured_log_download_url(log_key, ComputeIOType.STDERR),
         )
@@ -133,6 +197,10 @@ def delete_logs(
         self, log_key: Optional[Sequence[str]] = None, prefix: Optional[Sequence[str]] = None
     ):
         if log_key:
+            for io_type in [ComputeIOType.STDOUT, ComputeIOType.STDERR]:
+                delete_chunked_log(
+                    self.get_captured_local_path(log_key, IO_TYPE_EXTENSION[io_type])
+                )
             paths = [
                 self.get_captured_local_path(log_key, IO_TYPE_EXTENSION[ComputeIOType.STDOUT]),
                 self.get_captured_local_path(log_key, IO_TYPE_EXTENSION[ComputeIOType.STDERR]),
@@ -189,6 +257,9 @@ def read_path(
         offset: int = 0,
         max_bytes: Optional[int] = None,
     ):
+        if has_chunked_log(path):
+            return read_chunked_log(path, offset, max_bytes)
+
         if not os.path.exists(path) or not os.path.isfile(path):
             return None, offset
 
@@ -209,6 +280,16 @@ def get_captured_log_download_url(self, log_key, io_type):
 
         return f"{url}/{IO_TYPE_EXTENSION[io_type]}"
 
+    def get_captured_log_location(self, log_key: Sequence[str], io_type: ComputeIOType) -> str:
+        """Returns the path of the file containing the captured logs, which is a gzip file if the
+        logs have been compressed.
+        """
+        path = self.get_captured_local_path(log_key, IO_TYPE_EXTENSION[io_type])
+        if has_chunked_log(path):
+            data_path, _ = get_chunked_log_paths(path)
+            return data_path
+        return path
+
     def get_captured_local_path(self, log_key: Sequence[str], extension: str, partial=False):
         [*namespace, filebase] = log_key
         filename = f"{filebase}.{extension}"
@@ -244,9 +325,12 @@ def get_log_keys_for_log_key_prefix(
         results = []
         list_key_prefix = list(log_key_prefix)
 
+        chunked_log_suffix = f".{IO_TYPE_EXTENSION[io_type]}.{CHUNKED_LOG_INDEX_EXTENSION}"
         for obj in objects:
             if obj.is_file() and obj.suffix == "." + IO_TYPE_EXTENSION[io_type]:
                 results.append(list_key_prefix + [obj.stem])
+            elif obj.is_file() and obj.name.endswith(chunked_log_suffix):
+                results.append(list_key_prefix + [obj.name[: -len(chunked_log_suffix)]])
 
         return results
 
@@ -255,11 +339,23 @@ def dispose(self) -> None:
 
 
 class LocalComputeLogSubscriptionManager:
-    def __init__(self, manager):
+    """Notifies subscriptions of updates to the logs they are subscribed to.
+
+    A single polling thread watches the log files of every subscribed log key, checking the size
+    and modification time of each file, so the cost of watching does not depend on the number of
+    other files in the log directories and does not grow with an observer per log key.
+    """
+
+    def __init__(self, manager: LocalComputeLogManager):
         self._manager = manager
-        self._subscriptions = defaultdict(list)
-        self._watchers = {}
-        self._observer = None
+
+        # INVARIANT: _lock protects _subscriptions and _watched_file_states
+        self._lock = threading.Lock()
+        self._subscriptions: Dict[str, List[CapturedLogSubscription]] = defaultdict(list)
+        self._watched_file_states: Dict[str, Sequence[Optional[Tuple[int, int]]]] = {}
+
+        self._shutdown_event = threading.Event()
+        self._polling_thread: Optional[threading.Thread] = None
 
     def add_subscription(self, subscription: CapturedLogSubscription) -> None:
         check.inst_param(subscription, "subscription", CapturedLogSubscription)
@@ -270,7 +366,8 @@ def add_subscription(self, subscription: CapturedLogSubscription) -> None:
         else:
             log_key = self._log_key(subscription)
             watch_key = self._watch_key(log_key)
-            self._subscriptions[watch_key].append(subscription)
+            with self._lock:
+                self._subscriptions[watch_key].append(subscription)
             self.watch(subscription)
 
     def is_complete(self, subscription: CapturedLogSubscription) -> bool:
@@ -282,9 +379,14 @@ def remove_subscription(self, subscription: CapturedLogSubscription) -> None:
         check.inst_param(subscription, "subscription", CapturedLogSubscription)
         log_key = self._log_key(subscription)
         watch_key = self._watch_key(log_key)
-        if subscription in self._subscriptions[watch_key]:
+        with self._lock:
+            if subscription not in self._subscriptions[watch_key]:
+                return
             self._subscriptions[watch_key].remove(subscription)
-            subscription.complete()
+            if not self._subscriptions[watch_key]:
+                del self._subscriptions[watch_key]
+                self._watched_file_states.pop(watch_key, None)
+        subscription.complete()
 
     def _log_key(self, subscription: CapturedLogSubscription) -> Sequence[str]:
         check.inst_param(subscription, "subscription", CapturedLogSubscription)
@@ -296,72 +398,87 @@ def _watch_key(self, log_key: Sequence[str]) -> str:
 
     def remove_all_subscriptions(self, log_key: Sequence[str]) -> None:
         watch_key = self._watch_key(log_key)
-        for subscription in self._subscriptions.pop(watch_key, []):
+        with self._lock:
+            subscriptions = self._subscriptions.pop(watch_key, [])
+            self._watched_file_states.pop(watch_key, None)
+        for subscription in subscriptions:
             subscription.complete()
 
     def watch(self, subscription: CapturedLogSubscription) -> None:
         log_key = self._log_key(subscription)
         watch_key = self._watch_key(log_key)
-        if watch_key in self._watchers:
-            return
-
-        update_paths = [
-            self._manager.get_captured_local_path(log_key, IO_TYPE_EXTENSION[ComputeIOType.STDOUT]),
-            self._manager.get_captured_local_path(log_key, IO_TYPE_EXTENSION[ComputeIOType.STDERR]),
-            self._manager.get_captured_local_path(
-                log_key, IO_TYPE_EXTENSION[ComputeIOType.STDOUT], partial=True
-            ),
-            self._manager.get_captured_local_path(
-                log_key, IO_TYPE_EXTENSION[ComputeIOType.STDERR], partial=True
-            ),
-        ]
-        complete_paths = [self._manager.complete_artifact_path(log_key)]
-        directory = os.path.dirname(
-            self._manager.get_captured_local_path(log_key, ComputeIOType.STDERR),
-        )
-
-        if not self._observer:
-            self._observer = PollingObserver(timeout=self._manager.polling_timeout)
-            self._observer.start()
-
-        ensure_dir(directory)
-
-        self._watchers[watch_key] = self._observer.schedule(
-            LocalComputeLogFilesystemEventHandler(self, log_key, update_paths, complete_paths),
-            str(directory),
-        )
+        with self._lock:
+            if watch_key not in self._watched_file_states:
+                self._watched_file_states[watch_key] = self._get_file_states(log_key)
+
+            if not self._polling_thread:
+                self._polling_thread = threading.Thread(
+                    target=self._poll,
+                    args=(self._shutdown_event,),
+                    name="local-compute-log-subscription",
+                    daemon=True,
+                )
+                self._polling_thread.start()
+
+    def _get_watched_paths(self, log_key: Sequence[str]) -> Sequence[str]:
+        paths = []
+        for io_type in [ComputeIOType.STDOUT, ComputeIOType.STDERR]:
+            path = self._manager.get_captured_local_path(log_key, IO_TYPE_EXTENSION[io_type])
+            _, index_path = get_chunked_log_paths(path)
+            paths.extend(
+                [
+                    path,
+                    self._manager.get_captured_local_path(
+                        log_key, IO_TYPE_EXTENSION[io_type], partial=True
+                    ),
+                    index_path,
+                ]
+            )
+        return paths
+
+    def _get_file_states(self, log_key: Sequence[str]) -> Sequence[Optional[Tuple[int, int]]]:
+        states = []
+        for path in self._get_watched_paths(log_key):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                states.append(None)
+            else:
+                states.append((stat.st_size, stat.st_mtime_ns))
+        return states
+
+    def _poll(self, shutdown_event: threading.Event) -> None:
+        while not shutdown_event.wait(self._manager.polling_timeout):
+            with self._lock:
+                watch_keys = list(self._watched_file_states.keys())
+
+            for watch_key in watch_keys:
+                if shutdown_event.is_set():
+                    return
+
+                log_key = json.loads(watch_key)
+                file_states = self._get_file_states(log_key)
+                with self._lock:
+                    if watch_key not in self._watched_file_states:
+                        # unsubscribed while polling
+                        continue
+                    updated = self._watched_file_states[watch_key] != file_states
+                    self._watched_file_states[watch_key] = file_states
+
+                if updated:
+                    self.notify_subscriptions(log_key)
+                if self._manager.is_capture_complete(log_key):
+                    self.notify_subscriptions(log_key)
+                    self.remove_all_subscriptions(log_key)
 
     def notify_subscriptions(self, log_key: Sequence[str]) -> None:
         watch_key = self._watch_key(log_key)
-        for subscription in self._subscriptions[watch_key]:
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(watch_key, []))
+        for subscription in subscriptions:
             subscription.fetch()
 
-    def unwatch(self, log_key: Sequence[str], handler) -> None:
-        watch_key = self._watch_key(log_key)
-        if watch_key in self._watchers:
-            self._observer.remove_handler_for_watch(handler, self._watchers[watch_key])  # type: ignore
-        del self._watchers[watch_key]
-
     def dispose(self) -> None:
-        if self._observer:
-            self._observer.stop()
-            self._observer.join(15)
-
-
-class LocalComputeLogFilesystemEventHandler(PatternMatchingEventHandler):
-    def __init__(self, manager, log_key, update_paths, complete_paths):
-        self.manager = manager
-        self.log_key = log_key
-        self.update_paths = update_paths
-        self.complete_paths = complete_paths
-        patterns = update_paths + complete_paths
-        super(LocalComputeLogFilesystemEventHandler, self).__init__(patterns=patterns)
-
-    def on_created(self, event):
-        if event.src_path in self.complete_paths:
-            self.manager.remove_all_subscriptions(self.log_key)
-            self.manager.unwatch(self.log_key, self)
-
-    def on_modified(self, event):
-        if event.src_path in self.update_paths:
-            self.manager.notify_subscriptions(self.log_key)
+        self._shutdown_event.set()
+        if self._polling_thread:
+            self._polling_thread.join(15)
@@ -466,6 +466,28 @@ def add_cached_status_data_column() -> None:
     op.add_column("asset_keys", db.Column("cached_status_data", db.Text))
 
 
+def add_asset_status_cache_pending_columns() -> None:
+    if not has_table("asset_keys"):
+        return
+
+    if not has_column("asset_keys", "pending_materialized_partitions"):
+        op.add_column("asset_keys", db.Column("pending_materialized_partitions", db.Text))
+
+    if not has_column("asset_keys", "pending_materialization_storage_id"):
+        op.add_column("asset_keys", db.Column("pending_materialization_storage_id", db.BigInteger))
+
+
+def drop_asset_status_cache_pending_columns() -> None:
+    if not has_table("asset_keys"):
+        return
+
+    if has_column("asset_keys", "pending_materialized_partitions"):
+        op.drop_column("asset_keys", "pending_materialized_partitions")
+
+    if has_column("asset_keys", "pending_materialization_storage_id"):
+        op.drop_column("asset_keys", "pending_materialization_storage_id")
+
+
 def add_run_job_index() -> None:
     if not has_table("runs"):
         return
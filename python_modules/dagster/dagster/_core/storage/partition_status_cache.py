@@ -43,6 +43,9 @@
     DynamicPartitionsDefinition,
 )
 RUN_FETCH_BATCH_SIZE = 100
+# The maximum number of materialized partition keys that are folded into a stored cache value on
+# write, before a reader rebuilds it. Past this, materializations are picked up by the reader.
+MAX_PENDING_MATERIALIZED_PARTITION_KEYS = 1000
 
 
 class AssetPartitionStatus(Enum):
@@ -80,6 +83,8 @@ class AssetStatusCacheValue(
             ("serialized_failed_partition_subset", Optional[str]),
             ("serialized_in_progress_partition_subset", Optional[str]),
             ("earliest_in_progress_materialization_event_id", Optional[int]),
+            ("pending_materialized_partition_keys", Optional[Sequence[str]]),
+            ("pending_materialization_storage_id", Optional[int]),
         ],
     ),
     LoadableBy[Tuple[AssetKey, PartitionsDefinition]],
@@ -102,6 +107,12 @@ class AssetStatusCacheValue(
         earliest_in_progress_materialization_event_id (Optional(int)): The event id of the earliest
             materialization planned event for a run that is still in progress. This is used to check
             on the status of runs that are still in progress.
+        pending_materialized_partition_keys (Optional(Sequence[str])): Partition keys materialized
+            by events stored after the latest storage id, recorded by the event log storage as the
+            events are written. Not yet validated against the partitions definition, and folded
+            into the materialized subset the next time the cache value is read.
+        pending_materialization_storage_id (Optional(int)): The storage id of the latest
+            materialization reflected in the pending materialized partition keys.
     """
 
     def __new__(
@@ -112,6 +123,8 @@ def __new__(
         serialized_failed_partition_subset: Optional[str] = None,
         serialized_in_progress_partition_subset: Optional[str] = None,
         earliest_in_progress_materialization_event_id: Optional[int] = None,
+        pending_materialized_partition_keys: Optional[Sequence[str]] = None,
+        pending_materialization_storage_id: Optional[int] = None,
     ):
         check.int_param(latest_storage_id, "latest_storage_id")
         check.opt_str_param(partitions_def_id, "partitions_def_id")
@@ -124,6 +137,12 @@ def __new__(
         check.opt_str_param(
             serialized_in_progress_partition_subset, "serialized_in_progress_partition_subset"
         )
+        check.opt_sequence_param(
+            pending_materialized_partition_keys, "pending_materialized_partition_keys", of_type=str
+        )
+        check.opt_int_param(
+            pending_materialization_storage_id, "pending_materialization_storage_id"
+        )
         return super(AssetStatusCacheValue, cls).__new__(
             cls,
             latest_storage_id,
@@ -132,8 +151,17 @@ def __new__(
             serialized_failed_partition_subset,
             serialized_in_progress_partition_subset,
             earliest_in_progress_materialization_event_id,
+            pending_materialized_partition_keys,
+            pending_materialization_storage_id,
         )
 
+    @property
+    def materialization_cursor(self) -> int:
+        """The storage id up to which every materialization of the asset is reflected in this cache
+        value.
+        """
+        return max(self.latest_storage_id, self.pending_materialization_storage_id or 0)
+
     @staticmethod
     def from_db_string(db_string: str) -> Optional["AssetStatusCacheValue"]:
         if not db_string:
@@ -304,6 +332,7 @@ def _build_status_cache(
     latest_storage_id = max(
         last_materialization_storage_id or 0,
         last_planned_materialization_storage_id or 0,
+        stored_cache_value.materialization_cursor if stored_cache_value else 0,
     )
     if not latest_storage_id:
         return None
@@ -328,21 +357,26 @@ def _build_status_cache(
     )
 
     if stored_cache_value:
-        # fetch the incremental new materialized partitions, and update the cached materialized
-        # subset
-        new_partitions = set()
+        # materializations stored since the cache value was last built are recorded on it as they
+        # are written, so the event log only needs to be queried for any that were not recorded
+        new_partition_keys = set(stored_cache_value.pending_materialized_partition_keys or [])
+        materialization_cursor = stored_cache_value.materialization_cursor
         if (
             last_materialization_storage_id
-            and last_materialization_storage_id > stored_cache_value.latest_storage_id
+            and last_materialization_storage_id > materialization_cursor
         ):
-            new_partitions = get_validated_partition_keys(
-                dynamic_partitions_store,
-                partitions_def,
-                instance.get_materialized_partitions(
-                    asset_key, after_cursor=stored_cache_value.latest_storage_id
-                ),
+            new_partition_keys.update(
+                instance.get_materialized_partitions(asset_key, after_cursor=materialization_cursor)
             )
 
+        new_partitions = (
+            get_validated_partition_keys(
+                dynamic_partitions_store, partitions_def, new_partition_keys
+            )
+            if new_partition_keys
+            else set()
+        )
+
         materialized_subset: PartitionsSubset = (
             partitions_def.deserialize_subset(
                 stored_cache_value.serialized_materialized_partition_subset
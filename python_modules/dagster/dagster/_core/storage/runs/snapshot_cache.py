@@ -0,0 +1,122 @@
+import os
+import threading
+from collections import OrderedDict
+from typing import Generic, NamedTuple, Optional, Tuple, TypeVar
+
+import dagster._check as check
+
+T_Snapshot = TypeVar("T_Snapshot")
+
+# Default upper bound on the total uncompressed serialized size of the snapshots held by a run
+# storage's snapshot cache. Deserialized snapshots take up roughly twice their serialized size in
+# memory. Set to 0 to disable caching.
+DEFAULT_SNAPSHOT_CACHE_MAX_BYTES = 16 * 1024 * 1024
+
+
+def get_snapshot_cache_max_bytes() -> int:
+    return int(
+        os.getenv(
+            "DAGSTER_RUN_STORAGE_SNAPSHOT_CACHE_MAX_BYTES", str(DEFAULT_SNAPSHOT_CACHE_MAX_BYTES)
+        )
+    )
+
+
+class SnapshotCacheStats(
+    NamedTuple(
+        "_SnapshotCacheStats",
+        [
+            ("hits", int),
+            ("misses", int),
+            ("evictions", int),
+            ("num_entries", int),
+            ("size_bytes", int),
+            ("max_bytes", int),
+        ],
+    )
+):
+    """Point-in-time statistics of a SnapshotCache.
+
+    Args:
+        hits (int): The number of lookups that were served from the cache.
+        misses (int): The number of lookups of snapshots that were not in the cache.
+        evictions (int): The number of snapshots evicted to stay within ``max_bytes``.
+        num_entries (int): The number of snapshots currently in the cache.
+        size_bytes (int): The total size of the snapshots currently in the cache.
+        max_bytes (int): The maximum total size of the snapshots in the cache.
+    """
+
+
+class SnapshotCache(Generic[T_Snapshot]):
+    """Thread-safe LRU cache of deserialized snapshots, keyed by snapshot id.
+
+    Snapshot ids are derived from the content of the snapshot, so a cached snapshot never becomes
+    stale and entries only ever leave the cache to keep the total size of the cached snapshots
+    within ``max_bytes``. The size of a snapshot is measured by its caller, as the size of its
+    uncompressed serialized representation, which keeps the bound proportional to the memory held
+    by the cache without having to measure the deserialized objects.
+    """
+
+    def __init__(self, max_bytes: int):
+        self._max_bytes = check.int_param(max_bytes, "max_bytes")
+
+        # INVARIANT: _lock protects all of the fields below
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, Tuple[T_Snapshot, int]] = OrderedDict()
+        self._size_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_bytes > 0
+
+    def get(self, snapshot_id: str) -> Optional[T_Snapshot]:
+        with self._lock:
+            entry = self._entries.get(snapshot_id)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            self._hits += 1
+            self._entries.move_to_end(snapshot_id)
+            return entry[0]
+
+    def contains(self, snapshot_id: str) -> bool:
+        """Whether the snapshot is in the cache, without counting as a lookup."""
+        with self._lock:
+            return snapshot_id in self._entries
+
+    def set(self, snapshot_id: str, snapshot: T_Snapshot, size_bytes: int) -> None:
+        if size_bytes > self._max_bytes:
+            # would evict every other entry and then itself
+            return
+
+        with self._lock:
+            previous = self._entries.pop(snapshot_id, None)
+            if previous is not None:
+                self._size_bytes -= previous[1]
+
+            self._entries[snapshot_id] = (snapshot, size_bytes)
+            self._size_bytes += size_bytes
+
+            while self._size_bytes > self._max_bytes:
+                _, (_, evicted_size_bytes) = self._entries.popitem(last=False)
+                self._size_bytes -= evicted_size_bytes
+                self._evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+
+    def get_stats(self) -> SnapshotCacheStats:
+        with self._lock:
+            return SnapshotCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                num_entries=len(self._entries),
+                size_bytes=self._size_bytes,
+                max_bytes=self._max_bytes,
+            )
@@ -5,6 +5,7 @@
 from collections import defaultdict
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
 from typing import (
     Any,
     Callable,
@@ -70,6 +71,11 @@
     SecondaryIndexMigrationTable,
     SnapshotsTable,
 )
+from dagster._core.storage.runs.snapshot_cache import (
+    SnapshotCache,
+    SnapshotCacheStats,
+    get_snapshot_cache_max_bytes,
+)
 from dagster._core.storage.sql import SqlAlchemyQuery
 from dagster._core.storage.sqlalchemy_compat import (
     db_fetch_mappings,
@@ -568,6 +574,8 @@ def delete_run(self, run_id: str) -> None:
 
     def has_job_snapshot(self, job_snapshot_id: str) -> bool:
         check.str_param(job_snapshot_id, "job_snapshot_id")
+        # not answered from the snapshot cache, since the storage may have been wiped by another
+        # process since the snapshot was cached
         return self._has_snapshot_id(job_snapshot_id)
 
     def add_job_snapshot(self, job_snapshot: JobSnap, snapshot_id: Optional[str] = None) -> str:
@@ -649,18 +657,40 @@ def _has_snapshot_id(self, snapshot_id: str) -> bool:
 
         return bool(row)
 
+    @cached_property
+    def _snapshot_cache(self) -> SnapshotCache[Union[ExecutionPlanSnapshot, JobSnap]]:
+        # created on first use, for custom subclasses that don't call super().__init__()
+        return SnapshotCache(get_snapshot_cache_max_bytes())
+
+    def get_snapshot_cache_stats(self) -> SnapshotCacheStats:
+        """Hit, miss and size statistics of the in-process cache of job and execution plan
+        snapshots read from this storage.
+        """
+        return self._snapshot_cache.get_stats()
+
     def _get_snapshot(self, snapshot_id: str) -> Optional[JobSnap]:
+        # snapshots are immutable once stored, since their ids are derived from their contents
+        snapshot_cache = self._snapshot_cache
+        if snapshot_cache.enabled:
+            cached = snapshot_cache.get(snapshot_id)
+            if cached is not None:
+                return cached  # type: ignore
+
         query = db_select([SnapshotsTable.c.snapshot_body]).where(
             SnapshotsTable.c.snapshot_id == snapshot_id
         )
 
         row = self.fetchone(query)
+        if not row:
+            return None
 
-        return (
-            defensively_unpack_execution_plan_snapshot_query(logging, [row["snapshot_body"]])  # type: ignore
-            if row
-            else None
+        snapshot, serialized_size = _defensively_unpack_snapshot_body(
+            logging, [row["snapshot_body"]]
         )
+        if snapshot is not None and snapshot_cache.enabled:
+            snapshot_cache.set(snapshot_id, snapshot, serialized_size)
+
+        return snapshot  # type: ignore
 
     def get_run_partition_data(self, runs_filter: RunsFilter) -> Sequence[RunPartitionData]:
         if self.has_built_index(RUN_PARTITIONS) and self.has_run_stats_index_cols():
@@ -852,6 +882,7 @@ def wipe(self) -> None:
             conn.execute(SnapshotsTable.delete())
             conn.execute(DaemonHeartbeatsTable.delete())
             conn.execute(BulkActionsTable.delete())
+        self._snapshot_cache.clear()
 
     def wipe_daemon_heartbeats(self) -> None:
         with self.connect() as conn:
@@ -1136,6 +1167,14 @@ def replace_job_origin(self, run: DagsterRun, job_origin: RemoteJobOrigin) -> No
 def defensively_unpack_execution_plan_snapshot_query(
     logger: logging.Logger, row: Sequence[Any]
 ) -> Optional[Union[ExecutionPlanSnapshot, JobSnap]]:
+    snapshot, _ = _defensively_unpack_snapshot_body(logger, row)
+    return snapshot
+
+
+def _defensively_unpack_snapshot_body(
+    logger: logging.Logger, row: Sequence[Any]
+) -> Tuple[Optional[Union[ExecutionPlanSnapshot, JobSnap]], int]:
+    """Returns the unpacked snapshot, along with the length of its uncompressed serialized form."""
     # minimal checking here because sqlalchemy returns a different type based on what version of
     # SqlAlchemy you are using
 
@@ -1144,22 +1183,25 @@ def _warn(msg: str) -> None:
 
     if not isinstance(row[0], bytes):
         _warn("First entry in row is not a binary type.")
-        return None
+        return None, 0
 
     try:
         uncompressed_bytes = zlib.decompress(row[0])
     except zlib.error:
         _warn("Could not decompress bytes stored in snapshot table.")
-        return None
+        return None, 0
 
     try:
         decoded_str = uncompressed_bytes.decode("utf-8")
     except UnicodeDecodeError:
         _warn("Could not unicode decode decompressed bytes stored in snapshot table.")
-        return None
+        return None, 0
 
     try:
-        return deserialize_value(decoded_str, (ExecutionPlanSnapshot, JobSnap))
+        return (
+            deserialize_value(decoded_str, (ExecutionPlanSnapshot, JobSnap)),
+            len(uncompressed_bytes),
+        )
     except JSONDecodeError:
         _warn("Could not parse json in snapshot table.")
-        return None
+        return None, 0
@@ -1,8 +1,11 @@
 import asyncio
 import inspect
+import threading
 from abc import abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional, Union
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Iterator, Mapping, Optional, Union
 
 from fsspec import AbstractFileSystem
 from fsspec.implementations.local import LocalFileSystem
@@ -31,10 +34,19 @@ class UPathIOManager(IOManager):
      - the `get_metadata` method can be customized to add additional metadata to the output
      - the `allow_missing_partitions` metadata value can be set to `True` to skip missing partitions
        (the default behavior is to raise an error)
+     - the number of partitions loaded at the same time can be limited with the
+       `max_concurrent_partition_loads` attribute or metadata value. Synchronous `load_from_path`
+       implementations load partitions in a thread pool of this size, while asynchronous ones are
+       awaited with at most this many loads in flight (the default is to load partitions serially
+       for synchronous implementations, and all at once for asynchronous ones)
+     - the total size of the partition files being loaded at the same time can be limited with the
+       `max_concurrent_partition_load_bytes` attribute or metadata value
 
     """
 
     extension: Optional[str] = None  # override in child class
+    max_concurrent_partition_loads: Optional[int] = None  # override in child class
+    max_concurrent_partition_load_bytes: Optional[int] = None  # override in child class
 
     def __init__(
         self,
@@ -75,19 +87,76 @@ def load_partitions(self, context: InputContext):
                 context, partition_key, paths[partition_key], backcompat_paths.get(partition_key)
             )
         else:
-            objs = {}
+            max_concurrent_loads = self._get_max_concurrent_partition_loads(context)
+            limiter = _PartitionLoadLimiter(self._get_max_concurrent_partition_load_bytes(context))
+
+            def _load(partition_key: str) -> Any:
+                size = (
+                    self._get_partition_load_size(paths[partition_key])
+                    if limiter.max_bytes is not None
+                    else 0
+                )
+                with limiter.acquire(size):
+                    return self._load_partition_from_path(
+                        context,
+                        partition_key,
+                        paths[partition_key],
+                        backcompat_paths.get(partition_key),
+                    )
 
-            for partition_key in context.asset_partition_keys:
-                obj = self._load_partition_from_path(
-                    context,
-                    partition_key,
-                    paths[partition_key],
-                    backcompat_paths.get(partition_key),
+            if max_concurrent_loads is None or max_concurrent_loads <= 1:
+                return self._collect_loaded_partitions(
+                    context, map(_load, context.asset_partition_keys)
+                )
+
+            executor = ThreadPoolExecutor(
+                max_workers=max_concurrent_loads, thread_name_prefix="upath_io_manager_load"
+            )
+            try:
+                # results are yielded in the order of the partition keys, while the following
+                # partitions are loaded in the background
+                return self._collect_loaded_partitions(
+                    context, executor.map(_load, context.asset_partition_keys)
                 )
-                if obj is not None:  # in case some partitions were skipped
-                    objs[partition_key] = obj
+            finally:
+                # if a load failed, cancel the loads that have not started yet
+                executor.shutdown(wait=True, cancel_futures=True)
+
+    def _collect_loaded_partitions(
+        self, context: InputContext, loaded: Iterator[Any]
+    ) -> Dict[str, Any]:
+        return {
+            partition_key: obj
+            for partition_key, obj in zip(context.asset_partition_keys, loaded)
+            if obj is not None  # in case some partitions were skipped
+        }
+
+    def _get_max_concurrent_partition_loads(self, context: InputContext) -> Optional[int]:
+        if (
+            context.definition_metadata is not None
+            and "max_concurrent_partition_loads" in context.definition_metadata
+        ):
+            value = context.definition_metadata["max_concurrent_partition_loads"]
+        else:
+            value = self.max_concurrent_partition_loads
+        return check.opt_int_param(value, "max_concurrent_partition_loads")
+
+    def _get_max_concurrent_partition_load_bytes(self, context: InputContext) -> Optional[int]:
+        if (
+            context.definition_metadata is not None
+            and "max_concurrent_partition_load_bytes" in context.definition_metadata
+        ):
+            value = context.definition_metadata["max_concurrent_partition_load_bytes"]
+        else:
+            value = self.max_concurrent_partition_load_bytes
+        return check.opt_int_param(value, "max_concurrent_partition_load_bytes")
 
-            return objs
+    def _get_partition_load_size(self, path: "UPath") -> int:
+        # the size of the partition file is used as an estimate of the memory needed to load it
+        try:
+            return self.fs.size(str(path)) or 0
+        except (FileNotFoundError, NotImplementedError):
+            return 0
 
     @property
     def fs(self) -> AbstractFileSystem:
@@ -334,22 +403,36 @@ def load_partitions_async(self, context: InputContext):
             context
         )  # paths for multipartitions
 
+        max_concurrent_loads = self._get_max_concurrent_partition_loads(context)
+        limiter = _PartitionLoadLimiter(self._get_max_concurrent_partition_load_bytes(context))
+
+        async def load(partition_key: str, semaphore: asyncio.Semaphore) -> Any:
+            size = (
+                self._get_partition_load_size(paths[partition_key])
+                if limiter.max_bytes is not None
+                else 0
+            )
+            async with semaphore:
+                async with limiter.acquire_async(size):
+                    return await self._load_partition_from_path(
+                        context,
+                        partition_key,
+                        paths[partition_key],
+                        backcompat_paths.get(partition_key),
+                    )
+
         async def collect():
             loop = asyncio.get_running_loop()
+            semaphore = asyncio.Semaphore(
+                max_concurrent_loads
+                if max_concurrent_loads is not None and max_concurrent_loads > 0
+                else len(context.asset_partition_keys)
+            )
 
             tasks = []
 
             for partition_key in context.asset_partition_keys:
-                tasks.append(
-                    loop.create_task(
-                        self._load_partition_from_path(
-                            context,
-                            partition_key,
-                            paths[partition_key],
-                            backcompat_paths.get(partition_key),
-                        )
-                    )
-                )
+                tasks.append(loop.create_task(load(partition_key, semaphore)))
 
             results = await asyncio.gather(*tasks, return_exceptions=True)
 
@@ -458,6 +541,61 @@ def handle_output(self, context: OutputContext, obj: Any):
         context.add_output_metadata(metadata)
 
 
+class _PartitionLoadLimiter:
+    """Limits the total size of the partitions being loaded at the same time. A partition larger
+    than the limit is still loaded, once no other partitions are being loaded.
+    """
+
+    def __init__(self, max_bytes: Optional[int]):
+        self.max_bytes = max_bytes
+        self._bytes_in_flight = 0
+        self._condition = threading.Condition()
+        self._async_condition: Optional[asyncio.Condition] = None
+
+    def _can_acquire(self, size: int) -> bool:
+        return (
+            self.max_bytes is None
+            or self._bytes_in_flight == 0
+            or self._bytes_in_flight + size <= self.max_bytes
+        )
+
+    @contextmanager
+    def acquire(self, size: int) -> Iterator[None]:
+        if self.max_bytes is None:
+            yield
+            return
+
+        with self._condition:
+            self._condition.wait_for(lambda: self._can_acquire(size))
+            self._bytes_in_flight += size
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._bytes_in_flight -= size
+                self._condition.notify_all()
+
+    @asynccontextmanager
+    async def acquire_async(self, size: int) -> AsyncIterator[None]:
+        if self.max_bytes is None:
+            yield
+            return
+
+        if self._async_condition is None:
+            # created lazily, so that it is bound to the running event loop
+            self._async_condition = asyncio.Condition()
+        condition = self._async_condition
+        async with condition:
+            await condition.wait_for(lambda: self._can_acquire(size))
+            self._bytes_in_flight += size
+        try:
+            yield
+        finally:
+            async with condition:
+                self._bytes_in_flight -= size
+                condition.notify_all()
+
+
 def is_dict_type(type_obj) -> bool:
     if type_obj == dict:
         return True
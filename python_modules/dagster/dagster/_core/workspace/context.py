@@ -870,7 +870,9 @@ def _update_workspace(self, new_locations: Dict[str, CodeLocationEntry]):
             self._watch_threads = {}
 
             previous_locations = self._workspace_snapshot.code_location_entries
-            self._workspace_snapshot = WorkspaceSnapshot(code_location_entries=new_locations)
+            self._workspace_snapshot = self._workspace_snapshot.with_code_location_entries(
+                new_locations
+            )
 
             # start monitoring for new locations
             for entry in new_locations.values():
@@ -1,6 +1,6 @@
 from enum import Enum
 from functools import cached_property
-from typing import TYPE_CHECKING, Mapping, Optional
+from typing import TYPE_CHECKING, AbstractSet, Mapping, Optional
 
 from typing_extensions import Annotated
 
@@ -54,7 +54,51 @@ def asset_graph(self) -> "RemoteWorkspaceAssetGraph":
         return RemoteWorkspaceAssetGraph.build(self)
 
     def with_code_location(self, name: str, entry: CodeLocationEntry) -> "WorkspaceSnapshot":
-        return WorkspaceSnapshot(code_location_entries={**self.code_location_entries, name: entry})
+        return self._with_code_location_entries(
+            {**self.code_location_entries, name: entry}, changed_location_names={name}
+        )
+
+    def with_code_location_entries(
+        self, code_location_entries: Mapping[str, CodeLocationEntry]
+    ) -> "WorkspaceSnapshot":
+        """Returns a snapshot of the given code location entries. Locations that are loaded in
+        both snapshots with the same version key are considered unchanged, so any state derived
+        from them in this snapshot can be reused by the new snapshot.
+        """
+        changed_location_names = {
+            name
+            for name in {*self.code_location_entries, *code_location_entries}
+            if not _is_same_code_location_version(
+                self.code_location_entries.get(name), code_location_entries.get(name)
+            )
+        }
+        return self._with_code_location_entries(code_location_entries, changed_location_names)
+
+    def _with_code_location_entries(
+        self,
+        code_location_entries: Mapping[str, CodeLocationEntry],
+        changed_location_names: AbstractSet[str],
+    ) -> "WorkspaceSnapshot":
+        snapshot = WorkspaceSnapshot(code_location_entries=code_location_entries)
+        # If the asset graph of this snapshot has already been built, update it with the changed
+        # locations rather than having the new snapshot rebuild it from scratch on first access
+        if "asset_graph" in self.__dict__:
+            snapshot.__dict__["asset_graph"] = self.asset_graph.with_updated_code_locations(
+                snapshot, changed_location_names
+            )
+        return snapshot
+
+
+def _is_same_code_location_version(
+    entry: Optional[CodeLocationEntry], other_entry: Optional[CodeLocationEntry]
+) -> bool:
+    return bool(
+        entry
+        and other_entry
+        and entry.code_location
+        and other_entry.code_location
+        and entry.version_key == other_entry.version_key
+    )
 
 
 def location_status_from_location_entry(
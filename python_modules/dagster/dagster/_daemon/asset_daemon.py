@@ -1,15 +1,30 @@
 import base64
 import dataclasses
 import datetime
+import functools
 import logging
+import multiprocessing
 import sys
 import threading
 import zlib
 from collections import defaultdict
-from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from contextlib import ExitStack
 from types import TracebackType
-from typing import AbstractSet, Any, Dict, Mapping, Optional, Sequence, Set, Tuple, Type, cast
+from typing import (
+    AbstractSet,
+    Any,
+    Dict,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    cast,
+)
 
 import dagster._check as check
 from dagster._core.definitions.asset_daemon_cursor import (
@@ -41,9 +56,14 @@
 from dagster._core.execution.backfill import PartitionBackfill
 from dagster._core.execution.submit_asset_runs import RunRequestExecutionData, submit_asset_run
 from dagster._core.instance import DagsterInstance
+from dagster._core.instance.ref import InstanceRef
 from dagster._core.remote_representation import RemoteSensor
+from dagster._core.remote_representation.code_location import GrpcServerCodeLocation
 from dagster._core.remote_representation.external import RemoteRepository
-from dagster._core.remote_representation.origin import RemoteInstigatorOrigin
+from dagster._core.remote_representation.origin import (
+    GrpcServerCodeLocationOrigin,
+    RemoteInstigatorOrigin,
+)
 from dagster._core.scheduler.instigation import (
     InstigatorState,
     InstigatorStatus,
@@ -65,7 +85,12 @@
     make_new_backfill_id,
     make_new_run_id,
 )
-from dagster._core.workspace.context import IWorkspaceProcessContext
+from dagster._core.workspace.context import (
+    BaseWorkspaceRequestContext,
+    IWorkspaceProcessContext,
+    WorkspaceProcessContext,
+)
+from dagster._core.workspace.load_target import WorkspaceLoadTarget
 from dagster._daemon.daemon import DaemonIterator, DagsterDaemon, SpanMarker
 from dagster._daemon.sensor import is_under_min_interval, mark_sensor_state_for_tick
 from dagster._daemon.utils import DaemonErrorCapture
@@ -184,14 +209,20 @@ def get_current_evaluation_id(
     return cursor.evaluation_id
 
 
-def asset_daemon_cursor_to_instigator_serialized_cursor(cursor: AssetDaemonCursor) -> str:
+def asset_daemon_cursor_to_instigator_serialized_cursor(
+    cursor: AssetDaemonCursor, compact: bool = False
+) -> str:
     """This method compresses the serialized cursor and returns a b64 encoded string to be stored
     as a string value.
+
+    If `compact` is set, the cursor is serialized in the compact serdes format. deserialize_value
+    detects that format on read, so the version is unchanged and cursors in either format can be
+    read, but versions of Dagster that predate the compact format fail to read compact cursors.
     """
     # increment the version if the cursor format changes
     VERSION = "0"
 
-    serialized_bytes = serialize_value(cursor).encode("utf-8")
+    serialized_bytes = serialize_value(cursor, compact=compact).encode("utf-8")
     compressed_bytes = zlib.compress(serialized_bytes)
     encoded_cursor = base64.b64encode(compressed_bytes).decode("utf-8")
     return VERSION + encoded_cursor
@@ -222,6 +253,122 @@ def asset_daemon_cursor_from_instigator_serialized_cursor(
     return deserialized_cursor
 
 
+def get_sensor_shard_index(selector_id: str, num_shards: int) -> int:
+    """Returns the shard that the sensor with the given selector id is assigned to. The assignment
+    only depends on the selector id, so every asset daemon replica agrees on it without needing to
+    coordinate.
+    """
+    return zlib.crc32(selector_id.encode("utf-8")) % num_shards
+
+
+class CodeServerEndpointsTarget(
+    NamedTuple(
+        "_CodeServerEndpointsTarget",
+        [("origins", Tuple[GrpcServerCodeLocationOrigin, ...])],
+    ),
+    WorkspaceLoadTarget,
+):
+    """Loads the code locations of the asset daemon's workspace from the gRPC servers that the
+    daemon is already connected to, so that worker processes never spawn code servers of their own.
+    """
+
+    def create_origins(self) -> Sequence[GrpcServerCodeLocationOrigin]:
+        return list(self.origins)
+
+
+def get_code_server_endpoints_target(
+    workspace: BaseWorkspaceRequestContext,
+) -> CodeServerEndpointsTarget:
+    origins = []
+    for location_name, location_entry in workspace.get_code_location_entries().items():
+        code_location = location_entry.code_location
+        if code_location is None:
+            continue
+
+        check.invariant(
+            isinstance(code_location, GrpcServerCodeLocation),
+            "Processing automation condition sensor ticks in worker processes requires every code"
+            f" location to be served by a gRPC server, but {location_name} is loaded in process",
+        )
+        code_location = cast(GrpcServerCodeLocation, code_location)
+        origins.append(
+            GrpcServerCodeLocationOrigin(
+                host=code_location.host,
+                port=code_location.port,
+                socket=code_location.socket,
+                location_name=location_name,
+                use_ssl=code_location.use_ssl,
+            )
+        )
+    return CodeServerEndpointsTarget(tuple(origins))
+
+
+# Set in each worker process of the asset daemon's process pool
+_worker_instance: Optional[DagsterInstance] = None
+_worker_asset_daemon: Optional["AssetDaemon"] = None
+_worker_workspace_process_context: Optional[WorkspaceProcessContext] = None
+
+
+def _initialize_worker_process(instance_ref: InstanceRef, settings: Mapping[str, Any]) -> None:
+    global _worker_instance, _worker_asset_daemon  # noqa: PLW0603
+
+    _worker_instance = DagsterInstance.from_ref(instance_ref)
+    _worker_asset_daemon = AssetDaemon(settings=settings, pre_sensor_interval_seconds=0)
+
+
+def _get_worker_workspace_process_context(
+    workspace_load_target: CodeServerEndpointsTarget,
+) -> WorkspaceProcessContext:
+    global _worker_workspace_process_context  # noqa: PLW0603
+
+    # the workspace is reloaded when the daemon's code servers have moved, e.g. because a server
+    # that the daemon manages was restarted when its code location was reloaded
+    if (
+        _worker_workspace_process_context is None
+        or _worker_workspace_process_context.workspace_load_target != workspace_load_target
+    ):
+        if _worker_workspace_process_context is not None:
+            _worker_workspace_process_context.__exit__(None, None, None)
+        _worker_workspace_process_context = WorkspaceProcessContext(
+            instance=check.not_none(_worker_instance),
+            workspace_load_target=workspace_load_target,
+        )
+    return _worker_workspace_process_context
+
+
+def _process_auto_materialize_tick_in_worker_process(
+    workspace_load_target: CodeServerEndpointsTarget,
+    sensor_origin: RemoteInstigatorOrigin,
+    location_update_timestamp: float,
+    debug_crash_flags: SingleInstigatorDebugCrashFlags,
+) -> None:
+    workspace_process_context = _get_worker_workspace_process_context(workspace_load_target)
+    asset_daemon = check.not_none(_worker_asset_daemon)
+
+    repository_origin = sensor_origin.repository_origin
+    location_name = repository_origin.code_location_origin.location_name
+
+    # the worker's copy of the code location is refreshed whenever the daemon has refreshed the
+    # location since the worker last did
+    location_entry = workspace_process_context.get_workspace_snapshot().code_location_entries.get(
+        location_name
+    )
+    if location_entry and location_entry.update_timestamp < location_update_timestamp:
+        workspace_process_context.refresh_code_location(location_name)
+
+    workspace = workspace_process_context.create_request_context()
+    repository = workspace.get_code_location(location_name).get_repository(
+        repository_origin.repository_name
+    )
+    asset_daemon._process_auto_materialize_tick(  # noqa: SLF001
+        workspace_process_context,
+        repository,
+        repository.get_sensor(sensor_origin.instigator_name),
+        debug_crash_flags,
+        submit_threadpool_executor=None,
+    )
+
+
 class AutoMaterializeLaunchContext:
     def __init__(
         self,
@@ -341,6 +488,20 @@ def __init__(self, settings: Mapping[str, Any], pre_sensor_interval_seconds: int
 
         self._settings = settings
 
+        self._num_shards = check.opt_int_param(settings.get("num_shards"), "num_shards")
+        self._shard_index = check.opt_int_param(settings.get("shard_index"), "shard_index")
+        if self._num_shards is not None:
+            check.invariant(self._num_shards > 0, "num_shards must be a positive integer")
+            check.invariant(
+                self._shard_index is not None and 0 <= self._shard_index < self._num_shards,
+                "shard_index must be set to a value between 0 and num_shards - 1 when num_shards"
+                " is set",
+            )
+        else:
+            check.invariant(
+                self._shard_index is None, "shard_index can only be set when num_shards is set"
+            )
+
         super().__init__()
 
     @classmethod
@@ -360,6 +521,37 @@ def _get_print_sensor_name(self, sensor: Optional[RemoteSensor]) -> str:
         )
         return f" for {sensor.name} in {repo_name}"
 
+    def _is_in_shard(self, selector_id: Optional[str]) -> bool:
+        if self._num_shards is None:
+            return True
+        if selector_id is None:
+            # the legacy tick that is not tied to a sensor is evaluated by the first shard
+            return self._shard_index == 0
+        return get_sensor_shard_index(selector_id, self._num_shards) == self._shard_index
+
+    def _create_process_pool_executor(
+        self, workspace_process_context: IWorkspaceProcessContext
+    ) -> ProcessPoolExecutor:
+        # fail fast if the workspace cannot be shared with worker processes
+        get_code_server_endpoints_target(workspace_process_context.create_request_context())
+        return ProcessPoolExecutor(
+            max_workers=self._settings.get("num_workers"),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_initialize_worker_process,
+            initargs=(workspace_process_context.instance.get_ref(), self._settings),
+        )
+
+    def _log_worker_process_tick_exception(self, sensor: RemoteSensor, future: Future) -> None:
+        if future.cancelled():
+            return
+        exception = future.exception()
+        if exception is not None:
+            self._logger.error(
+                "Failed to process the automation condition sensor tick%s in a worker process",
+                self._get_print_sensor_name(sensor),
+                exc_info=(type(exception), exception, exception.__traceback__),
+            )
+
     def core_loop(
         self,
         workspace_process_context: IWorkspaceProcessContext,
@@ -381,8 +573,19 @@ def core_loop(
         amp_tick_futures: Dict[Optional[str], Future] = {}
         threadpool_executor = None
         submit_threadpool_executor = None
+        process_pool_executor = None
+
+        def _shutdown_process_pool_executor() -> None:
+            if process_pool_executor:
+                process_pool_executor.shutdown()
+
         with ExitStack() as stack:
-            if self._settings.get("use_threads"):
+            if self._settings.get("use_processes"):
+                process_pool_executor = self._create_process_pool_executor(
+                    workspace_process_context
+                )
+                stack.callback(_shutdown_process_pool_executor)
+            elif self._settings.get("use_threads"):
                 threadpool_executor = stack.enter_context(
                     InheritContextThreadPoolExecutor(
                         max_workers=self._settings.get("num_workers"),
@@ -408,7 +611,21 @@ def core_loop(
                         submit_threadpool_executor=submit_threadpool_executor,
                         amp_tick_futures=amp_tick_futures,
                         debug_crash_flags={},
+                        process_pool_executor=process_pool_executor,
+                    )
+                except BrokenProcessPool:
+                    # a worker process exited abruptly, e.g. because it ran out of memory, which
+                    # leaves the pool unusable, so start over with a new one
+                    error_info = DaemonErrorCapture.on_exception(
+                        exc_info=sys.exc_info(),
+                        logger=self._logger,
+                        log_message="AssetDaemon worker process pool broke, recreating it",
                     )
+                    check.not_none(process_pool_executor).shutdown(wait=False)
+                    process_pool_executor = self._create_process_pool_executor(
+                        workspace_process_context
+                    )
+                    yield error_info
                 except Exception:
                     error_info = DaemonErrorCapture.on_exception(
                         exc_info=sys.exc_info(),
@@ -430,6 +647,7 @@ def _run_iteration_impl(
         submit_threadpool_executor: Optional[ThreadPoolExecutor],
         amp_tick_futures: Dict[Optional[str], Future],
         debug_crash_flags: SingleInstigatorDebugCrashFlags,
+        process_pool_executor: Optional[ProcessPoolExecutor] = None,
     ):
         instance: DagsterInstance = workspace_process_context.instance
 
@@ -504,20 +722,25 @@ def _run_iteration_impl(
 
             for sensor, repo in eligible_sensors_and_repos:
                 selector_id = sensor.selector_id
-                if sensor.get_current_instigator_state(
-                    all_sensor_states.get(selector_id)
-                ).is_running:
+                if (
+                    self._is_in_shard(selector_id)
+                    and sensor.get_current_instigator_state(
+                        all_sensor_states.get(selector_id)
+                    ).is_running
+                ):
                     sensors_and_repos.append((sensor, repo))
 
         else:
-            sensors_and_repos.append(
-                (
-                    None,
-                    None,
-                )  # Represents that there's a single set of ticks with no underlying sensor
-            )
+            if self._is_in_shard(None):
+                sensors_and_repos.append(
+                    (
+                        None,
+                        None,
+                    )  # Represents that there's a single set of ticks with no underlying sensor
+                )
             all_sensor_states = {}
 
+        code_server_endpoints_target = None
         for sensor, repo in sensors_and_repos:
             if sensor:
                 selector_id = sensor.selector.get_id()
@@ -553,7 +776,29 @@ def _run_iteration_impl(
             elif is_under_min_interval(auto_materialize_state, sensor):
                 continue
 
-            if threadpool_executor:
+            if process_pool_executor and sensor:
+                # only one tick per sensor can be in flight
+                if selector_id in amp_tick_futures and not amp_tick_futures[selector_id].done():
+                    continue
+
+                if code_server_endpoints_target is None:
+                    code_server_endpoints_target = get_code_server_endpoints_target(workspace)
+                location_entry = check.not_none(
+                    workspace.get_location_entry(sensor.handle.location_name)
+                )
+                future = process_pool_executor.submit(
+                    _process_auto_materialize_tick_in_worker_process,
+                    code_server_endpoints_target,
+                    sensor.get_remote_origin(),
+                    location_entry.update_timestamp,
+                    debug_crash_flags,
+                )
+                future.add_done_callback(
+                    functools.partial(self._log_worker_process_tick_exception, sensor)
+                )
+                amp_tick_futures[selector_id] = future
+                yield
+            elif threadpool_executor:
                 # only one tick per sensor can be in flight
                 if selector_id in amp_tick_futures and not amp_tick_futures[selector_id].done():
                     continue
@@ -603,7 +848,9 @@ def _create_initial_sensor_cursors_from_raw_cursor(
                 ),
                 SensorInstigatorData(
                     min_interval=sensor.min_interval_seconds,
-                    cursor=asset_daemon_cursor_to_instigator_serialized_cursor(pre_sensor_cursor),
+                    cursor=asset_daemon_cursor_to_instigator_serialized_cursor(
+                        pre_sensor_cursor, compact=instance.auto_materialize_use_compact_cursors
+                    ),
                     last_sensor_start_timestamp=get_current_timestamp(),
                     sensor_type=sensor.sensor_type,
                 ),
@@ -990,7 +1237,9 @@ def _evaluate_auto_materialize_tick(
                         SensorInstigatorData(
                             last_tick_timestamp=tick.timestamp,
                             min_interval=sensor.min_interval_seconds,
-                            cursor=asset_daemon_cursor_to_instigator_serialized_cursor(new_cursor),
+                            cursor=asset_daemon_cursor_to_instigator_serialized_cursor(
+                                new_cursor, compact=instance.auto_materialize_use_compact_cursors
+                            ),
                             sensor_type=sensor.sensor_type,
                         )
                     )
@@ -35,6 +35,7 @@
 import dagster._check as check
 import dagster._seven as seven
 from dagster._core.code_pointer import CodePointer
+from dagster._core.definitions.job_definition import JobDefinition
 from dagster._core.definitions.reconstruct import ReconstructableRepository
 from dagster._core.definitions.repository_definition import RepositoryDefinition
 from dagster._core.errors import (
@@ -223,20 +224,122 @@ def wrapper(self: "DagsterApiServer", request: Any, context: grpc.ServicerContex
     return _MetricsRetriever()
 
 
+class RepositorySnapCache:
+    """Builds the snapshots that the server returns for a repository on first request, and caches
+    them in serialized form for the lifetime of the server, since the loaded definitions do not
+    change.
+
+    Each job snapshot is cached as its own component, so it is built at most once, whether it is
+    requested individually through `ExternalJob` or as part of the full repository snapshot. Only
+    the serialized form of a job snapshot is kept; when the full repository snapshot needs it again,
+    it is deserialized rather than rebuilt. Components are locked individually, so concurrent
+    requests for different jobs do not wait on each other, and concurrent requests for the same
+    component share a single build.
+    """
+
+    def __init__(self, repository_def: RepositoryDefinition):
+        self._repository_def = check.inst_param(
+            repository_def, "repository_def", RepositoryDefinition
+        )
+
+        self._component_locks: Dict[Tuple[str, object], threading.Lock] = {}
+        self._component_locks_lock = threading.Lock()
+
+        self._serialized_job_data_snaps: Dict[str, str] = {}
+        self._serialized_repository_snaps: Dict[bool, str] = {}
+
+    def _component_lock(self, component_type: str, key: object) -> threading.Lock:
+        with self._component_locks_lock:
+            return self._component_locks.setdefault((component_type, key), threading.Lock())
+
+    def _get_job_data_snap(self, job_def: JobDefinition) -> JobDataSnap:
+        with self._component_lock("job", job_def.name):
+            serialized_job_data_snap = self._serialized_job_data_snaps.get(job_def.name)
+            if serialized_job_data_snap is not None:
+                return deserialize_value(serialized_job_data_snap, JobDataSnap)
+
+            job_data_snap = JobDataSnap.from_job_def(job_def, include_parent_snapshot=True)
+            self._serialized_job_data_snaps[job_def.name] = serialize_value(job_data_snap)
+            return job_data_snap
+
+    def get_serialized_job_data_snap(self, job_name: str) -> str:
+        job_def = self._repository_def.get_job(job_name)
+        with self._component_lock("job", job_def.name):
+            if job_def.name not in self._serialized_job_data_snaps:
+                self._serialized_job_data_snaps[job_def.name] = serialize_value(
+                    JobDataSnap.from_job_def(job_def, include_parent_snapshot=True)
+                )
+            return self._serialized_job_data_snaps[job_def.name]
+
+    def get_serialized_repository_snap(self, defer_snapshots: bool) -> str:
+        with self._component_lock("serialized_repository", defer_snapshots):
+            if defer_snapshots not in self._serialized_repository_snaps:
+                self._serialized_repository_snaps[defer_snapshots] = serialize_value(
+                    RepositorySnap.from_def(
+                        self._repository_def,
+                        defer_snapshots=defer_snapshots,
+                        job_data_snap_fn=self._get_job_data_snap,
+                    )
+                )
+            return self._serialized_repository_snaps[defer_snapshots]
+
+
+def _get_repository_name_for_target(target: object) -> Optional[str]:
+    """Returns the name of the repository that a loadable target resolves to, if it can be
+    determined without resolving the target into a repository definition.
+    """
+    from dagster._core.definitions.assets import AssetsDefinition
+    from dagster._core.definitions.definitions_class import Definitions
+    from dagster._core.definitions.graph_definition import GraphDefinition
+    from dagster._core.definitions.reconstruct import get_ephemeral_repository_name
+    from dagster._core.definitions.repository_definition import SINGLETON_REPOSITORY_NAME
+    from dagster._core.definitions.source_asset import SourceAsset
+
+    if isinstance(target, Definitions):
+        return SINGLETON_REPOSITORY_NAME
+    elif isinstance(target, (JobDefinition, GraphDefinition)):
+        return get_ephemeral_repository_name(target.name)
+    elif isinstance(target, list) and all(
+        isinstance(item, (AssetsDefinition, SourceAsset)) for item in target
+    ):
+        return SINGLETON_REPOSITORY_NAME
+    elif isinstance(target, RepositoryDefinition):
+        return target.name
+    else:
+        return None
+
+
 class LoadedRepositories:
+    """The repositories loaded from a code location by the server.
+
+    By default, every repository definition is resolved up front. When `defer_definitions_loading`
+    is set, only the module or file containing the definitions is imported up front, which is
+    enough to advertise the repository symbols and code pointers of the location. Each repository
+    definition (along with any expensive work it does, like loading cacheable assets) is then
+    resolved on first use, or ahead of time via `load_all_definitions`. Targets whose repository
+    name can't be determined without resolving them are still resolved up front.
+    """
+
     def __init__(
         self,
         loadable_target_origin: Optional[LoadableTargetOrigin],
         entry_point: Sequence[str],
         container_image: Optional[str] = None,
+        defer_definitions_loading: bool = False,
     ):
         self._loadable_target_origin = loadable_target_origin
 
         self._code_pointers_by_repo_name: Dict[str, CodePointer] = {}
         self._recon_repos_by_name: Dict[str, ReconstructableRepository] = {}
         self._repo_defs_by_name: Dict[str, RepositoryDefinition] = {}
+        self._snap_caches_by_name: Dict[str, RepositorySnapCache] = {}
         self._loadable_repository_symbols: List[LoadableRepositorySymbol] = []
 
+        # Loading a repository definition sets process-wide state (see DefinitionsLoadContext),
+        # so deferred definitions are loaded one at a time.
+        # INVARIANT: _load_lock protects _repo_defs_by_name and _snap_caches_by_name
+        self._load_lock = threading.Lock()
+
         if not loadable_target_origin:
             # empty workspace
             return
@@ -267,27 +370,42 @@ def __init__(
                     sys.executable,
                     entry_point=entry_point,
                 )
-                with user_code_error_boundary(
-                    DagsterUserCodeLoadError,
-                    lambda: "Error occurred during the loading of Dagster definitions in "
-                    + pointer.describe(),
-                ):
-                    repo_def = recon_repo.get_definition()
-                    # force load of all lazy constructed code artifacts to prevent
-                    # any thread-safety issues loading them later on when serving
-                    # definitions from multiple threads
-                    repo_def.load_all_definitions()
-
-                self._code_pointers_by_repo_name[repo_def.name] = pointer
-                self._recon_repos_by_name[repo_def.name] = recon_repo
-                self._repo_defs_by_name[repo_def.name] = repo_def
+
+                repo_name = (
+                    _get_repository_name_for_target(loadable_target.target_definition)
+                    if defer_definitions_loading
+                    else None
+                )
+                if repo_name is None:
+                    repo_def = self._load_repository_def(recon_repo)
+                    repo_name = repo_def.name
+                    self._repo_defs_by_name[repo_name] = repo_def
+                    self._snap_caches_by_name[repo_name] = RepositorySnapCache(repo_def)
+
+                self._code_pointers_by_repo_name[repo_name] = pointer
+                self._recon_repos_by_name[repo_name] = recon_repo
                 self._loadable_repository_symbols.append(
                     LoadableRepositorySymbol(
                         attribute=loadable_target.attribute,
-                        repository_name=repo_def.name,
+                        repository_name=repo_name,
                     )
                 )
 
+    def _load_repository_def(self, recon_repo: ReconstructableRepository) -> RepositoryDefinition:
+        loadable_target_origin = check.not_none(self._loadable_target_origin)
+        with enter_loadable_target_origin_load_context(loadable_target_origin):
+            with user_code_error_boundary(
+                DagsterUserCodeLoadError,
+                lambda: "Error occurred during the loading of Dagster definitions in "
+                + recon_repo.pointer.describe(),
+            ):
+                repo_def = recon_repo.get_definition()
+                # force load of all lazy constructed code artifacts to prevent
+                # any thread-safety issues loading them later on when serving
+                # definitions from multiple threads
+                repo_def.load_all_definitions()
+                return repo_def
+
     @property
     def loadable_repository_symbols(self) -> Sequence[LoadableRepositorySymbol]:
         return self._loadable_repository_symbols
@@ -296,14 +414,58 @@ def loadable_repository_symbols(self) -> Sequence[LoadableRepositorySymbol]:
     def code_pointers_by_repo_name(self) -> Mapping[str, CodePointer]:
         return self._code_pointers_by_repo_name
 
+    @property
+    def repository_names(self) -> Sequence[str]:
+        return list(self._code_pointers_by_repo_name.keys())
+
+    @property
+    def pending_repository_names(self) -> Sequence[str]:
+        """The names of the repositories whose definitions have not been loaded yet."""
+        with self._load_lock:
+            return [name for name in self.repository_names if name not in self._repo_defs_by_name]
+
     @property
     def definitions_by_name(self) -> Mapping[str, RepositoryDefinition]:
+        self.load_all_definitions()
         return self._repo_defs_by_name
 
     @property
     def reconstructables_by_name(self) -> Mapping[str, ReconstructableRepository]:
         return self._recon_repos_by_name
 
+    @property
+    def snap_caches_by_name(self) -> Mapping[str, RepositorySnapCache]:
+        self.load_all_definitions()
+        return self._snap_caches_by_name
+
+    def get_definition(self, repository_name: str) -> RepositoryDefinition:
+        """Returns the definition of the given repository, loading it if it was deferred."""
+        check.invariant(
+            repository_name in self._code_pointers_by_repo_name,
+            f'Could not find a repository called "{repository_name}"',
+        )
+        with self._load_lock:
+            if repository_name not in self._repo_defs_by_name:
+                repo_def = self._load_repository_def(self._recon_repos_by_name[repository_name])
+                check.invariant(
+                    repo_def.name == repository_name,
+                    f"Expected {self._code_pointers_by_repo_name[repository_name].describe()} to"
+                    f' load a repository called "{repository_name}", but it loaded a repository'
+                    f' called "{repo_def.name}"',
+                )
+                self._repo_defs_by_name[repository_name] = repo_def
+                self._snap_caches_by_name[repository_name] = RepositorySnapCache(repo_def)
+            return self._repo_defs_by_name[repository_name]
+
+    def get_snap_cache(self, repository_name: str) -> RepositorySnapCache:
+        self.get_definition(repository_name)
+        return self._snap_caches_by_name[repository_name]
+
+    def load_all_definitions(self) -> None:
+        """Loads the definitions of every repository whose loading was deferred."""
+        for repository_name in self.pending_repository_names:
+            self.get_definition(repository_name)
+
 
 def _get_code_pointer(
     loadable_target_origin: LoadableTargetOrigin,
@@ -352,6 +514,8 @@ def __init__(
         instance_ref: Optional[InstanceRef] = None,
         location_name: Optional[str] = None,
         enable_metrics: bool = False,
+        defer_definitions_loading: bool = False,
+        warm_up_definitions: bool = True,
     ):
         super(DagsterApiServer, self).__init__()
 
@@ -422,6 +586,9 @@ def __init__(
                 loadable_target_origin,
                 self._entry_point,
                 self._container_image,
+                defer_definitions_loading=check.bool_param(
+                    defer_definitions_loading, "defer_definitions_loading"
+                ),
             )
         except Exception:
             if not lazy_load_user_code:
@@ -430,6 +597,23 @@ def __init__(
             self._serializable_load_error = serializable_error_info_from_exc_info(sys.exc_info())
             self._logger.exception("Error while importing code")
 
+        # Definitions whose loading was deferred are loaded on first use, or ahead of time
+        # in the background so that the server can start serving requests immediately
+        if (
+            self._loaded_repositories
+            and self._loaded_repositories.pending_repository_names
+            and check.bool_param(warm_up_definitions, "warm_up_definitions")
+        ):
+            self.__warm_up_thread: Optional[threading.Thread] = threading.Thread(
+                target=self._warm_up_thread,
+                args=(),
+                name="grpc-server-definitions-warm-up",
+                daemon=True,
+            )
+            self.__warm_up_thread.start()
+        else:
+            self.__warm_up_thread = None
+
         self.__last_heartbeat_time = time.time()
         if heartbeat:
             self.__heartbeat_thread: Optional[threading.Thread] = threading.Thread(
@@ -460,6 +644,26 @@ def cleanup(self) -> None:
 
         self._exit_stack.close()
 
+    def _warm_up_thread(self) -> None:
+        loaded_repositories = check.not_none(self._loaded_repositories)
+        pending_repository_names = loaded_repositories.pending_repository_names
+        for i, repository_name in enumerate(pending_repository_names):
+            start_time = time.time()
+            try:
+                loaded_repositories.get_definition(repository_name)
+            except Exception:
+                # the error is raised again to the requests that need this repository
+                self._logger.exception(
+                    f'Error while loading definitions for repository "{repository_name}"'
+                )
+                continue
+
+            self._logger.info(
+                f'Loaded definitions for repository "{repository_name}"'
+                f" ({i + 1}/{len(pending_repository_names)}) in"
+                f" {time.time() - start_time:.2f} seconds"
+            )
+
     def _heartbeat_thread(self, heartbeat_timeout: float) -> None:
         while True:
             self._shutdown_once_executions_finish_event.wait(heartbeat_timeout)
@@ -518,11 +722,21 @@ def _get_repo_for_origin(
         remote_repo_origin: RemoteRepositoryOrigin,
     ) -> RepositoryDefinition:
         loaded_repos = check.not_none(self._loaded_repositories)
-        if remote_repo_origin.repository_name not in loaded_repos.definitions_by_name:
+        if remote_repo_origin.repository_name not in loaded_repos.code_pointers_by_repo_name:
             raise Exception(
                 f'Could not find a repository called "{remote_repo_origin.repository_name}"'
             )
-        return loaded_repos.definitions_by_name[remote_repo_origin.repository_name]
+        return loaded_repos.get_definition(remote_repo_origin.repository_name)
+
+    def _get_snap_cache_for_origin(
+        self,
+        remote_repo_origin: RemoteRepositoryOrigin,
+    ) -> RepositorySnapCache:
+        # raises if the repository does not exist
+        self._get_repo_for_origin(remote_repo_origin)
+        return check.not_none(self._loaded_repositories).get_snap_cache(
+            remote_repo_origin.repository_name
+        )
 
     def ReloadCode(
         self, _request: api_pb2.ReloadCodeRequest, _context: grpc.ServicerContext
@@ -788,12 +1002,9 @@ def _get_serialized_external_repository_data(
                 RemoteRepositoryOrigin,
             )
 
-            return serialize_value(
-                RepositorySnap.from_def(
-                    self._get_repo_for_origin(repository_origin),
-                    defer_snapshots=request.defer_snapshots,
-                )
-            )
+            return self._get_snap_cache_for_origin(
+                repository_origin
+            ).get_serialized_repository_snap(request.defer_snapshots)
         except Exception:
             _maybe_log_exception(self._logger, "Repository")
             return serialize_value(
@@ -818,10 +1029,9 @@ def ExternalJob(
                 RemoteRepositoryOrigin,
             )
 
-            job_def = self._get_repo_for_origin(repository_origin).get_job(request.job_name)
-            ser_job_data = serialize_value(
-                JobDataSnap.from_job_def(job_def, include_parent_snapshot=True)
-            )
+            ser_job_data = self._get_snap_cache_for_origin(
+                repository_origin
+            ).get_serialized_job_data_snap(request.job_name)
             return api_pb2.ExternalJobReply(serialized_job_data=ser_job_data)
         except Exception:
             _maybe_log_exception(self._logger, "Job")
@@ -549,6 +549,14 @@ def get_storage_name(self) -> str:
 )
 
 
+# (storage key, custom field serializer, skip when empty, skip when none) of a field being packed
+_PackFieldPlan: TypeAlias = Tuple[str, Optional["FieldSerializer"], bool, bool]
+
+# (constructor parameter name, custom field serializer) of a stored field being unpacked, or
+# (None, None) if the field is not a parameter of the loaded class
+_UnpackFieldPlan: TypeAlias = Tuple[Optional[str], Optional["FieldSerializer"]]
+
+
 class ObjectSerializer(Serializer, Generic[T]):
     # NOTE: See `whitelist_for_serdes` docstring for explanations of parameters.
     def __init__(
@@ -585,14 +593,17 @@ def unpack(
         try:
             unpacked_dict = self.before_unpack(context, unpacked_dict)
             unpacked: Dict[str, PackableValue] = {}
+            field_plans = self._unpack_field_plans
             for key, value in unpacked_dict.items():
-                loaded_name = self.loaded_field_names.get(key, key)
+                field_plan = field_plans.get(key)
+                if field_plan is None:
+                    field_plan = self._compile_unpack_field_plan(key)
+                loaded_name, custom = field_plan
                 # Naively implements backwards compatibility by filtering arguments that aren't present in
                 # the constructor. If a property is present in the serialized object, but doesn't exist in
                 # the version of the class loaded into memory, that property will be completely ignored.
-                if loaded_name in self.constructor_param_names:
+                if loaded_name is not None:
                     # custom unpack regardless of hook vs recursive descent
-                    custom = self.field_serializers.get(loaded_name)
                     if custom:
                         unpacked[loaded_name] = custom.unpack(
                             value,
@@ -604,7 +615,7 @@ def unpack(
                     else:
                         unpacked[loaded_name] = value  # type: ignore # 2 hot 4 cast()
 
-                else:
+                elif context.observed_unknown_serdes_values:
                     context.clear_ignored_unknown_values(value)
 
             return self.klass(**unpacked)
@@ -642,13 +653,16 @@ def pack_items(
         descent_path: str,
     ) -> Iterator[Tuple[str, JsonSerializableValue]]:
         yield "__class__", self.get_storage_name()
+        field_plans = self._pack_field_plans
         for key, inner_value in self.object_as_mapping(self.before_pack(value)).items():
-            if (key in self.skip_when_empty_fields and inner_value in EMPTY_VALUES_TO_SKIP) or (
-                key in self.skip_when_none_fields and inner_value is None
+            field_plan = field_plans.get(key)
+            if field_plan is None:
+                field_plan = self._compile_pack_field_plan(key)
+            storage_key, custom, skip_when_empty, skip_when_none = field_plan
+            if (skip_when_empty and inner_value in EMPTY_VALUES_TO_SKIP) or (
+                skip_when_none and inner_value is None
             ):
                 continue
-            storage_key = self.storage_field_names.get(key, key)
-            custom = self.field_serializers.get(key)
             if custom:
                 yield (
                     storage_key,
@@ -675,6 +689,41 @@ def pack_items(
     def before_pack(self, value: T) -> T:
         return value
 
+    # The storage names, custom serializers and skip rules of each field are resolved once per field
+    # and cached in these plans, since pack_items and unpack are hot code paths.
+
+    @cached_property
+    def _pack_field_plans(self) -> Dict[str, _PackFieldPlan]:
+        return {}
+
+    @cached_property
+    def _unpack_field_plans(self) -> Dict[str, _UnpackFieldPlan]:
+        return {}
+
+    @cached_property
+    def _constructor_param_name_set(self) -> AbstractSet[str]:
+        return set(self.constructor_param_names)
+
+    def _compile_pack_field_plan(self, key: str) -> _PackFieldPlan:
+        field_plan = (
+            self.storage_field_names.get(key, key),
+            self.field_serializers.get(key),
+            key in self.skip_when_empty_fields,
+            key in self.skip_when_none_fields,
+        )
+        self._pack_field_plans[key] = field_plan
+        return field_plan
+
+    def _compile_unpack_field_plan(self, storage_key: str) -> _UnpackFieldPlan:
+        loaded_name = self.loaded_field_names.get(storage_key, storage_key)
+        field_plan = (
+            (loaded_name, self.field_serializers.get(loaded_name))
+            if loaded_name in self._constructor_param_name_set
+            else (None, None)
+        )
+        self._unpack_field_plans[storage_key] = field_plan
+        return field_plan
+
     @property
     @abstractmethod
     def constructor_param_names(self) -> Sequence[str]: ...
@@ -824,12 +873,21 @@ def pack(
 def serialize_value(
     val: PackableValue,
     whitelist_map: WhitelistMap = _WHITELIST_MAP,
+    compact: bool = False,
     **json_kwargs: Any,
 ) -> str:
     """Serialize an object to a JSON string.
 
     Objects are first converted to a JSON-serializable form with `pack_value`.
+
+    If `compact` is set, the value is instead written in the compact serdes format, which stores
+    the class name and field names of each distinct object shape once per payload rather than once
+    per object. This is much smaller and faster to load for values holding many objects of the same
+    type. `deserialize_value` detects the format automatically.
     """
+    if compact:
+        return _serialize_compact(val, whitelist_map, **json_kwargs)
+
     serializable_value = _transform_for_serialization(
         val,
         whitelist_map=whitelist_map,
@@ -1086,6 +1144,91 @@ def _wrap_object(
     return _LazySerializationWrapper(obj, whitelist_map, descent_path)
 
 
+###################################################################################################
+# Compact format
+###################################################################################################
+
+# The compact format is a JSON list of object shapes on the first line, followed by the JSON body on
+# the next. Each whitelisted object in the body is encoded as {"__c__": [shape_index, *values]},
+# where the shape at shape_index holds the storage name of its class and the storage keys of the
+# values. Shapes are collected from the objects actually written, rather than taken from the
+# whitelist map, so that payloads can be read by any version of the class, as with the JSON format.
+COMPACT_SERDES_PREFIX: Final = "#serdes-compact:1\n"
+_COMPACT_OBJECT_KEY: Final = "__c__"
+
+_CompactShape: TypeAlias = Tuple[str, Tuple[str, ...]]
+
+
+class _CompactObjectPacker:
+    """The object_handler for _transform_for_serialization to produce the compact format, interning
+    the shape of every packed object.
+    """
+
+    def __init__(self):
+        self.shapes: Dict[_CompactShape, int] = {}
+
+    def __call__(
+        self, obj: SerializableObject, whitelist_map: WhitelistMap, descent_path: str
+    ) -> Mapping[str, JsonSerializableValue]:
+        serializer = whitelist_map.object_serializers[obj.__class__.__name__]
+        items = serializer.pack_items(obj, whitelist_map, self, descent_path)
+        _, storage_name = next(items)
+        keys: List[str] = []
+        packed: List[JsonSerializableValue] = [0]  # placeholder for the shape index
+        for key, value in items:
+            keys.append(key)
+            packed.append(value)
+
+        shape = (cast(str, storage_name), tuple(keys))
+        shape_index = self.shapes.get(shape)
+        if shape_index is None:
+            shape_index = self.shapes[shape] = len(self.shapes)
+        packed[0] = shape_index
+        return {_COMPACT_OBJECT_KEY: packed}
+
+
+def _serialize_compact(val: PackableValue, whitelist_map: WhitelistMap, **json_kwargs: Any) -> str:
+    packer = _CompactObjectPacker()
+    serializable_value = _transform_for_serialization(
+        val,
+        whitelist_map=whitelist_map,
+        object_handler=packer,
+        descent_path=_root(val),
+    )
+    json_kwargs.setdefault("separators", (",", ":"))
+    body = seven.json.dumps(serializable_value, **json_kwargs)
+    # shapes are numbered in insertion order
+    shapes = seven.json.dumps([[name, keys] for name, keys in packer.shapes], separators=(",", ":"))
+    return f"{COMPACT_SERDES_PREFIX}{shapes}\n{body}"
+
+
+def _deserialize_compact(val: str, whitelist_map: WhitelistMap, context: UnpackContext) -> Any:
+    shapes_json, _, body = val[len(COMPACT_SERDES_PREFIX) :].partition("\n")
+    shapes = [(name, keys) for name, keys in seven.json.loads(shapes_json)]
+    return seven.json.loads(
+        body,
+        object_hook=partial(
+            _unpack_compact_object, shapes=shapes, whitelist_map=whitelist_map, context=context
+        ),
+    )
+
+
+def _unpack_compact_object(
+    val: dict,
+    shapes: Sequence[Tuple[str, Sequence[str]]],
+    whitelist_map: WhitelistMap,
+    context: UnpackContext,
+) -> UnpackedValue:
+    packed = val.get(_COMPACT_OBJECT_KEY)
+    if packed is not None and len(val) == 1:
+        klass_name, keys = shapes[packed[0]]
+        obj = dict(zip(keys, packed[1:]))
+        obj["__class__"] = klass_name
+        val = obj
+    # values written by custom field serializers are in the JSON format
+    return _unpack_object(val, whitelist_map, context)
+
+
 ###################################################################################################
 # Deserialize / Unpack
 ###################################################################################################
@@ -1129,7 +1272,8 @@ def deserialize_value(
 
     Two steps:
 
-    - Parse the input string as JSON with an object_hook for custom types.
+    - Parse the input string as JSON with an object_hook for custom types. Strings written with
+      `serialize_value(..., compact=True)` are detected and parsed as the compact format.
     - Optionally, check that the resulting object is of the expected type.
     """
     check.str_param(val, "val")
@@ -1178,10 +1322,15 @@ def deserialize_values(
         unpacked_values = []
         for val in vals:
             context = UnpackContext()
-            unpacked_value = seven.json.loads(
-                val,
-                object_hook=partial(_unpack_object, whitelist_map=whitelist_map, context=context),
-            )
+            if val.startswith(COMPACT_SERDES_PREFIX):
+                unpacked_value = _deserialize_compact(val, whitelist_map, context)
+            else:
+                unpacked_value = seven.json.loads(
+                    val,
+                    object_hook=partial(
+                        _unpack_object, whitelist_map=whitelist_map, context=context
+                    ),
+                )
             unpacked_value = context.finalize_unpack(unpacked_value)
             if as_type and not (
                 is_named_tuple_instance(unpacked_value)
@@ -6,6 +6,7 @@
     AbstractSet,
     Dict,
     Iterable,
+    List,
     Mapping,
     Optional,
     Sequence,
@@ -86,6 +87,7 @@ def __init__(
         self._asset_partition_versions_updated_after_cursor_cache: Dict[
             AssetKeyPartitionKey, int
         ] = {}
+        self._latest_storage_id_by_partition_cache: Dict[AssetKey, Mapping[str, int]] = {}
 
         self._dynamic_partitions_cache: Dict[str, Sequence[str]] = {}
 
@@ -117,6 +119,63 @@ def prefetch_asset_records(self, asset_keys: Iterable[AssetKey]):
 
         AssetRecord.blocking_get_many(self._loading_context, asset_keys)
 
+    def prefetch_latest_storage_ids_by_partition(
+        self, asset_keys: Iterable[AssetKey], after_cursor: Optional[int] = None
+    ) -> None:
+        """For performance, batches together queries for the latest storage id of each partition of
+        the selected partitioned assets. Materializable assets whose asset records show no
+        materialization after the given cursor are skipped, as their storage ids by partition are
+        not needed to find out what has been updated since.
+        """
+        asset_keys_by_event_type: Dict[DagsterEventType, List[AssetKey]] = defaultdict(list)
+        for asset_key in asset_keys:
+            if (
+                asset_key in self._latest_storage_id_by_partition_cache
+                or not self.asset_graph.has(asset_key)
+                or not self.asset_graph.get(asset_key).is_partitioned
+            ):
+                continue
+            # observations are not reflected in asset records, so observable assets are always
+            # fetched
+            if self.asset_graph.get(asset_key).is_materializable and (
+                not self.asset_partition_has_materialization_or_observation(
+                    AssetKeyPartitionKey(asset_key), after_cursor=after_cursor
+                )
+            ):
+                continue
+            asset_keys_by_event_type[self._event_type_for_key(asset_key)].append(asset_key)
+
+        for event_type, event_type_asset_keys in asset_keys_by_event_type.items():
+            for i in range(0, len(event_type_asset_keys), RECORD_BATCH_SIZE):
+                self._latest_storage_id_by_partition_cache.update(
+                    self.instance.get_latest_storage_id_by_partition_for_asset_keys(
+                        event_type_asset_keys[i : i + RECORD_BATCH_SIZE], event_type=event_type
+                    )
+                )
+
+    def prefetch_planned_materialization_runs(self, asset_keys: Iterable[AssetKey]) -> None:
+        """For performance, batches together queries for the runs of the latest planned
+        materializations of the selected unpartitioned assets, which determine whether they are
+        in progress or failed.
+        """
+        from dagster._core.storage.dagster_run import RunRecord
+
+        if not self.instance.event_log_storage.asset_records_have_last_planned_materialization_storage_id:
+            return
+
+        run_ids = set()
+        for asset_key in asset_keys:
+            if (
+                not self.asset_graph.has(asset_key)
+                or self.asset_graph.get(asset_key).is_partitioned
+            ):
+                continue
+            asset_record = self.get_asset_record(asset_key)
+            if asset_record and asset_record.asset_entry.last_planned_materialization_run_id:
+                run_ids.add(asset_record.asset_entry.last_planned_materialization_run_id)
+
+        RunRecord.blocking_get_many(self._loading_context, run_ids)
+
     ####################
     # ASSET STATUS CACHE
     ####################
@@ -217,7 +276,7 @@ def get_in_progress_asset_subset(
             ):
                 value = False
             else:
-                dagster_run = self.instance.get_run_by_id(planned_materialization_run_id)
+                dagster_run = self._get_run_by_id(planned_materialization_run_id)
                 value = dagster_run is not None and dagster_run.status in [
                     *IN_PROGRESS_RUN_STATUSES,
                     # an asset is considered to be "in progress" if there is planned work for it that has not
@@ -241,13 +300,26 @@ def get_failed_asset_subset(self, *, asset_key: AssetKey) -> SerializableEntityS
                 value = cache_value.deserialize_failed_partition_subsets(partitions_def)
         else:
             # ideally, unpartitioned assets would also be handled by the asset status cache
-            planned_materialization_info = (
-                self.instance.event_log_storage.get_latest_planned_materialization_info(asset_key)
-            )
-            if not planned_materialization_info:
+            if self.instance.event_log_storage.asset_records_have_last_planned_materialization_storage_id:
+                asset_record = self.get_asset_record(asset_key)
+                planned_materialization_run_id = (
+                    asset_record.asset_entry.last_planned_materialization_run_id
+                    if asset_record
+                    else None
+                )
+            else:
+                planned_materialization_info = (
+                    self.instance.event_log_storage.get_latest_planned_materialization_info(
+                        asset_key
+                    )
+                )
+                planned_materialization_run_id = (
+                    planned_materialization_info.run_id if planned_materialization_info else None
+                )
+            if not planned_materialization_run_id:
                 value = False
             else:
-                dagster_run = self.instance.get_run_by_id(planned_materialization_info.run_id)
+                dagster_run = self._get_run_by_id(planned_materialization_run_id)
 
                 value = dagster_run is not None and dagster_run.status == DagsterRunStatus.FAILURE
 
@@ -335,12 +407,18 @@ def _get_latest_materialization_or_observation_storage_ids_by_asset_partition(
             asset_partition: latest_record.storage_id if latest_record is not None else None
         }
         if self.asset_graph.get(asset_key).is_partitioned:
+            if asset_key in self._latest_storage_id_by_partition_cache:
+                latest_storage_id_by_partition = self._latest_storage_id_by_partition_cache[
+                    asset_key
+                ]
+            else:
+                latest_storage_id_by_partition = self.instance.get_latest_storage_id_by_partition(
+                    asset_key, event_type=self._event_type_for_key(asset_key)
+                )
             latest_storage_ids.update(
                 {
                     AssetKeyPartitionKey(asset_key, partition_key): storage_id
-                    for partition_key, storage_id in self.instance.get_latest_storage_id_by_partition(
-                        asset_key, event_type=self._event_type_for_key(asset_key)
-                    ).items()
+                    for partition_key, storage_id in latest_storage_id_by_partition.items()
                 }
             )
         return latest_storage_ids
@@ -469,7 +547,7 @@ def next_version_record(
 
     @cached_method
     def _get_run_record_by_id(self, *, run_id: str) -> Optional[RunRecord]:
-        return self.instance.get_run_record_by_id(run_id)
+        return RunRecord.blocking_get(self._loading_context, run_id)
 
     def _get_run_by_id(self, run_id: str) -> Optional[DagsterRun]:
         run_record = self._get_run_record_by_id(run_id=run_id)
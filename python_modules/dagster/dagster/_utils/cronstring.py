@@ -21,11 +21,13 @@ def get_fixed_minute_interval(cron_schedule: str) -> Optional[int]:
         return 60
 
     cron_parts = cron_schedule.split()
+    if len(cron_parts) != 5:
+        return None
     is_wildcard = [part == "*" for part in cron_parts]
 
-    # To match this criteria, every other field besides the first must end in *
+    # To match this criteria, every other field besides the first must be *
     # since it must be an every-n-minutes cronstring like */15
-    if not is_wildcard[1:]:
+    if not all(is_wildcard[1:]):
         return None
 
     if not cron_parts[0].startswith("*/"):
@@ -1,6 +1,7 @@
 import asyncio
 import sys
 from contextlib import contextmanager
+from unittest import mock
 
 import pytest
 from dagster import IntMetadataValue, TextMetadataValue, job, op, repository
@@ -8,7 +9,7 @@
     gen_streaming_external_repositories_data_grpc,
     sync_get_streaming_external_repositories_data_grpc,
 )
-from dagster._core.errors import DagsterUserCodeProcessError
+from dagster._core.errors import DagsterInvariantViolationError, DagsterUserCodeProcessError
 from dagster._core.instance import DagsterInstance
 from dagster._core.remote_representation import (
     ManagedGrpcPythonEnvCodeLocationOrigin,
@@ -20,7 +21,8 @@
 from dagster._core.remote_representation.origin import RemoteRepositoryOrigin
 from dagster._core.test_utils import instance_for_test
 from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
-from dagster._serdes.serdes import deserialize_value
+from dagster._grpc.server import RepositorySnapCache
+from dagster._serdes.serdes import deserialize_value, serialize_value
 
 from dagster_tests.api_tests.utils import get_bar_repo_code_location
 
@@ -180,3 +182,55 @@ def _ref_to_data(ref):
         job = repo.get_all_jobs()[0]
         _ = job.job_snapshot
         assert _state.get("cnt", 0) == 1
+
+
+@repository
+def small_repo():
+    @job
+    def job_one():
+        do_something()
+
+    @job
+    def job_two():
+        do_something()
+
+    return [job_one, job_two]
+
+
+def test_repository_snap_cache():
+    snap_cache = RepositorySnapCache(small_repo)
+
+    with mock.patch.object(
+        JobDataSnap, "from_job_def", wraps=JobDataSnap.from_job_def
+    ) as from_job_def_mock:
+        serialized_job_data_snap = snap_cache.get_serialized_job_data_snap("job_one")
+        assert deserialize_value(serialized_job_data_snap, JobDataSnap).name == "job_one"
+        assert from_job_def_mock.call_count == 1
+
+        # job snapshots that were already built are reused for the full repository snapshot
+        serialized_repository_snap = snap_cache.get_serialized_repository_snap(
+            defer_snapshots=False
+        )
+        assert from_job_def_mock.call_count == 2
+
+        assert snap_cache.get_serialized_repository_snap(defer_snapshots=False) is (
+            serialized_repository_snap
+        )
+        assert snap_cache.get_serialized_job_data_snap("job_one") is serialized_job_data_snap
+        assert snap_cache.get_serialized_job_data_snap("job_two")
+        assert from_job_def_mock.call_count == 2
+
+        deferred_repository_snap = deserialize_value(
+            snap_cache.get_serialized_repository_snap(defer_snapshots=True), RepositorySnap
+        )
+        assert deferred_repository_snap.job_datas is None
+        assert {job_ref.name for job_ref in deferred_repository_snap.get_job_refs()} == {
+            "job_one",
+            "job_two",
+        }
+        assert from_job_def_mock.call_count == 2
+
+    assert serialized_repository_snap == serialize_value(RepositorySnap.from_def(small_repo))
+
+    with pytest.raises(DagsterInvariantViolationError):
+        snap_cache.get_serialized_job_data_snap("does_not_exist")
@@ -17,6 +17,7 @@
     GraphOut,
     HourlyPartitionsDefinition,
     LastPartitionMapping,
+    Nothing,
     Out,
     PartitionMapping,
     StaticPartitionsDefinition,
@@ -764,6 +765,76 @@ def Bc(): ...
     ]
 
 
+def test_asset_graph_index_traversals(
+    asset_graph_from_assets: Callable[..., BaseAssetGraph],
+) -> None:
+    daily_partitions_def = DailyPartitionsDefinition(start_date="2022-01-01")
+
+    @asset
+    def a(): ...
+
+    @asset(deps=[a])
+    def b(): ...
+
+    @asset(deps=[a])
+    def c(): ...
+
+    @asset(
+        deps=[b, c],
+        partitions_def=daily_partitions_def,
+        automation_condition=AutomationCondition.eager(),
+    )
+    def d(): ...
+
+    @asset(
+        partitions_def=daily_partitions_def,
+        ins={
+            "d": AssetIn(dagster_type=Nothing),
+            "e": AssetIn(
+                partition_mapping=TimeWindowPartitionMapping(start_offset=-1, end_offset=-1),
+                dagster_type=Nothing,
+            ),
+        },
+        automation_condition=AutomationCondition.eager(),
+    )
+    def e(): ...
+
+    asset_graph = asset_graph_from_assets([a, b, c, d, e])
+    index = asset_graph.asset_graph_index
+
+    assert set(index.keys) == {a.key, b.key, c.key, d.key, e.key}
+    assert index.has_self_dependency(index.index_of(e.key))
+    assert not index.has_self_dependency(index.index_of(d.key))
+    assert {index.keys[i] for i in index.parent_indices(index.index_of(d.key))} == {b.key, c.key}
+
+    assert asset_graph.toposorted_asset_keys == [a.key, b.key, c.key, d.key, e.key]
+    assert asset_graph.toposorted_asset_keys_by_level == [
+        {a.key},
+        {b.key, c.key},
+        {d.key},
+        {e.key},
+    ]
+
+    assert asset_graph.get_ancestor_asset_keys(a.key) == set()
+    assert asset_graph.get_ancestor_asset_keys(d.key) == {a.key, b.key, c.key}
+    assert asset_graph.get_ancestor_asset_keys(e.key) == {a.key, b.key, c.key, d.key}
+    assert asset_graph.get_ancestor_asset_keys(d.key, include_self=True) == {
+        a.key,
+        b.key,
+        c.key,
+        d.key,
+    }
+    assert set(asset_graph.upstream_key_iterator(d.key)) == {a.key, b.key, c.key}
+    assert set(asset_graph.upstream_key_iterator(e.key)) == {a.key, b.key, c.key, d.key, e.key}
+
+    assert asset_graph.get_downstream_automation_conditions(asset_key=a.key) == {
+        AutomationCondition.eager(): {d.key, e.key}
+    }
+    assert asset_graph.get_downstream_automation_conditions(asset_key=e.key) == {
+        AutomationCondition.eager(): {e.key}
+    }
+
+
 def test_required_assets_and_checks_by_key_asset_decorator(
     asset_graph_from_assets: Callable[..., BaseAssetGraph],
 ):
@@ -2,6 +2,7 @@
 from functools import reduce
 from inspect import isclass
 from typing import AbstractSet, Iterable, Tuple, Union
+from unittest import mock
 
 import pytest
 from dagster import (
@@ -318,6 +319,41 @@ def test_upstream_include_self(all_assets: _AssetList):
     assert selection.resolve(all_assets) == _asset_keys_of({danny})
 
 
+def test_resolve_cached_per_asset_graph(all_assets: _AssetList):
+    asset_graph = AssetGraph.from_assets(all_assets)
+    selection = AssetSelection.assets("candace").downstream(depth=1) | AssetSelection.groups(
+        "robots"
+    )
+
+    with mock.patch.object(
+        KeysAssetSelection,
+        "resolve_inner",
+        autospec=True,
+        side_effect=KeysAssetSelection.resolve_inner,
+    ) as resolve_inner:
+        resolved = selection.resolve(asset_graph)
+        assert resolved == _asset_keys_of({candace, danny, robots})
+        # mutating a resolved selection doesn't affect later resolutions
+        resolved.add(AssetKey("zebra"))
+
+        assert selection.resolve(asset_graph) == _asset_keys_of({candace, danny, robots})
+        assert resolve_inner.call_count == 1
+
+        # an equal selection that is a different object, or a different asset graph, is resolved
+        # again
+        assert AssetSelection.assets("candace").downstream(depth=1).resolve(
+            asset_graph
+        ) == _asset_keys_of({candace, danny})
+        assert selection.resolve(all_assets) == _asset_keys_of({candace, danny, robots})
+        assert resolve_inner.call_count == 3
+
+
+def test_from_string_reuses_parsed_selection():
+    assert AssetSelection.from_string("key:my_asset+") is AssetSelection.from_string(
+        "key:my_asset+"
+    )
+
+
 def test_asset_selection_source_assets(all_assets: _AssetList):
     selection = AssetSelection.assets("alice").upstream_source_assets()
     assert selection.resolve(all_assets) == {earth.key}
@@ -21,6 +21,7 @@
 from dagster._core.definitions.backfill_policy import BackfillPolicy
 from dagster._core.definitions.data_version import CachingStaleStatusResolver
 from dagster._core.definitions.decorators.source_asset_decorator import observable_source_asset
+from dagster._core.definitions.remote_asset_graph import RemoteWorkspaceAssetGraph
 from dagster._core.remote_representation import InProcessCodeLocationOrigin
 from dagster._core.test_utils import instance_for_test
 from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
@@ -209,6 +210,44 @@ def test_cross_repo_dep_no_source_asset(instance) -> None:
     ]
 
 
+def test_update_workspace_asset_graph(instance) -> None:
+    workspace_snapshot = WorkspaceSnapshot(
+        code_location_entries={
+            defs_attr: _make_location_entry(defs_attr, instance)
+            for defs_attr in ["defs1", "defs2", "downstream_defs"]
+        }
+    )
+    asset_graph = workspace_snapshot.asset_graph
+
+    # reloading a location only rebuilds the nodes of the assets in that location
+    reloaded_snapshot = workspace_snapshot.with_code_location(
+        "defs2", _make_location_entry("defs2", instance)
+    )
+    reloaded_asset_graph = reloaded_snapshot.asset_graph
+    assert reloaded_asset_graph is not asset_graph
+    assert reloaded_asset_graph.get(asset1.key) is asset_graph.get(asset1.key)
+    assert reloaded_asset_graph.get(downstream.key) is asset_graph.get(downstream.key)
+    assert reloaded_asset_graph.get(asset2.key) is not asset_graph.get(asset2.key)
+    assert (
+        reloaded_asset_graph.get_all_asset_keys()
+        == RemoteWorkspaceAssetGraph.build(reloaded_snapshot).get_all_asset_keys()
+    )
+
+    # removing a location rebuilds the nodes of assets that it contributed to
+    removed_snapshot = reloaded_snapshot.with_code_location_entries(
+        {
+            name: entry
+            for name, entry in reloaded_snapshot.code_location_entries.items()
+            if name != "downstream_defs"
+        }
+    )
+    removed_asset_graph = removed_snapshot.asset_graph
+    assert removed_asset_graph.get(asset2.key) is reloaded_asset_graph.get(asset2.key)
+    assert removed_asset_graph.get(asset1.key).child_keys == set()
+    assert not removed_asset_graph.has(downstream.key)
+    assert removed_asset_graph.get_all_asset_keys() == {asset1.key, asset2.key}
+
+
 def test_partitioned_source_asset(instance) -> None:
     asset_graph = _make_context(instance, ["partitioned_defs"]).asset_graph
 
@@ -1,9 +1,22 @@
+import copy
+import json
+import pickle
 from typing import cast
 from unittest.mock import Mock
 
 import pytest
-from dagster import DailyPartitionsDefinition, MultiPartitionsDefinition, StaticPartitionsDefinition
-from dagster._core.definitions.partition import AllPartitionsSubset, DefaultPartitionsSubset
+from dagster import (
+    DailyPartitionsDefinition,
+    DynamicPartitionsDefinition,
+    MultiPartitionsDefinition,
+    StaticPartitionsDefinition,
+)
+from dagster._core.definitions.partition import (
+    AllPartitionsSubset,
+    BitmapPartitionsSubset,
+    DefaultPartitionsSubset,
+)
+from dagster._core.definitions.partition_key_range import PartitionKeyRange
 from dagster._core.definitions.time_window_partitions import (
     PersistedTimeWindow,
     TimeWindowPartitionsDefinition,
@@ -82,7 +95,8 @@ def test_get_subset_type():
 
 
 def test_empty_subsets():
-    assert type(static_partitions.empty_subset()) is DefaultPartitionsSubset
+    assert type(static_partitions.empty_subset()) is BitmapPartitionsSubset
+    assert type(DynamicPartitionsDefinition(name="fruits").empty_subset()) is BitmapPartitionsSubset
     assert type(time_window_partitions.empty_subset()) is TimeWindowPartitionsSubset
 
 
@@ -194,6 +208,132 @@ def test_all_partitions_subset_time_window_partitions_def() -> None:
         assert set(round_trip_subset.get_partition_keys()) == set(all_subset.get_partition_keys())
 
 
+def test_default_partitions_subset_set_operations() -> None:
+    static_partitions_def = StaticPartitionsDefinition(["a", "b", "c", "d"])
+    abc_subset = DefaultPartitionsSubset({"a", "b", "c"})
+    cd_subset = static_partitions_def.subset_with_partition_keys(["c", "d"])
+    empty_subset = static_partitions_def.empty_subset()
+
+    assert abc_subset | cd_subset == DefaultPartitionsSubset({"a", "b", "c", "d"})
+    assert abc_subset - cd_subset == DefaultPartitionsSubset({"a", "b"})
+    assert abc_subset & cd_subset == DefaultPartitionsSubset({"c"})
+    assert (abc_subset | empty_subset) is abc_subset
+    assert (empty_subset | abc_subset) is abc_subset
+    assert (abc_subset - empty_subset) is abc_subset
+    assert (abc_subset & empty_subset).is_empty
+    assert not abc_subset.is_empty
+    assert empty_subset.is_empty
+
+    # operands are left unchanged
+    assert abc_subset == DefaultPartitionsSubset({"a", "b", "c"})
+    assert cd_subset == DefaultPartitionsSubset({"c", "d"})
+
+    assert set(abc_subset.get_partition_keys_not_in_subset(static_partitions_def)) == {"d"}
+
+
+def test_bitmap_partitions_subset_set_operations() -> None:
+    static_partitions_def = StaticPartitionsDefinition([str(i) for i in range(100)])
+    evens_subset = static_partitions_def.subset_with_partition_keys(
+        [str(i) for i in range(0, 100, 2)]
+    )
+    first_half_subset = static_partitions_def.subset_with_partition_keys(
+        [str(i) for i in range(50)]
+    )
+    assert isinstance(evens_subset, BitmapPartitionsSubset)
+    assert len(evens_subset) == 50
+    assert "2" in evens_subset and "3" not in evens_subset and "unknown" not in evens_subset
+
+    union = evens_subset | first_half_subset
+    assert isinstance(union, BitmapPartitionsSubset)
+    assert union.partition_key_index is evens_subset.partition_key_index
+    assert len(union) == 75
+    assert union.get_partition_keys() == {str(i) for i in range(50)} | {
+        str(i) for i in range(50, 100, 2)
+    }
+    assert (evens_subset - first_half_subset).get_partition_keys() == {
+        str(i) for i in range(50, 100, 2)
+    }
+    assert (evens_subset & first_half_subset).get_partition_keys() == {
+        str(i) for i in range(0, 50, 2)
+    }
+    assert (evens_subset - evens_subset).is_empty
+    assert evens_subset.get_partition_keys_not_in_subset(static_partitions_def) == {
+        str(i) for i in range(1, 100, 2)
+    }
+    assert first_half_subset.get_partition_key_ranges(static_partitions_def) == [
+        PartitionKeyRange("0", "49")
+    ]
+    assert union.get_partition_key_ranges(static_partitions_def)[:2] == [
+        PartitionKeyRange("0", "50"),
+        PartitionKeyRange("52", "52"),
+    ]
+
+    # subsets of an equal partitions definition, and key-based subsets, are combined by key
+    other_partitions_def = StaticPartitionsDefinition([str(i) for i in range(100)])
+    other_subset = other_partitions_def.subset_with_partition_keys(["1", "2"])
+    assert (
+        evens_subset | other_subset
+    ).get_partition_keys() == evens_subset.get_partition_keys() | {"1"}
+    assert (evens_subset & DefaultPartitionsSubset({"1", "2"})) == DefaultPartitionsSubset({"2"})
+    assert other_subset == DefaultPartitionsSubset({"1", "2"})
+    assert DefaultPartitionsSubset({"1", "2"}) == other_subset
+
+    # keys outside of the partitions definition are retained
+    with_unknown_subset = evens_subset.with_partition_keys(["unknown"])
+    assert "unknown" in with_unknown_subset
+    assert len(with_unknown_subset) == 51
+    assert "unknown" not in with_unknown_subset.get_partition_keys_not_in_subset(
+        static_partitions_def
+    )
+
+
+def test_bitmap_partitions_subset_serialization() -> None:
+    static_partitions_def = StaticPartitionsDefinition([str(i) for i in range(10_000)])
+    subset = static_partitions_def.subset_with_partition_keys([str(i) for i in range(5_000)])
+
+    serialized = subset.serialize()
+    assert json.loads(serialized)["version"] == BitmapPartitionsSubset.SERIALIZATION_VERSION
+    assert len(serialized) < 200
+    assert static_partitions_def.can_deserialize_subset(serialized, None, None)
+    assert static_partitions_def.deserialize_subset(serialized) == subset
+
+    # key-based subsets serialized before the bitmap format are still readable
+    key_serialized = DefaultPartitionsSubset({"1", "2"}).serialize()
+    assert static_partitions_def.can_deserialize_subset(key_serialized, None, None)
+    assert static_partitions_def.deserialize_subset(key_serialized).get_partition_keys() == {
+        "1",
+        "2",
+    }
+
+    # bitmaps cannot be read once the partitions definition has changed
+    changed_partitions_def = StaticPartitionsDefinition([str(i) for i in range(10_001)])
+    assert not changed_partitions_def.can_deserialize_subset(serialized, None, None)
+    with pytest.raises(DagsterInvalidDeserializationVersionError):
+        changed_partitions_def.deserialize_subset(serialized)
+
+    # subsets with keys outside of the partitions definition fall back to the key-based format
+    with_unknown_serialized = subset.with_partition_keys(["unknown"]).serialize()
+    assert json.loads(with_unknown_serialized)["version"] == 1
+    assert changed_partitions_def.deserialize_subset(
+        with_unknown_serialized
+    ).get_partition_keys() == (subset.get_partition_keys() | {"unknown"})
+
+    # as do subsets of dynamic partitions, whose ordinals are only meaningful to this process
+    dynamic_partitions_def = DynamicPartitionsDefinition(name="fruits")
+    dynamic_subset = dynamic_partitions_def.subset_with_partition_keys(["apple", "banana"])
+    dynamic_serialized = dynamic_subset.serialize()
+    assert json.loads(dynamic_serialized) == {"version": 1, "subset": ["apple", "banana"]}
+    assert dynamic_partitions_def.deserialize_subset(dynamic_serialized) == dynamic_subset
+
+    # with serdes, bitmap subsets are stored as DefaultPartitionsSubsets
+    round_trip_subset = deserialize_value(serialize_value(subset))
+    assert isinstance(round_trip_subset, DefaultPartitionsSubset)
+    assert round_trip_subset == subset
+    assert serialize_value(subset) == serialize_value(
+        DefaultPartitionsSubset(set(subset.get_partition_keys()))
+    )
+
+
 def test_partitions_set_short_circuiting() -> None:
     static_partitions_def = StaticPartitionsDefinition(["a", "b", "c", "d"])
     default_ps = DefaultPartitionsSubset({"a", "b", "c"})
@@ -209,3 +349,25 @@ def test_partitions_set_short_circuiting() -> None:
 
     # Test short-circuiting of -. Returns an empty DefaultPartitionsSubset
     assert (default_ps - all_ps) == DefaultPartitionsSubset.empty_subset()
+
+
+def test_bitmap_partitions_subset_pickle_and_deepcopy() -> None:
+    static_partitions_def = StaticPartitionsDefinition(["a", "b", "c"])
+    dynamic_partitions_def = DynamicPartitionsDefinition(name="fruits")
+    for partitions_def, partition_keys in [
+        (static_partitions_def, ["a", "c"]),
+        (dynamic_partitions_def, ["apple", "banana"]),
+    ]:
+        subset = partitions_def.subset_with_partition_keys(partition_keys)
+        assert isinstance(subset, BitmapPartitionsSubset)
+        for round_trip in [pickle.loads(pickle.dumps(subset)), copy.deepcopy(subset)]:
+            assert round_trip == subset
+            assert round_trip.get_partition_keys() == set(partition_keys)
+            assert len(round_trip) == len(partition_keys)
+        assert pickle.loads(pickle.dumps(partitions_def)) == partitions_def
+        assert copy.deepcopy(partitions_def) == partitions_def
+
+    # keys added to dynamic subsets do not accumulate on the partitions definition
+    dynamic_partitions_def.empty_subset().with_partition_keys(["cherry"])
+    assert dynamic_partitions_def.partition_key_index.get_ordinal("cherry") is None
+    assert dynamic_partitions_def.empty_subset() == dynamic_partitions_def.empty_subset()
@@ -1,5 +1,5 @@
 import pytest
-from dagster import Any, Enum, EnumValue, Field, Noneable, Permissive, String
+from dagster import Any, Enum, EnumValue, Field, Noneable, Permissive, String, StringSource
 from dagster._check import CheckError, ParameterCheckError
 from dagster._config import (
     ConfigType,
@@ -8,6 +8,7 @@
     post_process_config,
     resolve_to_config_type,
 )
+from dagster._core.test_utils import environ
 
 
 def test_post_process_config():
@@ -193,3 +194,33 @@ def test_post_process_config():
     }
     assert post_process_config(noneable_permissive_config_type, {"args": {}}).value["args"] == {}
     assert post_process_config(noneable_permissive_config_type, None).value["args"] is None
+
+
+def test_post_process_config_cached_defaults():
+    config_type = resolve_to_config_type(
+        {
+            "nested": Field(
+                {"items": Field([float], is_required=False, default_value=[1, 2])},
+                is_required=False,
+                default_value={},
+            ),
+            "source": Field(StringSource, is_required=False, default_value={"env": "CACHED_ENV"}),
+        }
+    )
+
+    with environ({"CACHED_ENV": "foo"}):
+        first = post_process_config(config_type, {}).value
+    assert first == {"nested": {"items": [1.0, 2.0]}, "source": "foo"}
+
+    # the processed default is reused, but mutating the processed config doesn't change it
+    first["nested"]["items"].append(3.0)
+
+    # defaults that are read from the environment are processed each time
+    with environ({"CACHED_ENV": "bar"}):
+        second = post_process_config(config_type, {}).value
+    assert second == {"nested": {"items": [1.0, 2.0]}, "source": "bar"}
+
+    # errors are reported by the uncompiled traversal
+    result = post_process_config(config_type, {})
+    assert not result.success
+    assert "CACHED_ENV" in result.errors[0].message
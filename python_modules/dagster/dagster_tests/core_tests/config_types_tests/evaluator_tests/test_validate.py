@@ -1,4 +1,14 @@
-from dagster import Field, Noneable, Permissive, ScalarUnion, Selector, Shape
+from dagster import (
+    Enum,
+    EnumValue,
+    Field,
+    Noneable,
+    Permissive,
+    ScalarUnion,
+    Selector,
+    Shape,
+    StringSource,
+)
 from dagster._config import (
     DagsterEvaluationErrorReason,
     EvaluationStackListItemEntry,
@@ -7,7 +17,9 @@
     EvaluationStackPathEntry,
     resolve_to_config_type,
     validate_config,
+    validate_config_from_snap,
 )
+from dagster._config.compiled import INVALID_CONFIG
 
 
 def test_parse_scalar_success():
@@ -661,3 +673,73 @@ def test_list_of_scalar_or_dict():
     assert not validate_config(int_or_dict_list, [2, {"wrong_key": "kjdfd"}]).success
     assert not validate_config(int_or_dict_list, [2, {"a_string": 2343}]).success
     assert not validate_config(int_or_dict_list, ["kjdfkd", {"a_string": "kjdfd"}]).success
+
+
+def test_compiled_validator_matches_schema_snapshot():
+    config_type = resolve_to_config_type(
+        {
+            "name": Field(str, is_required=False, default_value="foo"),
+            "source": StringSource,
+            "retries": Noneable(int),
+            "storage": Selector(
+                {"filesystem": {"base_dir": Field(str, is_required=False)}, "in_memory": {}}
+            ),
+            "tags": {str: [float]},
+            "mode": Enum("mode", [EnumValue("fast"), EnumValue("slow")]),
+            "aliased": Field(
+                Shape(
+                    {"new_name": Field(int, is_required=False)}, field_aliases={"new_name": "old"}
+                )
+            ),
+            "extra": Permissive({"a": bool}),
+        }
+    )
+    valid_value = {
+        "source": {"env": "FOO"},
+        "retries": None,
+        "storage": {"filesystem": None},
+        "tags": {"a": [1, 2.5]},
+        "mode": "fast",
+        "aliased": {"old": 1},
+        "extra": {"a": True, "b": "anything"},
+    }
+    config_values = [
+        valid_value,
+        {**valid_value, "name": "bar", "source": "bar", "storage": {"in_memory": {}}},
+        {**valid_value, "aliased": {}, "retries": 3},
+        None,
+        [],
+        {},
+        {**valid_value, "unknown": 1},
+        {**valid_value, "name": None},
+        {**valid_value, "name": 1},
+        {**valid_value, "source": {"env": 1}},
+        {**valid_value, "retries": True},
+        {**valid_value, "storage": {}},
+        {**valid_value, "storage": {"filesystem": {}, "in_memory": {}}},
+        {**valid_value, "storage": {"s3": {}}},
+        {**valid_value, "storage": "filesystem"},
+        {**valid_value, "tags": {"a": ["1"]}},
+        {**valid_value, "tags": {1: [1.0]}},
+        {**valid_value, "tags": {"a": 1.0}},
+        {**valid_value, "mode": "medium"},
+        {**valid_value, "aliased": {"new_name": "2"}},
+        {**valid_value, "extra": {"b": 1}},
+    ]
+
+    compiled_validator = config_type.get_compiled_validator()
+    for config_value in config_values:
+        evr = validate_config_from_snap(
+            config_type.get_schema_snapshot(), config_type.key, config_value
+        )
+        validated_value = compiled_validator(config_value)
+        assert (validated_value is not INVALID_CONFIG) == evr.success, config_value
+        if evr.success:
+            assert validated_value == evr.value
+
+    assert (
+        compiled_validator({**valid_value, "aliased": {"old": 1, "new_name": 2}}) is INVALID_CONFIG
+    )
+    assert config_type.get_compiled_validator() is compiled_validator
+    assert validate_config(config_type, valid_value).value == valid_value
+    assert validate_config(config_type, {**valid_value, "unknown": 1}).errors
@@ -52,6 +52,7 @@
     AssetBackfillData,
     AssetBackfillIterationResult,
     AssetBackfillStatus,
+    _get_frontier_asset_partitions,
     execute_asset_backfill_iteration_inner,
     get_canceling_asset_backfill_iteration_data,
 )
@@ -1795,3 +1796,70 @@ def foo_child():
         "fake_id", asset_backfill_data, asset_graph, instance, assets_by_repo_name
     )
     assert asset_backfill_data.requested_subset == asset_backfill_data.target_subset
+
+
+def test_asset_backfill_frontier_asset_partitions():
+    daily_partitions_def = DailyPartitionsDefinition("2023-10-01")
+
+    @asset(partitions_def=daily_partitions_def)
+    def foo():
+        pass
+
+    @asset(partitions_def=daily_partitions_def, deps={foo})
+    def foo_child():
+        pass
+
+    @asset(deps={foo_child})
+    def unpartitioned_grandchild():
+        pass
+
+    assets_by_repo_name = {"repo1": [foo], "repo2": [foo_child, unpartitioned_grandchild]}
+    asset_graph = get_asset_graph(assets_by_repo_name)
+    partition_keys = ["2023-10-01", "2023-10-02", "2023-10-03"]
+
+    asset_backfill_data = AssetBackfillData.from_asset_partitions(
+        asset_graph=asset_graph,
+        partition_names=partition_keys,
+        asset_selection=[foo.key, foo_child.key, unpartitioned_grandchild.key],
+        dynamic_partitions_store=MagicMock(),
+        all_partitions=False,
+        backfill_start_timestamp=create_datetime(2023, 10, 4, 0, 0, 0).timestamp(),
+    )
+    asset_backfill_data = asset_backfill_data.replace_requested_subset(
+        AssetGraphSubset.from_asset_partition_set(
+            {
+                *(AssetKeyPartitionKey(foo.key, key) for key in partition_keys),
+                AssetKeyPartitionKey(foo_child.key, "2023-10-02"),
+            },
+            asset_graph,
+        )
+    )
+
+    def _frontier(materialized_since_last_tick):
+        return _get_frontier_asset_partitions(
+            asset_backfill_data=asset_backfill_data,
+            materialized_since_last_tick=materialized_since_last_tick,
+            updated_materialized_subset=materialized_since_last_tick,
+            asset_graph=asset_graph,
+            dynamic_partitions_store=MagicMock(),
+            current_time=asset_backfill_data.backfill_start_datetime,
+        )
+
+    assert _frontier(AssetGraphSubset()) == set()
+
+    # only the children of newly materialized partitions that haven't been requested are evaluated
+    assert _frontier(
+        AssetGraphSubset.from_asset_partition_set(
+            {
+                AssetKeyPartitionKey(foo.key, "2023-10-01"),
+                AssetKeyPartitionKey(foo.key, "2023-10-02"),
+            },
+            asset_graph,
+        )
+    ) == {AssetKeyPartitionKey(foo_child.key, "2023-10-01")}
+
+    assert _frontier(
+        AssetGraphSubset.from_asset_partition_set(
+            {AssetKeyPartitionKey(foo_child.key, "2023-10-02")}, asset_graph
+        )
+    ) == {AssetKeyPartitionKey(unpartitioned_grandchild.key)}
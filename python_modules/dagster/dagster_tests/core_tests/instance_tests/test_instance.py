@@ -1,6 +1,7 @@
 import os
 import re
 import tempfile
+import time
 from typing import Any, Mapping, Optional
 from unittest.mock import MagicMock, patch
 
@@ -15,6 +16,7 @@
     asset,
     execute_job,
     job,
+    materialize,
     op,
     reconstructable,
 )
@@ -31,6 +33,7 @@
     DagsterInvalidConfigError,
     DagsterInvariantViolationError,
 )
+from dagster._core.events import DagsterEventType
 from dagster._core.execution.api import create_execution_plan
 from dagster._core.instance import DagsterInstance, InstanceRef
 from dagster._core.instance.config import DEFAULT_LOCAL_CODE_SERVER_STARTUP_TIMEOUT
@@ -777,3 +780,53 @@ def test_invalid_run_id():
             match="run_id must be a valid UUID. Got invalid_run_id",
         ):
             create_run_for_test(instance, job_name="foo_job", run_id="invalid_run_id")
+
+
+def test_buffered_event_writes(monkeypatch):
+    @asset
+    def buffered_asset(context):
+        for i in range(5):
+            context.log.info(f"log line {i}")
+        return 1
+
+    monkeypatch.setenv("DAGSTER_EVENT_BATCH_SIZE", "100")
+    monkeypatch.setenv("DAGSTER_EVENT_BATCH_FLUSH_INTERVAL", "60")
+
+    with instance_for_test() as instance:
+        with patch.object(
+            instance.event_log_storage,
+            "store_event_batch",
+            wraps=instance.event_log_storage.store_event_batch,
+        ) as store_event_batch:
+            result = materialize([buffered_asset], instance=instance)
+            assert result.success
+            assert store_event_batch.call_count > 0
+
+        # every event is written, in order, by the time the run completes
+        records = instance.get_records_for_run(result.run_id).records
+        assert [record.storage_id for record in records] == sorted(
+            record.storage_id for record in records
+        )
+        messages = [record.event_log_entry.user_message for record in records]
+        assert [message for message in messages if message.startswith("log line")] == [
+            f"log line {i}" for i in range(5)
+        ]
+        assert records[-1].event_log_entry.dagster_event_type == DagsterEventType.RUN_SUCCESS
+        assert instance.get_latest_materialization_event(buffered_asset.key)
+
+
+def test_buffered_event_writes_flush_interval(monkeypatch):
+    monkeypatch.setenv("DAGSTER_EVENT_BATCH_SIZE", "100")
+    monkeypatch.setenv("DAGSTER_EVENT_BATCH_FLUSH_INTERVAL", "0.1")
+
+    with instance_for_test() as instance:
+        run = create_run_for_test(instance, job_name="foo_job")
+        instance.report_engine_event("buffered", dagster_run=run)
+        assert not instance.get_records_for_run(run.run_id).records
+
+        # written by the background thread once the flush interval has elapsed
+        for _ in range(50):
+            if instance.get_records_for_run(run.run_id).records:
+                break
+            time.sleep(0.1)
+        assert len(instance.get_records_for_run(run.run_id).records) == 1
@@ -405,7 +405,12 @@ def job_requires_config():
         "ops": {"requires_config": {"config": {"foo": "bar"}, "inputs": {}, "outputs": None}},
         "execution": {
             "multi_or_in_process_executor": {
-                "multiprocess": {"max_concurrent": None, "retries": {"enabled": {}}}
+                "multiprocess": {
+                    "max_concurrent": None,
+                    "reuse_processes": False,
+                    "max_steps_per_worker": None,
+                    "retries": {"enabled": {}},
+                }
             }
         },
         "resources": {"io_manager": {"config": None}},
@@ -431,7 +436,12 @@ def job_requires_config():
         "ops": {"requires_config": {"config": {"foo": "bar"}, "inputs": {}, "outputs": None}},
         "execution": {
             "multi_or_in_process_executor": {
-                "multiprocess": {"max_concurrent": None, "retries": {"enabled": {}}}
+                "multiprocess": {
+                    "max_concurrent": None,
+                    "reuse_processes": False,
+                    "max_steps_per_worker": None,
+                    "retries": {"enabled": {}},
+                }
             }
         },
         "resources": {"io_manager": {"config": None}},
@@ -5,10 +5,12 @@
     AutomationCondition,
     DagsterInstance,
     Definitions,
+    StaticPartitionsDefinition,
     asset,
     asset_check,
     evaluate_automation_conditions,
 )
+from dagster._utils import Counter, traced_counter
 
 from dagster_tests.definitions_tests.declarative_automation_tests.scenario_utils.automation_condition_scenario import (
     AutomationConditionScenarioState,
@@ -134,3 +136,43 @@ def foo_check() -> AssetCheckResult:
     instance.report_runless_asset_event(AssetMaterialization("A"))
     result = evaluate_automation_conditions(defs=defs, instance=instance, cursor=result.cursor)
     assert result.total_requested == 0
+
+
+def test_newly_updated_partitions_prefetched() -> None:
+    partitions_def = StaticPartitionsDefinition(["1", "2"])
+
+    @asset(partitions_def=partitions_def)
+    def A() -> None: ...
+
+    @asset(
+        deps=[A],
+        partitions_def=partitions_def,
+        automation_condition=AutomationCondition.newly_updated()
+        | AutomationCondition.any_deps_match(AutomationCondition.newly_updated()),
+    )
+    def B() -> None: ...
+
+    defs = Definitions(assets=[A, B])
+    instance = DagsterInstance.ephemeral()
+
+    result = evaluate_automation_conditions(defs=defs, instance=instance)
+    assert result.total_requested == 0
+
+    instance.report_runless_asset_event(AssetMaterialization("A", partition="1"))
+    instance.report_runless_asset_event(AssetMaterialization("B", partition="2"))
+
+    # the latest storage ids of both assets are fetched in a single query up front
+    traced_counter.set(Counter())
+    result = evaluate_automation_conditions(defs=defs, instance=instance, cursor=result.cursor)
+    assert result.total_requested == 2
+    counts = traced_counter.get().counts()
+    assert counts.get("DagsterInstance.get_latest_storage_id_by_partition_for_asset_keys") == 1
+    assert not counts.get("DagsterInstance.get_latest_storage_id_by_partition")
+
+    # nothing has been updated since, so nothing needs to be fetched
+    traced_counter.set(Counter())
+    result = evaluate_automation_conditions(defs=defs, instance=instance, cursor=result.cursor)
+    assert result.total_requested == 0
+    counts = traced_counter.get().counts()
+    assert not counts.get("DagsterInstance.get_latest_storage_id_by_partition_for_asset_keys")
+    assert not counts.get("DagsterInstance.get_latest_storage_id_by_partition")
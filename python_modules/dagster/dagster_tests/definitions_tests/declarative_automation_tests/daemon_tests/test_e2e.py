@@ -1,7 +1,9 @@
+import base64
 import datetime
 import os
 import sys
 import time
+import zlib
 from contextlib import contextmanager
 from typing import AbstractSet, Any, Dict, Mapping, Optional, Sequence, cast
 
@@ -39,11 +41,14 @@
 from dagster._daemon.asset_daemon import (
     AssetDaemon,
     asset_daemon_cursor_from_instigator_serialized_cursor,
+    asset_daemon_cursor_to_instigator_serialized_cursor,
+    get_sensor_shard_index,
 )
 from dagster._daemon.backfill import execute_backfill_iteration
 from dagster._daemon.daemon import get_default_daemon_logger
 from dagster._daemon.sensor import execute_sensor_iteration
 from dagster._grpc.server import GrpcServerProcess
+from dagster._serdes.serdes import COMPACT_SERDES_PREFIX
 from dagster._time import get_current_datetime
 
 
@@ -314,6 +319,44 @@ def test_checks_and_assets_in_same_run() -> None:
             }
 
 
+def test_compact_cursors() -> None:
+    time = get_current_datetime()
+    with (
+        get_workspace_request_context(
+            ["simple_non_user_code"], overrides={"auto_materialize": {"use_compact_cursors": True}}
+        ) as context,
+        get_threadpool_executor() as executor,
+    ):
+        for expected_evaluation_id in [1, 2]:
+            with freeze_time(time):
+                _execute_ticks(context, executor)
+                assert _get_latest_evaluation_ids(context) == {expected_evaluation_id}
+            time += datetime.timedelta(seconds=30)
+
+        for state in _get_current_state(context.create_request_context()).values():
+            serialized_cursor = check.not_none(
+                cast(SensorInstigatorData, state.instigator_data).cursor
+            )
+            assert (
+                zlib.decompress(base64.b64decode(serialized_cursor[1:]))
+                .decode("utf-8")
+                .startswith(COMPACT_SERDES_PREFIX)
+            )
+
+        # cursors in either format can be read
+        for cursor in _get_current_cursors(context).values():
+            for compact in [False, True]:
+                assert (
+                    asset_daemon_cursor_from_instigator_serialized_cursor(
+                        asset_daemon_cursor_to_instigator_serialized_cursor(
+                            cursor, compact=compact
+                        ),
+                        None,
+                    )
+                    == cursor
+                )
+
+
 def test_cross_location_checks() -> None:
     time = get_current_datetime()
     with (
@@ -747,3 +790,96 @@ def test_observable_source_asset() -> None:
             _execute_ticks(context, executor)
             runs = _get_runs_for_latest_ticks(context)
             assert len(runs) == 0
+
+
+def test_sharded_asset_daemons() -> None:
+    with get_workspace_request_context(
+        ["simple_non_user_code", "backfill_simple_non_user_code", "check_after_parent_updated"]
+    ) as context:
+        sensors = _get_automation_sensors(context.create_request_context())
+        assert len(sensors) == 3
+
+        num_shards = 2
+        evaluated_selector_ids = set()
+        for shard_index in range(num_shards):
+            amp_tick_futures = {}
+            list(
+                AssetDaemon(  # noqa: SLF001
+                    settings={"num_shards": num_shards, "shard_index": shard_index},
+                    pre_sensor_interval_seconds=0,
+                )._run_iteration_impl(
+                    context,
+                    threadpool_executor=None,
+                    submit_threadpool_executor=None,
+                    amp_tick_futures=amp_tick_futures,
+                    debug_crash_flags={},
+                )
+            )
+
+            # each replica only evaluates the sensors in its own shard
+            ticked_selector_ids = {
+                sensor.selector_id
+                for sensor in sensors
+                if context.instance.get_ticks(sensor.get_remote_origin_id(), sensor.selector_id)
+            } - evaluated_selector_ids
+            assert ticked_selector_ids == {
+                sensor.selector_id
+                for sensor in sensors
+                if get_sensor_shard_index(sensor.selector_id, num_shards) == shard_index
+            }
+            evaluated_selector_ids |= ticked_selector_ids
+
+        assert evaluated_selector_ids == {sensor.selector_id for sensor in sensors}
+
+
+def test_invalid_shard_settings() -> None:
+    with pytest.raises(check.CheckError, match="shard_index must be set"):
+        AssetDaemon(settings={"num_shards": 2}, pre_sensor_interval_seconds=0)
+
+    with pytest.raises(check.CheckError, match="shard_index must be set"):
+        AssetDaemon(settings={"num_shards": 2, "shard_index": 2}, pre_sensor_interval_seconds=0)
+
+    with pytest.raises(check.CheckError, match="shard_index can only be set"):
+        AssetDaemon(settings={"shard_index": 0}, pre_sensor_interval_seconds=0)
+
+
+def test_process_pool() -> None:
+    with get_grpc_workspace_request_context("simple_non_user_code") as context:
+        asset_daemon = AssetDaemon(
+            settings={"use_processes": True, "num_workers": 1}, pre_sensor_interval_seconds=0
+        )
+        with asset_daemon._create_process_pool_executor(context) as process_pool_executor:  # noqa: SLF001
+            for expected_evaluation_id in [1, 2]:
+                amp_tick_futures = {}
+                list(
+                    asset_daemon._run_iteration_impl(  # noqa: SLF001
+                        context,
+                        threadpool_executor=None,
+                        submit_threadpool_executor=None,
+                        amp_tick_futures=amp_tick_futures,
+                        debug_crash_flags={},
+                        process_pool_executor=process_pool_executor,
+                    )
+                )
+                assert len(amp_tick_futures) == 1
+                wait_for_futures(amp_tick_futures)
+                assert _get_latest_evaluation_ids(context) == {expected_evaluation_id}
+
+                # bypass the minimum interval between ticks of the sensor
+                for state in _get_current_state(context.create_request_context()).values():
+                    context.instance.update_instigator_state(
+                        state.with_data(
+                            cast(SensorInstigatorData, state.instigator_data)._replace(
+                                last_tick_timestamp=None, last_tick_start_timestamp=None
+                            )
+                        )
+                    )
+
+
+def test_process_pool_requires_code_servers() -> None:
+    with get_workspace_request_context(["simple_non_user_code"]) as context:
+        asset_daemon = AssetDaemon(
+            settings={"use_processes": True, "num_workers": 1}, pre_sensor_interval_seconds=0
+        )
+        with pytest.raises(check.CheckError, match="to be served by a gRPC server"):
+            asset_daemon._create_process_pool_executor(context)  # noqa: SLF001
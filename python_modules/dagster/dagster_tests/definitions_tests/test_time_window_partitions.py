@@ -23,6 +23,7 @@
     ScheduleType,
     TimeWindow,
     TimeWindowPartitionsSubset,
+    dst_safe_strftime,
     dst_safe_strptime,
 )
 from dagster._core.definitions.timestamp import TimestampWithTimezone
@@ -30,6 +31,7 @@
 from dagster._record import copy
 from dagster._serdes import deserialize_value, serialize_value
 from dagster._time import create_datetime, parse_time_string
+from dagster._utils.cronstring import get_fixed_minute_interval
 from dagster._utils.partitions import DEFAULT_HOURLY_FORMAT_WITHOUT_TIMEZONE
 
 DATE_FORMAT = "%Y-%m-%d"
@@ -1826,3 +1828,96 @@ def test_persisted_time_window_serdes():
     deserialized_time_window = deserialize_value(serialized_time_window, PersistedTimeWindow)
     assert isinstance(deserialized_time_window, PersistedTimeWindow)
     assert serialize_value(deserialized_time_window) == serialized_time_window
+
+
+@pytest.mark.parametrize(
+    "partitions_def",
+    [
+        HourlyPartitionsDefinition(start_date="2020-10-30-00:00", timezone="US/Pacific"),
+        HourlyPartitionsDefinition(start_date="2020-10-30-00:00", end_offset=-2),
+        HourlyPartitionsDefinition(
+            start_date="2020-10-30-00:00", end_date="2020-11-03-00:00", end_offset=3
+        ),
+        DailyPartitionsDefinition(start_date="2020-10-01", minute_offset=30, hour_offset=5),
+        DailyPartitionsDefinition(start_date="2020-10-01", end_date="2020-10-20", end_offset=2),
+        WeeklyPartitionsDefinition(start_date="2020-01-01", day_offset=1),
+        TimeWindowPartitionsDefinition(
+            cron_schedule="*/15 * * * *",
+            start="2020-10-31-22:00",
+            timezone="US/Pacific",
+            fmt="%Y-%m-%d-%H:%M",
+        ),
+    ],
+)
+def test_fixed_interval_partitions_match_cron_iteration(
+    partitions_def: TimeWindowPartitionsDefinition,
+) -> None:
+    assert partitions_def._fixed_interval_seconds  # noqa: SLF001
+    current_time = create_datetime(2020, 11, 2, 3, 20, tz="UTC")
+
+    # cron iteration, as used for schedules without a fixed interval
+    expected_windows = []
+    for window in partitions_def._iterate_time_windows(partitions_def.start.timestamp()):  # noqa: SLF001
+        if window.start.timestamp() >= current_time.timestamp() + 30 * 24 * 60 * 60:
+            break
+        expected_windows.append(window)
+    expected_keys = [
+        dst_safe_strftime(
+            window.start, partitions_def.timezone, partitions_def.fmt, partitions_def.cron_schedule
+        )
+        for window in expected_windows
+    ]
+
+    partition_keys = partitions_def.get_partition_keys(current_time)
+    assert partition_keys == expected_keys[: len(partition_keys)]
+    assert len(partition_keys) == partitions_def.get_num_partitions(current_time)
+    assert (
+        partitions_def.get_partition_keys_between_indexes(
+            len(partition_keys) - 3, len(partition_keys) + 3, current_time=current_time
+        )
+        == partition_keys[-3:]
+    )
+    for partition_key, window in zip(expected_keys, expected_windows):
+        assert partitions_def.time_window_for_partition_key(partition_key) == window
+        assert partitions_def.start_time_for_partition_key(partition_key) == window.start
+    assert partitions_def.time_windows_for_partition_keys(
+        frozenset(expected_keys), validate=False
+    ) == sorted(expected_windows, key=lambda window: window.start.timestamp())
+
+
+@pytest.mark.parametrize(
+    "cron_schedule",
+    ["*/15 9 * * *", "*/30 9-17 * * 1-5", "*/20 * 1 * *", "*/10 * * 2 *", "0 9,17 * * *"],
+)
+def test_restricted_hour_partitions_match_cron_iteration(cron_schedule: str) -> None:
+    partitions_def = TimeWindowPartitionsDefinition(
+        cron_schedule=cron_schedule, start="2020-01-01-00:00", fmt="%Y-%m-%d-%H:%M"
+    )
+    assert get_fixed_minute_interval(cron_schedule) is None
+    assert partitions_def._fixed_interval_seconds is None  # noqa: SLF001
+
+    current_time = create_datetime(2020, 2, 8, tz="UTC")
+    expected_windows = []
+    for window in partitions_def._iterate_time_windows(partitions_def.start.timestamp()):  # noqa: SLF001
+        if window.start.timestamp() >= current_time.timestamp():
+            break
+        expected_windows.append(window)
+
+    def _keys(windows):
+        return [
+            dst_safe_strftime(
+                window.start, partitions_def.timezone, partitions_def.fmt, cron_schedule
+            )
+            for window in windows
+        ]
+
+    expected_keys = _keys(
+        window for window in expected_windows if window.end.timestamp() <= current_time.timestamp()
+    )
+    assert partitions_def.get_partition_keys(current_time) == expected_keys
+    assert partitions_def.get_num_partitions(current_time) == len(expected_keys)
+
+    week_start = create_datetime(2020, 2, 1, tz="UTC")
+    assert partitions_def.get_partition_keys_in_time_window(
+        TimeWindow(week_start, current_time)
+    ) == _keys(window for window in expected_windows if window.start >= week_start)
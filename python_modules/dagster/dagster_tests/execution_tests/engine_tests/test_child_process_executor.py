@@ -11,6 +11,7 @@
     ChildProcessEvent,
     ChildProcessStartEvent,
     ChildProcessSystemErrorEvent,
+    ChildProcessWorkerPool,
     execute_child_process_command,
 )
 from dagster._utils import segfault
@@ -106,6 +107,52 @@ def test_child_process_segfault():
     assert exc.value.exit_code == -11
 
 
+def _start_pids(events):
+    return [event.pid for event in events if isinstance(event, ChildProcessStartEvent)]
+
+
+def test_worker_pool_reuses_process():
+    with ChildProcessWorkerPool(multiprocessing, max_workers=1) as pool:
+        first = list(pool.execute_command(DoubleAStringChildProcessCommand("aa")))
+        second = list(pool.execute_command(DoubleAStringChildProcessCommand("bb")))
+
+    assert "aaaa" in first
+    assert "bbbb" in second
+    assert isinstance(first[-1], ChildProcessDoneEvent)
+    assert _start_pids(first) == _start_pids(second)
+    assert _start_pids(first)[0] != os.getpid()
+
+
+def test_worker_pool_max_commands_per_worker():
+    with ChildProcessWorkerPool(multiprocessing, max_workers=1, max_commands_per_worker=1) as pool:
+        first = list(pool.execute_command(DoubleAStringChildProcessCommand("aa")))
+        second = list(pool.execute_command(DoubleAStringChildProcessCommand("bb")))
+
+    assert _start_pids(first) != _start_pids(second)
+
+
+def test_worker_pool_retires_worker_after_error():
+    with ChildProcessWorkerPool(multiprocessing, max_workers=1) as pool:
+        errored = list(pool.execute_command(ThrowAnErrorCommand()))
+        after = list(pool.execute_command(DoubleAStringChildProcessCommand("aa")))
+
+    error_events = [event for event in errored if isinstance(event, ChildProcessSystemErrorEvent)]
+    assert len(error_events) == 1
+    assert "AnError" in str(error_events[0].error_info.message)
+    assert "aaaa" in after
+    assert _start_pids(errored) != _start_pids(after)
+
+
+def test_worker_pool_crashy_process():
+    with ChildProcessWorkerPool(multiprocessing, max_workers=1) as pool:
+        with pytest.raises(ChildProcessCrashException) as exc:
+            list(pool.execute_command(CrashyCommand()))
+        assert exc.value.exit_code == 1
+
+        # the crashed worker is replaced
+        assert "aaaa" in list(pool.execute_command(DoubleAStringChildProcessCommand("aa")))
+
+
 @pytest.mark.skip("too long")
 def test_long_running_command():
     list(execute_child_process_command(multiprocessing, LongRunningCommand()))
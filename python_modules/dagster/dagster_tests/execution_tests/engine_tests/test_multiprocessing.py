@@ -107,6 +107,59 @@ def test_forkserver_preload():
             assert result.output_for_node("adder") == 11
 
 
+def test_reuse_processes():
+    with instance_for_test() as instance:
+        recon_job = reconstructable(define_diamond_job)
+        with execute_job(
+            recon_job,
+            run_config={
+                "execution": {
+                    "config": {"multiprocess": {"reuse_processes": True, "max_concurrent": 1}}
+                },
+            },
+            instance=instance,
+        ) as result:
+            assert result.success
+            assert result.output_for_node("adder") == 11
+
+            # with a single worker every step runs in the same process
+            pids = {
+                event.event_specific_data.metadata["pid"].value  # type: ignore
+                for event in result.all_events
+                if event.event_type == DagsterEventType.STEP_WORKER_STARTED
+            }
+            assert len(pids) == 1
+
+
+def test_reuse_processes_max_steps_per_worker():
+    with instance_for_test() as instance:
+        recon_job = reconstructable(define_diamond_job)
+        with execute_job(
+            recon_job,
+            run_config={
+                "execution": {
+                    "config": {
+                        "multiprocess": {
+                            "reuse_processes": True,
+                            "max_concurrent": 1,
+                            "max_steps_per_worker": 1,
+                        }
+                    }
+                },
+            },
+            instance=instance,
+        ) as result:
+            assert result.success
+            assert result.output_for_node("adder") == 11
+
+            pids = {
+                event.event_specific_data.metadata["pid"].value  # type: ignore
+                for event in result.all_events
+                if event.event_type == DagsterEventType.STEP_WORKER_STARTED
+            }
+            assert len(pids) == 4
+
+
 JUST_ADDER_CONFIG = {
     "ops": {"adder": {"inputs": {"left": {"value": 1}, "right": {"value": 1}}}},
 }
@@ -1545,7 +1545,7 @@ def test_add_run_tags_run_id_idx():
         with DagsterInstance.from_ref(InstanceRef.from_dir(test_dir)) as instance:
             instance.upgrade()
 
-        assert get_current_alembic_version(db_path) == "6b7fb194ff9c"
+        assert get_current_alembic_version(db_path) == "3e1d5c7a9b2f"
         assert "run_tags" in get_sqlite3_tables(db_path)
         assert "idx_run_tags" not in get_sqlite3_indexes(db_path, "run_tags")
         assert "idx_run_tags_run_id" in get_sqlite3_indexes(db_path, "run_tags")
@@ -1558,6 +1558,60 @@ def test_add_run_tags_run_id_idx():
         assert "idx_run_tags_run_id" not in get_sqlite3_indexes(db_path, "run_tags")
 
 
+def test_add_run_stats_table():
+    src_dir = file_relative_path(__file__, "snapshot_1_9_3_add_run_tags_run_id_idx/sqlite")
+
+    with copy_directory(src_dir) as test_dir:
+        index_db_path = os.path.join(test_dir, "history", "runs", "index.db")
+        run_id = "0582693a-4b0c-4154-95ec-d4c0cd0e1674"
+        run_db_path = os.path.join(test_dir, "history", "runs", f"{run_id}.db")
+
+        assert get_current_alembic_version(index_db_path) == "16e3655b4d9b"
+        assert "run_stats" not in get_sqlite3_tables(index_db_path)
+        assert "run_stats" not in get_sqlite3_tables(run_db_path)
+
+        with DagsterInstance.from_ref(InstanceRef.from_dir(test_dir)) as instance:
+            stats_before_migration = instance.get_run_stats(run_id)
+            assert stats_before_migration.end_time
+
+            instance.upgrade()
+
+        assert get_current_alembic_version(index_db_path) == "3e1d5c7a9b2f"
+        assert "run_stats" in get_sqlite3_tables(index_db_path)
+        assert "run_stats" in get_sqlite3_tables(run_db_path)
+
+        with DagsterInstance.from_ref(InstanceRef.from_dir(test_dir)) as instance:
+            assert instance.event_log_storage.has_run_stats_table  # pyright: ignore[reportAttributeAccessIssue]
+
+            # runs that stored their events before the migration are read from the event log
+            assert instance.get_run_stats(run_id) == stats_before_migration
+            assert instance.get_run_stats_for_runs([run_id]) == {run_id: stats_before_migration}
+
+
+def test_add_asset_status_cache_pending_columns():
+    src_dir = file_relative_path(__file__, "snapshot_1_9_3_add_run_tags_run_id_idx/sqlite")
+
+    with copy_directory(src_dir) as test_dir:
+        index_db_path = os.path.join(test_dir, "history", "runs", "index.db")
+
+        assert "pending_materialized_partitions" not in get_sqlite3_columns(
+            index_db_path, "asset_keys"
+        )
+
+        with DagsterInstance.from_ref(InstanceRef.from_dir(test_dir)) as instance:
+            assert not instance.event_log_storage.has_asset_status_cache_pending_cols  # pyright: ignore[reportAttributeAccessIssue]
+
+            instance.upgrade()
+
+        assert get_current_alembic_version(index_db_path) == "3e1d5c7a9b2f"
+        asset_key_columns = get_sqlite3_columns(index_db_path, "asset_keys")
+        assert "pending_materialized_partitions" in asset_key_columns
+        assert "pending_materialization_storage_id" in asset_key_columns
+
+        with DagsterInstance.from_ref(InstanceRef.from_dir(test_dir)) as instance:
+            assert instance.event_log_storage.has_asset_status_cache_pending_cols  # pyright: ignore[reportAttributeAccessIssue]
+
+
 # Prior to 0.10.0, it was possible to have `Materialization` events with no asset key.
 # `AssetMaterialization` is _supposed_ to runtime-check for null `AssetKey`, but it doesn't, so we
 # can deserialize a `Materialization` with a null asset key directly to an `AssetMaterialization`.
@@ -0,0 +1,15 @@
+from dagster import Definitions, asset
+
+
+@asset(key="my_asset")
+def my_asset():
+    pass
+
+
+@asset(key="my_asset")
+def my_other_asset():
+    pass
+
+
+# can be imported, but fails to load since both assets have the same key
+defs = Definitions(assets=[my_asset, my_other_asset])
@@ -8,6 +8,8 @@
 from dagster import _seven
 from dagster._api.list_repositories import sync_list_repositories_grpc
 from dagster._core.errors import DagsterUserCodeUnreachableError
+from dagster._core.origin import DEFAULT_DAGSTER_ENTRY_POINT
+from dagster._core.remote_representation.external_data import RepositoryErrorSnap
 from dagster._core.remote_representation.origin import (
     GrpcServerCodeLocationOrigin,
     RegisteredCodeLocationOrigin,
@@ -24,7 +26,12 @@
 )
 from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
 from dagster._grpc.client import DagsterGrpcClient
-from dagster._grpc.server import ExecuteExternalJobArgs, open_server_process, wait_for_grpc_server
+from dagster._grpc.server import (
+    ExecuteExternalJobArgs,
+    LoadedRepositories,
+    open_server_process,
+    wait_for_grpc_server,
+)
 from dagster._grpc.types import (
     JobSubsetSnapshotArgs,
     ListRepositoriesResponse,
@@ -644,6 +651,71 @@ def test_lazy_load_via_env_var(entrypoint):
             process.wait()
 
 
+def test_defer_definitions_loading():
+    port = find_free_port()
+    python_file = file_relative_path(__file__, "grpc_repo_with_deferred_error.py")
+
+    subprocess_args = [
+        "dagster",
+        "api",
+        "grpc",
+        "--port",
+        str(port),
+        "--python-file",
+        python_file,
+        "--defer-definitions-loading",
+        "--no-warm-up-definitions",
+    ]
+
+    process = subprocess.Popen(subprocess_args)
+
+    try:
+        client = DagsterGrpcClient(port=port, host="localhost")
+        wait_for_grpc_server(process, client, subprocess_args)
+
+        # the repository is advertised without its definitions being loaded
+        list_repositories_response = deserialize_value(
+            client.list_repositories(), ListRepositoriesResponse
+        )
+        assert [
+            symbol.repository_name for symbol in list_repositories_response.repository_symbols
+        ] == ["__repository__"]
+
+        # the load error surfaces when the repository is first requested
+        external_repository_response = deserialize_value(
+            client.external_repository(
+                RemoteRepositoryOrigin(
+                    repository_name="__repository__",
+                    code_location_origin=GrpcServerCodeLocationOrigin(port=port, host="localhost"),
+                )
+            ),
+            RepositoryErrorSnap,
+        )
+        assert "Duplicate asset key" in external_repository_response.error.to_string()
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def test_loaded_repositories_defer_definitions_loading():
+    loaded_repositories = LoadedRepositories(
+        LoadableTargetOrigin(
+            executable_path=sys.executable,
+            python_file=file_relative_path(__file__, "grpc_repo.py"),
+        ),
+        entry_point=DEFAULT_DAGSTER_ENTRY_POINT,
+        defer_definitions_loading=True,
+    )
+    assert loaded_repositories.repository_names == ["bar_repo"]
+    assert loaded_repositories.pending_repository_names == ["bar_repo"]
+
+    repo_def = loaded_repositories.get_definition("bar_repo")
+    assert repo_def.name == "bar_repo"
+    assert loaded_repositories.pending_repository_names == []
+    assert loaded_repositories.get_definition("bar_repo") is repo_def
+    assert loaded_repositories.definitions_by_name == {"bar_repo": repo_def}
+
+
 @pytest.mark.parametrize("entrypoint", entrypoints())
 def test_load_with_missing_env_var(entrypoint):
     port = find_free_port()
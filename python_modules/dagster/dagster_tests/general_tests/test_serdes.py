@@ -13,6 +13,7 @@
 from dagster._record import IHaveNew, record, record_custom
 from dagster._serdes.errors import DeserializationError, SerdesUsageError, SerializationError
 from dagster._serdes.serdes import (
+    COMPACT_SERDES_PREFIX,
     EnumSerializer,
     FieldSerializer,
     NamedTupleSerializer,
@@ -1214,3 +1215,98 @@ class Wat: ...
 
     with pytest.raises(CheckError):
         get_storage_name(Wat, whitelist_map=test_env)
+
+
+def test_compact_format() -> None:
+    test_env = WhitelistMap.create()
+
+    @_whitelist_for_serdes(test_env)
+    class Color(Enum):
+        RED = "RED"
+        BLUE = "BLUE"
+
+    @_whitelist_for_serdes(test_env, storage_field_names={"name": "label"})
+    class Bar(NamedTuple):
+        name: str
+        color: Color
+        tags: AbstractSet[str]
+
+    @_whitelist_for_serdes(test_env, field_serializers={"colors": SetToSequenceFieldSerializer})
+    class Foo(NamedTuple):
+        bars: Sequence[Bar]
+        colors: AbstractSet[Color]
+        lookup: Mapping[str, Optional[Bar]]
+
+    bars = [Bar(name=str(i), color=Color.RED, tags={"a", "b"}) for i in range(10)]
+    val = Foo(bars=bars, colors={Color.BLUE}, lookup={"x": bars[0], "y": None})
+
+    serialized = serialize_value(val, whitelist_map=test_env, compact=True)
+    assert serialized.startswith(COMPACT_SERDES_PREFIX)
+    # field names are written once per object shape
+    assert serialized.count('"label"') == 1
+    assert len(serialized) < len(serialize_value(val, whitelist_map=test_env))
+    assert deserialize_value(serialized, Foo, whitelist_map=test_env) == val
+
+
+def test_compact_format_forward_compat() -> None:
+    old_env = WhitelistMap.create()
+
+    @_whitelist_for_serdes(old_env)
+    class Quux(NamedTuple):
+        foo: str
+        bar: str
+
+    OldQuux = Quux
+
+    new_env = WhitelistMap.create()
+
+    @_whitelist_for_serdes(new_env)
+    class Quux(NamedTuple):
+        foo: str
+        bar: str
+        baz: str = "default"
+
+    new_serialized = serialize_value(
+        [Quux("a", "b", "c"), Quux("d", "e")], whitelist_map=new_env, compact=True
+    )
+    assert deserialize_value(new_serialized, whitelist_map=old_env) == [
+        OldQuux("a", "b"),
+        OldQuux("d", "e"),
+    ]
+
+    unknown = serialize_value(Quux("a", "b"), whitelist_map=new_env, compact=True)
+    with pytest.raises(DeserializationError, match="not in the whitelist"):
+        deserialize_value(unknown, whitelist_map=WhitelistMap.create())
+
+
+def test_serializer_field_plans() -> None:
+    test_env = WhitelistMap.create()
+
+    @_whitelist_for_serdes(
+        test_env,
+        storage_field_names={"name": "label"},
+        skip_when_none_fields={"description"},
+        field_serializers={"tags": SetToSequenceFieldSerializer},
+    )
+    class Foo(NamedTuple):
+        name: str
+        tags: AbstractSet[str]
+        description: Optional[str] = None
+
+    serializer = test_env.object_serializers["Foo"]
+    for val in [Foo("a", {"x"}), Foo("b", {"y", "z"}, "desc")]:
+        serialized = serialize_value(val, whitelist_map=test_env)
+        assert deserialize_value(serialized, whitelist_map=test_env) == val
+
+    assert serialize_value(Foo("a", set()), whitelist_map=test_env) == (
+        '{"__class__": "Foo", "label": "a", "tags": []}'
+    )
+    # field plans are resolved once and reused across objects
+    assert set(serializer._pack_field_plans.keys()) == {"name", "tags", "description"}  # noqa: SLF001
+    assert serializer._pack_field_plans["name"][0] == "label"  # noqa: SLF001
+
+    # stored fields that are not constructor parameters are skipped
+    assert deserialize_value(
+        '{"__class__": "Foo", "label": "a", "tags": [], "removed": 1}', whitelist_map=test_env
+    ) == Foo("a", set())
+    assert serializer._unpack_field_plans["removed"] == (None, None)  # noqa: SLF001
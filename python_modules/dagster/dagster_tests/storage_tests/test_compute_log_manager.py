@@ -162,19 +162,30 @@ def test_broken_compute_log_manager():
         assert not _has_teardown_exception(boo_result)
 
 
+import gzip
 import os
+import shutil
 import sys
+import threading
+import time
 from contextlib import contextmanager
 from typing import Any, Generator, Mapping, Sequence
 
 import pytest
 from dagster import job, op
 from dagster._core.events import DagsterEventType
+from dagster._core.execution.compute_logs import should_disable_io_stream_redirect
+from dagster._core.storage import cloud_storage_compute_log_manager
+from dagster._core.storage.cloud_storage_compute_log_manager import CloudStorageComputeLogManager
 from dagster._core.storage.compute_log_manager import CapturedLogContext, ComputeIOType
-from dagster._core.storage.local_compute_log_manager import LocalComputeLogManager
+from dagster._core.storage.local_compute_log_manager import (
+    IO_TYPE_EXTENSION,
+    LocalComputeLogManager,
+)
 from dagster._core.storage.noop_compute_log_manager import NoOpComputeLogManager
 from dagster._serdes import ConfigurableClassData
 from dagster._time import get_current_datetime
+from dagster._utils import ensure_dir, ensure_file, touch_file
 from typing_extensions import Self
 
 
@@ -193,6 +204,209 @@ def compute_log_manager(self):
             return LocalComputeLogManager(tmpdir_path)
 
 
+class TestCompressedLocalComputeLogManager(TestComputeLogManager):
+    __test__ = True
+
+    @pytest.fixture(name="compute_log_manager")
+    def compute_log_manager(self):
+        with tempfile.TemporaryDirectory() as tmpdir_path:
+            return LocalComputeLogManager(tmpdir_path, compress_logs=True, compressed_chunk_size=4)
+
+
+@pytest.mark.skipif(
+    should_disable_io_stream_redirect(), reason="compute logs disabled for win / py3.6+"
+)
+def test_compressed_logs():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        cm = LocalComputeLogManager(
+            tmpdir_path, compress_logs=True, compressed_chunk_size=10, max_log_bytes=25
+        )
+        log_key = ["compressed", "log", "key"]
+        with cm.capture_logs(log_key):
+            print("0123456789" * 4 + "abc")  # noqa: T201
+
+        stdout_path = cm.get_captured_local_path(log_key, "out")
+        assert not os.path.exists(stdout_path)
+        assert cm.get_log_metadata(log_key).stdout_location == f"{stdout_path}.gz"
+        with gzip.open(f"{stdout_path}.gz", "rb") as f:
+            # the oldest chunks are rotated out, but the data file is still a valid gzip file
+            assert f.read() == b"0123456789" * 3 + b"abc\n"
+
+        # offsets into the uncompressed log are preserved
+        log_data = cm.get_log_data(log_key, max_bytes=5)
+        assert log_data.stdout == b"01234"
+        assert log_data.cursor == "15:0"
+        log_data = cm.get_log_data(log_key, cursor=log_data.cursor, max_bytes=10)
+        assert log_data.stdout == b"5678901234"
+        log_data = cm.get_log_data(log_key, cursor=log_data.cursor)
+        assert log_data.stdout == b"567890123456789abc\n"
+        assert log_data.cursor == "44:0"
+
+        assert cm.get_log_keys_for_log_key_prefix(
+            ["compressed", "log"], io_type=ComputeIOType.STDOUT
+        ) == [log_key]
+
+        cm.delete_logs(log_key=log_key)
+        assert not os.listdir(os.path.join(tmpdir_path, "compressed", "log"))
+
+
+def test_log_subscriptions():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        cm = LocalComputeLogManager(tmpdir_path, polling_timeout=0.1)
+        log_keys = [["subscription", "log", str(i)] for i in range(3)]
+        for log_key in log_keys:
+            with cm.open_log_stream(log_key, ComputeIOType.STDOUT) as f:
+                f.write("hello")
+
+        received = {str(i): b"" for i in range(3)}
+
+        def _observer(log_data):
+            received[log_data.log_key[-1]] += log_data.stdout or b""
+
+        subscriptions = [cm.subscribe(log_key)(_observer) for log_key in log_keys]
+        for log_key in log_keys:
+            with cm.open_log_stream(log_key, ComputeIOType.STDOUT) as f:
+                f.write(" world")
+            touch_file(cm.complete_artifact_path(log_key))
+
+        start_time = time.time()
+        while not all(subscription.is_complete for subscription in subscriptions):
+            assert time.time() - start_time < 10
+            time.sleep(0.1)
+
+        # a single thread watches all of the subscribed logs
+        assert received == {str(i): b"hello world" for i in range(3)}
+        assert (
+            len([t for t in threading.enumerate() if t.name == "local-compute-log-subscription"])
+            == 1
+        )
+        cm.dispose()
+
+
+class FilesystemCloudStorageComputeLogManager(CloudStorageComputeLogManager):
+    """Stands in for cloud storage with a local directory, recording each partial log upload."""
+
+    def __init__(self, local_dir: str, storage_dir: str):
+        self._local_manager = LocalComputeLogManager(local_dir)
+        self._storage_dir = storage_dir
+        self.partial_uploads = []
+
+    @property
+    def local_manager(self) -> LocalComputeLogManager:
+        return self._local_manager
+
+    @property
+    def upload_interval(self):
+        return None
+
+    def _storage_path(self, log_key, io_type, partial=False):
+        path = os.path.join(self._storage_dir, *log_key) + f".{IO_TYPE_EXTENSION[io_type]}"
+        return f"{path}.partial" if partial else path
+
+    def _partial_log_object_path(self, log_key, io_type, name):
+        return os.path.join(f"{self._storage_path(log_key, io_type, partial=True)}.chunks", name)
+
+    def delete_logs(self, log_key=None, prefix=None):
+        raise NotImplementedError()
+
+    def download_url_for_type(self, log_key, io_type):
+        raise NotImplementedError()
+
+    def display_path_for_type(self, log_key, io_type):
+        return self._storage_path(log_key, io_type)
+
+    def cloud_storage_has_logs(self, log_key, io_type, partial=False):
+        return os.path.exists(self._storage_path(log_key, io_type, partial=partial))
+
+    def upload_to_cloud_storage(self, log_key, io_type, partial=False):
+        path = self.local_manager.get_captured_local_path(log_key, IO_TYPE_EXTENSION[io_type])
+        ensure_file(path)
+        storage_path = self._storage_path(log_key, io_type, partial=partial)
+        ensure_dir(os.path.dirname(storage_path))
+        shutil.copyfile(path, storage_path)
+
+    def download_from_cloud_storage(self, log_key, io_type, partial=False):
+        path = self.local_manager.get_captured_local_path(
+            log_key, IO_TYPE_EXTENSION[io_type], partial=partial
+        )
+        ensure_dir(os.path.dirname(path))
+        shutil.copyfile(self._storage_path(log_key, io_type, partial=partial), path)
+
+    @property
+    def supports_incremental_partial_upload(self) -> bool:
+        return True
+
+    def upload_partial_log_object(self, log_key, io_type, name, data):
+        self.partial_uploads.append((name, data))
+        path = self._partial_log_object_path(log_key, io_type, name)
+        ensure_dir(os.path.dirname(path))
+        with open(path, "wb") as f:
+            f.write(data)
+
+    def download_partial_log_object(self, log_key, io_type, name):
+        path = self._partial_log_object_path(log_key, io_type, name)
+        if not os.path.exists(path):
+            return None
+        with open(path, "rb") as f:
+            return f.read()
+
+    def delete_partial_log_objects(self, log_key, io_type):
+        shutil.rmtree(self._partial_log_object_path(log_key, io_type, ""), ignore_errors=True)
+
+
+def test_incremental_partial_log_upload(monkeypatch):
+    monkeypatch.setattr(cloud_storage_compute_log_manager, "MIN_PARTIAL_LOG_CHUNK_BYTES", 8)
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        storage_dir = os.path.join(tmpdir_path, "storage")
+        write_manager = FilesystemCloudStorageComputeLogManager(
+            os.path.join(tmpdir_path, "write"), storage_dir
+        )
+        read_manager = FilesystemCloudStorageComputeLogManager(
+            os.path.join(tmpdir_path, "read"), storage_dir
+        )
+        log_key = ["incremental", "log", "key"]
+        stdout_path = write_manager.local_manager.get_captured_local_path(log_key, "out")
+        ensure_dir(os.path.dirname(stdout_path))
+
+        def _write_and_upload(data):
+            with open(stdout_path, "ab") as f:
+                f.write(data)
+            write_manager.partial_uploads.clear()
+            write_manager.on_progress(log_key)
+            return [name for name, _ in write_manager.partial_uploads], [
+                data for name, data in write_manager.partial_uploads if name.endswith(".chunk")
+            ]
+
+        # a chunk smaller than the minimum is extended with the new bytes
+        assert _write_and_upload(b"01234") == (["000000.chunk", "manifest.json"], [b"01234"])
+        assert _write_and_upload(b"567") == (["000000.chunk", "manifest.json"], [b"01234567"])
+        # once the chunk is large enough, only the new bytes are uploaded, as a new chunk
+        assert _write_and_upload(b"89abc") == (["000001.chunk", "manifest.json"], [b"89abc"])
+        assert _write_and_upload(b"") == ([], [])
+        assert _write_and_upload(b"defghij") == (
+            ["000001.chunk", "manifest.json"],
+            [b"89abcdefghij"],
+        )
+        assert _write_and_upload(b"klm\n") == (["000002.chunk", "manifest.json"], [b"klm\n"])
+
+        # reads span chunks, only downloading the chunks overlapping the requested range
+        log_data = read_manager.get_log_data(log_key, max_bytes=10)
+        assert log_data.stdout == b"0123456789"
+        assert log_data.cursor == "10:0"
+        log_data = read_manager.get_log_data(log_key, cursor=log_data.cursor, max_bytes=12)
+        assert log_data.stdout == b"abcdefghijkl"
+        log_data = read_manager.get_log_data(log_key, cursor=log_data.cursor)
+        assert log_data.stdout == b"m\n"
+        assert log_data.cursor == "24:0"
+
+        # the partial log chunks are deleted once the complete logs are uploaded
+        write_manager._on_capture_complete(log_key)  # noqa: SLF001
+        assert not os.path.exists(
+            write_manager._partial_log_object_path(log_key, ComputeIOType.STDOUT, "")  # noqa: SLF001
+        )
+        assert read_manager.get_log_data(log_key).stdout == b"0123456789abcdefghijklm\n"
+
+
 class ExternalTestComputeLogManager(NoOpComputeLogManager):
     """Test compute log manager that does not actually capture logs, but generates an external url
     to be shown within the Dagster UI.
@@ -1,3 +1,4 @@
+import mmap
 import os
 import pickle
 import shutil
@@ -23,6 +24,8 @@
     StaticPartitionsDefinition,
     TimeWindowPartitionMapping,
     _seven as seven,
+    build_input_context,
+    build_output_context,
     define_asset_job,
     graph,
     job,
@@ -37,10 +40,15 @@
 from dagster._core.definitions.partition_mapping import UpstreamPartitionsResult
 from dagster._core.errors import DagsterInvariantViolationError
 from dagster._core.instance import DynamicPartitionsStore
-from dagster._core.storage.fs_io_manager import fs_io_manager
+from dagster._core.storage.fs_io_manager import (
+    OUT_OF_BAND_PICKLE_MAGIC,
+    PickledObjectFilesystemIOManager,
+    fs_io_manager,
+)
 from dagster._core.storage.io_manager import IOManagerDefinition
 from dagster._core.test_utils import instance_for_test
 from dagster._utils import file_relative_path
+from upath import UPath
 
 
 def define_job(io_manager: IOManagerDefinition):
@@ -107,6 +115,84 @@ def test_fs_io_manager_base_dir():
             assert pickle.load(read_obj) == [1, 2, 3]
 
 
+class OutOfBandBuffer:
+    """Holds a buffer that is pickled out-of-band with pickle protocol 5, like a NumPy array."""
+
+    def __init__(self, data):
+        self.data = memoryview(data)
+
+    def __reduce_ex__(self, protocol):
+        if protocol >= 5:
+            return OutOfBandBuffer, (pickle.PickleBuffer(self.data),)
+        return OutOfBandBuffer, (bytes(self.data),)
+
+
+def test_fs_io_manager_memory_map():
+    @op
+    def op_a():
+        return {"a": OutOfBandBuffer(bytearray(b"a" * 1000)), "b": OutOfBandBuffer(b"b" * 10)}
+
+    @op
+    def op_b(value):
+        # the buffers are views of the memory-mapped file, so they aren't copied on load
+        assert isinstance(value["a"].data.obj, mmap.mmap)
+        assert bytes(value["a"].data) == b"a" * 1000
+        assert bytes(value["b"].data) == b"b" * 10
+        # the mapping is copy-on-write
+        value["a"].data[0] = ord("z")
+        return bytes(value["a"].data[:2])
+
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+
+        @job(
+            resource_defs={
+                "io_manager": fs_io_manager.configured(
+                    {"base_dir": tmpdir_path, "memory_map": True}
+                )
+            }
+        )
+        def memory_map_job():
+            op_b(op_a())
+
+        result = memory_map_job.execute_in_process()
+        assert result.success
+        assert result.output_for_node("op_b") == b"za"
+
+        with open(os.path.join(tmpdir_path, result.run_id, "op_a", "result"), "rb") as f:
+            assert f.read(len(OUT_OF_BAND_PICKLE_MAGIC)) == OUT_OF_BAND_PICKLE_MAGIC
+            f.seek(0)
+            assert f.read().count(b"a" * 1000) == 1
+
+        # objects stored either way can be loaded regardless of the setting
+        manager = PickledObjectFilesystemIOManager(base_dir=tmpdir_path)
+        assert (
+            manager.load_from_path(
+                build_input_context(), UPath(tmpdir_path, result.run_id, "op_b", "result")
+            )
+            == b"za"
+        )
+        loaded = manager.load_from_path(
+            build_input_context(), UPath(tmpdir_path, result.run_id, "op_a", "result")
+        )
+        assert bytes(loaded["a"].data) == b"a" * 1000
+
+
+def test_fs_io_manager_memory_map_overwrite():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        manager = PickledObjectFilesystemIOManager(base_dir=tmpdir_path, memory_map=True)
+        path = UPath(tmpdir_path, "asset")
+        manager.dump_to_path(build_output_context(), OutOfBandBuffer(b"a" * 1_000_000), path)
+        loaded = manager.load_from_path(build_input_context(), path)
+        assert isinstance(loaded.data.obj, mmap.mmap)
+
+        # rematerializing replaces the file rather than truncating the file that the loaded
+        # buffer is mapped from, which would crash this process when the buffer is accessed
+        manager.dump_to_path(build_output_context(), OutOfBandBuffer(b"b" * 10), path)
+        assert bytes(loaded.data) == b"a" * 1_000_000
+        assert bytes(manager.load_from_path(build_input_context(), path).data) == b"b" * 10
+        assert os.listdir(tmpdir_path) == ["asset"]
+
+
 # lamdba functions can't be pickled (pickle.PicklingError)
 lam = lambda x: x * x
 
@@ -6,6 +6,7 @@
 from dagster import DagsterInstance
 from dagster._core.storage.legacy_storage import LegacyRunStorage
 from dagster._core.storage.runs import InMemoryRunStorage, SqliteRunStorage
+from dagster._core.storage.runs.snapshot_cache import SnapshotCache, SnapshotCacheStats
 from dagster._core.storage.sqlite_storage import DagsterSqliteStorage
 from dagster._core.test_utils import instance_for_test
 
@@ -130,3 +131,28 @@ def run_storage(self, instance):
 
     def test_storage_telemetry(self, storage):
         pass
+
+
+def test_snapshot_cache_eviction():
+    cache = SnapshotCache(max_bytes=10)
+    cache.set("a", "snapshot_a", 4)
+    cache.set("b", "snapshot_b", 4)
+    assert cache.get("a") == "snapshot_a"
+
+    # evicts the least recently used entry
+    cache.set("c", "snapshot_c", 4)
+    assert cache.get("b") is None
+    assert cache.get("a") == "snapshot_a"
+    assert cache.get("c") == "snapshot_c"
+
+    # entries larger than the cache are never stored
+    cache.set("d", "snapshot_d", 11)
+    assert not cache.contains("d")
+
+    assert cache.get_stats() == SnapshotCacheStats(
+        hits=3, misses=1, evictions=1, num_entries=2, size_bytes=8, max_bytes=10
+    )
+
+    cache.clear()
+    assert cache.get_stats().size_bytes == 0
+    assert not SnapshotCache(max_bytes=0).enabled
@@ -1,6 +1,10 @@
+import asyncio
 import inspect
 import json
 import pickle
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Optional, cast
@@ -24,6 +28,7 @@
     MultiPartitionsDefinition,
     OpExecutionContext,
     OutputContext,
+    PartitionKeyRange,
     StaticPartitionsDefinition,
     TimeWindowPartitionMapping,
     asset,
@@ -656,3 +661,89 @@ def my_asset():
     assert materialize(
         [my_asset], resources={"io_manager": my_io_manager}, partition_key=start.strftime(daily.fmt)
     ).success
+
+
+class ConcurrencyTrackingIOManager(UPathIOManager):
+    def __init__(self, base_path: UPath):
+        super().__init__(base_path=base_path)
+        self.loads_in_flight = 0
+        self.max_loads_in_flight = 0
+        self._lock = threading.Lock()
+
+    def dump_to_path(self, context: OutputContext, obj: Any, path: UPath):
+        path.write_text(json.dumps(obj))
+
+    @contextmanager
+    def _track_load(self):
+        with self._lock:
+            self.loads_in_flight += 1
+            self.max_loads_in_flight = max(self.max_loads_in_flight, self.loads_in_flight)
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.loads_in_flight -= 1
+
+    def load_from_path(self, context: InputContext, path: UPath) -> str:
+        with self._track_load():
+            time.sleep(0.05)
+            return json.loads(path.read_text())
+
+
+class AsyncConcurrencyTrackingIOManager(ConcurrencyTrackingIOManager):
+    async def load_from_path(self, context: InputContext, path: UPath) -> str:  # pyright: ignore[reportIncompatibleMethodOverride]
+        with self._track_load():
+            await asyncio.sleep(0.05)
+            return json.loads(path.read_text())
+
+
+@pytest.mark.parametrize(
+    "io_manager_class", [ConcurrencyTrackingIOManager, AsyncConcurrencyTrackingIOManager]
+)
+@pytest.mark.parametrize(
+    "metadata, expected_max_loads_in_flight",
+    [
+        ({"max_concurrent_partition_loads": 4}, 4),
+        # the partition files are 18 bytes, so only one fits in the limit at a time
+        ({"max_concurrent_partition_loads": 4, "max_concurrent_partition_load_bytes": 20}, 1),
+    ],
+)
+def test_upath_io_manager_max_concurrent_partition_loads(
+    tmp_path: Path,
+    hourly: HourlyPartitionsDefinition,
+    daily: DailyPartitionsDefinition,
+    start: datetime,
+    io_manager_class,
+    metadata: Dict[str, Any],
+    expected_max_loads_in_flight: int,
+):
+    manager = io_manager_class(base_path=UPath(tmp_path))
+
+    @asset(partitions_def=hourly, io_manager_def=IOManagerDefinition.hardcoded_io_manager(manager))
+    def upstream_asset(context: AssetExecutionContext) -> str:
+        return context.partition_key
+
+    @asset(
+        partitions_def=daily,
+        io_manager_def=IOManagerDefinition.hardcoded_io_manager(manager),
+        ins={"upstream_asset": AssetIn(metadata=metadata)},
+    )
+    def downstream_asset(upstream_asset: Dict[str, str]) -> Dict[str, str]:
+        return upstream_asset
+
+    partition_keys = hourly.get_partition_keys_in_range(
+        PartitionKeyRange(
+            f"{start:%Y-%m-%d-%H:%M}", f"{start + timedelta(hours=23):%Y-%m-%d-%H:%M}"
+        )
+    )
+    for partition_key in partition_keys:
+        materialize([upstream_asset], partition_key=partition_key)
+
+    result = materialize(
+        [upstream_asset.to_source_asset(), downstream_asset],
+        partition_key=start.strftime(daily.fmt),
+    )
+    downstream_asset_data = result.output_for_node("downstream_asset", "result")
+    assert list(downstream_asset_data.keys()) == partition_keys
+    assert all(key == value for key, value in downstream_asset_data.items())
+    assert manager.max_loads_in_flight == expected_max_loads_in_flight
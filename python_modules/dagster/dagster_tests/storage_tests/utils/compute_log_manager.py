@@ -96,6 +96,7 @@ def test_long_key(self, compute_log_manager):
     )
     def test_streaming(self, write_manager, read_manager):
         from dagster._core.storage.cloud_storage_compute_log_manager import (
+            PARTIAL_LOG_MANIFEST_NAME,
             CloudStorageComputeLogManager,
         )
 
@@ -127,8 +128,20 @@ def test_streaming(self, write_manager, read_manager):
             # check the cloud storage directly that only partial keys have been uploaded
             assert not read_manager.cloud_storage_has_logs(log_key, ComputeIOType.STDOUT)
             assert not read_manager.cloud_storage_has_logs(log_key, ComputeIOType.STDOUT)
-            assert read_manager.cloud_storage_has_logs(log_key, ComputeIOType.STDERR, partial=True)
-            assert read_manager.cloud_storage_has_logs(log_key, ComputeIOType.STDERR, partial=True)
+            if read_manager.supports_incremental_partial_upload:
+                assert read_manager.download_partial_log_object(
+                    log_key, ComputeIOType.STDOUT, PARTIAL_LOG_MANIFEST_NAME
+                )
+                assert read_manager.download_partial_log_object(
+                    log_key, ComputeIOType.STDERR, PARTIAL_LOG_MANIFEST_NAME
+                )
+            else:
+                assert read_manager.cloud_storage_has_logs(
+                    log_key, ComputeIOType.STDERR, partial=True
+                )
+                assert read_manager.cloud_storage_has_logs(
+                    log_key, ComputeIOType.STDERR, partial=True
+                )
 
     @pytest.mark.skipif(
         should_disable_io_stream_redirect(), reason="compute logs disabled for win / py3.6+"
@@ -84,7 +84,7 @@
 from dagster._core.execution.job_execution_result import JobExecutionResult
 from dagster._core.execution.plan.handle import StepHandle
 from dagster._core.execution.plan.objects import StepFailureData, StepSuccessData
-from dagster._core.execution.stats import StepEventStatus
+from dagster._core.execution.stats import StepEventStatus, build_run_stats_from_events
 from dagster._core.instance import RUNLESS_JOB_NAME, RUNLESS_RUN_ID
 from dagster._core.loader import LoadingContextForTest
 from dagster._core.remote_representation.external_data import PartitionsSnap
@@ -95,12 +95,12 @@
 )
 from dagster._core.storage.asset_check_execution_record import AssetCheckExecutionRecordStatus
 from dagster._core.storage.event_log import InMemoryEventLogStorage, SqlEventLogStorage
-from dagster._core.storage.event_log.base import EventLogStorage
+from dagster._core.storage.event_log.base import EventLogStorage, RunStatsRecord, RunStepStatsRecord
 from dagster._core.storage.event_log.migration import (
     EVENT_LOG_DATA_MIGRATIONS,
     migrate_asset_key_data,
 )
-from dagster._core.storage.event_log.schema import SqlEventLogStorageTable
+from dagster._core.storage.event_log.schema import RunStatsTable, SqlEventLogStorageTable
 from dagster._core.storage.event_log.sqlite.sqlite_event_log import SqliteEventLogStorage
 from dagster._core.storage.io_manager import IOManager
 from dagster._core.storage.partition_status_cache import AssetStatusCacheValue
@@ -795,6 +795,45 @@ def test_event_log_get_stats_for_run(
         assert stats.start_time
         assert math.isclose(stats.start_time, start_time)
 
+    def test_event_log_get_stats_for_run_with_multiple_end_events(
+        self,
+        test_run_id: str,
+        storage: EventLogStorage,
+    ):
+        import math
+
+        start_time = time.time()
+        failure_time = start_time + 20
+        canceled_time = failure_time + 5
+        for timestamp, event_type in [
+            (start_time, DagsterEventType.PIPELINE_START),
+            (failure_time, DagsterEventType.PIPELINE_FAILURE),
+            (canceled_time, DagsterEventType.PIPELINE_CANCELED),
+        ]:
+            storage.store_event(
+                EventLogEntry(
+                    error_info=None,
+                    level="debug",
+                    user_message="",
+                    run_id=test_run_id,
+                    timestamp=timestamp,
+                    dagster_event=DagsterEvent(event_type.value, "nonce"),
+                )
+            )
+
+        # the failure takes precedence over the cancel that was stored after it
+        stats = storage.get_stats_for_run(test_run_id)
+        assert stats.end_time
+        assert math.isclose(stats.end_time, failure_time)
+
+        if isinstance(storage, SqlEventLogStorage) and storage.has_run_stats_table:
+            with storage.run_connection(test_run_id) as conn:
+                rolled_up_values = storage._get_run_stats_rows(conn, [test_run_id])[test_run_id]  # noqa: SLF001
+                recomputed_values = storage._get_run_stats_values(conn, [test_run_id])[test_run_id]  # noqa: SLF001
+            assert {
+                column: rolled_up_values[column] for column in recomputed_values
+            } == recomputed_values
+
     def test_event_log_step_stats(
         self,
         test_run_id: str,
@@ -1020,6 +1059,53 @@ def test_basic_get_logs_for_run_cursor(self, test_run_id, storage):
             events
         )
 
+    def test_iter_records_for_run(self, test_run_id, storage):
+        events, result = _synthesize_events(return_one_op_func, run_id=test_run_id)
+
+        for event in events:
+            storage.store_event(event)
+
+        all_records = storage.get_records_for_run(result.run_id).records
+        assert len(all_records) > 3
+
+        # batches smaller than, equal to, and larger than the number of records
+        for batch_size in [1, 2, len(all_records), len(all_records) + 1]:
+            assert (
+                list(storage.iter_records_for_run(result.run_id, batch_size=batch_size))
+                == all_records
+            )
+            assert list(
+                storage.iter_records_for_run(result.run_id, ascending=False, batch_size=batch_size)
+            ) == list(reversed(all_records))
+
+        # resumes after a storage id cursor
+        cursor = EventLogCursor.from_storage_id(all_records[1].storage_id).to_string()
+        assert (
+            list(storage.iter_records_for_run(result.run_id, cursor=cursor, batch_size=2))
+            == (all_records[2:])
+        )
+
+        # resumes after an offset cursor
+        assert (
+            list(
+                storage.iter_records_for_run(
+                    result.run_id, cursor=EventLogCursor.from_offset(2).to_string(), batch_size=2
+                )
+            )
+            == all_records[2:]
+        )
+
+        assert [
+            record.event_log_entry.dagster_event_type
+            for record in storage.iter_records_for_run(
+                result.run_id,
+                of_type={DagsterEventType.STEP_SUCCESS, DagsterEventType.RUN_SUCCESS},
+                batch_size=1,
+            )
+        ] == [DagsterEventType.STEP_SUCCESS, DagsterEventType.RUN_SUCCESS]
+
+        assert list(storage.iter_records_for_run("nonexistent_run")) == []
+
     def test_basic_get_logs_for_run_multiple_runs(self, instance, storage):
         events_one, result_one = _synthesize_events(return_one_op_func)
         events_two, result_two = _synthesize_events(return_one_op_func)
@@ -1051,6 +1137,81 @@ def test_basic_get_logs_for_run_multiple_runs(self, instance, storage):
             stats_two = storage.get_stats_for_run(result_two.run_id)
             assert stats_two.steps_succeeded == 1
 
+    def test_get_stats_for_runs(self, instance, storage):
+        events_one, result_one = _synthesize_events(return_one_op_func)
+        events_two, result_two = _synthesize_events(return_one_op_func)
+        run_ids = [result_one.run_id, result_two.run_id]
+
+        with create_and_delete_test_runs(instance, run_ids):
+            # the second half of the first run's events are stored after its run stats are
+            # discarded, as if the first half had been stored before the run stats table existed
+            for event in events_one[: len(events_one) // 2]:
+                storage.store_event(event)
+            if isinstance(storage, SqlEventLogStorage) and storage.has_run_stats_table:
+                with storage.run_connection(result_one.run_id) as conn:
+                    conn.execute(
+                        RunStatsTable.delete().where(RunStatsTable.c.run_id == result_one.run_id)
+                    )
+            for event in events_one[len(events_one) // 2 :]:
+                storage.store_event(event)
+
+            for event in events_two:
+                storage.store_event(event)
+
+            stats_by_run_id = storage.get_stats_for_runs([*run_ids, "nonexistent_run"])
+            assert list(stats_by_run_id.keys()) == [*run_ids, "nonexistent_run"]
+            for run_id, events in zip(run_ids, [events_one, events_two]):
+                stats = stats_by_run_id[run_id]
+                assert stats == storage.get_stats_for_run(run_id)
+
+                expected_stats = build_run_stats_from_events(run_id, events)
+                assert stats.steps_succeeded == expected_stats.steps_succeeded == 1
+                assert stats.steps_failed == expected_stats.steps_failed
+                assert stats.materializations == expected_stats.materializations
+                assert stats.expectations == expected_stats.expectations
+                assert stats.start_time
+                assert stats.end_time
+                assert stats.end_time >= stats.start_time
+
+            assert stats_by_run_id["nonexistent_run"].steps_succeeded == 0
+            assert stats_by_run_id["nonexistent_run"].end_time is None
+            assert storage.get_stats_for_runs([]) == {}
+
+            step_stats_by_run_id = storage.get_step_stats_for_runs(run_ids)
+            for run_id in run_ids:
+                assert step_stats_by_run_id[run_id] == storage.get_step_stats_for_run(run_id)
+                assert len(step_stats_by_run_id[run_id]) == 1
+
+            # runs are fetched in batches, and step keys are filtered in the query
+            with mock.patch(
+                "dagster._core.storage.event_log.sql_event_log.STEP_STATS_RUN_ID_BATCH_SIZE", 1
+            ):
+                assert storage.get_step_stats_for_runs(run_ids) == step_stats_by_run_id
+                assert (
+                    storage.get_step_stats_for_runs(run_ids, step_keys=["return_one_op"])
+                    == step_stats_by_run_id
+                )
+                assert storage.get_step_stats_for_runs(run_ids, step_keys=["other_op"]) == {
+                    run_id: [] for run_id in run_ids
+                }
+
+            # the stats are loadable in batches, keyed by run id
+            loading_context = LoadingContextForTest(instance)
+            stats_records = RunStatsRecord.blocking_get_many(loading_context, run_ids)
+            assert [record.stats for record in stats_records] == [
+                stats_by_run_id[run_id] for run_id in run_ids
+            ]
+            step_stats_records = RunStepStatsRecord.blocking_get_many(loading_context, run_ids)
+            assert [record.step_stats for record in step_stats_records] == [
+                step_stats_by_run_id[run_id] for run_id in run_ids
+            ]
+
+            storage.delete_events(result_one.run_id)
+            assert (
+                storage.get_stats_for_runs([result_one.run_id])[result_one.run_id].steps_succeeded
+                == 0
+            )
+
     def test_basic_get_logs_for_run_multiple_runs_cursors(self, instance, storage):
         events_one, result_one = _synthesize_events(return_one_op_func)
         events_two, result_two = _synthesize_events(return_one_op_func)
@@ -1266,6 +1427,31 @@ def foo():
         result = storage.fetch_materializations(foo.key, limit=100)
         assert len(result.records) == 2
 
+    def test_store_event_batch_asset_index_latest_event(self, storage, test_run_id):
+        asset_key = AssetKey(["batched_asset"])
+
+        @op
+        def materialize(_):
+            for count in range(3):
+                yield AssetMaterialization(asset_key=asset_key, metadata={"count": count})
+            yield Output(1)
+
+        def _ops():
+            materialize()
+
+        with instance_for_test() as test_instance:
+            events, _ = _synthesize_events(_ops, instance=test_instance, run_id=test_run_id)
+
+        storage.store_event_batch(events)
+
+        latest_record = storage.fetch_materializations(asset_key, limit=1).records[0]
+        assert latest_record.asset_materialization.metadata["count"].value == 2
+
+        # the asset index points at the materialization with the highest storage id in the batch
+        asset_entry = storage.get_asset_records([asset_key])[0].asset_entry
+        assert asset_entry.last_materialization_storage_id == latest_record.storage_id
+        assert asset_entry.last_materialization_record == latest_record
+
     def test_asset_materialization_fetch(self, storage, instance):
         asset_key = AssetKey(["path", "to", "asset_one"])
 
@@ -2646,6 +2832,18 @@ def _assert_storage_matches(expected, partition: Optional[str] = None):
                 )
                 == expected
             )
+            if partition is None:
+                # the bulk query matches the per-asset query for every asset
+                assert storage.get_latest_storage_id_by_partition_for_asset_keys(
+                    [a, b, AssetKey(["never_materialized"])],
+                    DagsterEventType.ASSET_MATERIALIZATION,
+                ) == {
+                    a: expected,
+                    b: storage.get_latest_storage_id_by_partition(
+                        b, DagsterEventType.ASSET_MATERIALIZATION
+                    ),
+                    AssetKey(["never_materialized"]): {},
+                }
 
         def _store_partition_event(asset_key, partition) -> int:
             storage.store_event(
@@ -4690,6 +4888,8 @@ def yields_materialization():
                 serialized_failed_partition_subset="baz",
                 serialized_in_progress_partition_subset="qux",
                 earliest_in_progress_materialization_event_id=42,
+                pending_materialized_partition_keys=["quux"],
+                pending_materialization_storage_id=1,
             )
 
             # Check that AssetStatusCacheValue has all fields set. This ensures that we test that the
@@ -208,6 +208,71 @@ def _swap_partitions_def(new_partitions_def, asset, asset_graph, asset_job):
             for partition in ["b", "c"]
         )
 
+    def test_cached_status_updated_on_write(self, instance):
+        partitions_def = StaticPartitionsDefinition(["a", "b", "c", "d"])
+
+        @asset(partitions_def=partitions_def)
+        def asset1():
+            return 1
+
+        asset_key = AssetKey("asset1")
+        asset_graph = AssetGraph.from_assets([asset1])
+        asset_job = define_asset_job("asset_job").resolve(asset_graph=asset_graph)
+
+        def _stored_cache_value():
+            return next(iter(instance.get_asset_records([asset_key]))).asset_entry.cached_status
+
+        asset_job.execute_in_process(instance=instance, partition_key="a")
+        cached_status = get_and_update_asset_status_cache_value(instance, asset_key, partitions_def)
+        assert cached_status
+        assert not cached_status.pending_materialized_partition_keys
+
+        asset_job.execute_in_process(instance=instance, partition_key="b")
+        asset_job.execute_in_process(instance=instance, partition_key="c")
+        stored_cache_value = _stored_cache_value()
+        assert stored_cache_value.pending_materialized_partition_keys == ["b", "c"]
+        assert (
+            stored_cache_value.pending_materialization_storage_id
+            == next(iter(instance.fetch_materializations(asset_key, limit=1).records)).storage_id
+        )
+
+        # the pending partitions are folded in without querying the event log
+        traced_counter.set(Counter())
+        cached_status = get_and_update_asset_status_cache_value(instance, asset_key, partitions_def)
+        assert cached_status
+        assert set(
+            partitions_def.deserialize_subset(
+                cached_status.serialized_materialized_partition_subset
+            ).get_partition_keys()
+        ) == {"a", "b", "c"}
+        assert not traced_counter.get().counts().get("DagsterInstance.get_materialized_partitions")
+        assert _stored_cache_value() == cached_status
+        assert not cached_status.pending_materialized_partition_keys
+
+        # a stored cache value is only replaced by one reflecting at least as many materializations
+        instance.update_asset_cached_status_data(
+            asset_key, cached_status._replace(latest_storage_id=0)
+        )
+        assert _stored_cache_value() == cached_status
+
+        # a cache value missing prior materializations is left for the reader to catch up
+        instance.wipe_asset_cached_status([asset_key])
+        instance.update_asset_cached_status_data(
+            asset_key, cached_status._replace(latest_storage_id=0)
+        )
+        asset_job.execute_in_process(instance=instance, partition_key="d")
+        assert not _stored_cache_value().pending_materialized_partition_keys
+
+        traced_counter.set(Counter())
+        cached_status = get_and_update_asset_status_cache_value(instance, asset_key, partitions_def)
+        assert cached_status
+        assert set(
+            partitions_def.deserialize_subset(
+                cached_status.serialized_materialized_partition_subset
+            ).get_partition_keys()
+        ) == {"a", "b", "c", "d"}
+        assert traced_counter.get().counts().get("DagsterInstance.get_materialized_partitions") == 1
+
     def test_multipartition_get_cached_partition_status(self, instance):
         partitions_def = MultiPartitionsDefinition(
             {
@@ -30,6 +30,7 @@
 from dagster._core.storage.root import LocalArtifactStorage
 from dagster._core.storage.runs.base import RunStorage
 from dagster._core.storage.runs.migration import REQUIRED_DATA_MIGRATIONS
+from dagster._core.storage.runs.schema import SnapshotsTable
 from dagster._core.storage.runs.sql_run_storage import SqlRunStorage
 from dagster._core.storage.tags import (
     BACKFILL_ID_TAG,
@@ -45,7 +46,7 @@
 from dagster._core.utils import make_new_run_id
 from dagster._daemon.daemon import SensorDaemon
 from dagster._daemon.types import DaemonHeartbeat
-from dagster._serdes import serialize_pp
+from dagster._serdes import serialize_pp, serialize_value
 from dagster._time import create_datetime, datetime_from_timestamp
 
 win_py36 = _seven.IS_WINDOWS and sys.version_info[0] == 3 and sys.version_info[1] == 6
@@ -1093,6 +1094,49 @@ def test_add_get_snapshot(self, storage):
 
             assert not storage.has_job_snapshot(job_snapshot_id)
 
+    def test_snapshot_cache(self, storage):
+        if not isinstance(storage, SqlRunStorage):
+            pytest.skip("storage does not cache snapshots")
+
+        job_def = GraphDefinition(name="some_pipeline", node_defs=[]).to_job()
+        job_snapshot = job_def.get_job_snapshot()
+        job_snapshot_id = storage.add_job_snapshot(job_snapshot)
+
+        stats = storage.get_snapshot_cache_stats()
+        assert storage.get_job_snapshot(job_snapshot_id) == job_snapshot
+        after_first_read = storage.get_snapshot_cache_stats()
+        assert after_first_read.misses == stats.misses + 1
+        assert after_first_read.hits == stats.hits
+        # sized by the uncompressed serialized snapshot, not the compressed stored one
+        assert after_first_read.size_bytes - stats.size_bytes == len(
+            serialize_value(job_snapshot).encode("utf-8")
+        )
+
+        # subsequent reads are served from the cache
+        assert storage.get_job_snapshot(job_snapshot_id) is storage.get_job_snapshot(
+            job_snapshot_id
+        )
+        after_cached_reads = storage.get_snapshot_cache_stats()
+        assert after_cached_reads.hits == after_first_read.hits + 2
+        assert after_cached_reads.misses == after_first_read.misses
+
+        # missing snapshots are not cached
+        assert storage.get_execution_plan_snapshot("nope") is None
+        assert storage.get_execution_plan_snapshot("nope") is None
+        assert storage.get_snapshot_cache_stats().misses == after_cached_reads.misses + 2
+
+        # snapshots deleted elsewhere, e.g. by a wipe in another process, aren't reported as
+        # present because they are cached
+        with storage.connect() as conn:
+            conn.execute(SnapshotsTable.delete())
+        assert not storage.has_job_snapshot(job_snapshot_id)
+
+        if self.can_delete_runs():
+            storage.wipe()
+
+            assert storage.get_snapshot_cache_stats().num_entries == 0
+            assert not storage.has_job_snapshot(job_snapshot_id)
+
     def test_single_write_read_with_snapshot(self, storage: RunStorage):
         run_with_snapshot_id = str(uuid4())
         job_def = GraphDefinition(name="some_pipeline", node_defs=[]).to_job()
@@ -1,3 +1,4 @@
+import io
 import os
 from contextlib import contextmanager
 from typing import Any, Iterator, Mapping, Optional, Sequence
@@ -27,6 +28,9 @@
 
 POLLING_INTERVAL = 5
 
+# The maximum number of keys that a single S3 DeleteObjects request accepts
+DELETE_OBJECTS_BATCH_SIZE = 1000
+
 
 class S3ComputeLogManager(CloudStorageComputeLogManager, ConfigurableClass):
     """Logs compute function stdout and stderr to S3.
@@ -208,6 +212,10 @@ def delete_logs(
             to_delete = [{"Key": key} for key in s3_keys_to_remove]
             self._s3_session.delete_objects(Bucket=self._s3_bucket, Delete={"Objects": to_delete})
 
+        if log_key:
+            self.delete_partial_log_objects(log_key, ComputeIOType.STDOUT)
+            self.delete_partial_log_objects(log_key, ComputeIOType.STDERR)
+
     def download_url_for_type(self, log_key: Sequence[str], io_type: ComputeIOType):
         if not self.is_capture_complete(log_key):
             return None
@@ -261,6 +269,52 @@ def download_from_cloud_storage(
         with open(path, "wb") as fileobj:
             self._s3_session.download_fileobj(self._s3_bucket, s3_key, fileobj)
 
+    @property
+    def supports_incremental_partial_upload(self) -> bool:
+        return True
+
+    def _partial_log_object_key(self, log_key: Sequence[str], io_type: ComputeIOType, name: str):
+        return f"{self._s3_key(log_key, io_type, partial=True)}.chunks/{name}"
+
+    def upload_partial_log_object(
+        self, log_key: Sequence[str], io_type: ComputeIOType, name: str, data: bytes
+    ) -> None:
+        extra_args = {
+            "ContentType": "text/plain",
+            **(self._upload_extra_args if self._upload_extra_args else {}),
+        }
+        self._s3_session.upload_fileobj(
+            io.BytesIO(data),
+            self._s3_bucket,
+            self._partial_log_object_key(log_key, io_type, name),
+            ExtraArgs=extra_args,
+        )
+
+    def download_partial_log_object(
+        self, log_key: Sequence[str], io_type: ComputeIOType, name: str
+    ) -> Optional[bytes]:
+        try:
+            response = self._s3_session.get_object(
+                Bucket=self._s3_bucket, Key=self._partial_log_object_key(log_key, io_type, name)
+            )
+        except ClientError as ex:
+            if ex.response["Error"]["Code"] in ("NoSuchKey", "404"):
+                return None
+            raise
+        return response["Body"].read()
+
+    def delete_partial_log_objects(self, log_key: Sequence[str], io_type: ComputeIOType) -> None:
+        paginator = self._s3_session.get_paginator("list_objects_v2")
+        for page in paginator.paginate(
+            Bucket=self._s3_bucket, Prefix=self._partial_log_object_key(log_key, io_type, "")
+        ):
+            to_delete = [{"Key": obj["Key"]} for obj in page.get("Contents", [])]
+            for i in range(0, len(to_delete), DELETE_OBJECTS_BATCH_SIZE):
+                self._s3_session.delete_objects(
+                    Bucket=self._s3_bucket,
+                    Delete={"Objects": to_delete[i : i + DELETE_OBJECTS_BATCH_SIZE]},
+                )
+
     def get_log_keys_for_log_key_prefix(
         self, log_key_prefix: Sequence[str], io_type: ComputeIOType
     ) -> Sequence[Sequence[str]]:
@@ -17,6 +17,7 @@
 from dagster._time import get_current_datetime
 
 from dagster_aws.s3 import S3ComputeLogManager
+from dagster_aws.s3.compute_log_manager import DELETE_OBJECTS_BATCH_SIZE
 
 ensure_dagster_tests_import()
 from dagster_tests.storage_tests.test_compute_log_manager import TestComputeLogManager
@@ -245,6 +246,33 @@ def write_log_file(file_id: int, io_type: ComputeIOType):
     ]
 
 
+def test_partial_log_objects(mock_s3_bucket):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manager = S3ComputeLogManager(bucket=mock_s3_bucket.name, prefix="foo", local_dir=temp_dir)
+        log_key = ["arbitrary", "log", "key"]
+
+        manager.upload_partial_log_object(log_key, ComputeIOType.STDERR, "0", b"hello")
+        assert manager.download_partial_log_object(log_key, ComputeIOType.STDERR, "0") == b"hello"
+        assert manager.download_partial_log_object(log_key, ComputeIOType.STDERR, "1") is None
+
+        # more chunks than can be listed or deleted in a single request
+        chunk_prefix = manager._partial_log_object_key(log_key, ComputeIOType.STDERR, "")  # noqa: SLF001
+        for i in range(1, DELETE_OBJECTS_BATCH_SIZE + 1):
+            mock_s3_bucket.put_object(Key=f"{chunk_prefix}{i}", Body=b"hello")
+        manager.upload_partial_log_object(log_key, ComputeIOType.STDOUT, "0", b"hello")
+
+        manager.delete_partial_log_objects(log_key, ComputeIOType.STDERR)
+        assert not list(mock_s3_bucket.objects.filter(Prefix=chunk_prefix))
+        assert manager.download_partial_log_object(log_key, ComputeIOType.STDOUT, "0") == b"hello"
+
+        # errors other than a missing chunk are raised
+        missing_bucket_manager = S3ComputeLogManager(
+            bucket="missing-bucket", prefix="foo", local_dir=temp_dir
+        )
+        with pytest.raises(ClientError):
+            missing_bucket_manager.download_partial_log_object(log_key, ComputeIOType.STDERR, "0")
+
+
 class TestS3ComputeLogManager(TestComputeLogManager):
     __test__ = True
 
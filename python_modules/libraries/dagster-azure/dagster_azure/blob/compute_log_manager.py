@@ -4,6 +4,7 @@
 from typing import Any, Mapping, Optional, Sequence
 
 import dagster._seven as seven
+from azure.core.exceptions import ResourceNotFoundError
 from azure.identity import DefaultAzureCredential
 from azure.storage.blob import BlobSasPermissions, BlobServiceClient, UserDelegationKey
 from dagster import (
@@ -28,6 +29,9 @@
 
 from dagster_azure.blob.utils import create_blob_client, generate_blob_sas
 
+# The maximum number of blobs that a single batch delete request accepts
+DELETE_BLOBS_BATCH_SIZE = 256
+
 
 class AzureBlobComputeLogManager(CloudStorageComputeLogManager, ConfigurableClass):
     """Logs op compute function stdout and stderr to Azure Blob Storage.
@@ -186,7 +190,14 @@ def delete_logs(
                 self._blob_key(log_key, ComputeIOType.STDOUT, partial=True),
                 self._blob_key(log_key, ComputeIOType.STDERR, partial=True),
             ]
-            to_remove = [key for key in known_keys if key in blob_list]
+            # along with any incrementally uploaded partial log chunks
+            partial_prefixes = tuple(
+                self._partial_log_object_key(log_key, io_type, "")
+                for io_type in [ComputeIOType.STDOUT, ComputeIOType.STDERR]
+            )
+            to_remove = [
+                key for key in blob_list if key in known_keys or key.startswith(partial_prefixes)
+            ]
         elif prefix:
             to_remove = list(blob_list)
         else:
@@ -278,6 +289,44 @@ def download_from_cloud_storage(
             blob = self._container_client.get_blob_client(blob_key)
             blob.download_blob().readinto(fileobj)
 
+    @property
+    def supports_incremental_partial_upload(self) -> bool:
+        return True
+
+    def _partial_log_object_key(self, log_key: Sequence[str], io_type: ComputeIOType, name: str):
+        return f"{self._blob_key(log_key, io_type, partial=True)}.chunks/{name}"
+
+    def upload_partial_log_object(
+        self, log_key: Sequence[str], io_type: ComputeIOType, name: str, data: bytes
+    ) -> None:
+        blob = self._container_client.get_blob_client(
+            self._partial_log_object_key(log_key, io_type, name)
+        )
+        blob.upload_blob(data, overwrite=True)
+
+    def download_partial_log_object(
+        self, log_key: Sequence[str], io_type: ComputeIOType, name: str
+    ) -> Optional[bytes]:
+        blob = self._container_client.get_blob_client(
+            self._partial_log_object_key(log_key, io_type, name)
+        )
+        try:
+            return blob.download_blob().readall()
+        except ResourceNotFoundError:
+            return None
+
+    def delete_partial_log_objects(self, log_key: Sequence[str], io_type: ComputeIOType) -> None:
+        to_remove = []
+        for blob in self._container_client.list_blobs(
+            name_starts_with=self._partial_log_object_key(log_key, io_type, "")
+        ):
+            to_remove.append(blob.name)
+            if len(to_remove) == DELETE_BLOBS_BATCH_SIZE:
+                self._container_client.delete_blobs(*to_remove)
+                to_remove = []
+        if to_remove:
+            self._container_client.delete_blobs(*to_remove)
+
     def get_log_keys_for_log_key_prefix(
         self, log_key_prefix: Sequence[str], io_type: ComputeIOType
     ) -> Sequence[Sequence[str]]:
@@ -22,6 +22,7 @@
 )
 from dagster._serdes import ConfigurableClass, ConfigurableClassData
 from dagster._utils import ensure_dir, ensure_file
+from google.api_core.exceptions import NotFound
 from google.cloud import storage
 from typing_extensions import Self
 
@@ -171,6 +172,8 @@ def delete_logs(
             ]
             # if the blob doesn't exist, do nothing instead of raising a not found exception
             self._bucket.delete_blobs(gcs_keys_to_remove, on_error=lambda _: None)
+            self.delete_partial_log_objects(log_key, ComputeIOType.STDOUT)
+            self.delete_partial_log_objects(log_key, ComputeIOType.STDERR)
         elif prefix:
             # add the trailing '/' to make sure that ['a'] does not match ['apple']
             delete_prefix = "/".join([self._prefix, "storage", *prefix, ""])
@@ -230,6 +233,36 @@ def download_from_cloud_storage(
         with open(path, "wb") as fileobj:
             self._bucket.blob(gcs_key).download_to_file(fileobj)
 
+    @property
+    def supports_incremental_partial_upload(self) -> bool:
+        return True
+
+    def _partial_log_object_key(self, log_key: Sequence[str], io_type: ComputeIOType, name: str):
+        return f"{self._gcs_key(log_key, io_type, partial=True)}.chunks/{name}"
+
+    def upload_partial_log_object(
+        self, log_key: Sequence[str], io_type: ComputeIOType, name: str, data: bytes
+    ) -> None:
+        self._bucket.blob(self._partial_log_object_key(log_key, io_type, name)).upload_from_string(
+            data
+        )
+
+    def download_partial_log_object(
+        self, log_key: Sequence[str], io_type: ComputeIOType, name: str
+    ) -> Optional[bytes]:
+        try:
+            return self._bucket.blob(
+                self._partial_log_object_key(log_key, io_type, name)
+            ).download_as_bytes()
+        except NotFound:
+            return None
+
+    def delete_partial_log_objects(self, log_key: Sequence[str], io_type: ComputeIOType) -> None:
+        to_delete = self._bucket.list_blobs(
+            prefix=self._partial_log_object_key(log_key, io_type, "")
+        )
+        self._bucket.delete_blobs(list(to_delete), on_error=lambda _: None)
+
     def get_log_keys_for_log_key_prefix(
         self, log_key_prefix: Sequence[str], io_type: ComputeIOType
     ) -> Sequence[Sequence[str]]:
@@ -8,7 +8,7 @@
 from dagster._config.config_schema import UserConfigSchema
 from dagster._core.errors import DagsterInvariantViolationError
 from dagster._core.event_api import EventHandlerFn
-from dagster._core.events import ASSET_CHECK_EVENTS, ASSET_EVENTS, BATCH_WRITABLE_EVENTS
+from dagster._core.events import ASSET_CHECK_EVENTS, ASSET_EVENTS
 from dagster._core.events.log import EventLogEntry
 from dagster._core.storage.config import pg_config
 from dagster._core.storage.event_log import (
@@ -20,7 +20,6 @@
 )
 from dagster._core.storage.event_log.base import EventLogCursor
 from dagster._core.storage.event_log.migration import ASSET_KEY_INDEX_COLS
-from dagster._core.storage.event_log.polling_event_watcher import SqlPollingEventWatcher
 from dagster._core.storage.sql import (
     AlembicVersion,
     check_alembic_revision,
@@ -33,6 +32,7 @@
 from sqlalchemy import event
 from sqlalchemy.engine import Connection
 
+from dagster_postgres.event_log.event_watcher import PostgresEventWatcher
 from dagster_postgres.utils import (
     create_pg_connection,
     pg_alembic_config,
@@ -90,7 +90,7 @@ def __init__(
         self._engine = create_engine(
             self.postgres_url, isolation_level="AUTOCOMMIT", poolclass=db_pool.NullPool
         )
-        self._event_watcher: Optional[SqlPollingEventWatcher] = None
+        self._event_watcher: Optional[PostgresEventWatcher] = None
 
         self._secondary_index_cache = {}
 
@@ -183,7 +183,7 @@ def store_event(self, event: EventLogEntry) -> None:
             res = result.fetchone()
             result.close()
 
-            # LISTEN/NOTIFY no longer used for pg event watch - preserved here to support version skew
+            # wakes up the event watcher of any process watching this run
             conn.execute(
                 db.text(f"""NOTIFY {CHANNEL_NAME}, :notify_id; """),
                 {"notify_id": res[0] + "_" + str(res[1])},  # type: ignore
@@ -203,30 +203,68 @@ def store_event(self, event: EventLogEntry) -> None:
                 )
 
             self.store_asset_event_tags([event], [event_id])
+            self.update_asset_cached_status_for_events([event], [event_id])
 
         if event.is_dagster_event and event.dagster_event_type in ASSET_CHECK_EVENTS:
             self.store_asset_check_event(event, event_id)
 
+        self.update_run_stats_for_events([event])
+
     def store_event_batch(self, events: Sequence[EventLogEntry]) -> None:
         check.sequence_param(events, "event", of_type=EventLogEntry)
-
-        check.invariant(
-            all(event.get_dagster_event().event_type in BATCH_WRITABLE_EVENTS for event in events),
-            f"{BATCH_WRITABLE_EVENTS} are the only currently supported events for batch writes.",
-        )
+        if not events:
+            return
 
         insert_event_statement = self.prepare_insert_event_batch(events)
         with self._connect() as conn:
-            result = conn.execute(insert_event_statement.returning(SqlEventLogStorageTable.c.id))
-            event_ids = [cast(int, row[0]) for row in result.fetchall()]
-
-        # We only update the asset table with the last event
-        self.store_asset_event(events[-1], event_ids[-1])
+            result = conn.execute(
+                insert_event_statement.returning(
+                    SqlEventLogStorageTable.c.run_id, SqlEventLogStorageTable.c.id
+                )
+            )
+            rows = result.fetchall()
+            event_ids = [cast(int, row[1]) for row in rows]
+
+            # a single notification per run is enough for watchers to fetch the whole batch
+            last_id_by_run_id = {row[0]: row[1] for row in rows}
+            for run_id, last_id in last_id_by_run_id.items():
+                conn.execute(
+                    db.text(f"""NOTIFY {CHANNEL_NAME}, :notify_id; """),
+                    {"notify_id": run_id + "_" + str(last_id)},
+                )
 
         if any((event_id is None for event_id in event_ids)):
             raise DagsterInvariantViolationError("Cannot store asset event tags for null event id.")
 
-        self.store_asset_event_tags(events, event_ids)
+        asset_events = []
+        asset_event_ids = []
+        last_asset_event_by_key_and_type = {}
+        for event_entry, event_id in zip(events, event_ids):
+            dagster_event = event_entry.dagster_event
+            if dagster_event is None:
+                continue
+
+            if dagster_event.event_type in ASSET_EVENTS and dagster_event.asset_key:
+                asset_events.append(event_entry)
+                asset_event_ids.append(event_id)
+                key_and_type = (dagster_event.asset_key, dagster_event.event_type)
+                last_asset_event = last_asset_event_by_key_and_type.get(key_and_type)
+                if last_asset_event is None or event_id > last_asset_event[1]:
+                    last_asset_event_by_key_and_type[key_and_type] = (event_entry, event_id)
+
+            if dagster_event.event_type in ASSET_CHECK_EVENTS:
+                self.store_asset_check_event(event_entry, event_id)
+
+        # We only update the asset table with the event of each type for each asset that has the
+        # highest storage id, which is the one reads of the asset index treat as the latest
+        for event_entry, event_id in last_asset_event_by_key_and_type.values():
+            self.store_asset_event(event_entry, event_id)
+
+        if asset_events:
+            self.store_asset_event_tags(asset_events, asset_event_ids)
+            self.update_asset_cached_status_for_events(asset_events, asset_event_ids)
+
+        self.update_run_stats_for_events(events)
 
     def store_asset_event(self, event: EventLogEntry, event_id: int) -> None:
         check.inst_param(event, "event", EventLogEntry)
@@ -344,7 +382,8 @@ def watch(
         if cursor and EventLogCursor.parse(cursor).is_offset_cursor():
             check.failed("Cannot call `watch` with an offset cursor")
         if self._event_watcher is None:
-            self._event_watcher = SqlPollingEventWatcher(self)
+            self._event_watcher = PostgresEventWatcher(self, self.postgres_url, CHANNEL_NAME)
+            self._event_watcher.start()
 
         self._event_watcher.watch_run(run_id, cursor, callback)
 
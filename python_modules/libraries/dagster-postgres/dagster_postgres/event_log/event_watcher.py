@@ -0,0 +1,205 @@
+import logging
+import os
+import select
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Set
+
+import dagster._check as check
+import psycopg2
+import psycopg2.extensions
+from dagster._core.events.log import EventLogEntry
+from dagster._core.storage.event_log.base import EventLogCursor, EventLogStorage
+
+from dagster_postgres.utils import get_conn, retry_pg_connection_fn
+
+POLLING_FALLBACK_INTERVAL = 5.0  # 5s
+NOTIFY_WAIT_TIMEOUT = 0.250  # 250ms
+
+
+class _RunCallback:
+    """A subscriber to the events of a single run, tracking the storage id of the last event it
+    has been sent.
+    """
+
+    def __init__(self, storage_id: Optional[int], callback: Callable[[EventLogEntry, str], None]):
+        self.storage_id = storage_id
+        self.callback = callback
+
+
+class PostgresEventWatcher(threading.Thread):
+    """Event log watcher that multiplexes every watched run over a single LISTEN connection.
+
+    `PostgresEventLogStorage` issues a NOTIFY on ``channel`` for every stored event, with a payload
+    of the form ``<run_id>_<storage_id>``. This thread listens on that channel, and for each run
+    that was notified and has subscribers, fetches the new records once and fans them out to every
+    callback after its own cursor. Every ``POLLING_FALLBACK_INTERVAL`` seconds, and whenever the
+    listening connection has to be re-established, all watched runs are fetched regardless of
+    notifications, so that events written without a NOTIFY are still delivered.
+
+    LOCKING INFO:
+        INVARIANTS: _callbacks_lock protects _run_id_to_callbacks and _dirty_run_ids
+    """
+
+    def __init__(self, event_log_storage: EventLogStorage, conn_string: str, channel: str):
+        super(PostgresEventWatcher, self).__init__()
+        self._event_log_storage = check.inst_param(
+            event_log_storage, "event_log_storage", EventLogStorage
+        )
+        self._conn_string = check.str_param(conn_string, "conn_string")
+        self._channel = check.str_param(channel, "channel")
+        self._callbacks_lock: threading.Lock = threading.Lock()
+        self._run_id_to_callbacks: Dict[str, List[_RunCallback]] = {}
+        self._dirty_run_ids: Set[str] = set()
+        self._should_thread_exit = threading.Event()
+        self._chunk_limit = int(os.getenv("DAGSTER_POLLING_EVENT_WATCHER_BATCH_SIZE", "1000"))
+        self.name = "postgres-event-watch"
+        self.daemon = True
+
+    @property
+    def should_thread_exit(self) -> threading.Event:
+        return self._should_thread_exit
+
+    def has_run_id(self, run_id: str) -> bool:
+        run_id = check.str_param(run_id, "run_id")
+        with self._callbacks_lock:
+            return run_id in self._run_id_to_callbacks
+
+    def watch_run(
+        self,
+        run_id: str,
+        cursor: Optional[str],
+        callback: Callable[[EventLogEntry, str], None],
+    ) -> None:
+        run_id = check.str_param(run_id, "run_id")
+        cursor = check.opt_str_param(cursor, "cursor")
+        callback = check.callable_param(callback, "callback")
+        check.invariant(not self._should_thread_exit.is_set(), "Attempted to watch_run after close")
+
+        storage_id = EventLogCursor.parse(cursor).storage_id() if cursor else None
+        with self._callbacks_lock:
+            self._run_id_to_callbacks.setdefault(run_id, []).append(
+                _RunCallback(storage_id, callback)
+            )
+            # fetch any events already written after the cursor without waiting for a notification
+            self._dirty_run_ids.add(run_id)
+
+    def unwatch_run(self, run_id: str, handler: Callable[[EventLogEntry, str], None]) -> None:
+        run_id = check.str_param(run_id, "run_id")
+        handler = check.callable_param(handler, "handler")
+        with self._callbacks_lock:
+            if run_id not in self._run_id_to_callbacks:
+                return
+            callbacks = [
+                run_callback
+                for run_callback in self._run_id_to_callbacks[run_id]
+                if run_callback.callback != handler
+            ]
+            if callbacks:
+                self._run_id_to_callbacks[run_id] = callbacks
+            else:
+                del self._run_id_to_callbacks[run_id]
+                self._dirty_run_ids.discard(run_id)
+
+    def close(self) -> None:
+        self._should_thread_exit.set()
+        if self.is_alive():
+            self.join()
+        with self._callbacks_lock:
+            self._run_id_to_callbacks = {}
+            self._dirty_run_ids = set()
+
+    def _listen(self) -> psycopg2.extensions.connection:
+        conn = retry_pg_connection_fn(lambda: get_conn(self._conn_string))
+        with conn.cursor() as curs:
+            curs.execute(f"LISTEN {self._channel};")
+        return conn
+
+    def _mark_all_dirty(self) -> None:
+        with self._callbacks_lock:
+            self._dirty_run_ids = set(self._run_id_to_callbacks.keys())
+
+    def _mark_notified(self, conn: psycopg2.extensions.connection) -> None:
+        conn.poll()
+        notified_run_ids = set()
+        while conn.notifies:
+            notify = conn.notifies.pop(0)
+            run_id, _, _ = notify.payload.rpartition("_")
+            notified_run_ids.add(run_id)
+
+        with self._callbacks_lock:
+            self._dirty_run_ids.update(notified_run_ids.intersection(self._run_id_to_callbacks))
+
+    def _dispatch_run(self, run_id: str) -> None:
+        with self._callbacks_lock:
+            run_callbacks = list(self._run_id_to_callbacks.get(run_id, []))
+        if not run_callbacks:
+            return
+
+        storage_ids = [run_callback.storage_id for run_callback in run_callbacks]
+        min_storage_id = None if None in storage_ids else min(storage_ids)  # type: ignore
+        cursor = (
+            str(EventLogCursor.from_storage_id(min_storage_id))
+            if min_storage_id is not None
+            else None
+        )
+
+        has_more = True
+        while has_more and not self._should_thread_exit.is_set():
+            conn = self._event_log_storage.get_records_for_run(
+                run_id, cursor=cursor, limit=self._chunk_limit
+            )
+            cursor = conn.cursor
+            has_more = conn.has_more
+            for event_record in conn.records:
+                record_cursor = str(EventLogCursor.from_storage_id(event_record.storage_id))
+                with self._callbacks_lock:
+                    # skip any callbacks that were unwatched since the fetch started
+                    current_callbacks = self._run_id_to_callbacks.get(run_id, [])
+                    for run_callback in run_callbacks:
+                        if run_callback in current_callbacks and (
+                            run_callback.storage_id is None
+                            or run_callback.storage_id < event_record.storage_id
+                        ):
+                            run_callback.callback(event_record.event_log_entry, record_cursor)
+                            run_callback.storage_id = event_record.storage_id
+
+    def run(self) -> None:
+        """Waits on the LISTEN connection for notifications, then fetches and dispatches the new
+        events for each notified run with active subscribers.
+        """
+        conn = None
+        last_full_fetch = time.time()
+        while not self._should_thread_exit.is_set():
+            try:
+                if conn is None:
+                    conn = self._listen()
+                    # events may have been written while we were not listening
+                    self._mark_all_dirty()
+
+                if select.select([conn], [], [], NOTIFY_WAIT_TIMEOUT) != ([], [], []):
+                    self._mark_notified(conn)
+
+                if time.time() - last_full_fetch > POLLING_FALLBACK_INTERVAL:
+                    self._mark_all_dirty()
+                    last_full_fetch = time.time()
+
+                with self._callbacks_lock:
+                    dirty_run_ids = self._dirty_run_ids
+                    self._dirty_run_ids = set()
+
+                for run_id in dirty_run_ids:
+                    self._dispatch_run(run_id)
+
+            except Exception:
+                logging.exception("Error in postgres event watcher, reconnecting")
+                if conn is not None:
+                    try:
+                        conn.close()
+                    except psycopg2.Error:
+                        pass
+                conn = None
+                self._should_thread_exit.wait(NOTIFY_WAIT_TIMEOUT)
+
+        if conn is not None:
+            conn.close()
@@ -1,4 +1,5 @@
 import gc
+import threading
 import time
 from contextlib import contextmanager
 
@@ -103,11 +104,41 @@ def watch_two(event, _cursor):
 
             assert [int(evt.message) for evt in watched_1] == [2, 3, 4]
             assert [int(evt.message) for evt in watched_2] == [4, 5]
-            assert len(objgraph.by_type("SqlPollingEventWatcher")) == 1
+            assert len(objgraph.by_type("PostgresEventWatcher")) == 1
 
-        # ensure we clean up poller on exit
+        # ensure we clean up watcher on exit
         gc.collect()
-        assert len(objgraph.by_type("SqlPollingEventWatcher")) == 0
+        assert len(objgraph.by_type("PostgresEventWatcher")) == 0
+
+    def test_event_log_storage_watchers_share_connection(self, conn_string):
+        with _clean_storage(conn_string) as storage:
+            run_ids = [make_new_run_id() for _ in range(5)]
+            watched = {run_id: [] for run_id in run_ids}
+
+            for run_id in run_ids:
+                storage.watch(
+                    run_id,
+                    None,
+                    lambda event, _cursor, run_id=run_id: watched[run_id].append(event),
+                )
+
+            watcher_threads = [
+                thread for thread in threading.enumerate() if thread.name == "postgres-event-watch"
+            ]
+            assert len(watcher_threads) == 1
+
+            for run_id in run_ids:
+                storage.store_event(create_test_event_log_record("1", run_id=run_id))
+                storage.store_event(create_test_event_log_record("2", run_id=run_id))
+
+            attempts = 10
+            while any(len(events) < 2 for events in watched.values()) and attempts > 0:
+                time.sleep(0.5)
+                attempts -= 1
+
+            for run_id in run_ids:
+                assert [int(evt.message) for evt in watched[run_id]] == [1, 2]
+                assert all(evt.run_id == run_id for evt in watched[run_id])
 
     def test_load_from_config(self, hostname):
         url_cfg = f"""